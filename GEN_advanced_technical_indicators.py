@@ -29,11 +29,749 @@ Version: 1.0
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from numpy.lib.stride_tricks import sliding_window_view
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+from GEN_feature_cache import RollingFeatureCache
+
+# Calculation backends for the per-row indicators (PSAR, OBV, Fisher, CCI deviation)
+BACKENDS = ('numpy', 'pandas')
+
+# Upper bound on window elements materialized at once by the rolling kernels (~32 MB)
+ROLLING_CHUNK_ELEMENTS = 4_000_000
+
+# Panels with fewer rows run the sequential kernels row by row; wider panels
+# advance all rows per numpy step, which amortizes the per-step overhead
+PANEL_VECTOR_MIN_SYMBOLS = 32
+
+# Result layouts for calculate_all_indicators
+OUTPUT_MODES = ('frame', 'block', 'dict')
+BLOCK_DTYPES = ('float64', 'float32')
+
+# ========================================
+# ARRAY KERNELS
+# ========================================
+
+def linear_recurrence(coefficients: np.ndarray, inputs: np.ndarray, initial: float = 0.0) -> np.ndarray:
+    """
+    First-order filter y[i] = coefficients[i] * y[i-1] + inputs[i]
+    
+    The recurrence is evaluated sequentially on plain floats rather than with a
+    prefix-product scan: the scan drifts by an ulp in flat markets, which turns
+    steady states into spurious crossovers.
+    
+    A 2-D (symbols x bars) input advances every series together, one
+    vectorized step per bar.
+    
+    Args:
+        coefficients: Feedback coefficient per bar
+        inputs: Input term per bar
+        initial: Value of y before the first bar
+        
+    Returns:
+        Array with y for every bar
+    """
+    if np.ndim(inputs) == 2:
+        coefficients = np.broadcast_to(np.asarray(coefficients, dtype=np.float64), np.shape(inputs))
+        if len(inputs) < PANEL_VECTOR_MIN_SYMBOLS:
+            return np.array([linear_recurrence(c, u, initial) for c, u in zip(coefficients, inputs)]
+                            ).reshape(np.shape(inputs))
+        coefficients = np.asfortranarray(coefficients)
+        inputs = np.asfortranarray(inputs, dtype=np.float64)
+        output = np.empty(inputs.shape, order='F')
+        y = np.full(inputs.shape[0], initial, dtype=np.float64)
+        for i in range(inputs.shape[1]):
+            y = coefficients[:, i] * y + inputs[:, i]
+            output[:, i] = y
+        return output
+    
+    coefficient_list = np.ascontiguousarray(coefficients, dtype=np.float64).tolist()
+    input_list = np.ascontiguousarray(inputs, dtype=np.float64).tolist()
+    output = [0.0] * len(input_list)
+    
+    y = initial
+    for i, (c, u) in enumerate(zip(coefficient_list, input_list)):
+        y = c * y + u
+        output[i] = y
+    
+    return np.array(output, dtype=np.float64)
+
+
+def rolling_mean_abs_deviation(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean absolute deviation over strided window views
+    
+    Equivalent to rolling(window).apply(lambda x: np.mean(np.abs(x - np.mean(x))))
+    without a Python call per bar. Accepts a single series or a 2-D panel of
+    (symbols x bars); windows run along the last axis and are processed in
+    chunks so memory stays bounded for large universes.
+    
+    Args:
+        values: 1-D series or 2-D (symbols x bars) array
+        window: Rolling window length
+        
+    Returns:
+        Array of the input shape with NaN for incomplete windows
+    """
+    values = np.asarray(values, dtype=np.float64)
+    panel = values.reshape(1, -1) if values.ndim == 1 else values
+    mad = np.full(panel.shape, np.nan)
+    
+    if 0 < window <= panel.shape[-1]:
+        windows = sliding_window_view(panel, window, axis=-1)
+        chunk = max(1, ROLLING_CHUNK_ELEMENTS // (panel.shape[0] * window))
+        
+        for start in range(0, windows.shape[1], chunk):
+            block = windows[:, start:start + chunk, :]
+            block_mean = block.mean(axis=-1, keepdims=True)
+            mad[:, window - 1 + start:window - 1 + start + block.shape[1]] = \
+                np.abs(block - block_mean).mean(axis=-1)
+    
+    return mad[0] if values.ndim == 1 else mad
+
+
+def true_range(df: pd.DataFrame) -> pd.Series:
+    """True range of each bar (NaN on the first bar, which has no previous close)"""
+    return np.maximum(
+        df['high'] - df['low'],
+        np.maximum(
+            abs(df['high'] - df['close'].shift(1)),
+            abs(df['low'] - df['close'].shift(1))
+        )
+    )
+
+
+def typical_price(df: pd.DataFrame) -> pd.Series:
+    """Typical price (high + low + close) / 3 of each bar"""
+    return (df['high'] + df['low'] + df['close']) / 3
+
+
+def cci_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 20) -> np.ndarray:
+    """
+    Commodity Channel Index for a single series or a (symbols x bars) panel
+    
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: Lookback period
+        
+    Returns:
+        CCI array with the shape of the inputs
+    """
+    typical_price = (np.asarray(high, dtype=np.float64) + np.asarray(low, dtype=np.float64) +
+                     np.asarray(close, dtype=np.float64)) / 3
+    return cci_from_typical_price(typical_price, period)
+
+
+def cci_from_typical_price(typical_price: np.ndarray, period: int = 20) -> np.ndarray:
+    """
+    Commodity Channel Index from precomputed typical prices
+    
+    Args:
+        typical_price: Typical prices, single series or (symbols x bars) panel
+        period: Lookback period
+        
+    Returns:
+        CCI array with the shape of the input
+    """
+    typical_price = np.asarray(typical_price, dtype=np.float64)
+    
+    # pandas rolling mean keeps flat windows exact, so CCI stays 0 there rather than
+    # dividing rounding noise by rounding noise
+    panel = typical_price.reshape(1, -1) if typical_price.ndim == 1 else typical_price
+    sma_tp = pd.DataFrame(panel.T).rolling(window=period).mean().to_numpy().T.reshape(typical_price.shape)
+    mean_deviation = rolling_mean_abs_deviation(typical_price, period)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (typical_price - sma_tp) / (0.015 * mean_deviation)
+
+
+def parabolic_sar_kernel(high: np.ndarray, low: np.ndarray, af_start: float = 0.02,
+                         af_increment: float = 0.02, af_maximum: float = 0.2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parabolic SAR state machine over contiguous arrays
+
+    Args:
+        high: High prices, or a (symbols x bars) panel with NaN padding before
+              each symbol's first bar
+        low: Low prices
+        af_start: Initial acceleration factor
+        af_increment: AF increment per period
+        af_maximum: Maximum AF value
+
+    Returns:
+        Tuple of (psar values, bull trend flags)
+    """
+    if np.ndim(high) == 2:
+        return _parabolic_sar_panel(high, low, af_start, af_increment, af_maximum)
+    
+    psar, bull_trend, _ = parabolic_sar_resume(high, low, None, af_start, af_increment, af_maximum)
+    return psar, bull_trend
+
+
+def parabolic_sar_resume(high: np.ndarray, low: np.ndarray, state: Tuple = None, af_start: float = 0.02,
+                         af_increment: float = 0.02, af_maximum: float = 0.2) -> Tuple[np.ndarray, np.ndarray, Tuple]:
+    """
+    Parabolic SAR state machine continued from the state after the previous bar
+    
+    Args:
+        high: High prices of the bars following the state
+        low: Low prices
+        state: (sar, bull, af, ep) after the previous bar; None starts the
+               series at the first bar
+        af_start: Initial acceleration factor
+        af_increment: AF increment per period
+        af_maximum: Maximum AF value
+        
+    Returns:
+        Tuple of (psar values, bull trend flags, state after the last bar)
+    """
+    highs = np.ascontiguousarray(high, dtype=np.float64).tolist()
+    lows = np.ascontiguousarray(low, dtype=np.float64).tolist()
+    n = len(highs)
+    psar = np.zeros(n)
+    bull_trend = np.zeros(n, dtype=bool)
+    if n == 0:
+        return psar, bull_trend, state
+
+    # Plain floats in local variables keep the sequential loop tight
+    if state is None:
+        sar, bull, af, ep = lows[0], True, af_start, highs[0]
+        first = 1
+    else:
+        sar, bull, af, ep = state
+        first = 0
+    psar_out = [sar] * n
+    bull_out = [bull] * n
+
+    for i in range(first, n):
+        sar = sar + af * (ep - sar)
+        if bull:
+            if lows[i] <= sar:
+                bull, sar, af, ep = False, ep, af_start, lows[i]
+            elif highs[i] > ep:
+                ep, af = highs[i], min(af_maximum, af + af_increment)
+        else:
+            if highs[i] >= sar:
+                bull, sar, af, ep = True, ep, af_start, highs[i]
+            elif lows[i] < ep:
+                ep, af = lows[i], min(af_maximum, af + af_increment)
+        psar_out[i] = sar
+        bull_out[i] = bull
+
+    psar[:] = psar_out
+    bull_trend[:] = bull_out
+    return psar, bull_trend, (sar, bull, af, ep)
+
+
+def wilder_smoothing_resume(values: np.ndarray, alpha: float,
+                            state: Tuple = None) -> Tuple[np.ndarray, Tuple]:
+    """
+    Exponential smoothing equal to pandas ewm(alpha=alpha, adjust=False).mean(),
+    continued from the state after the previous bar
+    
+    Args:
+        values: Values of the bars following the state (NaN allowed)
+        alpha: Smoothing factor (1 / period for Wilder's smoothing)
+        state: (average, weight of the average) after the previous bar; None
+               starts the series at the first bar
+        
+    Returns:
+        Tuple of (smoothed values, state after the last bar)
+    """
+    average, weight = (np.nan, 1.0) if state is None else state
+    decay = 1.0 - alpha
+    out = []
+    for value in np.asarray(values, dtype=np.float64).tolist():
+        if average == average:
+            # Missing values still age the average, as with ignore_na=False
+            weight *= decay
+            if value == value:
+                if average != value:
+                    average = (weight * average + alpha * value) / (weight + alpha)
+                weight = 1.0
+        elif value == value:
+            average = value
+        out.append(average)
+    return np.array(out, dtype=np.float64), (average, weight)
+
+
+def _parabolic_sar_panel(high: np.ndarray, low: np.ndarray, af_start: float,
+                         af_increment: float, af_maximum: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Parabolic SAR for a (symbols x bars) panel, one vectorized step per bar"""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    symbols, n = high.shape
+    psar = np.full((symbols, n), np.nan)
+    bull_trend = np.zeros((symbols, n), dtype=bool)
+    
+    # Left-align the histories so every state machine starts at step 0
+    finite = np.isfinite(high)
+    start = np.where(finite.any(axis=1), finite.argmax(axis=1), n)
+    steps = n - start.min() if symbols else 0
+    if steps == 0:
+        return psar, bull_trend
+    
+    if symbols < PANEL_VECTOR_MIN_SYMBOLS:
+        for row, first in enumerate(start):
+            if first < n:
+                psar[row, first:], bull_trend[row, first:] = parabolic_sar_kernel(
+                    high[row, first:], low[row, first:], af_start, af_increment, af_maximum)
+        return psar, bull_trend
+    source = start[:, np.newaxis] + np.arange(steps)
+    inside = source < n
+    source = np.minimum(source, n - 1)
+    rows = np.arange(symbols)[:, np.newaxis]
+    highs = np.ascontiguousarray(np.where(inside, high[rows, source], np.nan).T)
+    lows = np.ascontiguousarray(np.where(inside, low[rows, source], np.nan).T)
+    
+    sar_out = np.empty((steps, symbols))
+    bull_out = np.empty((steps, symbols), dtype=bool)
+    sar, ep = lows[0].copy(), highs[0].copy()
+    af = np.full(symbols, af_start)
+    bull = np.ones(symbols, dtype=bool)
+    sar_out[0], bull_out[0] = sar, bull
+    
+    for i in range(1, steps):
+        h, l = highs[i], lows[i]
+        sar = sar + af * (ep - sar)
+        reverse = np.where(bull, l <= sar, h >= sar)
+        extend = np.where(bull, h > ep, l < ep) & ~reverse
+        sar = np.where(reverse, ep, sar)
+        ep = np.where(reverse | extend, np.where(bull ^ reverse, h, l), ep)
+        af = np.where(reverse, af_start, np.where(extend, np.minimum(af_maximum, af + af_increment), af))
+        bull = bull ^ reverse
+        sar_out[i], bull_out[i] = sar, bull
+    
+    # Scatter back to the right-aligned layout
+    target = (np.broadcast_to(rows, source.shape)[inside], source[inside])
+    psar[target] = sar_out.T[inside]
+    bull_trend[target] = bull_out.T[inside]
+    return psar, bull_trend
+
+
+def obv_kernel(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    On Balance Volume as a cumulative sum of signed volume
+
+    Args:
+        close: Close prices (or a (symbols x bars) panel)
+        volume: Volume per bar
+
+    Returns:
+        OBV array (0 at the first bar; bars without a prior close add nothing)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    obv = np.zeros(close.shape)
+    if close.shape[-1] < 2:
+        return obv
+
+    change = close[..., 1:] - close[..., :-1]
+    direction = np.where(change > 0, 1.0, np.where(change < 0, -1.0, 0.0))
+    np.cumsum(np.where(direction != 0, direction * volume[..., 1:], 0.0), axis=-1, out=obv[..., 1:])
+    return obv
+
+
+def fisher_transform_kernel(raw_value: np.ndarray) -> np.ndarray:
+    """
+    Fisher Transform of a clipped, normalized price series
+
+    Both the 0.33/0.67 smoothing and the 0.5 feedback of the transform are
+    first-order recurrences solved with linear_recurrence(); NaN inputs hold
+    the previous smoothed value and a zero smoothed value holds the previous
+    Fisher value, exactly like the per-bar loop.
+
+    Args:
+        raw_value: Normalized price in [-0.999, 0.999] (NaN during warm-up),
+                   or a (symbols x bars) panel
+
+    Returns:
+        Fisher Transform array (0 at the first bar)
+    """
+    raw_value = np.asarray(raw_value, dtype=np.float64)
+    if raw_value.shape[-1] < 2:
+        return np.zeros(raw_value.shape)
+
+    # Smoothing: fisher_ma[i] = 0.33 * raw[i] + 0.67 * fisher_ma[i-1]
+    valid = ~np.isnan(raw_value[..., 1:])
+    fisher_ma = np.zeros(raw_value.shape)
+    fisher_ma[..., 1:] = linear_recurrence(np.where(valid, 0.67, 1.0),
+                                           np.where(valid, 0.33 * np.nan_to_num(raw_value[..., 1:]), 0.0))
+
+    # Transform: fisher[i] = 0.5 * ln((1 + ma) / (1 - ma)) + 0.5 * fisher[i-1]
+    active = fisher_ma[..., 1:] != 0
+    log_ratio = 0.5 * np.log((1 + fisher_ma[..., 1:]) / (1 - fisher_ma[..., 1:]))
+    fisher = np.zeros(raw_value.shape)
+    fisher[..., 1:] = linear_recurrence(np.where(active, 0.5, 1.0), np.where(active, log_ratio, 0.0))
+    return fisher
+
+
+# ========================================
+# COLUMNAR OUTPUT
+# ========================================
+
+class _BufferLocIndexer:
+    """Boolean-mask assignment for IndicatorBuffer (df.loc[mask, column] = value)"""
+    
+    def __init__(self, buffer: 'IndicatorBuffer'):
+        self._buffer = buffer
+    
+    def __setitem__(self, key, value):
+        rows, column = key
+        target = self._buffer.arrays[column]
+        if not np.can_cast(np.asarray(value).dtype, target.dtype, casting='same_kind'):
+            target = self._buffer.arrays[column] = target.astype(np.result_type(target, value))
+        target[np.asarray(rows, dtype=bool)] = value
+
+
+class IndicatorBuffer:
+    """
+    Columnar workspace for calculate_all_indicators
+    
+    Holds one NumPy array per column over a shared index. The indicator
+    methods write their columns into it in place instead of copying the
+    growing DataFrame, and read columns back as zero-copy Series views.
+    Source columns are referenced, never modified.
+    """
+    
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize buffer over a source frame
+        
+        Args:
+            data: DataFrame with OHLCV data
+        """
+        self.index = data.index
+        self.source_columns = list(data.columns)
+        self.arrays = {column: data[column].to_numpy() for column in data.columns}
+        self.loc = _BufferLocIndexer(self)
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def __contains__(self, column: str) -> bool:
+        return column in self.arrays
+    
+    def __getitem__(self, column: str) -> pd.Series:
+        return pd.Series(self.arrays[column], index=self.index, name=column, copy=False)
+    
+    def __setitem__(self, column: str, value):
+        if isinstance(value, pd.Series):
+            value = value.to_numpy()
+        if np.ndim(value) == 0:
+            value = np.full(len(self.index), value)
+        self.arrays[column] = np.asarray(value)
+    
+    @property
+    def columns(self) -> List[str]:
+        return list(self.arrays)
+    
+    @property
+    def new_columns(self) -> List[str]:
+        """Columns computed in the buffer that were not in the source frame"""
+        source = set(self.source_columns)
+        return [column for column in self.arrays if column not in source]
+    
+    def to_dict(self, columns: List[str] = None) -> Dict[str, np.ndarray]:
+        """Column arrays by name (views, treat as read-only)"""
+        return {column: self.arrays[column] for column in (columns or self.columns)}
+    
+    def to_frame(self, columns: List[str] = None) -> pd.DataFrame:
+        """DataFrame with each column's own dtype"""
+        return pd.DataFrame(self.to_dict(columns), index=self.index)
+    
+    def to_block(self, columns: List[str] = None, dtype: str = 'float64') -> pd.DataFrame:
+        """
+        DataFrame view over a single preallocated 2-D block
+        
+        Args:
+            columns: Columns to include (non-numeric columns are skipped)
+            dtype: Block dtype, 'float64' or 'float32'
+            
+        Returns:
+            DataFrame backed by one (columns x bars) array without further copies
+        """
+        names = [column for column in (columns or self.columns)
+                 if self.arrays[column].dtype.kind in 'biuf']
+        block = np.empty((len(names), len(self.index)), dtype=dtype)
+        for row, column in enumerate(names):
+            block[row] = self.arrays[column]
+        return pd.DataFrame(block.T, index=self.index, columns=names, copy=False)
+
+
+# ========================================
+# PARAMETER SWEEPS
+# ========================================
+
+# Configuration key -> indicator method, for indicators with tunable parameters
+SWEEP_METHODS = {
+    'stochastic': 'calculate_stochastic',
+    'williams_r': 'calculate_williams_r',
+    'roc': 'calculate_roc',
+    'cci': 'calculate_cci',
+    'adx': 'calculate_adx',
+    'ichimoku': 'calculate_ichimoku',
+    'psar': 'calculate_parabolic_sar',
+    'keltner': 'calculate_keltner_channels',
+    'donchian': 'calculate_donchian_channels',
+    'mfi': 'calculate_mfi',
+    'cmf': 'calculate_cmf',
+    'fisher': 'calculate_fisher_transform'
+}
+
+# Working columns left behind by the indicator methods, not swept by default
+SWEEP_INTERMEDIATE_COLUMNS = ('tr', 'dm_plus', 'dm_minus', 'tr_smooth',
+                              'dm_plus_smooth', 'dm_minus_smooth', 'dx')
+
+# ========================================
+# WARM-UP LOOKBACKS
+# ========================================
+
+# Relative weight of history beyond the lookback of recursive (EMA-type) indicators
+LOOKBACK_TOLERANCE = 1e-12
+
+# Extra bar read by crossover signals (the previous bar's values via shift(1))
+CROSSOVER_BARS = 1
+
+# Cumulative levels that depend on where the history starts; their signals
+# (level vs. moving average) do not
+CUMULATIVE_COLUMNS = ('obv', 'obv_ma', 'ad_line', 'ad_line_ma')
+
+# Columns that depend on the whole path before a window: Parabolic SAR is a
+# state machine without a warm-up horizon, and the Wilder-smoothed ADX terms
+# are ratios of averages that decay together through flat, gap-filled
+# stretches, so a window restarting them can disagree with the full history
+# for hundreds of bars. Windows continue them with PathStateTracker
+PATH_COLUMNS = ('psar', 'psar_bull_trend', 'psar_signal', 'dm_plus', 'dm_minus', 'tr_smooth',
+                'dm_plus_smooth', 'dm_minus_smooth', 'di_plus', 'di_minus', 'dx', 'adx', 'adx_signal')
+
+
+def ema_horizon(alpha: float, tolerance: float = LOOKBACK_TOLERANCE) -> int:
+    """
+    Bars after which an exponential average no longer depends on older history
+    
+    Args:
+        alpha: Smoothing factor (2 / (span + 1) for span-based EMAs)
+        tolerance: Relative weight left on the history beyond the horizon
+        
+    Returns:
+        Number of bars
+    """
+    return int(np.ceil(np.log(tolerance) / np.log(1.0 - alpha)))
+
+
+# Configuration key -> bars needed for a stable last-bar value (defaults match the methods)
+INDICATOR_LOOKBACKS = {
+    'stochastic': lambda k_period=14, d_period=3, smooth_k=3:
+        k_period + smooth_k + d_period - 1 + CROSSOVER_BARS,
+    'williams_r': lambda period=14: period,
+    'roc': lambda period=12: period + 1,
+    'cci': lambda period=20: period,
+    'adx': lambda period=14: 2 * ema_horizon(1.0 / period) + 1,
+    'ichimoku': lambda tenkan_period=9, kijun_period=26, senkou_b_period=52, chikou_period=26:
+        max(tenkan_period, kijun_period, senkou_b_period) + kijun_period + chikou_period,
+    # SAR values come from PathStateTracker; the window only holds the previous trend for the signal
+    'psar': lambda af_start=0.02, af_increment=0.02, af_maximum=0.2: 1 + CROSSOVER_BARS,
+    'keltner': lambda period=20, multiplier=2.0, ma_type='ema':
+        max(ema_horizon(2.0 / (period + 1)) if ma_type.lower() == 'ema' else period, period + 1),
+    'donchian': lambda period=20: period,
+    'mfi': lambda period=14: period + 1,
+    'obv': lambda: 21,
+    'ad_line': lambda: 20,
+    'cmf': lambda period=20: period,
+    'fisher': lambda period=9: period + ema_horizon(0.33) + ema_horizon(0.5) + 1 + CROSSOVER_BARS
+}
+
+
+class PathStateTracker:
+    """
+    Full-history state of the path-dependent indicators (see PATH_COLUMNS)
+    
+    Keeps the Parabolic SAR and ADX smoothing state each series reached at
+    closed bars and continues windows of the history from it, so a trailing
+    window matches the full-history calculation while each call only steps
+    over the bars added since an earlier one. A checkpoint whose bar changed
+    or disappeared (rewritten history) is discarded.
+    """
+    
+    def __init__(self, max_series: int = 256, checkpoints: int = 4):
+        """
+        Initialize path state tracker
+        
+        Args:
+            max_series: Number of series kept before the least recently used is evicted
+            checkpoints: States kept per series (the latest positions)
+        """
+        self.max_series = max_series
+        self.checkpoints = checkpoints
+        self._series = OrderedDict()
+    
+    def resume(self, key: Hashable, data: pd.DataFrame, frame: pd.DataFrame, config: Dict[str, Dict] = None,
+               start: int = None) -> pd.DataFrame:
+        """
+        Recalculate the path-dependent columns of an indicator frame from the full-history state
+        
+        Args:
+            key: Series identity, e.g. (symbol, timeframe)
+            data: Full source OHLC frame
+            frame: Indicator frame aligned to the end of data (a trailing window or the full history)
+            config: Indicator parameters in calculate_all_indicators format (weights ignored)
+            start: First source row to recalculate (default: the first row of frame)
+            
+        Returns:
+            The same frame, its PATH_COLUMNS from `start` on equal to the full-history values
+        """
+        first = len(data) - len(frame)
+        start = first if start is None else start
+        if 'psar' not in frame.columns or start >= len(data):
+            return frame
+        
+        dtypes = frame.dtypes
+        for column, values in self.continue_columns(key, data, config, start).items():
+            if column in dtypes.index:
+                frame.iloc[start - first:, frame.columns.get_loc(column)] = values.astype(dtypes[column])
+        return frame
+    
+    def continue_columns(self, key: Hashable, data: pd.DataFrame, config: Dict[str, Dict] = None,
+                         start: int = 0) -> Dict[str, np.ndarray]:
+        """
+        Full-history values of the path-dependent columns for the source rows from `start` on
+        
+        Args:
+            key: Series identity, e.g. (symbol, timeframe)
+            data: Full source OHLC frame
+            config: Indicator parameters in calculate_all_indicators format (weights ignored)
+            start: First source row
+            
+        Returns:
+            Column name -> values of rows start..end
+        """
+        config = config or {}
+        psar_params = {k: v for k, v in config.get('psar', {}).items() if k != 'weight'}
+        period = config.get('adx', {}).get('period', 14)
+        series_key = (key, tuple(sorted(psar_params.items())), period)
+        
+        checkpoints = self._series.pop(series_key, {})
+        position, state = 0, None
+        for candidate in sorted(checkpoints, reverse=True):
+            if candidate <= start and self._unchanged(data, candidate, checkpoints[candidate]):
+                position, state = candidate, checkpoints[candidate]['state']
+                break
+        
+        if position < start:
+            _, state = self._advance(data, position, start, state, psar_params, period)
+        values, _ = self._advance(data, start, len(data), state, psar_params, period)
+        
+        # The bars before `start` are closed; keep the state reached there
+        checkpoints = {p: c for p, c in checkpoints.items()
+                       if p < len(data) and self._unchanged(data, p, c)}
+        if start > 0:
+            checkpoints[start] = {'time': data.index[start - 1], 'bar': self._bar(data, start - 1), 'state': state}
+        self._series[series_key] = {p: checkpoints[p] for p in sorted(checkpoints)[-self.checkpoints:]}
+        while len(self._series) > self.max_series:
+            self._series.popitem(last=False)
+        return values
+    
+    @staticmethod
+    def _bar(data: pd.DataFrame, position: int) -> Tuple[float, float, float]:
+        return (float(data['high'].iat[position]), float(data['low'].iat[position]),
+                float(data['close'].iat[position]))
+    
+    def _unchanged(self, data: pd.DataFrame, position: int, checkpoint: Dict) -> bool:
+        """Whether the bar before a checkpoint is still the same bar"""
+        if position > len(data) or data.index[position - 1] != checkpoint['time']:
+            return False
+        return self._bar(data, position - 1) == checkpoint['bar']
+    
+    @staticmethod
+    def _advance(data: pd.DataFrame, begin: int, end: int, state: Optional[Dict],
+                 psar_params: Dict, period: int) -> Tuple[Dict[str, np.ndarray], Dict]:
+        """Step the SAR and ADX state machines over rows begin..end"""
+        state = state or {}
+        window = data.iloc[max(begin - 1, 0):end]
+        high = window['high'].to_numpy(dtype=np.float64)
+        low = window['low'].to_numpy(dtype=np.float64)
+        prev_close = np.concatenate(([np.nan], window['close'].to_numpy(dtype=np.float64)[:-1]))
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        up_move = high - np.concatenate(([np.nan], high[:-1]))
+        down_move = np.concatenate(([np.nan], low[:-1])) - low
+        if begin > 0:
+            high, low, tr, up_move, down_move = high[1:], low[1:], tr[1:], up_move[1:], down_move[1:]
+        
+        out = {}
+        # Parabolic SAR (the first bar of a series has no previous trend to reverse)
+        out['psar'], bull, psar_state = parabolic_sar_resume(high, low, state.get('psar'), **psar_params)
+        previous = np.concatenate((bull[:1] if begin == 0 else [state['psar'][1]], bull[:-1]))
+        out['psar_bull_trend'] = bull
+        out['psar_signal'] = np.where(bull & ~previous, 1, np.where(~bull & previous, -1, 0))
+        
+        # ADX (Wilder's smoothing, as in calculate_adx)
+        alpha = 1.0 / period
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out['dm_plus'] = np.where(up_move > down_move, np.maximum(up_move, 0), 0).astype(np.float64)
+            out['dm_minus'] = np.where(down_move > up_move, np.maximum(down_move, 0), 0).astype(np.float64)
+            new_state = {'psar': psar_state}
+            for column, values in (('tr_smooth', tr), ('dm_plus_smooth', out['dm_plus']),
+                                   ('dm_minus_smooth', out['dm_minus'])):
+                out[column], new_state[column] = wilder_smoothing_resume(values, alpha, state.get(column))
+            out['di_plus'] = 100 * (out['dm_plus_smooth'] / out['tr_smooth'])
+            out['di_minus'] = 100 * (out['dm_minus_smooth'] / out['tr_smooth'])
+            out['dx'] = 100 * np.abs(out['di_plus'] - out['di_minus']) / (out['di_plus'] + out['di_minus'])
+            out['adx'], new_state['adx'] = wilder_smoothing_resume(out['dx'], alpha, state.get('adx'))
+            strong = out['adx'] > 25
+            out['adx_signal'] = np.where(strong & (out['di_minus'] > out['di_plus']), -1,
+                                         np.where(strong & (out['di_plus'] > out['di_minus']), 1, 0))
+        return out, new_state
+
+
+@dataclass
+class SweepResult:
+    """Indicator outputs for every parameter set of a sweep"""
+    indicator: str
+    params: List[Dict]
+    index: pd.Index
+    outputs: List[str]
+    values: np.ndarray  # (param set x bar x output)
+    
+    def __len__(self) -> int:
+        return len(self.params)
+    
+    def to_frame(self, position: int) -> pd.DataFrame:
+        """Outputs of one parameter set as a DataFrame"""
+        return pd.DataFrame(self.values[position], index=self.index, columns=self.outputs)
+    
+    def sel(self, **params) -> pd.DataFrame:
+        """
+        Outputs of the parameter set matching the given values
+        
+        Args:
+            **params: Parameter values, e.g. k_period=14
+            
+        Returns:
+            DataFrame of that parameter set's outputs
+        """
+        for position, candidate in enumerate(self.params):
+            if all(candidate.get(name) == value for name, value in params.items()):
+                return self.to_frame(position)
+        raise KeyError(f"No parameter set matches {params}")
+    
+    def output(self, name: str) -> pd.DataFrame:
+        """One output for all parameter sets (bars x param sets)"""
+        return pd.DataFrame(self.values[:, :, self.outputs.index(name)].T, index=self.index)
+    
+    def param_frame(self) -> pd.DataFrame:
+        """Parameter sets as a DataFrame, one row per position in values"""
+        return pd.DataFrame(self.params)
+
+
 class AdvancedTechnicalIndicators:
     """
     Advanced Technical Indicators Library
@@ -42,11 +780,61 @@ class AdvancedTechnicalIndicators:
     trading strategy development and market analysis.
     """
     
-    def __init__(self):
-        """Initialize advanced technical indicators library"""
+    def __init__(self, backend: str = 'numpy', feature_cache: RollingFeatureCache = None,
+                 output_mode: str = 'frame', new_columns_only: bool = False,
+                 block_dtype: str = 'float64'):
+        """
+        Initialize advanced technical indicators library
+        
+        Args:
+            backend: Calculation backend for the per-row indicators (PSAR, OBV,
+                     Fisher, CCI mean deviation): 'numpy' array kernels or the
+                     original 'pandas' loops
+            feature_cache: Rolling statistics cache, shared with other engines
+                           working on the same frames
+            output_mode: Default layout returned by calculate_all_indicators
+                         ('frame', 'block' or 'dict')
+            new_columns_only: Return only the indicator columns by default
+            block_dtype: Float dtype of the 'block' layout ('float64' or 'float32')
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode '{output_mode}', expected one of {OUTPUT_MODES}")
+        if block_dtype not in BLOCK_DTYPES:
+            raise ValueError(f"Unknown block dtype '{block_dtype}', expected one of {BLOCK_DTYPES}")
+        
+        self.backend = backend
+        self.output_mode = output_mode
+        self.new_columns_only = new_columns_only
+        self.block_dtype = block_dtype
+        self.feature_cache = feature_cache if feature_cache is not None else RollingFeatureCache()
         self.indicators_calculated = set()
         print("✅ Advanced Technical Indicators Library initialized")
     
+    @classmethod
+    def from_config(cls, config: Dict, **kwargs) -> 'AdvancedTechnicalIndicators':
+        """
+        Create library with output settings from the unified configuration
+        
+        Args:
+            config: Unified configuration (technical_analysis.advanced_indicators is read)
+            **kwargs: Constructor arguments taking precedence over the configuration
+            
+        Returns:
+            Configured AdvancedTechnicalIndicators instance
+        """
+        settings = config.get("technical_analysis", {}).get("advanced_indicators", {})
+        options = {key: settings[key] for key in ('output_mode', 'new_columns_only', 'block_dtype')
+                   if key in settings}
+        options.update(kwargs)
+        return cls(**options)
+    
+    @staticmethod
+    def _workspace(data: Union[pd.DataFrame, IndicatorBuffer]) -> Union[pd.DataFrame, IndicatorBuffer]:
+        """Columnar buffers are written in place; DataFrames are copied"""
+        return data if isinstance(data, IndicatorBuffer) else data.copy()
+    
     # ========================================
     # MOMENTUM OSCILLATORS
     # ========================================
@@ -68,11 +856,11 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with additional stochastic columns
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Calculate raw %K
-        lowest_low = df['low'].rolling(window=k_period).min()
-        highest_high = df['high'].rolling(window=k_period).max()
+        lowest_low = self.feature_cache.rolling(df, 'low', 'min', k_period)
+        highest_high = self.feature_cache.rolling(df, 'high', 'max', k_period)
         
         raw_k = 100 * ((df['close'] - lowest_low) / (highest_high - lowest_low))
         
@@ -110,10 +898,10 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with Williams %R column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
-        highest_high = df['high'].rolling(window=period).max()
-        lowest_low = df['low'].rolling(window=period).min()
+        highest_high = self.feature_cache.rolling(df, 'high', 'max', period)
+        lowest_low = self.feature_cache.rolling(df, 'low', 'min', period)
         
         df['williams_r'] = -100 * ((highest_high - df['close']) / (highest_high - lowest_low))
         
@@ -138,7 +926,7 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with ROC column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         df['roc'] = ((df['close'] - df['close'].shift(period)) / df['close'].shift(period)) * 100
         
@@ -163,21 +951,24 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with CCI column
         """
-        df = data.copy()
-        
-        # Calculate typical price
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
+        df = self._workspace(data)
         
-        # Calculate simple moving average of typical price
-        sma_tp = typical_price.rolling(window=period).mean()
+        # Calculate typical price (shared with MFI)
+        tp = self.feature_cache.feature(df, 'typical_price', typical_price)
         
-        # Calculate mean deviation
-        mean_deviation = typical_price.rolling(window=period).apply(
-            lambda x: np.mean(np.abs(x - np.mean(x)))
-        )
-        
-        # Calculate CCI
-        df['cci'] = (typical_price - sma_tp) / (0.015 * mean_deviation)
+        if self.backend == 'pandas':
+            # Calculate simple moving average of typical price
+            sma_tp = tp.rolling(window=period).mean()
+            
+            # Calculate mean deviation
+            mean_deviation = tp.rolling(window=period).apply(
+                lambda x: np.mean(np.abs(x - np.mean(x)))
+            )
+            
+            # Calculate CCI
+            df['cci'] = (tp - sma_tp) / (0.015 * mean_deviation)
+        else:
+            df['cci'] = cci_from_typical_price(tp.to_numpy(), period)
         
         # Generate signals
         df['cci_signal'] = 0
@@ -204,16 +995,10 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with ADX, +DI, -DI columns
         """
-        df = data.copy()
+        df = self._workspace(data)
         
-        # Calculate True Range (TR)
-        df['tr'] = np.maximum(
-            df['high'] - df['low'],
-            np.maximum(
-                abs(df['high'] - df['close'].shift(1)),
-                abs(df['low'] - df['close'].shift(1))
-            )
-        )
+        # Calculate True Range (TR), shared with ATR and Keltner Channels
+        df['tr'] = self.feature_cache.feature(df, 'tr', true_range)
         
         # Calculate Directional Movement
         df['dm_plus'] = np.where(
@@ -275,24 +1060,24 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with Ichimoku components
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Tenkan-sen (Conversion Line): (9-period high + 9-period low) / 2
-        tenkan_high = df['high'].rolling(window=tenkan_period).max()
-        tenkan_low = df['low'].rolling(window=tenkan_period).min()
+        tenkan_high = self.feature_cache.rolling(df, 'high', 'max', tenkan_period)
+        tenkan_low = self.feature_cache.rolling(df, 'low', 'min', tenkan_period)
         df['ichimoku_tenkan'] = (tenkan_high + tenkan_low) / 2
         
         # Kijun-sen (Base Line): (26-period high + 26-period low) / 2
-        kijun_high = df['high'].rolling(window=kijun_period).max()
-        kijun_low = df['low'].rolling(window=kijun_period).min()
+        kijun_high = self.feature_cache.rolling(df, 'high', 'max', kijun_period)
+        kijun_low = self.feature_cache.rolling(df, 'low', 'min', kijun_period)
         df['ichimoku_kijun'] = (kijun_high + kijun_low) / 2
         
         # Senkou Span A (Leading Span A): (Tenkan-sen + Kijun-sen) / 2, plotted 26 periods ahead
         df['ichimoku_senkou_a'] = ((df['ichimoku_tenkan'] + df['ichimoku_kijun']) / 2).shift(kijun_period)
         
         # Senkou Span B (Leading Span B): (52-period high + 52-period low) / 2, plotted 26 periods ahead
-        senkou_b_high = df['high'].rolling(window=senkou_b_period).max()
-        senkou_b_low = df['low'].rolling(window=senkou_b_period).min()
+        senkou_b_high = self.feature_cache.rolling(df, 'high', 'max', senkou_b_period)
+        senkou_b_low = self.feature_cache.rolling(df, 'low', 'min', senkou_b_period)
         df['ichimoku_senkou_b'] = ((senkou_b_high + senkou_b_low) / 2).shift(kijun_period)
         
         # Chikou Span (Lagging Span): Close price plotted 26 periods back
@@ -339,8 +1124,27 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with PSAR column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
+        if self.backend == 'pandas':
+            psar, bull_trend = self._parabolic_sar_loop(df, af_start, af_increment, af_maximum)
+        else:
+            psar, bull_trend = parabolic_sar_kernel(df['high'].to_numpy(), df['low'].to_numpy(),
+                                                    af_start, af_increment, af_maximum)
+        
+        df['psar'] = psar
+        df['psar_bull_trend'] = bull_trend
+        
+        # Generate signals
+        df['psar_signal'] = 0
+        df.loc[(df['psar_bull_trend'] == True) & (df['psar_bull_trend'].shift(1) == False), 'psar_signal'] = 1
+        df.loc[(df['psar_bull_trend'] == False) & (df['psar_bull_trend'].shift(1) == True), 'psar_signal'] = -1
+        
+        return df
+    
+    def _parabolic_sar_loop(self, df: pd.DataFrame, af_start: float, af_increment: float,
+                            af_maximum: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Original per-row Parabolic SAR loop (pandas backend)"""
         psar = np.zeros(len(df))
         bull_trend = np.zeros(len(df), dtype=bool)
         af = np.zeros(len(df))
@@ -388,15 +1192,7 @@ class AdvancedTechnicalIndicators:
                         ep[i] = ep[i-1]
                         af[i] = af[i-1]
         
-        df['psar'] = psar
-        df['psar_bull_trend'] = bull_trend
-        
-        # Generate signals
-        df['psar_signal'] = 0
-        df.loc[(df['psar_bull_trend'] == True) & (df['psar_bull_trend'].shift(1) == False), 'psar_signal'] = 1
-        df.loc[(df['psar_bull_trend'] == False) & (df['psar_bull_trend'].shift(1) == True), 'psar_signal'] = -1
-        
-        return df
+        return psar, bull_trend
     
     # ========================================
     # VOLATILITY INDICATORS
@@ -418,24 +1214,18 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with Keltner Channel columns
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Calculate True Range if not already present
         if 'atr' not in df.columns:
-            df['tr'] = np.maximum(
-                df['high'] - df['low'],
-                np.maximum(
-                    abs(df['high'] - df['close'].shift(1)),
-                    abs(df['low'] - df['close'].shift(1))
-                )
-            )
-            df['atr'] = df['tr'].rolling(window=period).mean()
+            df['tr'] = self.feature_cache.feature(df, 'tr', true_range)
+            df['atr'] = self.feature_cache.rolling(df, 'tr', 'mean', period)
         
         # Calculate middle line (moving average)
         if ma_type.lower() == 'ema':
-            df['keltner_middle'] = df['close'].ewm(span=period).mean()
+            df['keltner_middle'] = self.feature_cache.ewm(df, 'close', period)
         else:
-            df['keltner_middle'] = df['close'].rolling(window=period).mean()
+            df['keltner_middle'] = self.feature_cache.rolling(df, 'close', 'mean', period)
         
         # Calculate upper and lower channels
         df['keltner_upper'] = df['keltner_middle'] + (multiplier * df['atr'])
@@ -464,10 +1254,10 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with Donchian Channel columns
         """
-        df = data.copy()
+        df = self._workspace(data)
         
-        df['donchian_upper'] = df['high'].rolling(window=period).max()
-        df['donchian_lower'] = df['low'].rolling(window=period).min()
+        df['donchian_upper'] = self.feature_cache.rolling(df, 'high', 'max', period)
+        df['donchian_lower'] = self.feature_cache.rolling(df, 'low', 'min', period)
         df['donchian_middle'] = (df['donchian_upper'] + df['donchian_lower']) / 2
         
         # Calculate position within channels
@@ -498,24 +1288,24 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with MFI column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Use real_volume if available, otherwise use tick_volume
         volume_col = 'real_volume' if 'real_volume' in df.columns else 'tick_volume'
         
-        # Calculate typical price
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
+        # Calculate typical price (shared with CCI)
+        tp = self.feature_cache.feature(df, 'typical_price', typical_price)
         
         # Calculate money flow
-        money_flow = typical_price * df[volume_col]
+        money_flow = tp * df[volume_col]
         
         # Determine positive and negative money flow
-        positive_mf = np.where(typical_price > typical_price.shift(1), money_flow, 0)
-        negative_mf = np.where(typical_price < typical_price.shift(1), money_flow, 0)
+        positive_mf = np.where(tp > tp.shift(1), money_flow, 0)
+        negative_mf = np.where(tp < tp.shift(1), money_flow, 0)
         
         # Calculate money flow ratio
-        positive_mf_sum = pd.Series(positive_mf).rolling(window=period).sum()
-        negative_mf_sum = pd.Series(negative_mf).rolling(window=period).sum()
+        positive_mf_sum = pd.Series(positive_mf, index=df.index).rolling(window=period).sum()
+        negative_mf_sum = pd.Series(negative_mf, index=df.index).rolling(window=period).sum()
         
         money_flow_ratio = positive_mf_sum / negative_mf_sum
         
@@ -541,20 +1331,15 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with OBV column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Use real_volume if available, otherwise use tick_volume
         volume_col = 'real_volume' if 'real_volume' in df.columns else 'tick_volume'
         
-        obv = np.zeros(len(df))
-        
-        for i in range(1, len(df)):
-            if df['close'].iloc[i] > df['close'].iloc[i-1]:
-                obv[i] = obv[i-1] + df[volume_col].iloc[i]
-            elif df['close'].iloc[i] < df['close'].iloc[i-1]:
-                obv[i] = obv[i-1] - df[volume_col].iloc[i]
-            else:
-                obv[i] = obv[i-1]
+        if self.backend == 'pandas':
+            obv = self._obv_loop(df, volume_col)
+        else:
+            obv = obv_kernel(df['close'].to_numpy(), df[volume_col].to_numpy())
         
         df['obv'] = obv
         
@@ -568,6 +1353,20 @@ class AdvancedTechnicalIndicators:
         
         return df
     
+    def _obv_loop(self, df: pd.DataFrame, volume_col: str) -> np.ndarray:
+        """Original per-row OBV loop (pandas backend)"""
+        obv = np.zeros(len(df))
+        
+        for i in range(1, len(df)):
+            if df['close'].iloc[i] > df['close'].iloc[i-1]:
+                obv[i] = obv[i-1] + df[volume_col].iloc[i]
+            elif df['close'].iloc[i] < df['close'].iloc[i-1]:
+                obv[i] = obv[i-1] - df[volume_col].iloc[i]
+            else:
+                obv[i] = obv[i-1]
+        
+        return obv
+    
     def calculate_ad_line(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate Accumulation/Distribution Line
@@ -580,7 +1379,7 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with A/D Line column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Use real_volume if available, otherwise use tick_volume
         volume_col = 'real_volume' if 'real_volume' in df.columns else 'tick_volume'
@@ -620,7 +1419,7 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with CMF column
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Use real_volume if available, otherwise use tick_volume
         volume_col = 'real_volume' if 'real_volume' in df.columns else 'tick_volume'
@@ -634,7 +1433,7 @@ class AdvancedTechnicalIndicators:
         
         # Calculate CMF
         cmf_numerator = money_flow_volume.rolling(window=period).sum()
-        cmf_denominator = df[volume_col].rolling(window=period).sum()
+        cmf_denominator = self.feature_cache.rolling(df, volume_col, 'sum', period)
         
         df['cmf'] = cmf_numerator / cmf_denominator
         
@@ -662,24 +1461,43 @@ class AdvancedTechnicalIndicators:
         Returns:
             DataFrame with Fisher Transform columns
         """
-        df = data.copy()
+        df = self._workspace(data)
         
         # Calculate median price
         median_price = (df['high'] + df['low']) / 2
         
         # Calculate highest high and lowest low over period
-        max_high = df['high'].rolling(window=period).max()
-        min_low = df['low'].rolling(window=period).min()
+        max_high = self.feature_cache.rolling(df, 'high', 'max', period)
+        min_low = self.feature_cache.rolling(df, 'low', 'min', period)
         
         # Calculate raw value (normalized between -1 and 1)
         raw_value = 2 * ((median_price - min_low) / (max_high - min_low)) - 1
         raw_value = raw_value.clip(-0.999, 0.999)  # Prevent mathematical errors
         
         # Calculate Fisher Transform
-        fisher = np.zeros(len(df))
-        fisher_ma = np.zeros(len(df))
+        if self.backend == 'pandas':
+            fisher = self._fisher_transform_loop(raw_value)
+        else:
+            fisher = fisher_transform_kernel(raw_value.to_numpy())
         
-        for i in range(1, len(df)):
+        df['fisher_transform'] = fisher
+        df['fisher_signal_line'] = df['fisher_transform'].shift(1)
+        
+        # Generate signals
+        df['fisher_signal'] = 0
+        df.loc[(df['fisher_transform'] > df['fisher_signal_line']) & 
+               (df['fisher_transform'].shift(1) <= df['fisher_signal_line'].shift(1)), 'fisher_signal'] = 1
+        df.loc[(df['fisher_transform'] < df['fisher_signal_line']) & 
+               (df['fisher_transform'].shift(1) >= df['fisher_signal_line'].shift(1)), 'fisher_signal'] = -1
+        
+        return df
+    
+    def _fisher_transform_loop(self, raw_value: pd.Series) -> np.ndarray:
+        """Original per-row Fisher Transform loop (pandas backend)"""
+        fisher = np.zeros(len(raw_value))
+        fisher_ma = np.zeros(len(raw_value))
+        
+        for i in range(1, len(raw_value)):
             # Smooth the raw value
             if not np.isnan(raw_value.iloc[i]):
                 fisher_ma[i] = 0.33 * raw_value.iloc[i] + 0.67 * fisher_ma[i-1]
@@ -692,39 +1510,67 @@ class AdvancedTechnicalIndicators:
             else:
                 fisher[i] = fisher[i-1]
         
-        df['fisher_transform'] = fisher
-        df['fisher_signal_line'] = pd.Series(fisher).shift(1)
-        
-        # Generate signals
-        df['fisher_signal'] = 0
-        df.loc[(df['fisher_transform'] > df['fisher_signal_line']) & 
-               (df['fisher_transform'].shift(1) <= df['fisher_signal_line'].shift(1)), 'fisher_signal'] = 1
-        df.loc[(df['fisher_transform'] < df['fisher_signal_line']) & 
-               (df['fisher_transform'].shift(1) >= df['fisher_signal_line'].shift(1)), 'fisher_signal'] = -1
-        
-        return df
+        return fisher
     
     # ========================================
     # UTILITY METHODS
     # ========================================
     
     def calculate_all_indicators(self, data: pd.DataFrame, 
-                                config: Dict[str, Dict] = None) -> pd.DataFrame:
+                                config: Dict[str, Dict] = None,
+                                output_mode: str = None,
+                                new_columns_only: bool = None) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
         """
         Calculate all advanced technical indicators
         
+        Indicators are written into a single columnar buffer rather than
+        copying the frame once per indicator.
+        
         Args:
             data: DataFrame with OHLCV data
             config: Configuration dictionary for indicator parameters
+            output_mode: 'frame' (DataFrame with per-column dtypes), 'block'
+                         (DataFrame view over one float block) or 'dict'
+                         (column name -> array); defaults to the instance setting
+            new_columns_only: Return only the indicator columns, not the input ones
             
         Returns:
-            DataFrame with all indicators calculated
+            Input data with all indicators calculated, in the requested layout
         """
         if config is None:
             config = self._get_default_config()
+        output_mode = output_mode or self.output_mode
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode '{output_mode}', expected one of {OUTPUT_MODES}")
+        if new_columns_only is None:
+            new_columns_only = self.new_columns_only
+        
+        # Rolling statistics shared between indicators are computed once per frame
+        with self.feature_cache.frame(data):
+            df = self.add_all_indicators(IndicatorBuffer(data), config)
+        
+        columns = df.new_columns if new_columns_only else None
+        if output_mode == 'dict':
+            return df.to_dict(columns)
+        if output_mode == 'block':
+            return df.to_block(columns, self.block_dtype)
+        return df.to_frame(columns)
+    
+    def add_all_indicators(self, df: IndicatorBuffer, config: Dict[str, Dict]) -> IndicatorBuffer:
+        """
+        Write all advanced indicator columns into a buffer
         
-        df = data.copy()
+        Callers open the feature cache frame scope of the buffer's source data
+        so intermediates already computed for it (true range, EMAs, rolling
+        windows) are reused.
         
+        Args:
+            df: IndicatorBuffer with OHLCV (and possibly basic indicator) columns
+            config: Configuration dictionary for indicator parameters (no weights)
+            
+        Returns:
+            The same buffer
+        """
         print("🔄 Calculating advanced technical indicators...")
         
         # Momentum Oscillators
@@ -760,10 +1606,108 @@ class AdvancedTechnicalIndicators:
         df = self.calculate_fisher_transform(df, **config.get('fisher', {}))
         
         print("✅ All advanced indicators calculated")
-        
         return df
     
-    def _get_default_config(self) -> Dict:
+    def sweep_parameters(self, data: pd.DataFrame, indicator: str,
+                         grid: Union[Dict[str, List], List[Dict]],
+                         outputs: List[str] = None, dtype: str = 'float64') -> SweepResult:
+        """
+        Calculate one indicator for every parameter set of a grid in a single pass
+        
+        All variants run in one feature-cache scope over the same source
+        columns, so rolling windows and EMAs shared by several parameter sets
+        (e.g. the %K range for every smoothing, the ATR for every Keltner
+        multiplier) are computed once.
+        
+        Args:
+            data: DataFrame with OHLCV data
+            indicator: Configuration key, one of SWEEP_METHODS
+            grid: Parameter name -> values (cartesian product), or an explicit
+                  list of parameter dicts; missing parameters use the defaults
+            outputs: Output columns to keep (default: all except working columns)
+            dtype: Result dtype, 'float64' or 'float32'
+            
+        Returns:
+            SweepResult with values shaped (param set x bar x output)
+        """
+        if indicator not in SWEEP_METHODS:
+            raise ValueError(f"Unknown indicator '{indicator}', expected one of {tuple(SWEEP_METHODS)}")
+        if dtype not in BLOCK_DTYPES:
+            raise ValueError(f"Unknown dtype '{dtype}', expected one of {BLOCK_DTYPES}")
+        
+        defaults = self._get_default_config()[indicator]
+        if isinstance(grid, dict):
+            names = list(grid)
+            param_sets = [dict(zip(names, values)) for values in product(*grid.values())]
+        else:
+            param_sets = [dict(params) for params in grid]
+        unknown = {name for params in param_sets for name in params} - set(defaults)
+        if unknown:
+            raise ValueError(f"Unknown {indicator} parameters {sorted(unknown)}, expected {sorted(defaults)}")
+        param_sets = [{**defaults, **params} for params in param_sets]
+        
+        method = getattr(self, SWEEP_METHODS[indicator])
+        values = None
+        
+        with self.feature_cache.frame(data):
+            for position, params in enumerate(param_sets):
+                buffer = method(IndicatorBuffer(data), **params)
+                if values is None:
+                    outputs = outputs or [column for column in buffer.new_columns
+                                          if column not in SWEEP_INTERMEDIATE_COLUMNS]
+                    values = np.empty((len(param_sets), len(data), len(outputs)), dtype=dtype)
+                for column_position, column in enumerate(outputs):
+                    values[position, :, column_position] = buffer.arrays[column]
+        
+        if values is None:
+            values = np.empty((0, len(data), len(outputs or [])), dtype=dtype)
+        return SweepResult(indicator=indicator, params=param_sets, index=data.index,
+                           outputs=list(outputs or []), values=values)
+    
+    @staticmethod
+    def required_lookback(config: Dict[str, Dict] = None) -> int:
+        """
+        Bars of history needed for calculate_all_indicators to give stable last-bar values
+        
+        Recursive indicators use their EMA convergence horizon; OBV and the A/D
+        line are included through their signal windows (see CUMULATIVE_COLUMNS).
+        Parabolic SAR has no such horizon, and the ADX ratios lose theirs in
+        flat stretches: windows continue PATH_COLUMNS with PathStateTracker.
+        
+        Args:
+            config: Indicator parameters in calculate_all_indicators format
+                    (extra keys such as 'weight' are ignored)
+            
+        Returns:
+            Number of trailing bars
+        """
+        config = {**AdvancedTechnicalIndicators._get_default_config(), **(config or {})}
+        lookbacks = [INDICATOR_LOOKBACKS['obv'](), INDICATOR_LOOKBACKS['ad_line']()]
+        for indicator, params in config.items():
+            if indicator in INDICATOR_LOOKBACKS:
+                params = {k: v for k, v in params.items() if k != 'weight'}
+                lookbacks.append(INDICATOR_LOOKBACKS[indicator](**params))
+        return max(lookbacks)
+    
+    @staticmethod
+    def required_lookahead(config: Dict[str, Dict] = None) -> int:
+        """
+        Trailing bars whose values change when later bars arrive
+        
+        Only the Ichimoku Chikou span (and the signal built on it) reads
+        ahead, by chikou_period bars.
+        
+        Args:
+            config: Indicator parameters in calculate_all_indicators format
+            
+        Returns:
+            Number of trailing bars
+        """
+        config = {**AdvancedTechnicalIndicators._get_default_config(), **(config or {})}
+        return config.get('ichimoku', {}).get('chikou_period', 26)
+    
+    @staticmethod
+    def _get_default_config() -> Dict:
         """Get default configuration for all indicators"""
         return {
             'stochastic': {'k_period': 14, 'd_period': 3, 'smooth_k': 3},
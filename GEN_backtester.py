@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+"""
+Event-Driven Backtester
+=======================
+
+Replays stored M1 bars of many symbols in timestamp order through a
+multi-timeframe strategy, the coefficient-based risk rules and a simulated
+venue, producing an equity curve and a trade log.
+
+Flow per bar (bars are bid prices; ask = bid + the bar's spread):
+1. An order decided at the previous bar's close fills at this bar's open:
+   an opposite position is closed, then the entry is sized and checked by
+   CoefficientBasedRiskManager.evaluate_trade_request against the simulated
+   account and filled with spread and slippage.
+2. Stop loss / take profit (ATR multiples set at entry) are checked against
+   the bar's range; when both are inside one bar the stop is assumed first.
+3. At the bar's close the strategy's confluent signal is read; a change to
+   BUY or SELL queues an order for the symbol's next bar.
+
+Bars are fed to the strategy one block (default one week) at a time with
+append_bars, so higher timeframes and cached indicator frames are extended
+incrementally instead of being recomputed per bar. Signals of a block are
+then read as of each bar close with the vectorized confluence series
+(calculate_confluence_series / calculate_enhanced_confluence_series), which
+only uses bars closed by that time, so nothing looks ahead.
+
+Usage:
+    strategy = MultiTimeframeStrategy()
+    backtester = EventDrivenBacktester(strategy)
+    result = backtester.run(["BTCUSD", "NAS100", "XAUUSD"])
+    print(result.summary())
+    result.save("backtest_results")
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from GEN_columnar_store import available_symbols, load_symbol_bars
+from GEN_multi_timeframe_strategy import MultiTimeframeStrategy, TimeFrame
+from GEN_risk_manager import AccountMetrics, CoefficientBasedRiskManager, TradeRequest
+
+# Position direction per recommended action
+ACTION_DIRECTIONS = {"STRONG_BUY": 1, "BUY": 1, "HOLD": 0, "SELL": -1, "STRONG_SELL": -1}
+
+BAR_DURATION = pd.Timedelta(minutes=1)
+
+
+def bar_signals(strategy: MultiTimeframeStrategy, symbol: str, times: pd.DatetimeIndex,
+                stop_timeframe: str = "H1") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Signal direction, confidence and stop ATR as of the close of each M1 bar
+
+    Uses the enhanced confluence series when the strategy provides one. Only
+    bars closed by each bar's close are used.
+
+    Args:
+        strategy: Strategy holding the symbol's data (load_frame/append_bars)
+        symbol: Trading symbol
+        times: Open times of the M1 bars
+        stop_timeframe: Timeframe name of the ATR used for stops
+
+    Returns:
+        (direction (+1/0/-1, int8), confluence score, ATR) arrays aligned to times
+    """
+    closes = times + BAR_DURATION
+    series = getattr(strategy, 'calculate_enhanced_confluence_series', strategy.calculate_confluence_series)
+    signals = series(symbol, closes)
+    direction = signals['recommended_action'].map(ACTION_DIRECTIONS).to_numpy(dtype=np.int8)
+    confidence = signals['confluence_score'].to_numpy(dtype=float)
+    timeframe = getattr(TimeFrame, stop_timeframe)
+    if timeframe in strategy.data_cache[symbol]:
+        atr = strategy.indicator_asof(symbol, timeframe, ['atr'], closes)['atr'].to_numpy()
+    else:
+        atr = np.full(len(times), np.nan)
+    return direction, confidence, atr
+
+
+@dataclass
+class BacktestConfig:
+    """Backtest settings"""
+    initial_balance: float = 10000.0
+    leverage: float = 100.0
+    slippage_points: float = 2.0       # adverse slippage of market and stop fills
+    warmup: str = "1D"                 # history loaded before the first trade
+    block: str = "7D"                  # bars appended to the strategy per step
+    stop_timeframe: str = "H1"         # timeframe of the ATR used for stops
+    stop_loss_atr: float = 2.0
+    take_profit_atr: float = 1.5
+    close_on_hold: bool = False        # close positions when the signal turns to HOLD
+    strategy_id: str = "backtest"
+
+
+@dataclass
+class BacktestTrade:
+    """One round trip in the simulated venue"""
+    trade_id: int
+    symbol: str
+    direction: str                     # "BUY" or "SELL"
+    volume: float
+    entry_time: pd.Timestamp
+    entry_price: float
+    stop_loss: float = np.nan
+    take_profit: float = np.nan
+    spread_cost: float = 0.0
+    exit_time: Optional[pd.Timestamp] = None
+    exit_price: float = np.nan
+    exit_reason: Optional[str] = None
+    pnl: float = 0.0
+
+
+class SimulatedVenue:
+    """
+    Account, positions and fills of a backtest
+
+    Prices are converted to account currency with the symbol's tick value
+    per tick size (symbol_specifications.json), captured when the
+    specifications were screened.
+    """
+
+    def __init__(self, symbol_specs: Dict[str, Dict], initial_balance: float = 10000.0,
+                 leverage: float = 100.0, slippage_points: float = 2.0):
+        """
+        Initialize simulated venue
+
+        Args:
+            symbol_specs: Symbol -> specification (contract_size, tick_size,
+                          tick_value, point)
+            initial_balance: Starting balance in account currency
+            leverage: Account leverage used for margin
+            slippage_points: Adverse slippage of market and stop fills in points
+        """
+        self.symbol_specs = symbol_specs
+        self.initial_balance = initial_balance
+        self.balance = initial_balance
+        self.leverage = leverage
+        self.slippage_points = slippage_points
+        self.positions: Dict[str, BacktestTrade] = {}
+        self.trades: List[BacktestTrade] = []
+        self.quotes: Dict[str, Tuple[float, float]] = {}
+        self.unrealized: Dict[str, float] = {}
+        self.day = None
+        self.day_realized = 0.0
+        self._next_id = 1
+
+    def spec(self, symbol: str) -> Dict:
+        if symbol not in self.symbol_specs:
+            raise ValueError(f"No symbol specification for {symbol}")
+        return self.symbol_specs[symbol]
+
+    def value_per_price(self, symbol: str) -> float:
+        """Account currency per 1.0 price move per lot"""
+        spec = self.spec(symbol)
+        return spec['tick_value'] / spec['tick_size']
+
+    def slippage(self, symbol: str) -> float:
+        return self.slippage_points * self.spec(symbol)['point']
+
+    def set_quote(self, symbol: str, bid: float, spread: float):
+        self.quotes[symbol] = (bid, bid + spread)
+
+    def start_day(self, timestamp: pd.Timestamp):
+        """Reset the daily P&L at the first bar of a new day"""
+        day = timestamp.normalize()
+        if day != self.day:
+            self.day = day
+            self.day_realized = 0.0
+
+    def open_position(self, symbol: str, direction: int, volume: float, timestamp: pd.Timestamp,
+                      stop_distance: float = np.nan, target_distance: float = np.nan) -> BacktestTrade:
+        """Fill a market order at the current quote (ask for buys, bid for sells) with slippage"""
+        bid, ask = self.quotes[symbol]
+        price = ask + self.slippage(symbol) if direction > 0 else bid - self.slippage(symbol)
+        trade = BacktestTrade(
+            trade_id=self._next_id, symbol=symbol, direction="BUY" if direction > 0 else "SELL",
+            volume=volume, entry_time=timestamp, entry_price=price,
+            stop_loss=price - direction * stop_distance, take_profit=price + direction * target_distance,
+            spread_cost=(ask - bid) * volume * self.value_per_price(symbol)
+        )
+        self._next_id += 1
+        self.positions[symbol] = trade
+        self.unrealized[symbol] = 0.0
+        return trade
+
+    def close_position(self, symbol: str, timestamp: pd.Timestamp, price: float = None,
+                       reason: str = "signal") -> BacktestTrade:
+        """Close a position at a price (default: market with slippage) and book its P&L"""
+        trade = self.positions.pop(symbol)
+        self.unrealized.pop(symbol, None)
+        direction = 1 if trade.direction == "BUY" else -1
+        if price is None:
+            bid, ask = self.quotes[symbol]
+            price = bid - self.slippage(symbol) if direction > 0 else ask + self.slippage(symbol)
+        trade.exit_time = timestamp
+        trade.exit_price = price
+        trade.exit_reason = reason
+        trade.pnl = direction * (price - trade.entry_price) * trade.volume * self.value_per_price(symbol)
+        self.balance += trade.pnl
+        self.day_realized += trade.pnl
+        self.trades.append(trade)
+        return trade
+
+    def check_exits(self, symbol: str, timestamp: pd.Timestamp, open_: float, high: float, low: float,
+                    spread: float) -> Optional[BacktestTrade]:
+        """Stop loss / take profit inside a bar (the stop first when both are reached)"""
+        trade = self.positions.get(symbol)
+        if trade is None:
+            return None
+        slippage = self.slippage(symbol)
+        if trade.direction == "BUY":
+            # Long positions close at the bid
+            if low <= trade.stop_loss:
+                return self.close_position(symbol, timestamp, min(open_, trade.stop_loss) - slippage, "stop_loss")
+            if high >= trade.take_profit:
+                return self.close_position(symbol, timestamp, max(open_, trade.take_profit), "take_profit")
+        else:
+            # Short positions close at the ask
+            if high + spread >= trade.stop_loss:
+                return self.close_position(symbol, timestamp, max(open_ + spread, trade.stop_loss) + slippage,
+                                           "stop_loss")
+            if low + spread <= trade.take_profit:
+                return self.close_position(symbol, timestamp, min(open_ + spread, trade.take_profit), "take_profit")
+        return None
+
+    def mark(self, symbol: str):
+        """Unrealized P&L of a symbol's position at the current quote"""
+        trade = self.positions.get(symbol)
+        if trade is not None:
+            bid, ask = self.quotes[symbol]
+            if trade.direction == "BUY":
+                self.unrealized[symbol] = (bid - trade.entry_price) * trade.volume * self.value_per_price(symbol)
+            else:
+                self.unrealized[symbol] = (trade.entry_price - ask) * trade.volume * self.value_per_price(symbol)
+
+    @property
+    def equity(self) -> float:
+        return self.balance + sum(self.unrealized.values())
+
+    def position_value(self, symbol: str, volume: float) -> float:
+        """Notional value of a position in account currency at the current quote"""
+        return volume * self.quotes[symbol][1] * self.value_per_price(symbol)
+
+    def total_exposure(self) -> float:
+        return sum(self.position_value(symbol, trade.volume) for symbol, trade in self.positions.items())
+
+    def margin(self) -> float:
+        return self.total_exposure() / self.leverage
+
+    def account_metrics(self, drawdown_percent: float) -> AccountMetrics:
+        """Account state in the risk manager's format"""
+        equity = self.equity
+        margin = self.margin()
+        return AccountMetrics(
+            balance=self.balance,
+            equity=equity,
+            free_margin=equity - margin,
+            margin_level=equity / margin * 100 if margin > 0 else 0.0,
+            daily_pnl=self.day_realized,
+            total_exposure=self.total_exposure(),
+            drawdown_percent=drawdown_percent,
+            open_positions=len(self.positions)
+        )
+
+
+class BacktestRiskManager(CoefficientBasedRiskManager):
+    """
+    Coefficient-based sizing and safety limits evaluated against a simulated venue
+
+    Only the MT5 data sources are replaced (account, quotes, open positions);
+    sizing rules, hard limits and the evaluation flow are the live ones.
+    """
+
+    def __init__(self, venue: SimulatedVenue, config_path: str = "risk_config.json"):
+        """
+        Initialize backtest risk manager
+
+        Args:
+            venue: Simulated venue providing account state and quotes
+            config_path: Legacy risk configuration (the unified config is preferred)
+        """
+        self.venue = venue
+        super().__init__(config_path)
+
+    def setup_logging(self) -> logging.Logger:
+        """Console errors only; rejections are counted in the result, not logged per order"""
+        logger = logging.getLogger("RiskManager.backtest")
+        logger.setLevel(logging.ERROR)
+        logger.propagate = False
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+            logger.addHandler(handler)
+        return logger
+
+    def update_account_metrics(self) -> bool:
+        equity = self.venue.equity
+        self.account_metrics = self.venue.account_metrics(self.calculate_drawdown_percent(equity))
+        return True
+
+    def get_sizing_inputs(self, symbol: str) -> Optional[Tuple[float, float]]:
+        if symbol not in self.venue.quotes or symbol not in self.venue.symbol_specs:
+            return None
+        return self.venue.spec(symbol)['contract_size'], self.venue.quotes[symbol][1]
+
+    def count_open_positions(self, symbol: str) -> int:
+        return int(symbol in self.venue.positions)
+
+    def calculate_risk_metrics(self, symbol: str, position_size: float) -> Dict:
+        position_value = self.venue.position_value(symbol, position_size)
+        bid, ask = self.venue.quotes[symbol]
+        return {
+            "symbol": symbol,
+            "position_size": position_size,
+            "current_price": ask,
+            "contract_size": self.venue.spec(symbol)['contract_size'],
+            "position_value": position_value,
+            "risk_percent_of_account": position_value / self.venue.balance * 100 if self.venue.balance > 0 else 0,
+            "asset_class": self.risk_config['position_coefficients'].get(symbol, {}).get('asset_class', 'unknown'),
+            "spread": ask - bid
+        }
+
+
+@dataclass
+class BacktestResult:
+    """Equity curve, trade log and rejected orders of a backtest run"""
+    equity_curve: pd.DataFrame
+    trades: pd.DataFrame
+    rejections: Dict[str, int] = field(default_factory=dict)
+    initial_balance: float = 0.0
+    bars: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> Dict:
+        """Headline performance figures"""
+        equity = self.equity_curve['equity']
+        final_balance = self.equity_curve['balance'].iloc[-1] if len(equity) else self.initial_balance
+        drawdown = (equity / equity.cummax() - 1).min() * 100 if len(equity) else 0.0
+        pnl = self.trades['pnl'] if len(self.trades) else pd.Series(dtype=float)
+        gross_profit = pnl[pnl > 0].sum()
+        gross_loss = -pnl[pnl < 0].sum()
+        return {
+            "initial_balance": self.initial_balance,
+            "final_balance": float(final_balance),
+            "total_return_percent": float((final_balance / self.initial_balance - 1) * 100),
+            "max_drawdown_percent": float(-drawdown),
+            "total_trades": int(len(pnl)),
+            "win_rate": float((pnl > 0).mean()) if len(pnl) else 0.0,
+            "profit_factor": float(gross_profit / gross_loss) if gross_loss > 0 else float('inf') if gross_profit > 0 else 0.0,
+            "rejected_orders": int(sum(self.rejections.values())),
+            "bars": self.bars,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "bars_per_second": round(self.bars / self.elapsed) if self.elapsed > 0 else 0
+        }
+
+    def save(self, output_dir: str = "backtest_results") -> str:
+        """Write equity_curve.csv, trades.csv and summary.json; returns the directory"""
+        os.makedirs(output_dir, exist_ok=True)
+        self.equity_curve.to_csv(os.path.join(output_dir, "equity_curve.csv"))
+        self.trades.to_csv(os.path.join(output_dir, "trades.csv"), index=False)
+        with open(os.path.join(output_dir, "summary.json"), 'w') as f:
+            json.dump({**self.summary(), "rejections": self.rejections}, f, indent=2)
+        return output_dir
+
+
+class EventDrivenBacktester:
+    """
+    Multi-symbol bar replay through a strategy, the risk rules and a simulated venue
+
+    Works with MultiTimeframeStrategy and its subclasses; strategies providing
+    calculate_enhanced_confluence_series (EnhancedMultiTimeframeStrategy) are
+    replayed with their enhanced signals.
+    """
+
+    def __init__(self, strategy: MultiTimeframeStrategy, config: BacktestConfig = None,
+                 risk_config_path: str = "risk_config.json",
+                 symbol_specs_path: str = "symbol_specifications.json"):
+        """
+        Initialize backtester
+
+        Args:
+            strategy: Strategy instance (its data cache is replaced by the replay)
+            config: Backtest settings
+            risk_config_path: Risk configuration passed to the risk manager
+            symbol_specs_path: Symbol specifications (contract size, tick value, point)
+        """
+        self.strategy = strategy
+        self.config = config or BacktestConfig()
+        self.risk_config_path = risk_config_path
+        with open(symbol_specs_path, 'r') as f:
+            self.symbol_specs = json.load(f).get('symbol_specifications', {})
+        self.venue = None
+        self.risk_manager = None
+
+    def _execute(self, symbol: str, direction: int, confidence: float, atr: float,
+                 timestamp: pd.Timestamp, rejections: Dict[str, int]):
+        """Fill an order decided at the previous bar's close at the current quote"""
+        venue = self.venue
+        position = venue.positions.get(symbol)
+        if position is not None:
+            if direction == (1 if position.direction == "BUY" else -1):
+                return
+            venue.close_position(symbol, timestamp, reason="signal")
+        if direction == 0:
+            return
+
+        decision = self.risk_manager.evaluate_trade_request(TradeRequest(
+            symbol=symbol, direction="BUY" if direction > 0 else "SELL",
+            strategy_id=self.config.strategy_id, confidence=confidence))
+        if decision.decision.value != "approved":
+            reason = (decision.rejection_reason or "rejected").split(" (")[0]
+            rejections[reason] = rejections.get(reason, 0) + 1
+            return
+        venue.open_position(symbol, direction, decision.approved_lot_size, timestamp,
+                            self.config.stop_loss_atr * atr, self.config.take_profit_atr * atr)
+
+    def run(self, symbols: List[str] = None, data: Dict[str, pd.DataFrame] = None) -> BacktestResult:
+        """
+        Replay the bars of several symbols
+
+        Args:
+            symbols: Symbols to replay (defaults to every symbol with data)
+            data: Symbol -> M1 OHLCV DataFrame (loaded from DATA_SOURCES when omitted)
+
+        Returns:
+            BacktestResult with equity curve, trade log and rejections
+        """
+        started = time.perf_counter()
+        if data is None:
+            symbols = symbols or available_symbols()
+            data = {symbol: load_symbol_bars(symbol) for symbol in symbols}
+        else:
+            symbols = symbols or list(data)
+            data = {symbol: data[symbol] for symbol in symbols}
+
+        config = self.config
+        self.venue = venue = SimulatedVenue(self.symbol_specs, config.initial_balance,
+                                            config.leverage, config.slippage_points)
+        self.risk_manager = BacktestRiskManager(venue, self.risk_config_path)
+        for symbol in symbols:
+            self.strategy.data_cache.pop(symbol, None)
+            self.strategy.resamplers.pop(symbol, None)
+
+        first = min(df.index[0] for df in data.values())
+        last = max(df.index[-1] for df in data.values())
+        trading_start = first + pd.Timedelta(config.warmup)
+        boundaries = [first] + list(pd.date_range(trading_start, last, freq=config.block))
+        boundaries = sorted(set(boundaries)) + [last + BAR_DURATION]
+
+        last_direction = {symbol: 0 for symbol in symbols}
+        pending: Dict[str, Tuple] = {}
+        rejections: Dict[str, int] = {}
+        curve_times, curve_balance, curve_equity, curve_positions = [], [], [], []
+        bars = 0
+
+        print(f"🔄 Backtesting {len(symbols)} symbols from {trading_start} to {last}")
+        for block_start, block_end in zip(boundaries[:-1], boundaries[1:]):
+            trading = block_start >= trading_start
+            streams = []
+            for symbol in symbols:
+                df = data[symbol]
+                start, end = df.index.searchsorted([block_start, block_end])
+                if start == end:
+                    continue
+                block = df.iloc[start:end]
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if symbol in self.strategy.resamplers:
+                        self.strategy.append_bars(symbol, block)
+                    else:
+                        self.strategy.load_frame(symbol, block)
+                    if not trading:
+                        continue
+                    direction, confidence, atr = bar_signals(self.strategy, symbol, block.index,
+                                                             config.stop_timeframe)
+                streams.append((symbol, block.index, block['open'].to_numpy(dtype=float),
+                                block['high'].to_numpy(dtype=float), block['low'].to_numpy(dtype=float),
+                                block['close'].to_numpy(dtype=float), block['spread'].to_numpy(dtype=float),
+                                direction, confidence, atr))
+            if not streams:
+                continue
+
+            # Merge the symbols' bars of the block in timestamp order
+            times = np.concatenate([stream[1].asi8 for stream in streams])
+            owners = np.concatenate([np.full(len(stream[1]), i) for i, stream in enumerate(streams)])
+            rows = np.concatenate([np.arange(len(stream[1])) for stream in streams])
+            order = np.argsort(times, kind='stable')
+            columns = [tuple(column.tolist() if isinstance(column, np.ndarray) else column
+                             for column in stream[2:]) for stream in streams]
+
+            current = None
+            for position in order:
+                stream = streams[owners[position]]
+                symbol, index = stream[0], stream[1]
+                opens, highs, lows, closes, spreads, directions, confidences, atrs = columns[owners[position]]
+                row = rows[position]
+                timestamp = index[row]
+
+                if timestamp != current:
+                    if current is not None:
+                        curve_times.append(current + BAR_DURATION)
+                        curve_balance.append(venue.balance)
+                        curve_equity.append(venue.equity)
+                        curve_positions.append(len(venue.positions))
+                    current = timestamp
+                    venue.start_day(timestamp)
+                bars += 1
+
+                # 1. Orders decided at the previous close fill at this open
+                venue.set_quote(symbol, opens[row], spreads[row])
+                order_ = pending.pop(symbol, None)
+                if order_ is not None:
+                    self._execute(symbol, *order_, timestamp, rejections)
+
+                # 2. Stops and targets inside the bar, then mark to the close
+                venue.check_exits(symbol, timestamp, opens[row], highs[row], lows[row], spreads[row])
+                venue.set_quote(symbol, closes[row], spreads[row])
+                venue.mark(symbol)
+
+                # 3. Signal changes at the close queue an order for the next bar
+                direction = directions[row]
+                if direction != last_direction[symbol]:
+                    last_direction[symbol] = direction
+                    if direction != 0 or (config.close_on_hold and symbol in venue.positions):
+                        pending[symbol] = (direction, confidences[row], atrs[row])
+
+            curve_times.append(current + BAR_DURATION)
+            curve_balance.append(venue.balance)
+            curve_equity.append(venue.equity)
+            curve_positions.append(len(venue.positions))
+
+        # Close what is still open at the last close
+        for symbol in list(venue.positions):
+            venue.close_position(symbol, data[symbol].index[-1] + BAR_DURATION, reason="end_of_data")
+        if curve_times:
+            curve_balance[-1] = curve_equity[-1] = venue.balance
+            curve_positions[-1] = 0
+
+        equity_curve = pd.DataFrame({'balance': curve_balance, 'equity': curve_equity,
+                                     'open_positions': curve_positions},
+                                    index=pd.DatetimeIndex(curve_times, name='time'))
+        trades = pd.DataFrame([asdict(trade) for trade in venue.trades],
+                              columns=list(BacktestTrade.__dataclass_fields__))
+        result = BacktestResult(equity_curve, trades, rejections, config.initial_balance, bars,
+                                time.perf_counter() - started)
+        print(f"✅ Backtest complete: {bars:,} bars, {len(trades)} trades in {result.elapsed:.1f}s")
+        return result
+
+
+def main():
+    """Backtest the multi-timeframe strategy on the stored M1 data"""
+    parser = argparse.ArgumentParser(description="Event-driven multi-symbol backtest")
+    parser.add_argument("--symbols", nargs="*", help="Symbols to replay (default: all with data)")
+    parser.add_argument("--enhanced", action="store_true", help="Use EnhancedMultiTimeframeStrategy")
+    parser.add_argument("--config", default="GEN_unified_config.json", help="Strategy configuration")
+    parser.add_argument("--output", default="backtest_results", help="Directory for the results")
+    args = parser.parse_args()
+
+    print("🚀 EVENT-DRIVEN BACKTEST")
+    print("=" * 60)
+    if args.enhanced:
+        from GEN_enhanced_multi_timeframe_strategy import EnhancedMultiTimeframeStrategy
+        strategy = EnhancedMultiTimeframeStrategy(args.config)
+    else:
+        strategy = MultiTimeframeStrategy(args.config)
+
+    result = EventDrivenBacktester(strategy).run(args.symbols)
+    print("\n📊 SUMMARY")
+    for key, value in result.summary().items():
+        print(f"   {key}: {value}")
+    if result.rejections:
+        print("\n⚠️  Rejected orders:")
+        for reason, count in result.rejections.items():
+            print(f"   {reason}: {count}")
+    print(f"\n💾 Results saved to {result.save(args.output)}/")
+
+
+if __name__ == "__main__":
+    main()
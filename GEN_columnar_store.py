@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Columnar Market Data Store
+==========================
+
+Binary column files next to the bar CSVs, with one loader shared by every
+entry point that reads bars (strategy load_data, backtesters, data quality
+controller, gap filler and the gap/validation scripts).
+
+Layout: GEN_BTCUSD_M1_1month.csv gets a sibling directory
+GEN_BTCUSD_M1_1month.columns/ holding one .npy file per column (the time
+column as int64 nanoseconds since the epoch) and meta.json with the row
+count, column order and the size/mtime of the CSV it was converted from.
+
+The loader memory-maps only the requested columns (copy-on-write, so frames
+are writable without touching the files) and builds the DataFrame without
+copying them; the CSV is parsed only when its store is missing or older
+than the CSV, and the store is then (re)written so the next load is fast.
+A store whose CSV has been removed is still served.
+
+DATA_SOURCES lists where the M1 bar files of a symbol live (gap-filled
+first); find_data_file/load_symbol_bars resolve a symbol through it.
+
+Usage:
+    python GEN_columnar_store.py CSVdata/raw CSVdata/fixed     # one-shot conversion
+    df = load_bars("CSVdata/raw/GEN_BTCUSD_M1_1month.csv")    # indexed by time
+    closes = load_bars(path, columns=["close"])
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+STORE_SUFFIX = ".columns"
+STORE_VERSION = 1
+META_FILE = "meta.json"
+
+# Columns parsed as timestamps (the first one present becomes the index)
+TIME_COLUMNS = ('time', 'datetime')
+
+# Data directories and file names, in order of preference (gap-filled first)
+DATA_SOURCES = (
+    ("CSVdata/fixed", "GEN_{symbol}_M1_1month_fixed.csv"),
+    ("CSVdata/raw", "GEN_{symbol}_M1_1month.csv"),
+)
+
+
+def store_path(csv_path: str) -> str:
+    """Column store directory of a CSV file"""
+    return os.path.splitext(csv_path)[0] + STORE_SUFFIX
+
+
+def _source_stamp(csv_path: str) -> Optional[Dict]:
+    if not os.path.exists(csv_path):
+        return None
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _read_meta(store: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(store, META_FILE), 'r') as f:
+            meta = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return meta if meta.get('version') == STORE_VERSION else None
+
+
+def is_fresh(csv_path: str) -> bool:
+    """Whether the column store exists and matches the CSV (or the CSV is gone)"""
+    meta = _read_meta(store_path(csv_path))
+    if meta is None:
+        return False
+    stamp = _source_stamp(csv_path)
+    return stamp is None or stamp == meta['source']
+
+
+def bars_exist(csv_path: str) -> bool:
+    """Whether bars can be loaded from the CSV path (CSV or column store)"""
+    return os.path.exists(csv_path) or _read_meta(store_path(csv_path)) is not None
+
+
+def write_store(df: pd.DataFrame, csv_path: str) -> str:
+    """
+    Write the column store of a CSV file from its DataFrame
+
+    Call after writing the CSV so the store is recorded as matching it.
+
+    Args:
+        df: Bars with a time column (or indexed by time) and numeric columns
+        csv_path: CSV file the store belongs to
+
+    Returns:
+        Store directory
+    """
+    if isinstance(df.index, pd.DatetimeIndex):
+        df = df.reset_index()
+    store = store_path(csv_path)
+    staging = f"{store}.tmp-{os.getpid()}"
+    os.makedirs(staging, exist_ok=True)
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        if name in TIME_COLUMNS:
+            array = pd.to_datetime(values).to_numpy(dtype='datetime64[ns]').view(np.int64)
+            kind = 'time'
+        elif pd.api.types.is_numeric_dtype(values):
+            array = values.to_numpy()
+            kind = 'value'
+        else:
+            shutil.rmtree(staging)
+            raise ValueError(f"Column '{name}' of {csv_path} is not numeric")
+        np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(array))
+        columns[name] = kind
+
+    with open(os.path.join(staging, META_FILE), 'w') as f:
+        json.dump({'version': STORE_VERSION, 'rows': len(df), 'columns': columns,
+                   'source': _source_stamp(csv_path)}, f, indent=2)
+    if os.path.exists(store):
+        shutil.rmtree(store)
+    os.replace(staging, store)
+    return store
+
+
+def convert_csv(csv_path: str, force: bool = False) -> str:
+    """
+    Convert a CSV file to its column store (skipped when the store is fresh)
+
+    Args:
+        csv_path: Bar CSV file
+        force: Rewrite a fresh store
+
+    Returns:
+        Store directory
+    """
+    if force or not is_fresh(csv_path):
+        write_store(pd.read_csv(csv_path), csv_path)
+    return store_path(csv_path)
+
+
+def convert_directory(directory: str, force: bool = False) -> Dict[str, str]:
+    """
+    Convert every CSV file of a directory
+
+    Args:
+        directory: Directory with bar CSV files
+        force: Rewrite fresh stores
+
+    Returns:
+        CSV path -> "converted", "fresh" or the error message
+    """
+    results = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.csv'):
+            continue
+        path = os.path.join(directory, name)
+        fresh = not force and is_fresh(path)
+        try:
+            convert_csv(path, force)
+            results[path] = "fresh" if fresh else "converted"
+        except (OSError, ValueError, pd.errors.ParserError) as e:
+            results[path] = str(e)
+    return results
+
+
+def _frame_from_csv(csv_path: str, columns: List[str], index: bool) -> pd.DataFrame:
+    df = pd.read_csv(csv_path)
+    time_column = next((name for name in TIME_COLUMNS if name in df.columns), None)
+    if time_column:
+        df[time_column] = pd.to_datetime(df[time_column])
+    if columns is not None:
+        df = df[[name for name in df.columns if name == time_column or name in columns]]
+    return df.set_index(time_column) if index and time_column else df
+
+
+def _frame_from_store(store: str, meta: Dict, columns: List[str], index: bool) -> pd.DataFrame:
+    time_column = next((name for name, kind in meta['columns'].items() if kind == 'time'), None)
+    arrays = {}
+    for name in meta['columns']:
+        if name == time_column or columns is None or name in columns:
+            array = np.asarray(np.load(os.path.join(store, f"{name}.npy"), mmap_mode='c'))
+            arrays[name] = array.view('datetime64[ns]') if name == time_column else array
+    missing = [name for name in (columns or []) if name not in arrays]
+    if missing:
+        raise KeyError(f"Columns {missing} not in {store}")
+
+    if index and time_column:
+        times = pd.DatetimeIndex(arrays.pop(time_column), name=time_column, copy=False)
+        return pd.DataFrame(arrays, index=times, copy=False)
+    return pd.DataFrame(arrays, copy=False)
+
+
+def load_bars(csv_path: str, columns: List[str] = None, index: bool = True,
+              refresh: bool = True) -> pd.DataFrame:
+    """
+    Load bars of a CSV file, from its column store where possible
+
+    Args:
+        csv_path: Bar CSV file (its store may exist without it)
+        columns: Columns to load besides the time column (None for all)
+        index: Index the frame by the time column; otherwise keep it as a column
+        refresh: Write the store when it is missing or stale (skipped if the
+                 directory is not writable)
+
+    Returns:
+        DataFrame with parsed timestamps
+    """
+    store = store_path(csv_path)
+    if not is_fresh(csv_path):
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"Data file not found: {csv_path}")
+        if not refresh:
+            return _frame_from_csv(csv_path, columns, index)
+        try:
+            df = pd.read_csv(csv_path)
+            write_store(df, csv_path)
+        except (OSError, ValueError):
+            return _frame_from_csv(csv_path, columns, index)
+    return _frame_from_store(store, _read_meta(store), columns, index)
+
+
+def find_data_file(symbol: str, sources=DATA_SOURCES) -> Optional[str]:
+    """Path of the preferred M1 data file of a symbol (None when there is none)"""
+    for directory, pattern in sources:
+        path = os.path.join(directory, pattern.format(symbol=symbol))
+        if bars_exist(path):
+            return path
+    return None
+
+
+def available_symbols(sources=DATA_SOURCES) -> List[str]:
+    """Symbols with an M1 data file (or its column store) in any of the sources"""
+    symbols = set()
+    for directory, pattern in sources:
+        prefix, suffix = pattern.split("{symbol}")
+        stored = os.path.splitext(suffix)[0] + STORE_SUFFIX
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                for ending in (suffix, stored):
+                    if name.startswith(prefix) and name.endswith(ending):
+                        symbols.add(name[len(prefix):-len(ending)])
+    return sorted(symbols)
+
+
+def load_symbol_bars(symbol: str, sources=DATA_SOURCES) -> pd.DataFrame:
+    """M1 OHLCV bars of a symbol indexed by time"""
+    path = find_data_file(symbol, sources)
+    if path is None:
+        raise ValueError(f"No M1 data file for {symbol}")
+    return load_bars(path)
+
+
+def main():
+    """Convert the bar CSV files of the given directories to column stores"""
+    parser = argparse.ArgumentParser(description="Convert bar CSV files to columnar stores")
+    parser.add_argument("directories", nargs="*", default=["CSVdata/raw", "CSVdata/fixed"],
+                        help="Directories with bar CSV files")
+    parser.add_argument("--force", action="store_true", help="Rewrite stores that are up to date")
+    args = parser.parse_args()
+
+    print("🚀 COLUMNAR STORE CONVERSION")
+    print("=" * 60)
+    start = time.perf_counter()
+    counts = {"converted": 0, "fresh": 0, "failed": 0}
+    for directory in args.directories:
+        if not os.path.isdir(directory):
+            print(f"⚠️  Directory not found: {directory}")
+            continue
+        for path, status in convert_directory(directory, args.force).items():
+            if status in counts:
+                counts[status] += 1
+                if status == "converted":
+                    print(f"   ✅ {path}")
+            else:
+                counts["failed"] += 1
+                print(f"   ❌ {path}: {status}")
+    print(f"\n📊 {counts['converted']} converted, {counts['fresh']} up to date, {counts['failed']} failed "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
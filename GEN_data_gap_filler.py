@@ -16,12 +16,16 @@ Version: 1.0
 
 import pandas as pd
 import numpy as np
+import json
 import os
 from datetime import datetime, timedelta
 from typing import Literal, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+from GEN_columnar_store import load_bars, write_store
+from GEN_partitioned_store import LAKE_DIR, changed_partitions, datasets, load_manifest, partition_path
+
 class DataGapFiller:
     """Comprehensive data gap filling for MT5 minute bar data"""
     
@@ -245,6 +249,20 @@ class DataGapFiller:
         
         return df
     
+    def apply_strategy(self, df: pd.DataFrame,
+                       strategy: Literal["forward_fill", "linear", "flat", "smart"]) -> pd.DataFrame:
+        """Fill gaps with the selected strategy"""
+        if strategy == "forward_fill":
+            return self.fill_gaps_forward_fill(df)
+        elif strategy == "linear":
+            return self.fill_gaps_linear_interpolation(df)
+        elif strategy == "flat":
+            return self.fill_gaps_flat_interpolation(df)
+        elif strategy == "smart":
+            return self.fill_gaps_smart_interpolation(df)
+        else:
+            raise ValueError(f"Unknown strategy: {strategy}")
+    
     def process_file(self, symbol: str, 
                     strategy: Literal["forward_fill", "linear", "flat", "smart"] = "smart",
                     backup_original: bool = True) -> bool:
@@ -260,7 +278,7 @@ class DataGapFiller:
         try:
             # Load data
             print(f"📊 Processing {symbol}...")
-            df = pd.read_csv(input_file)
+            df = load_bars(input_file, index=False)
             original_count = len(df)
             
             # Detect gaps before filling
@@ -274,22 +292,14 @@ class DataGapFiller:
             print(f"   🔍 Found {gap_count} gaps to fill")
             
             # Apply selected strategy
-            if strategy == "forward_fill":
-                df_fixed = self.fill_gaps_forward_fill(df)
-            elif strategy == "linear":
-                df_fixed = self.fill_gaps_linear_interpolation(df)
-            elif strategy == "flat":
-                df_fixed = self.fill_gaps_flat_interpolation(df)
-            elif strategy == "smart":
-                df_fixed = self.fill_gaps_smart_interpolation(df)
-            else:
-                raise ValueError(f"Unknown strategy: {strategy}")
+            df_fixed = self.apply_strategy(df, strategy)
             
             # Calculate filled bars
             bars_added = len(df_fixed) - original_count
             
             # Save fixed data
             df_fixed.to_csv(output_file, index=False)
+            write_store(df_fixed, output_file)
             
             # Update stats
             self.fill_stats["files_processed"] += 1
@@ -357,6 +367,79 @@ class DataGapFiller:
         
         return results
     
+    def process_lake(self, lake_dir: str = LAKE_DIR, timeframe: str = "M1",
+                     strategy: Literal["forward_fill", "linear", "flat", "smart"] = "smart",
+                     state_file: str = "_gap_state.json") -> dict:
+        """
+        Fill gaps in the month partitions of the partitioned store, skipping unchanged ones
+        
+        Fixed partitions mirror the store layout under fixed/lake; a state file
+        there records the checksum each partition had when it was processed
+        (and the strategy used), so only new or changed partitions are filled again.
+        
+        Args:
+            lake_dir: Partitioned store root
+            timeframe: Timeframe to process
+            strategy: Gap filling strategy
+            state_file: State file name inside the fixed store
+        
+        Returns:
+            "SYMBOL YYYY/MM" -> bars added, for the partitions processed in this run
+        """
+        fixed_root = os.path.join(self.fixed_dir, "lake")
+        state_path = os.path.join(fixed_root, state_file)
+        os.makedirs(fixed_root, exist_ok=True)
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {}
+        
+        print(f"🔧 DATA GAP FILLER (partitioned store)")
+        print(f"=" * 60)
+        
+        results = {}
+        skipped = 0
+        for symbol, dataset_timeframe in datasets(lake_dir):
+            if dataset_timeframe != timeframe:
+                continue
+            manifest = load_manifest(lake_dir, symbol, timeframe)
+            dataset = f"{symbol}/{timeframe}"
+            recorded = state.setdefault(dataset, {})
+            # A different strategy invalidates earlier results
+            processed = {key: entry['checksum'] for key, entry in recorded.items()
+                         if entry['strategy'] == strategy}
+            changed = changed_partitions(manifest, processed)
+            skipped += len(manifest['partitions']) - len(changed)
+            
+            for key in changed:
+                year, month = key.split('/')
+                df = load_bars(partition_path(lake_dir, symbol, timeframe, int(year), int(month)), index=False)
+                gap_count = len(self.detect_gaps(df))
+                df_fixed = self.apply_strategy(df, strategy) if gap_count else df
+                
+                output_file = partition_path(fixed_root, symbol, timeframe, int(year), int(month))
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                df_fixed.to_csv(output_file, index=False)
+                write_store(df_fixed, output_file)
+                
+                bars_added = len(df_fixed) - len(df)
+                recorded[key] = {'checksum': manifest['partitions'][key]['checksum'], 'strategy': strategy,
+                                 'gaps': gap_count, 'bars_added': bars_added}
+                results[f"{symbol} {key}"] = bars_added
+                self.fill_stats["files_processed"] += 1
+                self.fill_stats["total_gaps_filled"] += bars_added
+                print(f"   ✅ {symbol} {key}: {gap_count} gaps, added {bars_added} bars")
+        
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, state_path)
+        
+        print(f"📊 {len(results)} partitions processed, {skipped} unchanged (skipped)")
+        print(f"💾 Fixed partitions saved to: {fixed_root}")
+        return results
+    
     def compare_before_after(self, symbol: str) -> None:
         """Compare original vs fixed data for a symbol"""
         original_file = os.path.join(self.raw_dir, f"GEN_{symbol}_M1_1month.csv")
@@ -366,8 +449,8 @@ class DataGapFiller:
             print(f"❌ Cannot compare {symbol} - files missing")
             return
         
-        df_orig = pd.read_csv(original_file)
-        df_fixed = pd.read_csv(fixed_file)
+        df_orig = load_bars(original_file, index=False)
+        df_fixed = load_bars(fixed_file, index=False)
         
         # Detect gaps in original
         gaps_orig = self.detect_gaps(df_orig)
@@ -22,6 +22,7 @@ Version: 2.0
 
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
 import json
@@ -34,7 +35,18 @@ from GEN_multi_timeframe_strategy import (
     MultiTimeframeStrategy, ConfluentSignal, TimeFrame, 
     MarketDirection, SignalStrength, TimeframeSignal
 )
-from GEN_advanced_technical_indicators import AdvancedTechnicalIndicators
+from GEN_advanced_technical_indicators import AdvancedTechnicalIndicators, IndicatorBuffer, PathStateTracker
+from GEN_batch_indicator_engine import BatchIndicatorEngine, SymbolPanel
+from GEN_indicator_frame_cache import IndicatorFrameCache
+
+
+@dataclass(frozen=True)
+class IndicatorPlan:
+    """Basic + advanced indicator pipeline compiled from one indicator configuration"""
+    basic: Dict[str, float]              # resolved basic indicator parameters
+    advanced: Optional[Dict[str, Dict]]  # advanced indicator parameters without weights (None if disabled)
+    output_mode: str                     # 'frame' or 'block'
+
 
 class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
     """
@@ -48,18 +60,30 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
         """Initialize enhanced multi-timeframe strategy"""
         super().__init__(config_path)
         
-        # Initialize advanced indicators library
-        self.advanced_indicators = AdvancedTechnicalIndicators()
-        
         # Enhanced indicator configuration
         self.enhanced_config = self.config.get("enhanced_indicators", self._get_enhanced_default_config())
         
+        # Initialize advanced indicators library (output layout from technical_analysis.advanced_indicators)
+        self.advanced_indicators = AdvancedTechnicalIndicators.from_config(
+            self.config,
+            backend=self.enhanced_config.get("backend", "numpy"),
+            feature_cache=self.feature_cache
+        )
+        
+        # Compiled indicator plans by configuration hash
+        self._indicator_plans: Dict[str, IndicatorPlan] = {}
+        self._batch_engines: Dict[str, BatchIndicatorEngine] = {}
+        
+        # Full-history SAR and ADX state continuing truncated windows
+        self.path_states = PathStateTracker()
+        
         print("🚀 Enhanced Multi-Timeframe Strategy with Advanced Indicators initialized")
     
     def _get_enhanced_default_config(self) -> Dict:
         """Get enhanced default configuration for advanced indicators"""
         return {
             "enabled": True,
+            "backend": "numpy",
             "momentum_weight": 0.25,
             "trend_weight": 0.35,
             "volatility_weight": 0.20,
@@ -80,29 +104,105 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             }
         }
     
+    def indicator_lookahead(self) -> int:
+        """Trailing bars whose indicator values depend on later bars (Ichimoku Chikou span)"""
+        if not self.enhanced_config.get("enabled", True):
+            return 0
+        return AdvancedTechnicalIndicators.required_lookahead(self.enhanced_config.get("indicators", {}))
+    
+    def indicator_settings(self) -> Dict:
+        """Basic and advanced indicator parameters the calculated frames depend on"""
+        return {**super().indicator_settings(), "enhanced": self.enhanced_config}
+    
+    def indicator_lookback(self) -> int:
+        """
+        Bars of history needed for stable last-bar values of basic and advanced indicators
+        
+        Returns:
+            Number of trailing bars
+        """
+        lookback = super().indicator_lookback()
+        if self.enhanced_config.get("enabled", True):
+            lookback = max(lookback, AdvancedTechnicalIndicators.required_lookback(
+                self.enhanced_config.get("indicators", {})))
+        return lookback
+    
+    def indicator_plan(self) -> IndicatorPlan:
+        """
+        Indicator pipeline for the current configuration
+        
+        Parameters are resolved and weights stripped once per configuration;
+        the plan is recompiled only when the indicator settings change.
+        
+        Returns:
+            Compiled IndicatorPlan
+        """
+        key = IndicatorFrameCache.config_hash(self.indicator_settings(), self.advanced_indicators.output_mode)
+        plan = self._indicator_plans.get(key)
+        if plan is None:
+            advanced = None
+            if self.enhanced_config.get("enabled", True):
+                # Filter out weight parameters from indicator configs
+                advanced = {indicator: {k: v for k, v in params.items() if k != 'weight'}
+                            for indicator, params in self.enhanced_config.get("indicators", {}).items()}
+            
+            # Signal generation needs the basic columns too, so the output is always a full frame
+            plan = IndicatorPlan(
+                basic=self.basic_indicator_parameters(),
+                advanced=advanced,
+                output_mode='block' if advanced is not None and self.advanced_indicators.output_mode == 'block' else 'frame'
+            )
+            self._indicator_plans[key] = plan
+        return plan
+    
+    def _resume_path_columns(self, symbol: str, timeframe: TimeFrame, data: pd.DataFrame,
+                             frame: pd.DataFrame, start: int) -> pd.DataFrame:
+        """Continue the SAR and ADX columns of a window from the full-history state (see PathStateTracker)"""
+        plan = self.indicator_plan()
+        if plan.advanced is None:
+            return frame
+        return self.path_states.resume((symbol, timeframe), data, frame, plan.advanced, start)
+    
+    def enhanced_batch_engine(self) -> BatchIndicatorEngine:
+        """
+        Batch engine for the basic and advanced indicators of the current configuration
+        
+        Returns:
+            BatchIndicatorEngine built from the indicator plan (one per configuration)
+        """
+        key = IndicatorFrameCache.config_hash(self.indicator_settings())
+        engine = self._batch_engines.get(key)
+        if engine is None:
+            plan = self.indicator_plan()
+            engine = BatchIndicatorEngine(plan.basic, advanced_config=plan.advanced)
+            self._batch_engines[key] = engine
+        return engine
+    
     def calculate_enhanced_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate enhanced technical indicators including basic + advanced
         
+        Basic and advanced indicators are written into one columnar buffer and
+        share intermediates (true range, EMAs, typical price, rolling windows),
+        so the input is materialized into a single output frame.
+        
         Args:
             data: DataFrame with OHLC data
             
         Returns:
             DataFrame with all technical indicators
         """
-        # Start with basic indicators from parent class
-        df = self.calculate_technical_indicators(data)
+        plan = self.indicator_plan()
         
-        # Add advanced indicators
-        if self.enhanced_config.get("enabled", True):
-            # Filter out weight parameters from indicator configs
-            filtered_config = {}
-            for indicator, params in self.enhanced_config.get("indicators", {}).items():
-                filtered_config[indicator] = {k: v for k, v in params.items() if k != 'weight'}
-            
-            df = self.advanced_indicators.calculate_all_indicators(df, filtered_config)
+        with self.feature_cache.frame(data):
+            df = IndicatorBuffer(data)
+            self._add_basic_indicators(df, plan.basic)
+            if plan.advanced is not None:
+                self.advanced_indicators.add_all_indicators(df, plan.advanced)
         
-        return df
+        if plan.output_mode == 'block':
+            return df.to_block(dtype=self.advanced_indicators.block_dtype)
+        return df.to_frame()
     
     def generate_enhanced_timeframe_signal(self, symbol: str, timeframe: TimeFrame, 
                                          current_time: datetime = None) -> TimeframeSignal:
@@ -126,18 +226,59 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
         # Get data for this timeframe
         data = self.data_cache[symbol][timeframe]
         
-        # Calculate enhanced indicators
-        df = self.calculate_enhanced_technical_indicators(data)
+        # Calculate enhanced indicators (cached; latest bar only needs the warm-up tail)
+        df = self._calculate_indicator_frame(symbol, timeframe, data, self.calculate_enhanced_technical_indicators,
+                                             latest_only=current_time is None)
         
         # Get latest values (or at specific time if provided)
         if current_time:
-            idx = df.index.get_indexer([current_time], method='nearest')[0]
-            latest = df.iloc[idx]
-            signal_time = df.index[idx]
+            latest, signal_time = self._bar_at(symbol, timeframe, df, current_time)
         else:
             latest = df.iloc[-1]
             signal_time = df.index[-1]
         
+        return self._enhanced_signal_from_row(timeframe, latest, signal_time)
+    
+    def generate_enhanced_timeframe_signals_batch(self, symbols: List[str],
+                                                  timeframe: TimeFrame) -> Dict[str, TimeframeSignal]:
+        """
+        Generate latest-bar enhanced signals for many symbols in one batched indicator pass
+        
+        Basic and advanced indicators of all symbols are computed together by
+        the batch engine. In 'tail' mode the panel holds the trailing
+        indicator_lookback() bars, the SAR and ADX values are continued from
+        the full-history state and symbols in tail_fallbacks are evaluated
+        per symbol over their full history instead.
+        
+        Args:
+            symbols: Symbols with data in the cache
+            timeframe: Timeframe to evaluate
+            
+        Returns:
+            Symbol -> TimeframeSignal (symbols without data for the timeframe are omitted)
+        """
+        available = [symbol for symbol in symbols if timeframe in self.data_cache.get(symbol, {})]
+        fallbacks = [symbol for symbol in available if (symbol, timeframe) in self.tail_fallbacks]
+        frames = {symbol: self.data_cache[symbol][timeframe] for symbol in available if symbol not in fallbacks}
+        max_bars = self.indicator_lookback() if self.evaluation_mode == 'tail' else None
+        panel = SymbolPanel.from_frames(frames, max_bars=max_bars)
+        plan = self.indicator_plan()
+        summaries = self.enhanced_batch_engine().analyze_panel(panel, include_advanced=plan.advanced is not None)
+        if max_bars is not None and plan.advanced is not None:
+            for symbol, summary in summaries.items():
+                if len(frames[symbol]) > max_bars:
+                    values = self.path_states.continue_columns((symbol, timeframe), frames[symbol], plan.advanced,
+                                                               len(frames[symbol]) - 1)
+                    summary.update({column: column_values[-1] for column, column_values in values.items()})
+        
+        signals = {symbol: self._enhanced_signal_from_row(timeframe, summary, summary['time'])
+                   for symbol, summary in summaries.items()}
+        for symbol in fallbacks:
+            signals[symbol] = self.generate_enhanced_timeframe_signal(symbol, timeframe)
+        return {symbol: signals[symbol] for symbol in available}
+    
+    def _enhanced_signal_from_row(self, timeframe: TimeFrame, latest, signal_time) -> TimeframeSignal:
+        """Build an enhanced timeframe signal from one bar of indicator values (row or summary dict)"""
         # Enhanced signal generation with weighted scoring
         signals = []
         indicators = {}
@@ -190,7 +331,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
         if self.enhanced_config.get("enabled", True):
             
             # Stochastic Oscillator
-            if 'stoch_k' in df.columns:
+            if 'stoch_k' in latest:
                 stoch_signal = latest.get('stoch_signal', 0)
                 stoch_crossover = latest.get('stoch_crossover', 0)
                 
@@ -208,7 +349,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['stoch_signal'] = combined_stoch
             
             # Williams %R
-            if 'williams_r' in df.columns:
+            if 'williams_r' in latest:
                 williams_signal = latest.get('williams_r_signal', 0)
                 signals.append(williams_signal)
                 signal_weights.append(self.enhanced_config["indicators"]["williams_r"]["weight"])
@@ -216,7 +357,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['williams_r_signal'] = williams_signal
             
             # CCI
-            if 'cci' in df.columns:
+            if 'cci' in latest:
                 cci_signal = latest.get('cci_signal', 0)
                 signals.append(cci_signal)
                 signal_weights.append(self.enhanced_config["indicators"]["cci"]["weight"])
@@ -224,7 +365,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['cci_signal'] = cci_signal
             
             # Rate of Change
-            if 'roc' in df.columns:
+            if 'roc' in latest:
                 roc_signal = latest.get('roc_signal', 0)
                 # Apply threshold to ROC for stronger signals
                 roc_value = latest['roc']
@@ -244,7 +385,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             # ========================================
             
             # ADX - Trend Strength
-            if 'adx' in df.columns:
+            if 'adx' in latest:
                 adx_signal = latest.get('adx_signal', 0)
                 # Enhance ADX signal with trend strength
                 adx_value = latest['adx']
@@ -271,7 +412,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['adx_signal'] = enhanced_adx_signal
             
             # Ichimoku Cloud
-            if 'ichimoku_tenkan' in df.columns:
+            if 'ichimoku_tenkan' in latest:
                 ichimoku_signal = latest.get('ichimoku_signal', 0)
                 
                 # Enhanced Ichimoku analysis
@@ -309,7 +450,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['ichimoku_signal'] = enhanced_ichimoku_signal
             
             # Parabolic SAR
-            if 'psar' in df.columns:
+            if 'psar' in latest:
                 psar_signal = latest.get('psar_signal', 0)
                 psar_value = latest['psar']
                 price = latest['close']
@@ -334,7 +475,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             # ========================================
             
             # Keltner Channels
-            if 'keltner_upper' in df.columns:
+            if 'keltner_upper' in latest:
                 keltner_signal = latest.get('keltner_signal', 0)
                 keltner_position = latest.get('keltner_position', 0.5)
                 
@@ -355,7 +496,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['keltner_signal'] = enhanced_keltner_signal
             
             # Donchian Channels
-            if 'donchian_upper' in df.columns:
+            if 'donchian_upper' in latest:
                 donchian_signal = latest.get('donchian_signal', 0)
                 donchian_position = latest.get('donchian_position', 0.5)
                 
@@ -376,7 +517,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             # ========================================
             
             # Money Flow Index
-            if 'mfi' in df.columns:
+            if 'mfi' in latest:
                 mfi_signal = latest.get('mfi_signal', 0)
                 mfi_value = latest['mfi']
                 
@@ -397,7 +538,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
                 indicators['mfi_signal'] = enhanced_mfi_signal
             
             # Chaikin Money Flow
-            if 'cmf' in df.columns:
+            if 'cmf' in latest:
                 cmf_signal = latest.get('cmf_signal', 0)
                 cmf_value = latest['cmf']
                 
@@ -422,7 +563,7 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             # ========================================
             
             # Fisher Transform
-            if 'fisher_transform' in df.columns:
+            if 'fisher_transform' in latest:
                 fisher_signal = latest.get('fisher_signal', 0)
                 fisher_value = latest['fisher_transform']
                 
@@ -505,6 +646,237 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             price=latest['close']
         )
     
+    def generate_enhanced_timeframe_signal_series(self, symbol: str, timeframe: TimeFrame) -> pd.DataFrame:
+        """
+        Enhanced timeframe signal of every bar, vectorized
+        
+        Row i holds what generate_enhanced_timeframe_signal(symbol, timeframe, t)
+        returns for the bar at t = index[i].
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe to evaluate
+            
+        Returns:
+            DataFrame indexed by bar time with each indicator's vote,
+            normalized_signal, signal_count, direction (MarketDirection value),
+            strength (SignalStrength value), confidence and price
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        
+        if timeframe not in self.data_cache[symbol]:
+            raise ValueError(f"Timeframe {timeframe.name} not available for {symbol}")
+        
+        data = self.data_cache[symbol][timeframe]
+        df = self._calculate_indicator_frame(symbol, timeframe, data, self.calculate_enhanced_technical_indicators)
+        return self._enhanced_signal_series_from_frame(df)
+    
+    def _enhanced_signal_series_from_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized signal scoring of generate_enhanced_timeframe_signal over every row of an indicator frame"""
+        column = lambda name: df[name].to_numpy(dtype=float)
+        weights = self.enhanced_config.get("indicators", {})
+        close = column('close')
+        
+        def zones(levels: List[np.ndarray], scores: List) -> np.ndarray:
+            # NaN comparisons are False, so warm-up bars score 0 (as in the scalar path)
+            return np.select(levels, scores, default=0.0)
+        
+        # (name, vote, weight) in the order the scalar path appends them
+        votes = []
+        with np.errstate(invalid='ignore'):
+            rsi = column('rsi')
+            votes.append(('rsi_signal', zones([rsi < 30, rsi > 70], [1, -1]), 0.15))
+            macd, macd_signal, macd_histogram = column('macd'), column('macd_signal'), column('macd_histogram')
+            votes.append(('macd_signal', zones([(macd > macd_signal) & (macd_histogram > 0),
+                                                      (macd < macd_signal) & (macd_histogram < 0)], [1, -1]), 0.15))
+            bb_position = column('bb_position')
+            votes.append(('bb_signal', zones([bb_position < 0.2, bb_position > 0.8], [1, -1]), 0.10))
+            
+            if self.enhanced_config.get("enabled", True):
+                if 'stoch_k' in df.columns:
+                    stoch_signal, stoch_crossover = column('stoch_signal'), column('stoch_crossover')
+                    votes.append(('stoch_signal', np.where(stoch_signal != 0, stoch_signal,
+                                                           np.where(stoch_crossover != 0, stoch_crossover * 0.5, 0)),
+                                  weights["stochastic"]["weight"]))
+                if 'williams_r' in df.columns:
+                    votes.append(('williams_r_signal', column('williams_r_signal'), weights["williams_r"]["weight"]))
+                if 'cci' in df.columns:
+                    votes.append(('cci_signal', column('cci_signal'), weights["cci"]["weight"]))
+                if 'roc' in df.columns:
+                    roc = column('roc')
+                    votes.append(('roc_signal', zones([roc > 2.0, roc < -2.0], [1, -1]), weights["roc"]["weight"]))
+                if 'adx' in df.columns:
+                    adx = column('adx')
+                    trend = np.where(column('di_plus') > column('di_minus'), 1.0, -1.0)
+                    votes.append(('adx_signal', zones([adx > 25, adx > 20], [trend, trend * 0.5]),
+                                  weights["adx"]["weight"]))
+                if 'ichimoku_tenkan' in df.columns:
+                    cloud_top = column('ichimoku_cloud_top') if 'ichimoku_cloud_top' in df.columns else close
+                    cloud_bottom = column('ichimoku_cloud_bottom') if 'ichimoku_cloud_bottom' in df.columns else close
+                    tenkan_above = column('ichimoku_tenkan') > column('ichimoku_kijun')
+                    tenkan_below = column('ichimoku_tenkan') < column('ichimoku_kijun')
+                    votes.append(('ichimoku_signal', np.select(
+                        [(close > cloud_top) & tenkan_above, close > cloud_top,
+                         (close < cloud_bottom) & tenkan_below, close < cloud_bottom, tenkan_above],
+                        [1, 0.5, -1, -0.5, 0.2], default=-0.2), weights["ichimoku"]["weight"]))
+                if 'psar' in df.columns:
+                    psar_signal = column('psar_signal')
+                    votes.append(('psar_signal', np.where(psar_signal != 0, psar_signal,
+                                                          np.where(close > column('psar'), 0.5, -0.5)),
+                                  weights["psar"]["weight"]))
+                if 'keltner_upper' in df.columns:
+                    position = column('keltner_position')
+                    votes.append(('keltner_signal', zones([position < 0.1, position < 0.3, position > 0.9,
+                                                                     position > 0.7], [1, 0.5, -1, -0.5]),
+                                  weights["keltner"]["weight"]))
+                if 'donchian_upper' in df.columns:
+                    signal, position = column('donchian_signal'), column('donchian_position')
+                    votes.append(('donchian_signal', zones([(signal == 1) & (position >= 0.95),
+                                                                    (signal == -1) & (position <= 0.05)], [1, -1]),
+                                  weights["donchian"]["weight"]))
+                if 'mfi' in df.columns:
+                    mfi = column('mfi')
+                    votes.append(('mfi_signal', zones([mfi < 15, mfi < 25, mfi > 85, mfi > 75], [1, 0.5, -1, -0.5]),
+                                  weights["mfi"]["weight"]))
+                if 'cmf' in df.columns:
+                    cmf = column('cmf')
+                    votes.append(('cmf_signal', zones([cmf > 0.15, cmf > 0.05, cmf < -0.15, cmf < -0.05],
+                                                      [1, 0.5, -1, -0.5]), weights["cmf"]["weight"]))
+                if 'fisher_transform' in df.columns:
+                    fisher, fisher_signal = column('fisher_transform'), column('fisher_signal')
+                    level = zones([fisher > 2, fisher > 1, fisher < -2, fisher < -1], [-1, -0.5, 1, 0.5])
+                    votes.append(('fisher_signal', np.where(fisher_signal != 0, (level + fisher_signal) / 2, level),
+                                  weights["fisher"]["weight"]))
+        
+        # Accumulate in vote order, as the scalar path does, for identical sums
+        weighted_signal_sum = np.zeros(len(df))
+        for _, vote, weight in votes:
+            weighted_signal_sum += vote * weight
+        total_weight = sum(weight for _, _, weight in votes)
+        normalized_signal = weighted_signal_sum / total_weight if total_weight > 0 else np.zeros(len(df))
+        signal_count = np.count_nonzero(np.vstack([vote for _, vote, _ in votes]), axis=0)
+        
+        levels = [normalized_signal >= 0.6, normalized_signal >= 0.3, normalized_signal >= 0.1,
+                  normalized_signal <= -0.6, normalized_signal <= -0.3, normalized_signal <= -0.1]
+        direction = np.select(levels, [MarketDirection.STRONG_BUY.value, MarketDirection.BUY.value,
+                                       MarketDirection.BUY.value, MarketDirection.STRONG_SELL.value,
+                                       MarketDirection.SELL.value, MarketDirection.SELL.value],
+                              default=MarketDirection.NEUTRAL.value)
+        strength = np.select(levels, [SignalStrength.VERY_STRONG.value, SignalStrength.STRONG.value,
+                                      SignalStrength.WEAK.value, SignalStrength.VERY_STRONG.value,
+                                      SignalStrength.STRONG.value, SignalStrength.WEAK.value],
+                             default=SignalStrength.NEUTRAL.value)
+        
+        series = pd.DataFrame({name: vote for name, vote, _ in votes}, index=df.index)
+        series['normalized_signal'] = normalized_signal
+        series['signal_count'] = signal_count
+        series['direction'] = direction
+        series['strength'] = strength
+        series['confidence'] = np.where(signal_count > 0, np.minimum(np.abs(normalized_signal) * 2, 1.0), 0.0)
+        series['price'] = df['close']
+        return series
+    
+    def calculate_enhanced_confluence_series(self, symbol: str, times=None,
+                                             base_timeframe: TimeFrame = TimeFrame.M1) -> pd.DataFrame:
+        """
+        Enhanced confluent signal at many times, vectorized
+        
+        Row i holds what analyze_symbol_enhanced(symbol, times[i]) returns;
+        timeframes without a closed bar are left out, as the scalar path
+        skips them (see calculate_confluence_series for the layout).
+        
+        Args:
+            symbol: Trading symbol
+            times: Evaluation times (defaults to every bar of base_timeframe)
+            base_timeframe: Timeframe whose bars are evaluated when times is None
+            
+        Returns:
+            DataFrame indexed by evaluation time with the columns of
+            calculate_confluence_series
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        
+        if times is None:
+            times = self.data_cache[symbol][base_timeframe].index
+        times = pd.DatetimeIndex(times)
+        
+        timeframes = [tf for tf in self.timeframes if tf in self.data_cache[symbol]]
+        if not timeframes:
+            raise ValueError(f"No valid enhanced signals generated for {symbol}")
+        
+        # Accumulate in timeframe order, as the scalar path does, for identical sums
+        weighted_direction = np.zeros(len(times))
+        total_weight = np.zeros(len(times))
+        agreeing_timeframes = np.zeros(len(times), dtype=np.int64)
+        available_timeframes = np.zeros(len(times), dtype=np.int64)
+        total_indicators = np.zeros(len(times), dtype=np.int64)
+        timestamp = np.full(len(times), np.iinfo(np.int64).min)
+        columns = {}
+        
+        for tf in timeframes:
+            series = self.generate_enhanced_timeframe_signal_series(symbol, tf)
+            positions = self.bar_positions(symbol, tf, times)
+            valid = positions >= 0
+            positions = np.maximum(positions, 0)
+            direction = np.where(valid, series['direction'].to_numpy()[positions], 0)
+            confidence = np.where(valid, series['confidence'].to_numpy()[positions], 0.0)
+            signal_count = np.where(valid, series['signal_count'].to_numpy()[positions], 0)
+            
+            # Enhanced weighting with indicator count and signal strength
+            indicator_count_bonus = np.minimum(signal_count / 10, 0.2)
+            adjusted_weight = np.where(valid, self.timeframe_weights.get(tf, 0.1) *
+                                       (confidence + indicator_count_bonus), 0.0)
+            weighted_direction += direction * adjusted_weight
+            total_weight += adjusted_weight
+            agreeing_timeframes += direction != 0
+            available_timeframes += valid
+            total_indicators += signal_count
+            
+            signal_time = np.where(valid, series.index.asi8[positions], np.iinfo(np.int64).min)
+            timestamp = np.maximum(timestamp, signal_time)
+            columns[f"{tf.name.lower()}_direction"] = direction
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            normalized_direction = np.where(total_weight > 0, weighted_direction / total_weight, 0.0)
+            available = np.maximum(available_timeframes, 1)
+            indicator_diversity_bonus = np.minimum(total_indicators / (available * 15), 0.1)
+        
+        overall_direction = np.select(
+            [normalized_direction >= 1.8, normalized_direction >= 0.6,
+             normalized_direction <= -1.8, normalized_direction <= -0.6],
+            [MarketDirection.STRONG_BUY.value, MarketDirection.BUY.value,
+             MarketDirection.STRONG_SELL.value, MarketDirection.SELL.value],
+            default=MarketDirection.NEUTRAL.value)
+        confluence_score = np.minimum(agreeing_timeframes / available + indicator_diversity_bonus, 1.0)
+        overall_strength = np.minimum(np.abs(normalized_direction), 1.0)
+        
+        # Slightly higher threshold for the enhanced system
+        actionable = (confluence_score >= 0.65) & (overall_strength >= 0.6)
+        strong = overall_strength >= 0.8
+        buy = overall_direction > 0
+        recommended_action = np.select(
+            [~actionable, buy & strong, buy, strong],
+            ["HOLD", "STRONG_BUY", "BUY", "STRONG_SELL"], default="SELL")
+        risk_level = np.select([~actionable, confluence_score >= 0.8], ["HIGH", "LOW"], default="MEDIUM")
+        position_size_multiplier = np.where(actionable, confluence_score * overall_strength * 1.1, 0.5)
+        
+        result = pd.DataFrame({
+            'overall_direction': overall_direction,
+            'normalized_direction': normalized_direction,
+            'overall_strength': overall_strength,
+            'confluence_score': confluence_score,
+            'recommended_action': recommended_action,
+            'risk_level': risk_level,
+            'position_size_multiplier': position_size_multiplier,
+            'timestamp': pd.DatetimeIndex(timestamp.view('datetime64[ns]')),
+            'timeframes': available_timeframes,
+            **columns
+        }, index=times)
+        result.index.name = 'time'
+        return result
+    
     def analyze_symbol_enhanced(self, symbol: str, current_time: datetime = None) -> ConfluentSignal:
         """
         Enhanced symbol analysis using advanced indicators
@@ -533,6 +905,11 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
         if not timeframe_signals:
             raise ValueError(f"No valid enhanced signals generated for {symbol}")
         
+        return self._enhanced_confluence_from_signals(symbol, timeframe_signals)
+    
+    def _enhanced_confluence_from_signals(self, symbol: str,
+                                          timeframe_signals: List[TimeframeSignal]) -> ConfluentSignal:
+        """Enhanced weighted consensus of one symbol's timeframe signals"""
         # Calculate enhanced weighted consensus
         weighted_direction = 0
         total_weight = 0
@@ -615,6 +992,64 @@ class EnhancedMultiTimeframeStrategy(MultiTimeframeStrategy):
             timestamp=latest_timestamp
         )
 
+    def analyze_multiple_symbols_enhanced(self, symbols: List[str], current_time: datetime = None,
+                                          parallel: bool = False,
+                                          batched: bool = False) -> Dict[str, ConfluentSignal]:
+        """
+        Enhanced analysis of several symbols
+        
+        Args:
+            symbols: Trading symbols
+            current_time: Specific time for analysis
+            parallel: Analyze in persistent worker processes (see analyze_symbols_parallel)
+            batched: Compute the latest-bar basic and advanced indicators of all
+                     symbols in one batched pass per timeframe (latest-bar analysis
+                     only); parallel takes precedence
+            
+        Returns:
+            Symbol -> Enhanced ConfluentSignal (None when the analysis failed)
+        """
+        batched = batched and current_time is None and not parallel
+        if batched:
+            batch_signals = self._generate_enhanced_batch_timeframe_signals(symbols)
+        if parallel:
+            outcomes = self.analyze_symbols_parallel(symbols, current_time, method="analyze_symbol_enhanced")
+        
+        results = {}
+        for symbol in symbols:
+            try:
+                if parallel:
+                    if isinstance(outcomes[symbol], Exception):
+                        raise outcomes[symbol]
+                    results[symbol] = outcomes[symbol]
+                elif batched:
+                    if symbol not in batch_signals:
+                        raise ValueError(f"Failed to load data for {symbol}")
+                    if not batch_signals[symbol]:
+                        raise ValueError(f"No valid enhanced signals generated for {symbol}")
+                    results[symbol] = self._enhanced_confluence_from_signals(symbol, batch_signals[symbol])
+                else:
+                    results[symbol] = self.analyze_symbol_enhanced(symbol, current_time)
+            except Exception as e:
+                print(f"   ❌ Enhanced analysis failed for {symbol}: {e}")
+                results[symbol] = None
+        
+        return results
+    
+    def _generate_enhanced_batch_timeframe_signals(self, symbols: List[str]) -> Dict[str, List[TimeframeSignal]]:
+        """Latest-bar enhanced signals on every timeframe for all loadable symbols, batched per timeframe"""
+        loaded = [symbol for symbol in symbols if symbol in self.data_cache or self.load_data(symbol)]
+        signals = {symbol: [] for symbol in loaded}
+        
+        for tf in self.timeframes:
+            try:
+                for symbol, signal in self.generate_enhanced_timeframe_signals_batch(loaded, tf).items():
+                    signals[symbol].append(signal)
+            except Exception as e:
+                print(f"⚠️  Error generating batched enhanced signals for {tf.name}: {e}")
+        
+        return signals
+
 def main():
     """Main execution for testing enhanced strategy"""
     print("🚀 ENHANCED MULTI-TIMEFRAME STRATEGY WITH ADVANCED INDICATORS")
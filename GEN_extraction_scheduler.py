@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Extraction Scheduler
+====================
+
+Concurrent per-symbol extraction with an adaptive request rate limit.
+
+Symbols are extracted by a bounded thread pool (requests to the MT5
+terminal are I/O waits, not Python work). Every request first takes a
+token from a shared token bucket, so the pool as a whole stays within the
+request rate instead of each symbol sleeping a fixed time. The bucket
+adapts to the observed error rate: while recent requests fail (the request
+returns None and last_error() reports why), the rate is halved down to a
+floor; successes raise it again step by step up to the ceiling. Failed
+requests are retried after a jittered exponential backoff (full jitter), so
+retrying workers do not hit the terminal in lockstep.
+
+The scheduler only sees callables, so it runs against the MetaTrader5
+module or any stand-in with the same copy_rates_*/last_error functions.
+
+Usage:
+    limiter = TokenBucket(rate=5.0, max_rate=20.0)
+    scheduler = ExtractionScheduler(limiter, max_workers=4)
+    rates = scheduler.request(lambda: mt5.copy_rates_range(...), mt5.last_error)
+    progress = scheduler.run(symbols, extract_symbol)    # {symbol: SymbolProgress}
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: random.Random = random) -> float:
+    """
+    Jittered exponential backoff (full jitter)
+
+    Args:
+        attempt: Failed attempts so far (1 for the first retry)
+        base: Delay ceiling of the first retry in seconds
+        cap: Maximum delay ceiling in seconds
+        rng: Random source
+
+    Returns:
+        Delay in seconds, uniform in [0, min(cap, base * 2^(attempt-1))]
+    """
+    return rng.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts to request errors
+
+    Rate control is additive-increase / multiplicative-decrease: each
+    success adds `increase` requests per second, each failure while the
+    error rate of the last `window` requests is at or above
+    `error_threshold` multiplies the rate by `decrease`.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: float = None,
+                 min_rate: float = 0.5, max_rate: float = None,
+                 increase: float = 0.5, decrease: float = 0.5,
+                 window: int = 20, error_threshold: float = 0.2,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the bucket (full)
+
+        Args:
+            rate: Initial requests per second
+            capacity: Burst size in tokens (defaults to one second of the initial rate)
+            min_rate: Floor of the adapted rate
+            max_rate: Ceiling of the adapted rate (defaults to the initial rate)
+            increase: Requests per second added per success
+            decrease: Rate multiplier per failure above the error threshold
+            window: Number of recent requests the error rate is computed over
+            error_threshold: Error rate at which failures slow the rate down
+            clock: Monotonic clock in seconds
+            sleep: Sleep function
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.increase = increase
+        self.decrease = decrease
+        self.error_threshold = error_threshold
+        self.clock = clock
+        self.sleep = sleep
+
+        self.tokens = self.capacity
+        self.updated = clock()
+        self.outcomes = deque(maxlen=window)
+        self.lock = threading.Lock()
+        self.stats = {'acquired': 0, 'waited_seconds': 0.0, 'successes': 0, 'errors': 0,
+                      'slowdowns': 0, 'min_rate_seen': rate}
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting until one is available
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill(self.clock())
+                # Tolerance for refills that land a rounding error short of a token
+                if self.tokens >= 1 - 1e-9:
+                    self.tokens = max(0.0, self.tokens - 1)
+                    self.stats['acquired'] += 1
+                    self.stats['waited_seconds'] += waited
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+    def record(self, success: bool):
+        """Record a request outcome and adapt the rate"""
+        with self.lock:
+            self._refill(self.clock())
+            self.outcomes.append(success)
+            if success:
+                self.stats['successes'] += 1
+                self.rate = min(self.max_rate, self.rate + self.increase)
+                return
+            self.stats['errors'] += 1
+            if self.error_rate() >= self.error_threshold:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                # Drop the burst allowance too, otherwise a full bucket keeps
+                # requests going at the old pace
+                self.tokens = min(self.tokens, 1.0)
+                self.stats['slowdowns'] += 1
+                self.stats['min_rate_seen'] = min(self.stats['min_rate_seen'], self.rate)
+
+    def error_rate(self) -> float:
+        """Error rate over the recent request window"""
+        return (len(self.outcomes) - sum(self.outcomes)) / len(self.outcomes) if self.outcomes else 0.0
+
+
+@dataclass
+class SymbolProgress:
+    """Extraction progress of one symbol"""
+    symbol: str
+    status: str = "pending"          # pending, running, done, failed
+    result: Any = None
+    error: str = ""
+    started: float = 0.0
+    seconds: float = 0.0
+
+
+class ExtractionScheduler:
+    """
+    Bounded worker pool running per-symbol jobs with rate-limited, retried requests
+
+    Jobs call request() for every terminal request; request() takes a token,
+    records the outcome on the bucket and retries failures with backoff.
+    """
+
+    def __init__(self, limiter: TokenBucket, max_workers: int = 4, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_cap: float = 8.0, seed: int = None,
+                 on_progress: Callable[[SymbolProgress, int, int], None] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize the scheduler
+
+        Args:
+            limiter: Token bucket shared by all requests
+            max_workers: Symbols extracted concurrently
+            max_retries: Attempts per request (including the first)
+            backoff_base: Backoff ceiling of the first retry in seconds
+            backoff_cap: Maximum backoff ceiling in seconds
+            seed: Seed of the backoff jitter (None for a random seed)
+            on_progress: Called with (progress, finished, total) whenever a symbol
+                         starts or finishes; defaults to printing a progress line
+            sleep: Sleep function used for backoff
+        """
+        self.limiter = limiter
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rng = random.Random(seed)
+        self.on_progress = on_progress or self.print_progress
+        self.sleep = sleep
+
+        self.lock = threading.Lock()
+        self.progress: Dict[str, SymbolProgress] = {}
+        self.stats = {'requests': 0, 'retries': 0, 'failed_requests': 0, 'backoff_seconds': 0.0,
+                      'errors': {}}
+
+    def request(self, call: Callable[[], Any], last_error: Callable[[], Any] = None,
+                label: str = "") -> Any:
+        """
+        Run a terminal request with rate limiting and retries
+
+        A request fails when it raises or returns None; the reason is taken
+        from last_error() when given.
+
+        Args:
+            call: Request function
+            last_error: Function reporting the reason of the last failure
+            label: Name used in error statistics
+
+        Returns:
+            Request result, or None after max_retries failures
+        """
+        for attempt in range(1, self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                result = call()
+                error = None if result is not None else (last_error() if last_error else "no result")
+            except Exception as e:
+                result, error = None, f"{type(e).__name__}: {e}"
+            self.limiter.record(result is not None)
+
+            with self.lock:
+                self.stats['requests'] += 1
+                if result is None:
+                    key = str(error)
+                    self.stats['errors'][key] = self.stats['errors'].get(key, 0) + 1
+            if result is not None:
+                return result
+            if attempt < self.max_retries:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap, self.rng)
+                with self.lock:
+                    self.stats['retries'] += 1
+                    self.stats['backoff_seconds'] += delay
+                self.sleep(delay)
+
+        with self.lock:
+            self.stats['failed_requests'] += 1
+        return None
+
+    def _run_job(self, symbol: str, job: Callable[[str], Any]):
+        progress = self.progress[symbol]
+        self._update(progress, status="running", started=time.perf_counter())
+        try:
+            result = job(symbol)
+            if result is None or result is False:
+                self._update(progress, status="failed", result=result, error="extraction failed")
+            else:
+                self._update(progress, status="done", result=result)
+        except Exception as e:
+            self._update(progress, status="failed", error=f"{type(e).__name__}: {e}")
+
+    def _update(self, progress: SymbolProgress, **changes):
+        with self.lock:
+            for name, value in changes.items():
+                setattr(progress, name, value)
+            if progress.status in ("done", "failed"):
+                progress.seconds = time.perf_counter() - progress.started
+            finished = sum(p.status in ("done", "failed") for p in self.progress.values())
+            self.on_progress(progress, finished, len(self.progress))
+
+    def run(self, symbols: List[str], job: Callable[[str], Any]) -> Dict[str, SymbolProgress]:
+        """
+        Run a job for every symbol on the worker pool
+
+        Args:
+            symbols: Symbols to extract
+            job: Per-symbol function; None, False or an exception marks the symbol failed
+
+        Returns:
+            Symbol -> progress record (in input order)
+        """
+        self.progress = {symbol: SymbolProgress(symbol) for symbol in symbols}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="extract") as pool:
+            for future in [pool.submit(self._run_job, symbol, job) for symbol in symbols]:
+                future.result()
+        return self.progress
+
+    @staticmethod
+    def print_progress(progress: SymbolProgress, finished: int, total: int):
+        """Default progress report: one line per finished symbol"""
+        if progress.status == "done":
+            print(f"   [{finished}/{total}] ✅ {progress.symbol} in {progress.seconds:.1f}s")
+        elif progress.status == "failed":
+            print(f"   [{finished}/{total}] ❌ {progress.symbol}: {progress.error}")
+
+    def summary(self) -> Dict:
+        """Request, retry and rate statistics"""
+        return {**self.stats, 'rate': round(self.limiter.rate, 3), 'limiter': dict(self.limiter.stats)}
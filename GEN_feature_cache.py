@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Rolling Feature Cache
+=====================
+
+Per-frame cache for rolling statistics shared by the indicator libraries.
+
+Several indicators need the same rolling window over the same column
+(max(high)/min(low) for Stochastic, Williams %R, Donchian, Fisher and
+Ichimoku; mean(close) for Bollinger and the SMAs; mean(tr) for ATR).
+Inside a frame scope each (column, operation, window) is computed once and
+reused until the underlying OHLCV data changes. Exponential moving averages
+are cached the same way, keyed by (column, 'ewm', span), and so are derived
+series shared between indicators (true range, typical price), keyed by name.
+
+Usage:
+    cache = RollingFeatureCache()
+    with cache.frame(data):
+        highest = cache.rolling(df, 'high', 'max', 14)
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Tuple
+
+import pandas as pd
+
+# Rolling operations the cache knows how to compute
+OPERATIONS = ('max', 'min', 'mean', 'std', 'sum')
+
+# Columns that identify a frame; cached columns must be derived from these
+FRAME_COLUMNS = ('open', 'high', 'low', 'close', 'tick_volume', 'real_volume', 'volume')
+
+
+class RollingFeatureCache:
+    """
+    Cache of rolling statistics keyed by (column, operation, window)
+
+    Entries are grouped per frame, identified by a fingerprint of the index
+    and OHLCV columns, so a refreshed frame never sees stale values. Lookups
+    made outside a frame scope are computed directly and not counted.
+    """
+
+    def __init__(self, max_frames: int = 16):
+        """
+        Initialize rolling feature cache
+
+        Args:
+            max_frames: Number of frames kept before the least recently used is evicted
+        """
+        self.max_frames = max_frames
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._scope = []
+
+    @staticmethod
+    def fingerprint(data: pd.DataFrame) -> Tuple:
+        """
+        Identify a frame by its index and OHLCV values
+
+        Args:
+            data: DataFrame with OHLCV data
+
+        Returns:
+            Hashable fingerprint, equal for copies of the same data
+        """
+        columns = tuple(c for c in FRAME_COLUMNS if c in data.columns)
+        return (len(data), columns, hash(data.index.to_numpy().tobytes()),
+                tuple(hash(data[c].to_numpy().tobytes()) for c in columns))
+
+    @contextmanager
+    def frame(self, data: pd.DataFrame):
+        """
+        Scope in which rolling lookups on this frame are cached
+
+        Args:
+            data: Source DataFrame; columns added inside the scope must be
+                  derived from its OHLCV data
+        """
+        key = self.fingerprint(data)
+        if key not in self._frames:
+            self._frames[key] = {}
+            while len(self._frames) > self.max_frames:
+                self._frames.popitem(last=False)
+        self._frames.move_to_end(key)
+
+        self._scope.append(key)
+        try:
+            yield self
+        finally:
+            self._scope.pop()
+
+    def rolling(self, df: pd.DataFrame, column: str, operation: str, window: int) -> pd.Series:
+        """
+        Rolling statistic of a column, computed once per frame
+
+        Args:
+            df: DataFrame holding the column (may be a copy of the scoped frame)
+            column: Column name
+            operation: One of OPERATIONS
+            window: Rolling window length
+
+        Returns:
+            Rolling statistic aligned to df's index
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown rolling operation '{operation}', expected one of {OPERATIONS}")
+
+        if not self._scope:
+            return getattr(df[column].rolling(window=window), operation)()
+
+        entries = self._frames.setdefault(self._scope[-1], {})
+        key = (column, operation, window)
+        if key in entries:
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        entries[key] = getattr(df[column].rolling(window=window), operation)()
+        return entries[key]
+
+    def ewm(self, df: pd.DataFrame, column: str, span: int) -> pd.Series:
+        """
+        Exponential moving average of a column, computed once per frame
+
+        Args:
+            df: DataFrame holding the column (may be a copy of the scoped frame)
+            column: Column name
+            span: EMA span
+
+        Returns:
+            EMA aligned to df's index
+        """
+        if not self._scope:
+            return df[column].ewm(span=span).mean()
+
+        entries = self._frames.setdefault(self._scope[-1], {})
+        key = (column, 'ewm', span)
+        if key in entries:
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        entries[key] = df[column].ewm(span=span).mean()
+        return entries[key]
+
+    def feature(self, df: pd.DataFrame, name: str, calculate: Callable[[pd.DataFrame], pd.Series]) -> pd.Series:
+        """
+        Derived series (e.g. true range, typical price), computed once per frame
+
+        Args:
+            df: DataFrame the series is derived from (may be a copy of the scoped frame)
+            name: Name identifying the derived series
+            calculate: Function computing the series from df's OHLCV columns
+
+        Returns:
+            Derived series aligned to df's index
+        """
+        if not self._scope:
+            return calculate(df)
+
+        entries = self._frames.setdefault(self._scope[-1], {})
+        key = (name, 'feature')
+        if key in entries:
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        entries[key] = calculate(df)
+        return entries[key]
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters and cache size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'frames': len(self._frames),
+            'entries': sum(len(entries) for entries in self._frames.values())
+        }
+
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Drop all cached frames"""
+        self._frames.clear()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Incremental Multi-Timeframe Resampler
+=====================================
+
+Keeps M5, M15, H1, H4 and D1 bars current as M1 bars are appended.
+
+Each timeframe is derived from the one below it (M5 from M1, M15 from M5,
+H1 from M15, H4 from H1, D1 from H4) and only the buckets touched by new
+bars are re-aggregated: appending k M1 bars costs O(k) per timeframe
+instead of a full df.resample() over the whole history. The last bar of
+each timeframe is the open (still forming) bucket; bars are reported as
+closed once a later bucket has started.
+
+Output matches df.resample(freq).agg(...).dropna() with the aggregation
+used by MultiTimeframeStrategy.load_data (first/max/min/last/sum, mean
+spread). OHLC and volumes are identical; the mean spread is a running
+sum over count and may differ from pandas' compensated mean in the last
+bit.
+
+frame() returns read-only views of the column arrays, so handing out the
+current frames after an append does not copy the history. Rows before the
+last are closed and never change; the last row of a frame obtained earlier
+follows later appends while its bucket is still open.
+
+Usage:
+    resampler = IncrementalResampler()
+    resampler.append(m1_history)
+    closed = resampler.append(new_m1_bars)   # {'M5': DataFrame of newly closed bars, ...}
+    h1 = resampler.frame('H1')
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# (timeframe, bucket length, parent timeframe); each parent bucket nests in its child's
+DEFAULT_LEVELS = (
+    ('M1', '1min', None),
+    ('M5', '5min', 'M1'),
+    ('M15', '15min', 'M5'),
+    ('H1', '1h', 'M15'),
+    ('H4', '4h', 'H1'),
+    ('D1', '1D', 'H4'),
+)
+
+# Output columns in load_data order; spread is kept as a running sum and bar
+# count, and the mean is materialized for the rows each append rewrites
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+SUM_COLUMNS = ('tick_volume', 'real_volume')
+OUTPUT_COLUMNS = ('open', 'high', 'low', 'close', 'tick_volume', 'spread', 'real_volume')
+
+INITIAL_CAPACITY = 1024
+
+
+class _BarArrays:
+    """Growable column arrays of one timeframe (time as int64 nanoseconds)"""
+
+    def __init__(self, dtypes: Dict[str, np.dtype]):
+        self.dtypes = dtypes
+        self.columns = {name: np.empty(INITIAL_CAPACITY, dtype=dtype) for name, dtype in dtypes.items()}
+        self.size = 0
+
+    def write(self, position: int, values: Dict[str, np.ndarray]):
+        """Overwrite rows from `position` on with values and truncate after them"""
+        size = position + len(values['time'])
+        capacity = len(self.columns['time'])
+        if size > capacity:
+            capacity = max(size, 2 * capacity)
+            for name, array in self.columns.items():
+                grown = np.empty(capacity, dtype=array.dtype)
+                grown[:self.size] = array[:self.size]
+                self.columns[name] = grown
+        for name, array in self.columns.items():
+            array[position:size] = values[name]
+        self.size = size
+
+    def view(self, name: str, start: int = 0) -> np.ndarray:
+        return self.columns[name][start:self.size]
+
+
+class IncrementalResampler:
+    """
+    Hierarchical OHLCV resampler updated bar by bar
+
+    State per timeframe is a set of column arrays; the last row of each
+    is the open bucket and is rewritten as its child bars change.
+    """
+
+    def __init__(self, levels: Tuple = DEFAULT_LEVELS):
+        """
+        Initialize incremental resampler
+
+        Args:
+            levels: (timeframe, bucket length, parent timeframe) from the base
+                    timeframe up; every bucket must nest in its parent's
+        """
+        self.levels = levels
+        self.base = levels[0][0]
+        self.bucket_ns = {name: pd.Timedelta(freq).value for name, freq, _ in levels}
+        self.bars: Dict[str, _BarArrays] = {}
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    @property
+    def timeframes(self) -> List[str]:
+        return [name for name, _, _ in self.levels]
+
+    def append(self, bars: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Append base-timeframe bars and update every timeframe
+
+        A bar with the same time as the current last bar replaces it (a
+        still-forming bar being updated); earlier times are rejected.
+
+        Args:
+            bars: OHLCV DataFrame indexed by time (open, high, low, close,
+                  tick_volume, spread, real_volume)
+
+        Returns:
+            Higher timeframe -> DataFrame of bars closed by this append
+            (timeframes without newly closed bars are omitted)
+        """
+        if len(bars) == 0:
+            return {}
+        if not bars.index.is_monotonic_increasing or bars.index.has_duplicates:
+            raise ValueError("Appended bars must have strictly increasing times")
+
+        times = bars.index.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        if not self.bars:
+            self._initialize(bars)
+        base = self.bars[self.base]
+        position = base.size
+        if base.size:
+            last = base.columns['time'][base.size - 1]
+            if times[0] < last:
+                raise ValueError(f"Appended bar at {bars.index[0]} precedes the last bar "
+                                 f"{pd.Timestamp(last)}")
+            if times[0] == last:
+                position -= 1
+
+        values = {'time': times, 'count': np.ones(len(bars), dtype=np.int64),
+                  'spread_sum': bars['spread'].to_numpy(dtype=np.float64)}
+        values['spread'] = values['spread_sum'] / values['count']
+        for column in PRICE_COLUMNS + SUM_COLUMNS:
+            values[column] = bars[column].to_numpy()
+
+        sizes = {name: array.size for name, array in self.bars.items()}
+        changed = {self.base: position}
+        base.write(position, values)
+
+        for name, _, parent in self.levels[1:]:
+            changed[name] = self._update_level(name, parent, changed[parent])
+
+        closed = {}
+        self._frames.clear()
+        for name in self.timeframes[1:]:
+            first_closed = max(sizes[name] - 1, 0)
+            if self.bars[name].size - 1 > first_closed:
+                closed[name] = self._to_frame(name, first_closed, self.bars[name].size - 1)
+        return closed
+
+    def _initialize(self, bars: pd.DataFrame):
+        dtypes = {'time': np.dtype(np.int64), 'count': np.dtype(np.int64), 'spread_sum': np.dtype(np.float64),
+                  'spread': np.dtype(np.float64)}
+        for column in PRICE_COLUMNS + SUM_COLUMNS:
+            dtypes[column] = bars[column].dtype
+        self.bars = {name: _BarArrays(dtypes) for name in self.timeframes}
+
+    def _update_level(self, name: str, parent: str, parent_changed: int) -> int:
+        """Re-aggregate the buckets of `name` touched from parent row `parent_changed` on"""
+        source = self.bars[parent]
+        target = self.bars[name]
+        bucket_ns = self.bucket_ns[name]
+
+        # Start at the first parent row of the bucket holding the first changed row
+        first_bucket = source.columns['time'][parent_changed] // bucket_ns * bucket_ns
+        start = int(np.searchsorted(source.view('time'), first_bucket, side='left'))
+        position = int(np.searchsorted(target.view('time'), first_bucket, side='left'))
+
+        times = source.view('time', start)
+        buckets = times // bucket_ns * bucket_ns
+        starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+        ends = np.append(starts[1:], len(times)) - 1
+
+        values = {'time': buckets[starts],
+                  'open': source.view('open', start)[starts],
+                  'high': np.fmax.reduceat(source.view('high', start), starts),
+                  'low': np.fmin.reduceat(source.view('low', start), starts),
+                  'close': source.view('close', start)[ends]}
+        for column in SUM_COLUMNS + ('spread_sum', 'count'):
+            values[column] = np.add.reduceat(source.view(column, start), starts)
+        values['spread'] = values['spread_sum'] / values['count']
+
+        target.write(position, values)
+        return position
+
+    def _to_frame(self, name: str, start: int = 0, stop: int = None, copy: bool = True) -> pd.DataFrame:
+        bars = self.bars[name]
+        stop = bars.size if stop is None else stop
+        columns = {}
+        for column in ('time',) + OUTPUT_COLUMNS:
+            array = bars.columns[column][start:stop]
+            if copy:
+                array = array.copy()
+            else:
+                array.flags.writeable = False
+            columns[column] = array
+        index = pd.DatetimeIndex(columns.pop('time').view('datetime64[ns]'), name='time', copy=False)
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    def _empty_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(columns=list(OUTPUT_COLUMNS), index=pd.DatetimeIndex([], name='time'))
+
+    def frame(self, timeframe: str) -> pd.DataFrame:
+        """
+        Current bars of a timeframe, including the open bucket
+
+        Args:
+            timeframe: Timeframe name (e.g. 'H1')
+
+        Returns:
+            Read-only OHLCV DataFrame indexed by bucket start time, a view of the
+            resampler's arrays (rebuilt, without copying, only after an append)
+        """
+        if timeframe not in self._frames:
+            self._frames[timeframe] = self._to_frame(timeframe, copy=False) if self.bars else self._empty_frame()
+        return self._frames[timeframe]
+
+    def frames(self) -> Dict[str, pd.DataFrame]:
+        """Current bars of every timeframe"""
+        return {name: self.frame(name) for name in self.timeframes}
+
+    def open_bar(self, timeframe: str) -> Optional[pd.Series]:
+        """Open (still forming) bar of a timeframe, or None before the first append"""
+        if not self.bars or self.bars[timeframe].size == 0:
+            return None
+        return self.frame(timeframe).iloc[-1]
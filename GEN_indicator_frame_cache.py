@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Indicator Frame Cache
+=====================
+
+Per-(symbol, timeframe, indicator config) cache of computed indicator frames.
+
+The strategies ask for the same indicator frames repeatedly (every timeframe
+of every symbol on each dashboard or analysis refresh). A cached frame is
+reused until its source data gains a new bar or its last bar changes, and
+new bars are appended by calculating only the warm-up tail they need
+instead of the whole history. Path-dependent columns (Parabolic SAR, ADX)
+of appended rows are continued from the full-history state through the
+caller's resume hook.
+
+History before the last cached bar is treated as closed: a source frame
+whose earlier rows differ (shorter, re-indexed) is recalculated in full.
+
+Usage:
+    cache = IndicatorFrameCache()
+    key = cache.config_hash(indicator_config)
+    df = cache.get(symbol, timeframe, key, data, calculate, lookback)
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from GEN_advanced_technical_indicators import CUMULATIVE_COLUMNS
+
+# Source columns compared to detect a changed (still forming) last bar
+BAR_COLUMNS = ('open', 'high', 'low', 'close', 'tick_volume', 'real_volume')
+
+
+class IndicatorFrameCache:
+    """
+    Indicator frames keyed by (symbol, timeframe, config hash)
+
+    An entry covers the source rows from `start` to the end. Tail-only
+    entries (start > 0) serve latest-bar lookups; full entries serve both
+    latest-bar and historical lookups.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize indicator frame cache
+
+        Args:
+            max_entries: Number of entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.appends = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def config_hash(*configs) -> str:
+        """
+        Stable hash of indicator configuration(s)
+
+        Args:
+            *configs: JSON-serializable configuration objects
+
+        Returns:
+            Hex digest identifying the configuration
+        """
+        payload = json.dumps(configs, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _bar_values(data: pd.DataFrame, position: int) -> np.ndarray:
+        columns = [c for c in BAR_COLUMNS if c in data.columns]
+        return data[columns].iloc[position].to_numpy(dtype=float)
+
+    def get(self, symbol: str, timeframe: Hashable, config_key: str, data: pd.DataFrame,
+            calculate: Callable[[pd.DataFrame], pd.DataFrame], lookback: int,
+            lookahead: int = 0, tail_only: bool = False,
+            resume: Callable[[pd.DataFrame, int], pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Indicator frame for a source frame, from the cache where possible
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of the source frame
+            config_key: Hash of the indicator configuration (see config_hash)
+            data: Source OHLCV frame
+            calculate: Indicator function, DataFrame -> DataFrame with indicators
+            lookback: Bars needed for stable last-bar values of calculate
+            lookahead: Trailing rows whose values depend on later bars
+                       (e.g. the Ichimoku Chikou span); recalculated on append
+            tail_only: Only the last row will be read; a tail of `lookback`
+                       bars may be calculated instead of the full history
+            resume: resume(frame, start) continues the path-dependent columns
+                    of a frame aligned to the end of data from source row
+                    `start` on, where they were calculated over a truncated
+                    window (tail misses and appended rows)
+
+        Returns:
+            Indicator frame aligned to the end of data (covering all of it
+            unless tail_only)
+        """
+        key = (symbol, timeframe, config_key)
+        entry = self._entries.get(key)
+
+        if entry is not None and (tail_only or entry['start'] == 0):
+            keep = self._unchanged_rows(entry, data)
+            if keep == len(data):
+                self.hits += 1
+                entry['data'] = data
+                self._entries.move_to_end(key)
+                return entry['frame']
+            keep -= lookahead
+            if keep > 0 and entry['bars'] - keep < len(entry['frame']):
+                self.appends += 1
+                frame = self._append(entry, data, keep, calculate, lookback, tail_only, resume)
+                self._store(key, data, frame)
+                return frame
+
+        self.misses += 1
+        source = data.iloc[-lookback:] if tail_only and lookback < len(data) else data
+        frame = calculate(source)
+        if resume is not None and len(source) < len(data):
+            frame = resume(frame, len(data) - len(source))
+        self._store(key, data, frame)
+        return frame
+
+    def _unchanged_rows(self, entry: Dict, data: pd.DataFrame) -> int:
+        """Number of leading source rows the cached frame is still valid for"""
+        if entry['data'] is data:
+            return len(data)
+
+        bars = entry['bars']
+        if len(data) < bars or data.index[bars - 1] != entry['last_time']:
+            return 0
+        if np.array_equal(self._bar_values(data, bars - 1), entry['last_values'], equal_nan=True):
+            return bars
+        # Last cached bar was still forming: keep everything before it
+        return bars - 1
+
+    def _append(self, entry: Dict, data: pd.DataFrame, keep: int, calculate: Callable,
+                lookback: int, tail_only: bool, resume: Callable = None) -> pd.DataFrame:
+        """
+        Extend a cached frame by the rows after `keep`, calculated over their warm-up tail
+
+        Cumulative levels are re-anchored on the last kept bar and the
+        path-dependent columns of the new rows are continued by `resume`.
+        """
+        window_start = max(0, keep - lookback)
+        computed = calculate(data.iloc[window_start:])
+        new_rows = computed.iloc[keep - window_start:]
+
+        cached = entry['frame']
+        kept = cached.iloc[:len(cached) - (entry['bars'] - keep)]
+        if len(kept):
+            # Cumulative levels restart at the window; re-anchor them on the last kept bar
+            anchor = computed.iloc[keep - 1 - window_start]
+            new_rows = new_rows.copy()
+            for column in CUMULATIVE_COLUMNS:
+                if column in new_rows.columns:
+                    new_rows[column] = new_rows[column] + (kept[column].iloc[-1] - anchor[column])
+
+        frame = pd.concat([kept, new_rows])
+        if resume is not None and window_start > 0:
+            frame = resume(frame, keep)
+        return frame.iloc[-lookback:] if tail_only and entry['start'] > 0 else frame
+
+    def _store(self, key: Tuple, data: pd.DataFrame, frame: pd.DataFrame):
+        self._entries[key] = {
+            'data': data,
+            'frame': frame,
+            'bars': len(data),
+            'start': len(data) - len(frame),
+            'last_time': data.index[-1],
+            'last_values': self._bar_values(data, -1)
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, symbol: str = None):
+        """Drop the entries of one symbol, or all entries"""
+        if symbol is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == symbol]:
+            del self._entries[key]
+
+    def get_stats(self) -> Dict:
+        """Hit/append/miss counters and cache size"""
+        lookups = self.hits + self.appends + self.misses
+        return {
+            'hits': self.hits,
+            'appends': self.appends,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries)
+        }
+
+    def reset_stats(self):
+        """Reset counters"""
+        self.hits = 0
+        self.appends = 0
+        self.misses = 0
@@ -0,0 +1,762 @@
+#!/usr/bin/env python3
+"""
+Incremental Indicator Streams
+=============================
+
+Stateful, bar-by-bar counterpart of AdvancedTechnicalIndicators.calculate_all_indicators
+for live trading. Instead of recomputing every indicator over the whole history on
+each M1 bar close, an IndicatorStream keeps the rolling windows and recursive state
+of each indicator and advances them in O(1) / O(window) per bar:
+
+- Stochastic, Williams %R, ROC, CCI
+- ADX (+DI / -DI), Ichimoku, Parabolic SAR
+- Keltner Channels, Donchian Channels
+- MFI, OBV, A/D Line, CMF
+- Fisher Transform
+
+The value emitted by update() for a bar equals the last row of the batch calculation
+run over all bars seen so far (within float tolerance). Columns that look into the
+future in the batch version (Ichimoku chikou span) are NaN at the live edge, exactly
+as they are on the last row of the batch result.
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import math
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from GEN_advanced_technical_indicators import AdvancedTechnicalIndicators
+
+NAN = float('nan')
+
+
+def _is_nan(value: float) -> bool:
+    """NaN check that works for plain floats"""
+    return value != value
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """Division with NumPy semantics (x/0 -> +/-inf, 0/0 -> NaN) for plain floats"""
+    if _is_nan(numerator) or _is_nan(denominator):
+        return NAN
+    if denominator == 0:
+        if numerator == 0:
+            return NAN
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+# ========================================
+# STREAMING PRIMITIVES
+# ========================================
+
+class _RollingWindow:
+    """Fixed-length window over the most recent values (mean/sum need a full window)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque(maxlen=size)
+
+    def push(self, value: float):
+        self.values.append(value)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def sum(self) -> float:
+        if not self.full:
+            return NAN
+        return math.fsum(self.values) if not any(_is_nan(v) for v in self.values) else NAN
+
+    def mean(self) -> float:
+        if not self.full:
+            return NAN
+        first = self.values[0]
+        # pandas returns the exact value for constant windows
+        if all(v == first for v in self.values):
+            return first
+        return self.sum() / self.size
+
+    def mean_abs_deviation(self) -> float:
+        mean = self.mean()
+        if _is_nan(mean):
+            return NAN
+        return math.fsum(abs(v - mean) for v in self.values) / self.size
+
+
+class _RollingExtreme:
+    """Rolling max or min using a monotonic deque (amortised O(1) per bar)"""
+
+    def __init__(self, size: int, mode: str = 'max'):
+        self.size = size
+        self.is_max = mode == 'max'
+        self.count = 0
+        self.candidates = deque()  # (bar number, value)
+
+    def push(self, value: float):
+        if self.is_max:
+            while self.candidates and self.candidates[-1][1] <= value:
+                self.candidates.pop()
+        else:
+            while self.candidates and self.candidates[-1][1] >= value:
+                self.candidates.pop()
+        self.candidates.append((self.count, value))
+        self.count += 1
+        if self.candidates[0][0] <= self.count - 1 - self.size:
+            self.candidates.popleft()
+
+    def value(self) -> float:
+        if self.count < self.size:
+            return NAN
+        return self.candidates[0][1]
+
+
+class _EwmState:
+    """Recursive exponentially weighted mean replicating pandas ewm(...).mean() (ignore_na=False)"""
+
+    def __init__(self, alpha: float, adjust: bool = True):
+        self.adjust = adjust
+        self.old_wt_factor = 1.0 - alpha
+        self.new_wt = 1.0 if adjust else alpha
+        self.old_wt = 1.0
+        self.weighted = NAN
+
+    def update(self, value: float) -> float:
+        is_observation = not _is_nan(value)
+        if not _is_nan(self.weighted):
+            self.old_wt *= self.old_wt_factor
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = ((self.old_wt * self.weighted + self.new_wt * value) /
+                                     (self.old_wt + self.new_wt))
+                if self.adjust:
+                    self.old_wt += self.new_wt
+                else:
+                    self.old_wt = 1.0
+        elif is_observation:
+            self.weighted = value
+        return self.weighted
+
+
+class _Lag:
+    """Value of a series `periods` bars ago (NaN until enough history)"""
+
+    def __init__(self, periods: int):
+        self.periods = periods
+        self.values = deque(maxlen=periods + 1)
+
+    def push(self, value: float):
+        self.values.append(value)
+
+    def value(self) -> float:
+        if len(self.values) <= self.periods:
+            return NAN
+        return self.values[0]
+
+
+# ========================================
+# INDICATOR STREAM
+# ========================================
+
+class IndicatorStream:
+    """
+    Incremental advanced indicator engine for one symbol and timeframe
+
+    Feed closed bars in time order through update(); each call returns the
+    indicator values for that bar using the same column names as
+    AdvancedTechnicalIndicators.calculate_all_indicators.
+    """
+
+    def __init__(self, symbol: str = None, timeframe: str = None,
+                 config: Dict[str, Dict] = None):
+        """
+        Initialize indicator stream
+
+        Args:
+            symbol: Trading symbol (informational)
+            timeframe: Timeframe name (informational)
+            config: Indicator parameters in calculate_all_indicators format
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+
+        defaults = AdvancedTechnicalIndicators._get_default_config()
+        config = config or {}
+        self.config = {name: {**params, **config.get(name, {})} for name, params in defaults.items()}
+
+        self.bars_processed = 0
+        self.last_time = None
+        self.latest: Dict[str, float] = {}
+        self.volume_col: Optional[str] = None
+
+        self._extremes: Dict[Tuple[str, int], _RollingExtreme] = {}
+        self._prev: Dict[str, float] = {}
+        self._init_state()
+
+    def _extreme(self, column: str, window: int) -> _RollingExtreme:
+        """Shared rolling extreme for (column, window); max for highs, min for lows"""
+        key = (column, window)
+        if key not in self._extremes:
+            self._extremes[key] = _RollingExtreme(window, 'max' if column == 'high' else 'min')
+        return self._extremes[key]
+
+    def _init_state(self):
+        """Create the rolling/recursive state of every indicator"""
+        cfg = self.config
+
+        # Momentum oscillators
+        stoch = cfg['stochastic']
+        self._stoch_hh = self._extreme('high', stoch['k_period'])
+        self._stoch_ll = self._extreme('low', stoch['k_period'])
+        self._stoch_raw_k = _RollingWindow(stoch['smooth_k'])
+        self._stoch_k = _RollingWindow(stoch['d_period'])
+
+        wr = cfg['williams_r']
+        self._wr_hh = self._extreme('high', wr['period'])
+        self._wr_ll = self._extreme('low', wr['period'])
+
+        self._roc_close = _Lag(cfg['roc']['period'])
+
+        self._cci_tp = _RollingWindow(cfg['cci']['period'])
+
+        # Trend indicators
+        adx_alpha = 1.0 / cfg['adx']['period']
+        self._adx_tr = _EwmState(adx_alpha, adjust=False)
+        self._adx_dm_plus = _EwmState(adx_alpha, adjust=False)
+        self._adx_dm_minus = _EwmState(adx_alpha, adjust=False)
+        self._adx_dx = _EwmState(adx_alpha, adjust=False)
+
+        ichi = cfg['ichimoku']
+        self._ichi_tenkan_hh = self._extreme('high', ichi['tenkan_period'])
+        self._ichi_tenkan_ll = self._extreme('low', ichi['tenkan_period'])
+        self._ichi_kijun_hh = self._extreme('high', ichi['kijun_period'])
+        self._ichi_kijun_ll = self._extreme('low', ichi['kijun_period'])
+        self._ichi_senkou_hh = self._extreme('high', ichi['senkou_b_period'])
+        self._ichi_senkou_ll = self._extreme('low', ichi['senkou_b_period'])
+        self._ichi_span_a = _Lag(ichi['kijun_period'])
+        self._ichi_span_b = _Lag(ichi['kijun_period'])
+        self._ichi_close = _Lag(max(-ichi['chikou_period'], 0))
+        self._ichi_chikou_base = _Lag(max(ichi['chikou_period'], 0))
+
+        self._psar_state = None  # (psar, bull_trend, af, ep)
+
+        # Volatility indicators
+        keltner = cfg['keltner']
+        self._keltner_tr = _RollingWindow(keltner['period'])
+        if keltner['ma_type'].lower() == 'ema':
+            self._keltner_ma = _EwmState(2.0 / (keltner['period'] + 1.0), adjust=True)
+        else:
+            self._keltner_ma = _RollingWindow(keltner['period'])
+
+        donchian = cfg['donchian']
+        self._donchian_hh = self._extreme('high', donchian['period'])
+        self._donchian_ll = self._extreme('low', donchian['period'])
+
+        # Volume indicators
+        mfi_period = cfg['mfi']['period']
+        self._mfi_positive = _RollingWindow(mfi_period)
+        self._mfi_negative = _RollingWindow(mfi_period)
+        self._obv = 0.0
+        self._obv_ma = _RollingWindow(20)
+        self._ad_line = 0.0
+        self._ad_line_ma = _RollingWindow(20)
+        self._cmf_mfv = _RollingWindow(cfg['cmf']['period'])
+        self._cmf_volume = _RollingWindow(cfg['cmf']['period'])
+
+        # Composite indicators
+        fisher = cfg['fisher']
+        self._fisher_hh = self._extreme('high', fisher['period'])
+        self._fisher_ll = self._extreme('low', fisher['period'])
+        self._fisher_ma = 0.0
+        self._fisher = 0.0
+
+    # ----------------------------------------
+    # Public API
+    # ----------------------------------------
+
+    def update(self, bar: Dict) -> Dict[str, float]:
+        """
+        Advance all indicators by one closed bar
+
+        Args:
+            bar: Mapping with open/high/low/close and tick_volume and/or real_volume
+                 (a dict, a DataFrame row or a namedtuple converted with _asdict())
+
+        Returns:
+            Dictionary of indicator values for this bar
+        """
+        high = float(bar['high'])
+        low = float(bar['low'])
+        close = float(bar['close'])
+
+        if self.volume_col is None:
+            if 'real_volume' in bar:
+                self.volume_col = 'real_volume'
+            elif 'tick_volume' in bar:
+                self.volume_col = 'tick_volume'
+            else:
+                self.volume_col = ''
+
+        for extreme in self._extremes.values():
+            extreme.push(high if extreme.is_max else low)
+
+        out: Dict[str, float] = {}
+        self._update_stochastic(out, close)
+        self._update_williams_r(out, close)
+        self._update_roc(out, close)
+        self._update_cci(out, high, low, close)
+        self._update_adx(out, high, low, close)
+        self._update_ichimoku(out, close)
+        self._update_psar(out, high, low)
+        self._update_keltner(out, bar, high, low, close)
+        self._update_donchian(out, close)
+        if self.volume_col:
+            volume = float(bar[self.volume_col])
+            self._update_mfi(out, high, low, close, volume)
+            self._update_obv(out, close, volume)
+            self._update_ad_line_and_cmf(out, high, low, close, volume)
+        self._update_fisher(out, high, low)
+
+        self._prev.update(close=close, high=high, low=low)
+        self.bars_processed += 1
+        self.last_time = bar.get('time') if hasattr(bar, 'get') else None
+        self.latest = out
+        return out
+
+    def warm_up(self, data: pd.DataFrame) -> Dict[str, float]:
+        """
+        Replay historical bars to initialise the stream state
+
+        Args:
+            data: DataFrame with OHLCV data in time order
+
+        Returns:
+            Indicator values for the last replayed bar
+        """
+        columns = [c for c in ('open', 'high', 'low', 'close', 'tick_volume', 'real_volume')
+                   if c in data.columns]
+        for row in data[columns].itertuples(index=True):
+            bar = row._asdict()
+            bar['time'] = bar.pop('Index')
+            self.update(bar)
+        return self.latest
+
+    def to_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Replay data and collect every emitted row (mainly for validation against the batch path)"""
+        columns = [c for c in ('open', 'high', 'low', 'close', 'tick_volume', 'real_volume')
+                   if c in data.columns]
+        rows = []
+        for row in data[columns].itertuples(index=False):
+            rows.append(self.update(row._asdict()))
+        return pd.DataFrame(rows, index=data.index)
+
+    # ----------------------------------------
+    # Momentum oscillators
+    # ----------------------------------------
+
+    def _update_stochastic(self, out: Dict, close: float):
+        lowest_low = self._stoch_ll.value()
+        highest_high = self._stoch_hh.value()
+        raw_k = 100 * _div(close - lowest_low, highest_high - lowest_low)
+
+        self._stoch_raw_k.push(raw_k)
+        stoch_k = self._stoch_raw_k.mean()
+        self._stoch_k.push(stoch_k)
+        stoch_d = self._stoch_k.mean()
+
+        signal = 0
+        if stoch_k < 20:
+            signal = 1
+        if stoch_k > 80:
+            signal = -1
+
+        prev_k = self._prev.get('stoch_k', NAN)
+        prev_d = self._prev.get('stoch_d', NAN)
+        crossover = 0
+        if stoch_k > stoch_d and prev_k <= prev_d:
+            crossover = 1
+        if stoch_k < stoch_d and prev_k >= prev_d:
+            crossover = -1
+
+        self._prev['stoch_k'] = stoch_k
+        self._prev['stoch_d'] = stoch_d
+        out.update(stoch_k=stoch_k, stoch_d=stoch_d, stoch_signal=signal, stoch_crossover=crossover)
+
+    def _update_williams_r(self, out: Dict, close: float):
+        highest_high = self._wr_hh.value()
+        lowest_low = self._wr_ll.value()
+        williams_r = -100 * _div(highest_high - close, highest_high - lowest_low)
+
+        signal = 0
+        if williams_r < -80:
+            signal = 1
+        if williams_r > -20:
+            signal = -1
+        out.update(williams_r=williams_r, williams_r_signal=signal)
+
+    def _update_roc(self, out: Dict, close: float):
+        self._roc_close.push(close)
+        previous = self._roc_close.value()
+        roc = _div(close - previous, previous) * 100
+
+        signal = 0
+        if roc > 0:
+            signal = 1
+        if roc < 0:
+            signal = -1
+        out.update(roc=roc, roc_signal=signal)
+
+    def _update_cci(self, out: Dict, high: float, low: float, close: float):
+        typical_price = (high + low + close) / 3
+        self._cci_tp.push(typical_price)
+        sma_tp = self._cci_tp.mean()
+        mean_deviation = self._cci_tp.mean_abs_deviation()
+        cci = _div(typical_price - sma_tp, 0.015 * mean_deviation)
+
+        signal = 0
+        if cci < -100:
+            signal = 1
+        if cci > 100:
+            signal = -1
+        out.update(cci=cci, cci_signal=signal)
+
+    # ----------------------------------------
+    # Trend indicators
+    # ----------------------------------------
+
+    def _update_adx(self, out: Dict, high: float, low: float, close: float):
+        prev_close = self._prev.get('close', NAN)
+        prev_high = self._prev.get('high', NAN)
+        prev_low = self._prev.get('low', NAN)
+
+        if _is_nan(prev_close):
+            tr = NAN
+        else:
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        up_move = high - prev_high
+        down_move = prev_low - low
+        dm_plus = max(up_move, 0.0) if up_move > down_move else 0.0
+        dm_minus = max(down_move, 0.0) if down_move > up_move else 0.0
+
+        tr_smooth = self._adx_tr.update(tr)
+        dm_plus_smooth = self._adx_dm_plus.update(dm_plus)
+        dm_minus_smooth = self._adx_dm_minus.update(dm_minus)
+
+        di_plus = 100 * _div(dm_plus_smooth, tr_smooth)
+        di_minus = 100 * _div(dm_minus_smooth, tr_smooth)
+        dx = 100 * _div(abs(di_plus - di_minus), di_plus + di_minus)
+        adx = self._adx_dx.update(dx)
+
+        signal = 0
+        if adx > 25 and di_plus > di_minus:
+            signal = 1
+        if adx > 25 and di_minus > di_plus:
+            signal = -1
+
+        self._prev['tr'] = tr
+        out.update(tr=tr, dm_plus=dm_plus, dm_minus=dm_minus, tr_smooth=tr_smooth,
+                   dm_plus_smooth=dm_plus_smooth, dm_minus_smooth=dm_minus_smooth,
+                   di_plus=di_plus, di_minus=di_minus, dx=dx, adx=adx, adx_signal=signal)
+
+    def _update_ichimoku(self, out: Dict, close: float):
+        tenkan = (self._ichi_tenkan_hh.value() + self._ichi_tenkan_ll.value()) / 2
+        kijun = (self._ichi_kijun_hh.value() + self._ichi_kijun_ll.value()) / 2
+        senkou_mid = (self._ichi_senkou_hh.value() + self._ichi_senkou_ll.value()) / 2
+
+        self._ichi_span_a.push((tenkan + kijun) / 2)
+        self._ichi_span_b.push(senkou_mid)
+        senkou_a = self._ichi_span_a.value()
+        senkou_b = self._ichi_span_b.value()
+
+        # Chikou is plotted into the past: unknown at the live edge for a positive period
+        self._ichi_close.push(close)
+        chikou = NAN if self.config['ichimoku']['chikou_period'] > 0 else self._ichi_close.value()
+        self._ichi_chikou_base.push(close)
+        chikou_base = self._ichi_chikou_base.value()
+
+        if _is_nan(senkou_a) or _is_nan(senkou_b):
+            cloud_top = cloud_bottom = NAN
+        else:
+            cloud_top = max(senkou_a, senkou_b)
+            cloud_bottom = min(senkou_a, senkou_b)
+
+        signal = 0
+        if close > cloud_top and tenkan > kijun and chikou > chikou_base:
+            signal = 1
+        if close < cloud_bottom and tenkan < kijun and chikou < chikou_base:
+            signal = -1
+
+        out.update(ichimoku_tenkan=tenkan, ichimoku_kijun=kijun, ichimoku_senkou_a=senkou_a,
+                   ichimoku_senkou_b=senkou_b, ichimoku_chikou=chikou,
+                   ichimoku_cloud_top=cloud_top, ichimoku_cloud_bottom=cloud_bottom,
+                   ichimoku_signal=signal)
+
+    def _update_psar(self, out: Dict, high: float, low: float):
+        cfg = self.config['psar']
+        af_start, af_increment, af_maximum = cfg['af_start'], cfg['af_increment'], cfg['af_maximum']
+
+        if self._psar_state is None:
+            psar, bull, af, ep = low, True, af_start, high
+            signal = 0
+        else:
+            prev_psar, prev_bull, prev_af, prev_ep = self._psar_state
+            psar = prev_psar + prev_af * (prev_ep - prev_psar)
+            if prev_bull:
+                if low <= psar:
+                    bull, psar, af, ep = False, prev_ep, af_start, low
+                elif high > prev_ep:
+                    bull, ep, af = True, high, min(af_maximum, prev_af + af_increment)
+                else:
+                    bull, ep, af = True, prev_ep, prev_af
+            else:
+                if high >= psar:
+                    bull, psar, af, ep = True, prev_ep, af_start, high
+                elif low < prev_ep:
+                    bull, ep, af = False, low, min(af_maximum, prev_af + af_increment)
+                else:
+                    bull, ep, af = False, prev_ep, prev_af
+
+            signal = 0
+            if bull and not prev_bull:
+                signal = 1
+            if not bull and prev_bull:
+                signal = -1
+
+        self._psar_state = (psar, bull, af, ep)
+        out.update(psar=psar, psar_bull_trend=bull, psar_signal=signal)
+
+    # ----------------------------------------
+    # Volatility indicators
+    # ----------------------------------------
+
+    def _update_keltner(self, out: Dict, bar: Dict, high: float, low: float, close: float):
+        cfg = self.config['keltner']
+
+        # Like the batch version, reuse an ATR column supplied with the bar
+        if 'atr' in bar:
+            atr = float(bar['atr'])
+        else:
+            self._keltner_tr.push(out['tr'])
+            atr = self._keltner_tr.mean()
+            out['atr'] = atr
+
+        if isinstance(self._keltner_ma, _EwmState):
+            middle = self._keltner_ma.update(close)
+        else:
+            self._keltner_ma.push(close)
+            middle = self._keltner_ma.mean()
+
+        upper = middle + cfg['multiplier'] * atr
+        lower = middle - cfg['multiplier'] * atr
+        position = _div(close - lower, upper - lower)
+
+        signal = 0
+        if close < lower:
+            signal = 1
+        if close > upper:
+            signal = -1
+        out.update(keltner_middle=middle, keltner_upper=upper, keltner_lower=lower,
+                   keltner_position=position, keltner_signal=signal)
+
+    def _update_donchian(self, out: Dict, close: float):
+        upper = self._donchian_hh.value()
+        lower = self._donchian_ll.value()
+        middle = (upper + lower) / 2
+        position = _div(close - lower, upper - lower)
+
+        signal = 0
+        if close >= upper:
+            signal = 1
+        if close <= lower:
+            signal = -1
+        out.update(donchian_upper=upper, donchian_lower=lower, donchian_middle=middle,
+                   donchian_position=position, donchian_signal=signal)
+
+    # ----------------------------------------
+    # Volume indicators
+    # ----------------------------------------
+
+    def _update_mfi(self, out: Dict, high: float, low: float, close: float, volume: float):
+        typical_price = (high + low + close) / 3
+        prev_tp = self._prev.get('typical_price', NAN)
+        money_flow = typical_price * volume
+
+        self._mfi_positive.push(money_flow if typical_price > prev_tp else 0.0)
+        self._mfi_negative.push(money_flow if typical_price < prev_tp else 0.0)
+        ratio = _div(self._mfi_positive.sum(), self._mfi_negative.sum())
+        mfi = 100 - _div(100, 1 + ratio)
+
+        signal = 0
+        if mfi < 20:
+            signal = 1
+        if mfi > 80:
+            signal = -1
+
+        self._prev['typical_price'] = typical_price
+        out.update(mfi=mfi, mfi_signal=signal)
+
+    def _update_obv(self, out: Dict, close: float, volume: float):
+        if self.bars_processed > 0:
+            prev_close = self._prev['close']
+            if close > prev_close:
+                self._obv += volume
+            elif close < prev_close:
+                self._obv -= volume
+
+        self._obv_ma.push(self._obv)
+        obv_ma = self._obv_ma.mean()
+
+        signal = 0
+        if self._obv > obv_ma:
+            signal = 1
+        if self._obv < obv_ma:
+            signal = -1
+        out.update(obv=self._obv, obv_ma=obv_ma, obv_signal=signal)
+
+    def _update_ad_line_and_cmf(self, out: Dict, high: float, low: float,
+                                close: float, volume: float):
+        multiplier = _div((close - low) - (high - close), high - low)
+        if _is_nan(multiplier):
+            multiplier = 0.0
+        money_flow_volume = multiplier * volume
+
+        # A/D Line
+        self._ad_line += money_flow_volume
+        self._ad_line_ma.push(self._ad_line)
+        ad_line_ma = self._ad_line_ma.mean()
+
+        ad_signal = 0
+        if self._ad_line > ad_line_ma:
+            ad_signal = 1
+        if self._ad_line < ad_line_ma:
+            ad_signal = -1
+
+        # Chaikin Money Flow
+        self._cmf_mfv.push(money_flow_volume)
+        self._cmf_volume.push(volume)
+        cmf = _div(self._cmf_mfv.sum(), self._cmf_volume.sum())
+
+        cmf_signal = 0
+        if cmf > 0.1:
+            cmf_signal = 1
+        if cmf < -0.1:
+            cmf_signal = -1
+
+        out.update(ad_line=self._ad_line, ad_line_ma=ad_line_ma, ad_line_signal=ad_signal,
+                   cmf=cmf, cmf_signal=cmf_signal)
+
+    # ----------------------------------------
+    # Composite indicators
+    # ----------------------------------------
+
+    def _update_fisher(self, out: Dict, high: float, low: float):
+        median_price = (high + low) / 2
+        max_high = self._fisher_hh.value()
+        min_low = self._fisher_ll.value()
+
+        raw_value = 2 * _div(median_price - min_low, max_high - min_low) - 1
+        if not _is_nan(raw_value):
+            raw_value = min(max(raw_value, -0.999), 0.999)
+
+        prev_fisher = self._fisher
+        signal_line = prev_fisher if self.bars_processed > 0 else NAN
+        prev_signal_line = self._prev.get('fisher_signal_line', NAN)
+
+        # The batch loop starts at the second bar; the first bar stays at zero
+        if self.bars_processed > 0:
+            if not _is_nan(raw_value):
+                self._fisher_ma = 0.33 * raw_value + 0.67 * self._fisher_ma
+            if self._fisher_ma != 0:
+                self._fisher = (0.5 * math.log((1 + self._fisher_ma) / (1 - self._fisher_ma)) +
+                                0.5 * prev_fisher)
+
+        fisher = self._fisher
+        signal = 0
+        if fisher > signal_line and prev_fisher <= prev_signal_line:
+            signal = 1
+        if fisher < signal_line and prev_fisher >= prev_signal_line:
+            signal = -1
+
+        self._prev['fisher_signal_line'] = signal_line
+        out.update(fisher_transform=fisher, fisher_signal_line=signal_line, fisher_signal=signal)
+
+
+class IndicatorStreamManager:
+    """
+    Registry of IndicatorStream objects keyed by (symbol, timeframe)
+
+    Keeps per-bar work flat for the whole symbol x timeframe universe: each
+    closed bar only advances the stream it belongs to.
+    """
+
+    def __init__(self, config: Dict[str, Dict] = None):
+        """Initialize stream manager with a shared indicator configuration"""
+        self.config = config
+        self.streams: Dict[Tuple[str, str], IndicatorStream] = {}
+
+    def get_stream(self, symbol: str, timeframe: str) -> IndicatorStream:
+        """Get (or create) the stream for a symbol/timeframe pair"""
+        key = (symbol, timeframe)
+        if key not in self.streams:
+            self.streams[key] = IndicatorStream(symbol, timeframe, self.config)
+        return self.streams[key]
+
+    def warm_up(self, symbol: str, timeframe: str, data: pd.DataFrame) -> Dict[str, float]:
+        """Initialise a stream from historical bars"""
+        return self.get_stream(symbol, timeframe).warm_up(data)
+
+    def update(self, symbol: str, timeframe: str, bar: Dict) -> Dict[str, float]:
+        """Advance the stream of a symbol/timeframe pair by one closed bar"""
+        return self.get_stream(symbol, timeframe).update(bar)
+
+    def latest(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Latest indicator values for every stream"""
+        return {key: stream.latest for key, stream in self.streams.items()}
+
+
+def main():
+    """Main execution for testing indicator streams"""
+    print("🚀 INCREMENTAL INDICATOR STREAMS")
+    print("=" * 60)
+
+    data_path = "CSVdata/raw/GEN_BTCUSD_M1_1month.csv"
+    try:
+        df = pd.read_csv(data_path)
+        df['time'] = pd.to_datetime(df['time'])
+        df.set_index('time', inplace=True)
+    except FileNotFoundError:
+        print(f"❌ Data file not found: {data_path}")
+        return
+
+    history, live = df.iloc[:-100], df.iloc[-100:]
+
+    stream = IndicatorStream("BTCUSD", "M1")
+    start = datetime.now()
+    stream.warm_up(history)
+    warm_up_seconds = (datetime.now() - start).total_seconds()
+    print(f"✅ Warmed up on {len(history):,} bars in {warm_up_seconds:.2f}s")
+
+    start = datetime.now()
+    for row in live.itertuples(index=True):
+        bar = row._asdict()
+        bar['time'] = bar.pop('Index')
+        stream.update(bar)
+    per_bar_us = (datetime.now() - start).total_seconds() / len(live) * 1e6
+    print(f"⚡ Live updates: {per_bar_us:.0f} µs per bar")
+
+    latest = stream.latest
+    print(f"📊 {stream.symbol} {stream.timeframe} @ {stream.last_time}")
+    for column in ('stoch_k', 'williams_r', 'cci', 'adx', 'psar', 'mfi', 'cmf', 'fisher_transform'):
+        print(f"   {column:<18} {latest.get(column, float('nan')):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1499 @@
+#!/usr/bin/env python3
+"""
+Indicator Validation Test Suite
+===============================
+
+Offline checks for the indicator pipeline that run directly on CSVdata/raw
+(no MT5 connection required):
+
+1. Streaming indicators match the batch calculation bar by bar
+2. NumPy kernels match the original pandas loops (PSAR, OBV, Fisher, CCI)
+3. Panel (symbols x bars) kernels match the per-symbol results
+4. The shared rolling feature cache is transparent and invalidates on new data
+5. Columnar output modes of calculate_all_indicators match the chained DataFrame path
+6. The batched multi-symbol engine matches the per-symbol strategy, enhanced strategy and dashboard
+7. Parameter sweeps match calling the indicator once per parameter set
+8. Latest-bar signals over the derived warm-up tail match the full history
+9. Cached indicator frames are reused, extended on new bars and match a recalculation
+10. Incremental hierarchical resampling matches a full pandas resample
+11. Vectorized signal and confluence series match the per-timestamp signals
+12. Point-in-time queries return the last closed bar (no look-ahead)
+13. Process-pool analysis matches sequential analysis and keeps worker caches
+14. Shared-memory market data is zero-copy, read-only and follows the writer
+15. The bounded signal history keeps the newest signals, spills the rest and counts by time range
+16. The single-pass basic + advanced indicator plan matches running the two stages separately
+17. Enhanced confluence series match the per-timestamp enhanced analysis
+18. The event-driven backtester books every fill and does not look ahead
+19. The vectorized backtester reproduces the event-driven trade log
+20. Walk-forward optimization matches in-process backtests and resumes from its cache
+21. Column stores load the same bars as the CSVs, follow CSV changes and skip unrequested columns
+22. The extraction scheduler stays within a throttled terminal's rate and completes every symbol
+23. Chunked history extraction fills month partitions exactly and resumes after a failed chunk
+24. The offline MT5 simulator serves stored bars as of its clock, fills deterministically and drives the extractor
+25. The partitioned store's manifest indexes range queries and lets quality/gap tools skip unchanged partitions
+
+Run with --benchmark to time the calculation backends side by side on every
+file in CSVdata/raw.
+
+Author: Multi-Symbol Strategy Framework
+Version: 1.0
+Date: 2025-09-21
+"""
+
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from multiprocessing import resource_tracker
+
+import numpy as np
+import pandas as pd
+
+from GEN_advanced_technical_indicators import (AdvancedTechnicalIndicators, CUMULATIVE_COLUMNS, PATH_COLUMNS,
+                                               SWEEP_METHODS, cci_kernel, rolling_mean_abs_deviation)
+from GEN_backtester import BacktestConfig, EventDrivenBacktester
+from GEN_batch_indicator_engine import BatchIndicatorEngine, SymbolPanel
+from GEN_columnar_store import convert_directory, is_fresh, load_bars, store_path
+from GEN_enhanced_multi_timeframe_strategy import EnhancedMultiTimeframeStrategy
+from GEN_extraction_scheduler import ExtractionScheduler, TokenBucket, backoff_delay
+from GEN_incremental_resampler import IncrementalResampler
+from GEN_indicator_stream import IndicatorStream
+import GEN_mt5_simulator as mt5_sim
+from GEN_partitioned_store import (PartitionedBarWriter, extract_history, file_checksum, import_csv,
+                                   load_manifest, read_range, select_partitions, verify_partitions)
+from data_quality_controller import DataQualityController
+from GEN_data_gap_filler import DataGapFiller
+from GEN_point_in_time_index import TIMEFRAME_DURATIONS
+from GEN_shared_market_data import SharedMarketDataReader, SharedMarketDataWriter
+from GEN_signal_history import SignalHistoryStore
+from GEN_trading_status_dashboard import TradingStatusDashboard
+from GEN_vectorized_backtester import VectorizedBacktester
+from GEN_walk_forward_optimizer import WalkForwardOptimizer, walk_forward_windows
+from GEN_multi_timeframe_strategy import (SIGNAL_VOTE_COLUMNS, TAIL_ATOL, TAIL_RTOL, MultiTimeframeStrategy,
+                                          TimeFrame)
+
+FLOAT_RTOL = 1e-7
+FLOAT_ATOL = 1e-9
+
+
+def load_symbol_data(symbol: str, bars: int = None, data_dir: str = "CSVdata/raw") -> pd.DataFrame:
+    """Load M1 data for a symbol indexed by time"""
+    df = load_bars(os.path.join(data_dir, f"GEN_{symbol}_M1_1month.csv"))
+    return df if bars is None else df.iloc[:bars]
+
+
+def quiet(func, *args, **kwargs):
+    """Call a function with its console output suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def compare_values(actual: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """Element-wise float comparison treating NaN == NaN"""
+    return np.isclose(np.asarray(actual, dtype=float), np.asarray(expected, dtype=float),
+                      rtol=FLOAT_RTOL, atol=FLOAT_ATOL, equal_nan=True)
+
+
+class IndicatorValidationTester:
+    """Validation suite for indicator calculations"""
+
+    def __init__(self, symbols=None):
+        self.symbols = symbols or ["BTCUSD", "NAS100", "USDCAD"]
+        self.indicators = quiet(AdvancedTechnicalIndicators)
+        self.test_results = []
+
+    def run_test(self, test_name, test_func, *args, **kwargs):
+        """Run a single test and record results"""
+        try:
+            print(f"\n🧪 Running test: {test_name}")
+            start = time.time()
+            result = test_func(*args, **kwargs)
+            duration = time.time() - start
+            self.test_results.append({"name": test_name, "status": "PASSED",
+                                      "details": result, "duration": duration})
+            print(f"✅ {test_name}: PASSED ({duration:.2f}s)")
+            return True
+        except Exception as e:
+            self.test_results.append({"name": test_name, "status": "FAILED", "error": str(e)})
+            print(f"❌ {test_name}: FAILED - {e}")
+            return False
+
+    # ========================================
+    # STREAMING INDICATORS
+    # ========================================
+
+    def test_stream_matches_batch(self, bars: int = 1500, stride: int = 53):
+        """Stream output at bar t equals the last row of the batch run over bars[0..t]"""
+        checked = 0
+        for symbol in self.symbols:
+            df = load_symbol_data(symbol, bars)
+            streamed = IndicatorStream(symbol, "M1").to_frame(df)
+
+            for t in list(range(0, 80)) + list(range(80, len(df), stride)):
+                expected = quiet(self.indicators.calculate_all_indicators, df.iloc[:t + 1]).iloc[-1]
+                for column in streamed.columns:
+                    if not compare_values(streamed[column].iloc[t], expected[column]):
+                        raise AssertionError(f"{symbol} bar {t} {column}: "
+                                             f"stream={streamed[column].iloc[t]} batch={expected[column]}")
+                checked += 1
+            print(f"   {symbol}: {checked} bars verified")
+        return {"bars_checked": checked}
+
+    def test_stream_full_history(self):
+        """Replaying a full month through the stream reproduces the batch float columns"""
+        df = load_symbol_data(self.symbols[0])
+        batch = quiet(self.indicators.calculate_all_indicators, df)
+        streamed = IndicatorStream(self.symbols[0], "M1").to_frame(df)
+
+        # Chikou looks into the future in the batch result; threshold signals are
+        # skipped because values sitting exactly on a threshold may land either side
+        skip = {'ichimoku_chikou'}
+        mismatched = [c for c in streamed.columns
+                      if c not in skip and not c.endswith(('_signal', '_crossover'))
+                      and not compare_values(streamed[c].values, batch[c].values).all()]
+        if mismatched:
+            raise AssertionError(f"Columns differ from batch: {mismatched}")
+        return {"bars": len(df), "columns": len(streamed.columns)}
+
+    # ========================================
+    # CALCULATION BACKENDS
+    # ========================================
+
+    RECURSIVE_INDICATORS = ('calculate_parabolic_sar', 'calculate_obv', 'calculate_fisher_transform',
+                            'calculate_cci')
+
+    # Signals allowed to differ where the source value sits on a threshold within float noise
+    THRESHOLD_SIGNALS = {'cci_signal': ('cci', (-100.0, 100.0))}
+
+    def test_kernel_backends_match(self):
+        """NumPy kernels reproduce the pandas loops on full months of data"""
+        legacy = quiet(AdvancedTechnicalIndicators, backend='pandas')
+        kernels = quiet(AdvancedTechnicalIndicators, backend='numpy')
+
+        for symbol in self.symbols:
+            df = load_symbol_data(symbol)
+            for method in self.RECURSIVE_INDICATORS:
+                expected = getattr(legacy, method)(df)
+                actual = getattr(kernels, method)(df)
+                for column in expected.columns.difference(df.columns):
+                    matches = compare_values(actual[column].values, expected[column].values)
+                    if column in self.THRESHOLD_SIGNALS:
+                        source, thresholds = self.THRESHOLD_SIGNALS[column]
+                        matches |= np.isclose(expected[source].values[:, np.newaxis], thresholds,
+                                              rtol=FLOAT_RTOL, atol=FLOAT_ATOL).any(axis=1)
+                    if not matches.all():
+                        raise AssertionError(f"{symbol} {method}: column {column} differs")
+            print(f"   {symbol}: {len(df):,} bars identical across backends")
+        return {"symbols": len(self.symbols)}
+
+    def test_panel_kernels_match(self, window: int = 20):
+        """Rolling MAD and CCI on a NaN-padded (symbols x bars) panel match per-symbol runs"""
+        frames = [load_symbol_data(symbol) for symbol in self.symbols]
+        length = max(len(df) for df in frames)
+        panels = {column: np.full((len(frames), length), np.nan) for column in ('high', 'low', 'close')}
+        for row, df in enumerate(frames):
+            for column, panel in panels.items():
+                panel[row, length - len(df):] = df[column].values
+
+        mad = rolling_mean_abs_deviation(panels['close'], window)
+        cci = cci_kernel(panels['high'], panels['low'], panels['close'], window)
+
+        for row, (symbol, df) in enumerate(zip(self.symbols, frames)):
+            offset = length - len(df)
+            expected_mad = df['close'].rolling(window).apply(lambda x: np.mean(np.abs(x - np.mean(x))), raw=True)
+            expected_cci = self.indicators.calculate_cci(df, window)['cci']
+            if not compare_values(mad[row, offset:], expected_mad.values).all():
+                raise AssertionError(f"{symbol}: panel rolling MAD differs")
+            if not compare_values(cci[row, offset:], expected_cci.values).all():
+                raise AssertionError(f"{symbol}: panel CCI differs")
+            print(f"   {symbol}: {len(df):,} bars identical in panel")
+        return {"panel_shape": panels['close'].shape}
+
+    # ========================================
+    # FEATURE CACHE
+    # ========================================
+
+    def test_feature_cache(self):
+        """Cached rolling statistics reproduce uncached results and are refreshed with the data"""
+        strategy = quiet(EnhancedMultiTimeframeStrategy)
+        cache = strategy.feature_cache
+        df = load_symbol_data(self.symbols[0], bars=5000)
+
+        uncached = quiet(AdvancedTechnicalIndicators).calculate_stochastic(df)
+        cached = quiet(strategy.calculate_enhanced_technical_indicators, df)
+        if not compare_values(cached['stoch_k'].values, uncached['stoch_k'].values).all():
+            raise AssertionError("Cached stochastic differs from uncached calculation")
+        first = cache.get_stats()
+        if first['hits'] == 0:
+            raise AssertionError("No rolling statistic was shared between indicators")
+
+        # Same frame again: every lookup is a hit
+        cache.reset_stats()
+        quiet(strategy.calculate_enhanced_technical_indicators, df.copy())
+        if cache.get_stats()['misses'] != 0:
+            raise AssertionError(f"Unchanged frame recomputed features: {cache.get_stats()}")
+
+        # New bar: the frame fingerprint changes and nothing stale is reused
+        cache.reset_stats()
+        extended = load_symbol_data(self.symbols[0], bars=5001)
+        result = quiet(strategy.calculate_enhanced_technical_indicators, extended)
+        if cache.get_stats()['misses'] != first['misses']:
+            raise AssertionError(f"Extended frame reused stale features: {cache.get_stats()}")
+        expected = quiet(AdvancedTechnicalIndicators).calculate_donchian_channels(extended)
+        if not compare_values(result['donchian_upper'].values, expected['donchian_upper'].values).all():
+            raise AssertionError("Donchian channel differs after refresh")
+
+        print(f"   First refresh: {first['misses']} computed, {first['hits']} shared")
+        return first
+
+    # ========================================
+    # OUTPUT MODES
+    # ========================================
+
+    def test_output_modes(self):
+        """Frame, block and dict layouts carry the same values as chaining the DataFrame methods"""
+        df = load_symbol_data(self.symbols[0], bars=5000)
+        config = self.indicators._get_default_config()
+
+        # Reference: every method on its own DataFrame copy
+        expected = df
+        for method, key in (('calculate_stochastic', 'stochastic'), ('calculate_williams_r', 'williams_r'),
+                            ('calculate_roc', 'roc'), ('calculate_cci', 'cci'), ('calculate_adx', 'adx'),
+                            ('calculate_ichimoku', 'ichimoku'), ('calculate_parabolic_sar', 'psar'),
+                            ('calculate_keltner_channels', 'keltner'), ('calculate_donchian_channels', 'donchian'),
+                            ('calculate_mfi', 'mfi'), ('calculate_obv', None), ('calculate_ad_line', None),
+                            ('calculate_cmf', 'cmf'), ('calculate_fisher_transform', 'fisher')):
+            expected = getattr(self.indicators, method)(expected, **config.get(key, {}))
+
+        frame = quiet(self.indicators.calculate_all_indicators, df)
+        pd.testing.assert_frame_equal(frame, expected)
+
+        new_columns = [c for c in expected.columns if c not in df.columns]
+        block = quiet(self.indicators.calculate_all_indicators, df, output_mode='block', new_columns_only=True)
+        arrays = quiet(self.indicators.calculate_all_indicators, df, output_mode='dict', new_columns_only=True)
+        if list(block.columns) != new_columns or list(arrays) != new_columns:
+            raise AssertionError("new_columns_only returned unexpected columns")
+        if len(block._mgr.blocks) != 1:
+            raise AssertionError("Block layout is not backed by a single array")
+        for column in new_columns:
+            if not (compare_values(block[column].values, expected[column].values.astype(float)).all() and
+                    compare_values(arrays[column], expected[column].values.astype(float)).all()):
+                raise AssertionError(f"Column {column} differs between layouts")
+        print(f"   {len(new_columns)} indicator columns identical in frame, block and dict layouts")
+        return {"columns": len(new_columns)}
+
+    # ========================================
+    # BATCHED MULTI-SYMBOL ENGINE
+    # ========================================
+
+    def test_batch_engine_matches(self):
+        """Panel indicators and batched confluence signals match the per-symbol strategy"""
+        strategy = quiet(MultiTimeframeStrategy)
+        for symbol in self.symbols:
+            quiet(strategy.load_data, symbol)
+
+        timeframe = TimeFrame.H1
+        frames = {symbol: strategy.data_cache[symbol][timeframe] for symbol in self.symbols}
+        panel = SymbolPanel.from_frames(frames)
+        engine = quiet(BatchIndicatorEngine, strategy.config.get("multi_timeframe", {}).get("indicators", {}))
+        indicators = engine.calculate_all(panel)
+
+        for row, symbol in enumerate(self.symbols):
+            start = panel.start[row]
+            basic = quiet(strategy.calculate_technical_indicators, frames[symbol])
+            advanced = quiet(self.indicators.calculate_all_indicators, frames[symbol])
+            expected = {**{c: advanced[c] for c in advanced.columns}, **{c: basic[c] for c in basic.columns}}
+            compared = 0
+            for name, values in indicators.items():
+                # Keltner bands use the basic ATR in the combined pipeline
+                if name not in expected or name.startswith('keltner_'):
+                    continue
+                if not compare_values(values[row, start:], expected[name].values.astype(float)).all():
+                    raise AssertionError(f"{symbol}: panel column {name} differs")
+                compared += 1
+            print(f"   {symbol}: {compared} indicator columns identical on {len(frames[symbol]):,} {timeframe.name} bars")
+
+        scalar = quiet(strategy.analyze_multiple_symbols, self.symbols)
+        batched = quiet(strategy.analyze_multiple_symbols, self.symbols, batched=True)
+        for symbol in self.symbols:
+            a, b = scalar[symbol], batched[symbol]
+            if (a.overall_direction, a.recommended_action, a.risk_level) != \
+                    (b.overall_direction, b.recommended_action, b.risk_level) or \
+                    not np.isclose([a.overall_strength, a.confluence_score],
+                                   [b.overall_strength, b.confluence_score]).all():
+                raise AssertionError(f"{symbol}: batched confluence signal differs")
+        print(f"   {len(self.symbols)} confluence signals identical (batched vs per-symbol)")
+
+        # Enhanced analysis: basic + advanced panel vs per-symbol frames, one pair falling back to full history
+        enhanced = quiet(EnhancedMultiTimeframeStrategy)
+        for symbol in self.symbols:
+            quiet(enhanced.load_data, symbol)
+        enhanced.tail_fallbacks.add((self.symbols[0], TimeFrame.M15))
+        scalar = {symbol: quiet(enhanced.analyze_symbol_enhanced, symbol) for symbol in self.symbols}
+        batched = quiet(enhanced.analyze_multiple_symbols_enhanced, self.symbols, batched=True)
+        compared = 0
+        for symbol in self.symbols:
+            a, b = scalar[symbol], batched[symbol]
+            if (a.overall_direction, a.recommended_action, a.risk_level, len(a.timeframe_signals)) != \
+                    (b.overall_direction, b.recommended_action, b.risk_level, len(b.timeframe_signals)) or \
+                    not np.isclose([a.overall_strength, a.confluence_score],
+                                   [b.overall_strength, b.confluence_score]).all():
+                raise AssertionError(f"{symbol}: batched enhanced confluence signal differs")
+            for tf_a, tf_b in zip(a.timeframe_signals, b.timeframe_signals):
+                if (tf_a.timeframe, tf_a.direction, tf_a.timestamp, tf_a.indicators.keys()) != \
+                        (tf_b.timeframe, tf_b.direction, tf_b.timestamp, tf_b.indicators.keys()):
+                    raise AssertionError(f"{symbol} {tf_a.timeframe.name}: batched enhanced signal differs")
+                names = list(tf_a.indicators)
+                if not compare_values([tf_b.indicators[n] for n in names], [tf_a.indicators[n] for n in names]).all():
+                    raise AssertionError(f"{symbol} {tf_a.timeframe.name}: batched enhanced indicator values differ")
+                compared += len(names)
+        print(f"   {len(self.symbols)} enhanced confluence signals identical ({compared} indicator values)")
+
+        dashboard = quiet(TradingStatusDashboard)
+        dashboard.strategy = enhanced
+        rows = quiet(dashboard.analyze_symbols, self.symbols)
+        for symbol, row in zip(self.symbols, rows):
+            expected = quiet(dashboard.analyze_symbol, symbol)
+            numeric = ['confluence', 'strength', 'last_price']
+            if row['signal'] == '❌ ERROR' or \
+                    {k: v for k, v in row.items() if k not in numeric} != \
+                    {k: v for k, v in expected.items() if k not in numeric} or \
+                    not compare_values([row[k] for k in numeric], [expected[k] for k in numeric]).all():
+                raise AssertionError(f"{symbol}: batched dashboard status differs")
+        print(f"   {len(rows)} dashboard status rows identical (batched vs per-symbol)")
+        return {"panel_shape": panel.fields['close'].shape, "enhanced_values": compared}
+
+    # ========================================
+    # PARAMETER SWEEPS
+    # ========================================
+
+    def test_parameter_sweep(self):
+        """Every slice of a sweep equals the indicator called with that parameter set"""
+        df = load_symbol_data(self.symbols[0], bars=5000)
+        grids = {
+            'stochastic': {'k_period': [5, 14, 21], 'd_period': [3, 5], 'smooth_k': [1, 3]},
+            'adx': {'period': [7, 14, 28]},
+            'keltner': {'period': [10, 20], 'multiplier': [1.5, 2.0, 2.5]}
+        }
+        for indicator, grid in grids.items():
+            result = self.indicators.sweep_parameters(df, indicator, grid)
+            expected_sets = int(np.prod([len(values) for values in grid.values()]))
+            if result.values.shape != (expected_sets, len(df), len(result.outputs)):
+                raise AssertionError(f"{indicator}: unexpected result shape {result.values.shape}")
+            for position, params in enumerate(result.params):
+                expected = getattr(self.indicators, SWEEP_METHODS[indicator])(df, **params)
+                for column_position, column in enumerate(result.outputs):
+                    if not compare_values(result.values[position, :, column_position],
+                                          expected[column].values.astype(float)).all():
+                        raise AssertionError(f"{indicator} {params}: column {column} differs")
+            print(f"   {indicator}: {len(result)} parameter sets x {len(result.outputs)} outputs identical")
+        return {"indicators": len(grids)}
+
+    # ========================================
+    # TAIL-WINDOW EVALUATION
+    # ========================================
+
+    def test_tail_evaluation(self):
+        """Signals computed over indicator_lookback() bars match the full-history signals"""
+        strategy = quiet(EnhancedMultiTimeframeStrategy)
+        lookback = strategy.indicator_lookback()
+        for symbol in self.symbols:
+            quiet(strategy.load_data, symbol)
+
+        for symbol in self.symbols:
+            for timeframe in strategy.timeframes:
+                strategy.evaluation_mode = 'full'
+                full = quiet(strategy.generate_enhanced_timeframe_signal, symbol, timeframe)
+                strategy.evaluation_mode = 'verify'
+                quiet(strategy.generate_enhanced_timeframe_signal, symbol, timeframe)
+                strategy.evaluation_mode = 'tail'
+                tail = quiet(strategy.generate_enhanced_timeframe_signal, symbol, timeframe)
+                if (tail.direction, tail.strength, tail.timestamp) != (full.direction, full.strength, full.timestamp) \
+                        or not np.isclose(tail.confidence, full.confidence):
+                    raise AssertionError(f"{symbol} {timeframe.name}: tail signal differs from full history")
+
+        # Tails starting inside gap-filled weekend bars, where a restarted SAR and
+        # the ADX ratios stay off the full-history path for hundreds of bars
+        m1 = load_symbol_data("AUDUSD")
+        for end in ("2025-08-23 16:57", "2025-09-01 00:30"):
+            quiet(strategy.load_frame, "AUDUSD", m1.loc[:end])
+            strategy.evaluation_mode = 'full'
+            full = quiet(strategy.generate_enhanced_timeframe_signal, "AUDUSD", TimeFrame.M1)
+            strategy.evaluation_mode = 'verify'
+            quiet(strategy.generate_enhanced_timeframe_signal, "AUDUSD", TimeFrame.M1)
+            strategy.evaluation_mode = 'tail'
+            tail = quiet(strategy.generate_enhanced_timeframe_signal, "AUDUSD", TimeFrame.M1)
+            if (tail.direction, tail.strength, tail.timestamp) != (full.direction, full.strength, full.timestamp) \
+                    or not np.isclose(tail.confidence, full.confidence):
+                raise AssertionError(f"AUDUSD M1 at {end}: tail signal differs from full history")
+            # The batched panel continues the same state (its flat-stretch MACD differs only by rounding)
+            batched = quiet(strategy.generate_enhanced_timeframe_signals_batch, ["AUDUSD"], TimeFrame.M1)["AUDUSD"]
+            path = ['psar', 'psar_signal', 'adx', 'di_plus', 'di_minus', 'adx_signal']
+            if not compare_values([batched.indicators[n] for n in path], [full.indicators[n] for n in path]).all():
+                raise AssertionError(f"AUDUSD M1 at {end}: batched SAR/ADX differ from full history")
+
+        mismatched = [check for check in strategy.tail_checks if check['mismatched']]
+        if mismatched:
+            raise AssertionError(f"Tail values differ from full history: {mismatched[0]}")
+
+        # A tail too short for the EMA warm-ups is caught by 'verify' and that
+        # symbol/timeframe falls back to full history in 'tail' mode
+        short = quiet(EnhancedMultiTimeframeStrategy)
+        short.indicator_lookback = lambda: 60
+        symbol = self.symbols[0]
+        quiet(short.load_data, symbol)
+        short.evaluation_mode = 'verify'
+        quiet(short.generate_enhanced_timeframe_signal, symbol, TimeFrame.M1)
+        if (symbol, TimeFrame.M1) not in short.tail_fallbacks:
+            raise AssertionError("Mismatching 60-bar tail did not trigger the full-history fallback")
+        short.evaluation_mode = 'tail'
+        fallback = quiet(short.generate_enhanced_timeframe_signal, symbol, TimeFrame.M1)
+        strategy.evaluation_mode = 'full'
+        full = quiet(strategy.generate_enhanced_timeframe_signal, symbol, TimeFrame.M1)
+        if (fallback.direction, fallback.strength) != (full.direction, full.strength):
+            raise AssertionError("Fallback evaluation differs from full history")
+        print(f"   {len(strategy.tail_checks)} latest-bar checks over a {lookback}-bar tail identical "
+              f"(max abs diff {max(c['max_abs_diff'] for c in strategy.tail_checks):.1e})")
+        return {"lookback": lookback, "checks": len(strategy.tail_checks)}
+
+    # ========================================
+    # INDICATOR FRAME CACHE
+    # ========================================
+
+    def test_indicator_frame_cache(self, bars: int = 40000):
+        """Unchanged frames are cache hits; appended bars extend cached frames exactly"""
+        strategy = quiet(EnhancedMultiTimeframeStrategy)
+        cache = strategy.indicator_cache
+        symbol = self.symbols[0]
+        quiet(strategy.load_data, symbol)
+
+        first = quiet(strategy.analyze_symbol_enhanced, symbol)
+        cache.reset_stats()
+        second = quiet(strategy.analyze_symbol_enhanced, symbol)
+        if cache.get_stats()['misses'] or cache.get_stats()['appends']:
+            raise AssertionError(f"Refresh without new bars recalculated frames: {cache.get_stats()}")
+        if (first.overall_direction, first.confluence_score) != (second.overall_direction, second.confluence_score):
+            raise AssertionError("Cached refresh changed the confluence signal")
+
+        # Growing M1 history: new bars, and a still-forming last bar on the resampled timeframes
+        m1 = strategy.data_cache[symbol][TimeFrame.M1]
+        aggregation = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last',
+                       'tick_volume': 'sum', 'spread': 'mean', 'real_volume': 'sum'}
+        calculate = strategy.calculate_enhanced_technical_indicators
+        cache.reset_stats()
+        for timeframe in (TimeFrame.M1, TimeFrame.M5, TimeFrame.H1):
+            for latest_only in (False, True):
+                for n in (bars, bars + 1, bars + 3, bars + 10):
+                    data = m1.iloc[:n]
+                    if timeframe != TimeFrame.M1:
+                        data = data.resample(timeframe.value).agg(aggregation).dropna()
+                    cached = quiet(strategy._calculate_indicator_frame, 'TEST', timeframe, data,
+                                   calculate, latest_only=latest_only)
+                expected = quiet(calculate, data)
+                rows = slice(-1, None) if latest_only else slice(None)
+                for column in expected.columns:
+                    if column in CUMULATIVE_COLUMNS and latest_only:
+                        continue
+                    if not np.isclose(cached[column].to_numpy(float)[rows], expected[column].to_numpy(float)[rows],
+                                      rtol=TAIL_RTOL, atol=TAIL_ATOL, equal_nan=True).all():
+                        raise AssertionError(f"{timeframe.name} (latest_only={latest_only}): "
+                                             f"appended column {column} differs")
+        # Every growth step (3 per timeframe and mode) must extend the cached frame
+        stats = cache.get_stats()
+        if stats['appends'] < 18:
+            raise AssertionError(f"New bars were not appended incrementally: {stats}")
+
+        # Appends across gap-filled weekend bars, where the SAR and ADX of a
+        # window restarted inside the flat stretch leave the full-history path
+        weekend = load_symbol_data("AUDUSD")
+        cache.reset_stats()
+        for latest_only in (False, True):
+            for end in ("2025-08-23 12:00", "2025-08-23 16:57", "2025-08-24 12:00",
+                        "2025-08-25 00:30", "2025-08-25 00:31", "2025-08-25 01:00"):
+                data = weekend.loc[:end]
+                cached = quiet(strategy._calculate_indicator_frame, 'WEEKEND', TimeFrame.M1, data,
+                               calculate, latest_only=latest_only)
+                expected = quiet(calculate, data)
+                rows = slice(-1, None) if latest_only else slice(None)
+                for column in PATH_COLUMNS:
+                    if not compare_values(cached[column].to_numpy(float)[rows],
+                                          expected[column].to_numpy(float)[rows]).all():
+                        raise AssertionError(f"AUDUSD M1 to {end} (latest_only={latest_only}): "
+                                             f"appended column {column} differs from a full recalculation")
+        if cache.get_stats()['appends'] < 10:
+            raise AssertionError(f"Weekend bars were not appended incrementally: {cache.get_stats()}")
+
+        # A changed indicator configuration must not reuse frames
+        strategy.enhanced_config = {**strategy.enhanced_config, "indicators": {
+            **strategy.enhanced_config["indicators"], "cci": {"period": 14, "weight": 0.15}}}
+        cache.reset_stats()
+        quiet(strategy.generate_enhanced_timeframe_signal, symbol, TimeFrame.H1)
+        if cache.get_stats()['misses'] != 1:
+            raise AssertionError(f"Config change reused a cached frame: {cache.get_stats()}")
+
+        print(f"   Refresh without new bars: all hits; {stats['appends']} appends match recalculation")
+        return stats
+
+    # ========================================
+    # INCREMENTAL RESAMPLING
+    # ========================================
+
+    RESAMPLE_AGGREGATION = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last',
+                            'tick_volume': 'sum', 'spread': 'mean', 'real_volume': 'sum'}
+    RESAMPLE_FREQUENCIES = {'M5': '5min', 'M15': '15min', 'H1': '1h', 'H4': '4h', 'D1': '1D'}
+
+    def test_incremental_resampler(self, appended: int = 600):
+        """Bulk and bar-by-bar hierarchical resampling reproduce df.resample().agg()"""
+        rng = np.random.default_rng(7)
+        for symbol in self.symbols:
+            df = load_symbol_data(symbol)
+            expected = {name: df.resample(freq).agg(self.RESAMPLE_AGGREGATION).dropna()
+                        for name, freq in self.RESAMPLE_FREQUENCIES.items()}
+
+            bulk = IncrementalResampler()
+            bulk.append(df)
+
+            # Replay the tail in random chunks, re-sending a still-forming bar now and then
+            incremental = IncrementalResampler()
+            incremental.append(df.iloc[:-appended])
+            closed = {name: [] for name in self.RESAMPLE_FREQUENCIES}
+            position = len(df) - appended
+            while position < len(df):
+                step = int(rng.integers(1, 5))
+                if rng.random() < 0.2:
+                    forming = df.iloc[[position]].copy()
+                    forming[['high', 'close']] *= 1.001
+                    incremental.append(forming)
+                for name, bars in incremental.append(df.iloc[position:position + step]).items():
+                    closed[name].append(bars)
+                position += step
+
+            for name, frame in expected.items():
+                for resampler in (bulk, incremental):
+                    pd.testing.assert_frame_equal(resampler.frame(name), frame, check_freq=False,
+                                                  check_exact=False, rtol=1e-15)
+                if closed[name]:
+                    emitted = pd.concat(closed[name])
+                    pd.testing.assert_frame_equal(emitted, frame.loc[emitted.index], check_freq=False,
+                                                  check_exact=False, rtol=1e-15)
+                    if emitted.index[-1] != frame.index[-2]:
+                        raise AssertionError(f"{symbol} {name}: closed bars not emitted up to the open bucket")
+            print(f"   {symbol}: {len(expected)} timeframes identical (bulk and {appended} bars appended)")
+
+        # Strategy: appended bars leave data_cache equal to a fresh load
+        symbol = self.symbols[0]
+        strategy = quiet(MultiTimeframeStrategy)
+        fresh = quiet(MultiTimeframeStrategy)
+        quiet(fresh.load_data, symbol)
+        df = load_symbol_data(symbol)
+        strategy.resamplers[symbol] = IncrementalResampler()
+        strategy.resamplers[symbol].append(df.iloc[:-30])
+        strategy.append_bars(symbol, df.iloc[-30:])
+        for tf in strategy.timeframes:
+            pd.testing.assert_frame_equal(strategy.data_cache[symbol][tf], fresh.data_cache[symbol][tf],
+                                          check_freq=False, check_exact=False, rtol=1e-15)
+
+        # Appends hand out read-only views, so their cost does not grow with the history
+        close = strategy.data_cache[symbol][TimeFrame.H1]['close'].to_numpy()
+        if close.flags.writeable or \
+                not np.shares_memory(close, strategy.resamplers[symbol].bars['H1'].columns['close']):
+            raise AssertionError("Appended frames copy the resampler's arrays")
+        per_append = {}
+        for history in (2000, len(df) - 300):
+            timed = quiet(MultiTimeframeStrategy)
+            timed.resamplers[symbol] = IncrementalResampler()
+            timed.resamplers[symbol].append(df.iloc[:history])
+            start = time.perf_counter()
+            for position in range(history, history + 300):
+                timed.append_bars(symbol, df.iloc[position:position + 1])
+            per_append[history] = (time.perf_counter() - start) / 300
+        short, long = sorted(per_append)
+        if per_append[long] > 2 * per_append[short]:
+            raise AssertionError(f"Append cost grows with the history: {per_append}")
+        print(f"   append_bars {per_append[short] * 1000:.2f}ms at {short:,} bars, "
+              f"{per_append[long] * 1000:.2f}ms at {long:,} bars")
+        return {"symbols": len(self.symbols)}
+
+    # ========================================
+    # SIGNAL SERIES
+    # ========================================
+
+    def test_signal_series(self, samples: int = 150):
+        """Signal and confluence series equal the scalar signal at every sampled time"""
+        strategy = quiet(MultiTimeframeStrategy)
+        rng = np.random.default_rng(11)
+        for symbol in self.symbols:
+            quiet(strategy.load_data, symbol)
+
+            # Every bar of the hourly series against the row-by-row signal
+            timeframe = TimeFrame.H1
+            series = strategy.generate_timeframe_signal_series(symbol, timeframe)
+            frame = strategy._calculate_indicator_frame(symbol, timeframe, strategy.data_cache[symbol][timeframe],
+                                                        strategy.calculate_technical_indicators)
+            for time_, row in series.iterrows():
+                signal = strategy._timeframe_signal_from_row(timeframe, frame.loc[time_], time_)
+                votes = tuple(signal.indicators[name] for name in SIGNAL_VOTE_COLUMNS)
+                if votes != tuple(row[list(SIGNAL_VOTE_COLUMNS)]) \
+                        or (signal.direction.value, signal.strength.value, signal.confidence) \
+                        != (row['direction'], row['strength'], row['confidence']):
+                    raise AssertionError(f"{symbol} {timeframe.name} {time_}: series differs from scalar signal")
+
+            # Confluence at bar times and between bars
+            m1 = strategy.data_cache[symbol][TimeFrame.M1].index
+            times = m1[rng.integers(0, len(m1), samples)].append(
+                m1[rng.integers(0, len(m1), samples // 3)] + pd.Timedelta(seconds=20))
+            confluence = strategy.calculate_confluence_series(symbol, times)
+            for time_, row in zip(times, confluence.itertuples()):
+                signal = quiet(strategy.calculate_confluence_signal, symbol, time_)
+                if (signal.overall_direction.value, signal.overall_strength, signal.confluence_score,
+                        signal.recommended_action, signal.risk_level, signal.position_size_multiplier,
+                        signal.timestamp) != (row.overall_direction, row.overall_strength, row.confluence_score,
+                                              row.recommended_action, row.risk_level,
+                                              row.position_size_multiplier, row.timestamp):
+                    raise AssertionError(f"{symbol} {time_}: confluence series differs from scalar signal")
+
+            start = time.perf_counter()
+            full = strategy.calculate_confluence_series(symbol)
+            elapsed = time.perf_counter() - start
+            print(f"   {symbol}: {len(series)} H1 bars and {len(times)} confluence times identical; "
+                  f"{len(full)} M1 bars in {elapsed * 1000:.0f}ms")
+        return {"symbols": len(self.symbols)}
+
+    # ========================================
+    # POINT-IN-TIME QUERIES
+    # ========================================
+
+    def test_point_in_time_index(self, samples: int = 2000):
+        """As-of lookups return the last bar closed by the query time, in batches and after appends"""
+        strategy = quiet(MultiTimeframeStrategy)
+        index = strategy.point_in_time
+        rng = np.random.default_rng(12)
+        for symbol in self.symbols:
+            quiet(strategy.load_data, symbol)
+            m1 = strategy.data_cache[symbol][TimeFrame.M1].index
+            # Random times plus exact bar boundaries and a time before the first close
+            times = pd.DatetimeIndex(m1[0] + (m1[-1] - m1[0]) * rng.random(samples)).append(
+                m1[rng.integers(0, len(m1), samples // 4)]).append(pd.DatetimeIndex([m1[0]]))
+
+            for timeframe in strategy.timeframes:
+                bars = strategy.data_cache[symbol][timeframe].index
+                close = bars + TIMEFRAME_DURATIONS[timeframe.name]
+                positions = index.positions(symbol, timeframe, times)
+                expected = np.array([np.flatnonzero(close <= t)[-1] if close[0] <= t else -1 for t in times])
+                if not np.array_equal(positions, expected):
+                    raise AssertionError(f"{symbol} {timeframe.name}: as-of positions differ from a linear scan")
+                if index.positions(symbol, timeframe, times[7])[0] != positions[7]:
+                    raise AssertionError(f"{symbol} {timeframe.name}: single query differs from batch query")
+
+            asof = index.asof(symbol, times)
+            if asof['M1'].iloc[-1] is not pd.NaT or (asof['H1'] + pd.Timedelta('1h') > asof.index).any():
+                raise AssertionError(f"{symbol}: as-of lookup returned a bar that had not closed")
+
+            start = time.perf_counter()
+            index.positions(symbol, TimeFrame.M1, times)
+            batch = time.perf_counter() - start
+            print(f"   {symbol}: {len(times)} times x {len(strategy.timeframes)} timeframes match a linear scan "
+                  f"(M1 batch in {batch * 1e6:.0f}us)")
+
+        # Appended bars replace the cached frame and are visible to later queries
+        symbol = self.symbols[0]
+        df = load_symbol_data(symbol)
+        strategy.resamplers[symbol] = IncrementalResampler()
+        strategy.resamplers[symbol].append(df.iloc[:-120])
+        strategy.data_cache[symbol] = {tf: strategy.resamplers[symbol].frame(tf.name) for tf in strategy.timeframes}
+        before = index.positions(symbol, TimeFrame.M5, df.index[-1])[0]
+        strategy.append_bars(symbol, df.iloc[-120:])
+        after = index.positions(symbol, TimeFrame.M5, df.index[-1])[0]
+        m5 = strategy.data_cache[symbol][TimeFrame.M5].index
+        expected = np.count_nonzero(m5 + TIMEFRAME_DURATIONS['M5'] <= df.index[-1]) - 1
+        if after <= before or after != expected:
+            raise AssertionError(f"Appended M5 bars not visible to as-of queries ({before} -> {after}, "
+                                 f"expected {expected})")
+        return {"symbols": len(self.symbols)}
+
+    # ========================================
+    # PARALLEL ANALYSIS
+    # ========================================
+
+    def test_parallel_analysis(self, workers: int = 2):
+        """Worker-process analysis matches sequential analysis; repeat calls reuse worker caches"""
+        strategy = quiet(MultiTimeframeStrategy)
+        strategy.parallel_workers = workers
+        symbols = list(self.symbols) + ['MISSING']
+        try:
+            sequential = quiet(strategy.analyze_multiple_symbols, symbols)
+            parallel = quiet(strategy.analyze_multiple_symbols, symbols, parallel=True)
+            for symbol in symbols:
+                expected, signal = sequential[symbol], parallel[symbol]
+                if (expected is None) != (signal is None):
+                    raise AssertionError(f"{symbol}: parallel and sequential analysis disagree on failure")
+                if expected is not None and (
+                        (signal.overall_direction, signal.overall_strength, signal.confluence_score,
+                         signal.recommended_action, signal.timestamp)
+                        != (expected.overall_direction, expected.overall_strength, expected.confluence_score,
+                            expected.recommended_action, expected.timestamp)):
+                    raise AssertionError(f"{symbol}: parallel signal differs from sequential signal")
+
+            start = time.perf_counter()
+            quiet(strategy.analyze_multiple_symbols, symbols, parallel=True)
+            elapsed = time.perf_counter() - start
+            stats = strategy.parallel_analyzer.worker_stats()
+        finally:
+            strategy.close_workers()
+
+        loaded = sorted(symbol for worker in stats for symbol in worker['symbols'])
+        if loaded != sorted(self.symbols):
+            raise AssertionError(f"Symbols loaded by more than one worker: {stats}")
+        hits = sum(worker['indicator_cache']['hits'] for worker in stats)
+        misses = sum(worker['indicator_cache']['misses'] for worker in stats)
+        if misses != hits:
+            raise AssertionError(f"Repeat call recalculated frames in the workers: {stats}")
+        print(f"   {len(symbols)} symbols on {len(stats)} workers identical to sequential; "
+              f"repeat call served from worker caches in {elapsed * 1000:.0f}ms")
+        return {"workers": len(stats)}
+
+    # ========================================
+    # SHARED-MEMORY MARKET DATA
+    # ========================================
+
+    def test_shared_market_data(self, withheld: int = 300):
+        """Readers and workers attach to the writer's bars without copies and see appended bars"""
+        prefix = f"gen_validation_{os.getpid()}"
+        symbol = self.symbols[0]
+        df = load_symbol_data(symbol)
+
+        writer = quiet(MultiTimeframeStrategy)
+        writer.resamplers[symbol] = IncrementalResampler()
+        writer.resamplers[symbol].append(df.iloc[:-withheld])
+        writer.data_cache[symbol] = {tf: writer.resamplers[symbol].frame(tf.name) for tf in writer.timeframes}
+        for other in self.symbols[1:]:
+            quiet(writer.load_data, other)
+        reader = quiet(MultiTimeframeStrategy)
+        try:
+            writer.publish_shared_data(prefix=prefix)
+            reader.attach_shared_data(prefix)
+            quiet(reader.load_data, symbol)
+
+            close = reader.data_cache[symbol][TimeFrame.M1]['close'].to_numpy()
+            segment = reader.shared_reader._attached[(symbol, 'M1')]['segment']
+            if close.flags.writeable or not np.shares_memory(close, np.ndarray(segment.size, np.uint8, segment.buf)):
+                raise AssertionError("Attached frame is a writable copy instead of a read-only shared view")
+            if reader.shared_reader.frame(symbol, 'M1') is not reader.data_cache[symbol][TimeFrame.M1]:
+                raise AssertionError("Unchanged shared frame was rebuilt")
+
+            writer.parallel_workers = 2
+            before = writer.analyze_symbols_parallel(self.symbols)
+            for start in range(len(df) - withheld, len(df), 7):
+                writer.append_bars(symbol, df.iloc[start:start + 7])
+            after = writer.analyze_symbols_parallel(self.symbols)
+            stats = writer.parallel_analyzer.worker_stats()
+
+            reader.refresh_shared_data()
+            for tf in writer.timeframes:
+                pd.testing.assert_frame_equal(reader.data_cache[symbol][tf], writer.data_cache[symbol][tf],
+                                              check_freq=False)
+            expected = quiet(writer.analyze_symbol, symbol)
+            if (after[symbol].timestamp, after[symbol].overall_strength) \
+                    != (expected.timestamp, expected.overall_strength) or after[symbol].timestamp <= before[symbol].timestamp:
+                raise AssertionError("Workers did not see the bars published after they attached")
+            shared = sorted(name for worker in stats for name in worker['shared_symbols'])
+            if shared != sorted(self.symbols):
+                raise AssertionError(f"Workers loaded files instead of attaching: {stats}")
+
+            # A frame outgrowing its segment moves to a new generation
+            small = SharedMarketDataWriter(prefix + "_grow")
+            grow_reader = SharedMarketDataReader(prefix + "_grow")
+            try:
+                small.publish(symbol, 'M1', df.iloc[:100])
+                first = grow_reader.frame(symbol, 'M1')
+                small.publish(symbol, 'M1', df)
+                pd.testing.assert_frame_equal(grow_reader.frame(symbol, 'M1'), df, check_freq=False,
+                                              check_names=False)
+                if len(first) != 100:
+                    raise AssertionError("Earlier snapshot changed length after the writer grew")
+
+                # Views follow only the forming bar; copies and closed rows never change
+                held = grow_reader.frame(symbol, 'M1')
+                frozen = grow_reader.frame(symbol, 'M1', copy=True)
+                closed = held.iloc[:-1].copy()
+                updated = df.copy()
+                updated.iloc[-1, updated.columns.get_loc('close')] += 1.0
+                small.publish(symbol, 'M1', updated)
+                if held['close'].iloc[-1] != updated['close'].iloc[-1]:
+                    raise AssertionError("Held view does not follow the forming bar")
+                pd.testing.assert_frame_equal(frozen, df, check_freq=False, check_names=False)
+                if np.shares_memory(frozen['close'].to_numpy(), held['close'].to_numpy()) or \
+                        np.shares_memory(frozen.index.asi8, held.index.asi8):
+                    raise AssertionError("Copied frame shares memory with the segment")
+                rewritten = updated.copy()
+                rewritten['close'] += 1.0
+                small.publish(symbol, 'M1', rewritten.iloc[:-2])
+                pd.testing.assert_frame_equal(held.iloc[:-1], closed)
+                pd.testing.assert_frame_equal(grow_reader.frame(symbol, 'M1'), rewritten.iloc[:-2],
+                                              check_freq=False, check_names=False)
+                if resource_tracker.register.__module__ != resource_tracker.__name__:
+                    raise AssertionError("Attach left the resource tracker hook replaced")
+            finally:
+                grow_reader.close()
+                small.close()
+        finally:
+            writer.close_workers()
+            reader.close_shared_data()
+            writer.close_shared_data()
+
+        print(f"   {len(self.symbols)} symbols shared with 2 workers; {withheld} appended M1 bars visible "
+              f"to readers and workers")
+        return {"symbols": len(self.symbols)}
+
+    # ========================================
+    # SIGNAL HISTORY
+    # ========================================
+
+    def test_signal_history(self, signals: int = 5000, capacity: int = 300):
+        """Signal history stays bounded, keeps time order and loses nothing when spilling"""
+        rng = np.random.default_rng(15)
+        actions = ("BUY", "SELL", "HOLD")
+        start = pd.Timestamp("2025-09-01")
+        # Mostly in order, with some late signals
+        times = start + pd.to_timedelta(np.arange(signals) - rng.integers(0, 20, signals) * (rng.random(signals) < 0.1),
+                                         unit='min')
+        with tempfile.TemporaryDirectory() as spill_dir:
+            store = SignalHistoryStore({'confidence': np.float64, 'sequence': np.int64}, {'action': actions},
+                                       capacity=capacity, spill_dir=spill_dir)
+            for i, time_ in enumerate(times):
+                store.append('TEST', time_, confidence=i / signals, sequence=i, action=actions[i % 3])
+                if i == capacity:
+                    memory = store.memory_bytes()
+            store.flush()
+            kept = store.range('TEST')
+            spilled = store.load_spilled('TEST')
+
+        if len(kept) != capacity or store.memory_bytes() != memory:
+            raise AssertionError(f"History not bounded: {len(kept)} signals, {store.memory_bytes()} bytes")
+        if not kept.index.is_monotonic_increasing:
+            raise AssertionError("Retained signals are not in time order")
+        recorded = np.sort(np.concatenate([kept['sequence'].to_numpy(), spilled['sequence'].to_numpy()]))
+        if not np.array_equal(recorded, np.arange(signals)):
+            raise AssertionError("Signals lost or duplicated between memory and spill file")
+        if (kept['action'].astype(str).to_numpy() != np.array(actions)[kept['sequence'] % 3]).any():
+            raise AssertionError("Categorical fields decoded incorrectly")
+
+        lower, upper = kept.index[capacity // 4], kept.index[capacity // 2]
+        expected = int(((kept.index >= lower) & (kept.index < upper)).sum())
+        if store.count('TEST', lower, upper) != expected or len(store.range('TEST', lower, upper)) != expected:
+            raise AssertionError("Time-range query differs from a scan")
+
+        # Strategy history records every analyzed symbol
+        strategy = quiet(MultiTimeframeStrategy)
+        quiet(strategy.analyze_multiple_symbols, self.symbols, batched=True)
+        latest = strategy.signal_history.latest(n=len(self.symbols))
+        if sorted(latest['symbol']) != sorted(self.symbols):
+            raise AssertionError(f"Strategy signal history incomplete: {list(latest['symbol'])}")
+        print(f"   {signals} signals -> {capacity} retained ({memory} bytes) + {len(spilled)} spilled; "
+              f"range counts match a scan")
+        return {"retained": capacity, "spilled": len(spilled)}
+
+    # ========================================
+    # UNIFIED INDICATOR PLAN
+    # ========================================
+
+    def test_unified_indicator_plan(self):
+        """One-buffer basic + advanced pipeline equals the basic frame followed by calculate_all_indicators"""
+        strategy = quiet(EnhancedMultiTimeframeStrategy)
+        df = load_symbol_data(self.symbols[0], bars=5000)
+
+        # Reference: separate stages with their own feature caches
+        reference = quiet(MultiTimeframeStrategy).calculate_technical_indicators(df)
+        config = {name: {k: v for k, v in params.items() if k != 'weight'}
+                  for name, params in strategy.enhanced_config["indicators"].items()}
+        expected = quiet(quiet(AdvancedTechnicalIndicators).calculate_all_indicators, reference, config)
+
+        result = quiet(strategy.calculate_enhanced_technical_indicators, df)
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+        plan = strategy.indicator_plan()
+        if strategy.indicator_plan() is not plan:
+            raise AssertionError("Indicator plan recompiled for an unchanged configuration")
+        strategy.enhanced_config["enabled"] = False
+        if strategy.indicator_plan().advanced is not None:
+            raise AssertionError("Plan not recompiled after disabling advanced indicators")
+        basic_only = quiet(strategy.calculate_enhanced_technical_indicators, df)
+        pd.testing.assert_frame_equal(basic_only, reference, check_exact=True)
+
+        print(f"   {len(result.columns)} columns identical to the two-stage pipeline; "
+              f"{len(strategy._indicator_plans)} plans compiled")
+        return {"columns": len(result.columns)}
+
+    def test_enhanced_signal_series(self, samples: int = 60):
+        """Enhanced confluence series equal analyze_symbol_enhanced at sampled times"""
+        strategy = quiet(EnhancedMultiTimeframeStrategy)
+        rng = np.random.default_rng(17)
+        for symbol in self.symbols:
+            quiet(strategy.load_data, symbol)
+            m1 = strategy.data_cache[symbol][TimeFrame.M1].index
+            times = m1[np.sort(rng.integers(0, len(m1), samples))]
+            confluence = quiet(strategy.calculate_enhanced_confluence_series, symbol, times)
+            for time_, row in zip(times, confluence.itertuples()):
+                signal = quiet(strategy.analyze_symbol_enhanced, symbol, time_)
+                if (signal.overall_direction.value, signal.overall_strength, signal.confluence_score,
+                        signal.recommended_action, signal.risk_level, signal.position_size_multiplier) \
+                        != (row.overall_direction, row.overall_strength, row.confluence_score,
+                            row.recommended_action, row.risk_level, row.position_size_multiplier):
+                    raise AssertionError(f"{symbol} {time_}: enhanced series differs from analyze_symbol_enhanced")
+            print(f"   {symbol}: {samples} enhanced confluence times identical")
+        return {"symbols": len(self.symbols)}
+
+    # ========================================
+    # BACKTESTING
+    # ========================================
+
+    def test_backtester(self, cutoff_days: int = 20):
+        """Balance equals the booked P&L, fills pay the spread and truncating the data keeps earlier trades"""
+        data = {symbol: load_symbol_data(symbol) for symbol in self.symbols}
+        backtester = EventDrivenBacktester(quiet(MultiTimeframeStrategy))
+        result = quiet(backtester.run, data=data)
+        trades, summary = result.trades, result.summary()
+        if not len(trades):
+            raise AssertionError("Backtest produced no trades")
+
+        if not np.isclose(summary['final_balance'], summary['initial_balance'] + trades['pnl'].sum()):
+            raise AssertionError("Final balance differs from initial balance plus booked P&L")
+        if not np.isclose(result.equity_curve['equity'].iloc[-1], summary['final_balance']):
+            raise AssertionError("Equity curve does not end at the final balance")
+        for trade in trades.itertuples():
+            bar = data[trade.symbol].loc[trade.entry_time]
+            ask = bar['open'] + bar['spread']
+            if (trade.direction == "BUY" and trade.entry_price < ask) or \
+                    (trade.direction == "SELL" and trade.entry_price > bar['open']):
+                raise AssertionError(f"Trade {trade.trade_id} filled better than the quote")
+
+        # Trades closed before the cutoff are the same without the bars after it
+        cutoff = min(df.index[0] for df in data.values()) + pd.Timedelta(days=cutoff_days)
+        truncated = quiet(EventDrivenBacktester(quiet(MultiTimeframeStrategy)).run,
+                          data={symbol: df[df.index < cutoff] for symbol, df in data.items()})
+        columns = ['symbol', 'direction', 'volume', 'entry_time', 'entry_price', 'exit_time', 'exit_price', 'pnl']
+        before = trades[trades['exit_time'] < cutoff][columns].reset_index(drop=True)
+        kept = truncated.trades[truncated.trades['exit_time'] < cutoff][columns].reset_index(drop=True)
+        pd.testing.assert_frame_equal(before, kept)
+
+        print(f"   {summary['bars']:,} bars, {summary['total_trades']} trades, "
+              f"{summary['rejected_orders']} rejected orders in {summary['elapsed_seconds']}s; "
+              f"{len(before)} trades unchanged when the data ends at {cutoff}")
+        return summary
+
+    def test_vectorized_backtester(self, runs: int = 5):
+        """Vectorized runs give the event-driven trades and equity when the risk manager approves every order"""
+        # Symbols inside the risk configuration, sized at their minimum lot by the risk manager
+        symbols = [symbol for symbol in self.symbols if symbol != "USDCAD"]
+        data = {symbol: load_symbol_data(symbol) for symbol in symbols}
+        vectorized = VectorizedBacktester()
+        vectorized.prepare_strategy(quiet(MultiTimeframeStrategy), symbols, data)
+
+        columns = ['symbol', 'direction', 'volume', 'entry_time', 'entry_price', 'exit_time', 'exit_price',
+                   'exit_reason']
+        for config in (BacktestConfig(), BacktestConfig(close_on_hold=True, stop_loss_atr=1.0, slippage_points=5)):
+            expected = quiet(EventDrivenBacktester(quiet(MultiTimeframeStrategy), config).run, data=data)
+            if expected.rejections:
+                raise AssertionError(f"Event-driven run rejected orders: {expected.rejections}")
+            result = vectorized.run(config)
+            pd.testing.assert_frame_equal(
+                result.trades.sort_values(['symbol', 'entry_time'])[columns].reset_index(drop=True),
+                expected.trades.sort_values(['symbol', 'entry_time'])[columns].reset_index(drop=True))
+            pd.testing.assert_frame_equal(result.equity_curve, expected.equity_curve, check_exact=False)
+
+        start = time.perf_counter()
+        for multiple in range(runs):
+            vectorized.run(BacktestConfig(stop_loss_atr=1.0 + multiple))
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"   {len(expected.trades)} trades and {len(expected.equity_curve):,} equity points identical; "
+              f"{elapsed * 1000:.0f}ms per vectorized run")
+        return {"trades": len(expected.trades), "run_ms": elapsed * 1000}
+
+    def test_walk_forward_optimizer(self, workers: int = 2):
+        """Worker results equal an in-process backtest and an interrupted run resumes from the cache"""
+        symbols = self.symbols[:2]
+        data = {symbol: load_symbol_data(symbol) for symbol in symbols}
+        grid = {"confluence_threshold": [0.5, 0.7], "indicators.rsi_period": [14]}
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "cache.jsonl")
+            optimizer = WalkForwardOptimizer(grid=grid, symbols=symbols, workers=workers, cache_path=cache_path)
+            report = quiet(optimizer.run, data)
+            if report.evaluated != 2 or len(report.results) != 2 * len(report.walk_forward) * 2:
+                raise AssertionError(f"Unexpected result count {len(report.results)}")
+
+            # Same figures as backtesting the parameter set in this process
+            row = report.results.iloc[-1]
+            strategy = quiet(MultiTimeframeStrategy)
+            quiet(strategy.apply_parameters, {"confluence_threshold": row["confluence_threshold"],
+                                              "indicators.rsi_period": row["indicators.rsi_period"]})
+            backtester = VectorizedBacktester()
+            backtester.prepare_strategy(strategy, symbols, data)
+            windows = walk_forward_windows(min(df.index[0] for df in data.values()),
+                                           max(df.index[-1] for df in data.values()) + pd.Timedelta(minutes=1))
+            window = next(w for w in windows if w.key == row['window'])
+            expected = backtester.run(optimizer.execution, start=window.test_start, end=window.test_end).summary()
+            for metric in ('total_return_percent', 'max_drawdown_percent', 'total_trades', 'bars'):
+                if not np.isclose(row[metric], expected[metric]):
+                    raise AssertionError(f"{metric}: worker {row[metric]} != in-process {expected[metric]}")
+            if report.results.groupby('confluence_threshold')['total_trades'].sum().nunique() != 2:
+                raise AssertionError("Parameter sets produced identical trades")
+
+            # Interrupted after the first parameter set: only the second is evaluated again
+            with open(cache_path) as f:
+                lines = f.readlines()
+            with open(cache_path, 'w') as f:
+                f.writelines(lines[:len(lines) // 2] + ['{"truncated'])
+            resumed = quiet(optimizer.run, data)
+            if resumed.evaluated != 1:
+                raise AssertionError(f"Resume evaluated {resumed.evaluated} parameter sets instead of 1")
+            pd.testing.assert_frame_equal(resumed.ranking, report.ranking)
+
+        print(f"   {len(report.results)} results over {len(report.walk_forward)} windows match in-process "
+              f"backtests; resume re-evaluated {resumed.evaluated} of 2 parameter sets")
+        return report.summary()
+
+    # ========================================
+    # COLUMNAR STORAGE
+    # ========================================
+
+    def test_columnar_store(self, data_dir: str = "CSVdata/raw"):
+        """Stored bars equal the parsed CSV, stale stores are rebuilt and loading is memory-mapped"""
+        source = os.path.join(data_dir, f"GEN_{self.symbols[0]}_M1_1month.csv")
+        expected = pd.read_csv(source)
+        expected['time'] = pd.to_datetime(expected['time'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, os.path.basename(source))
+            expected.iloc[:-1].to_csv(path, index=False)
+            pd.testing.assert_frame_equal(load_bars(path, index=False), expected.iloc[:-1])
+            if not is_fresh(path):
+                raise AssertionError("Store not written on first load")
+
+            closes = load_bars(path, columns=['close'])
+            if list(closes.columns) != ['close'] or closes.index.name != 'time':
+                raise AssertionError(f"Column selection returned {list(closes.columns)}")
+            closes.iloc[0, 0] = -1.0
+            if load_bars(path)['close'].iloc[0] != expected['close'].iloc[0]:
+                raise AssertionError("Writing to a loaded frame changed the store")
+
+            # A changed CSV replaces its store; a store without its CSV is still served
+            expected.to_csv(path, index=False)
+            if is_fresh(path):
+                raise AssertionError("Store not stale after the CSV changed")
+            pd.testing.assert_frame_equal(load_bars(path), expected.set_index('time'))
+            os.remove(path)
+            pd.testing.assert_frame_equal(load_bars(path), expected.set_index('time'))
+            if not os.path.isdir(store_path(path)):
+                raise AssertionError("Store directory missing")
+
+        convert_directory(data_dir)
+        paths = sorted(glob.glob(os.path.join(data_dir, "GEN_*_M1_1month.csv")))
+        start = time.perf_counter()
+        for path in paths:
+            pd.read_csv(path, parse_dates=['time'])
+        parsed = time.perf_counter() - start
+        start = time.perf_counter()
+        frames = [load_bars(path) for path in paths]
+        loaded = time.perf_counter() - start
+        print(f"   {len(paths)} files ({sum(len(df) for df in frames):,} bars): CSV parse {parsed:.2f}s, "
+              f"column stores {loaded * 1000:.0f}ms")
+        return {"parse_seconds": parsed, "load_ms": loaded * 1000}
+
+    # ========================================
+    # EXTRACTION SCHEDULING
+    # ========================================
+
+    def test_extraction_scheduler(self):
+        """Token bucket pacing, backoff bounds and concurrent extraction against a throttled terminal"""
+        # Bucket pacing on a simulated clock: a burst of 1, then one token per 0.1s
+        now = [0.0]
+        bucket = TokenBucket(rate=10.0, capacity=1.0, clock=lambda: now[0],
+                             sleep=lambda seconds: now.__setitem__(0, now[0] + seconds))
+        waits = [bucket.acquire() for _ in range(5)]
+        if abs(now[0] - 0.4) > 1e-9 or waits[0] != 0:
+            raise AssertionError(f"5 tokens at 10/s took {now[0]:.3f}s")
+
+        rng = random.Random(1)
+        delays = [backoff_delay(attempt, 0.5, 4.0, rng) for attempt in range(1, 7) for _ in range(200)]
+        if min(delays) < 0 or max(delays[:200]) > 0.5 or max(delays) > 4.0:
+            raise AssertionError("Backoff delay outside its jitter bounds")
+
+        class ThrottledTerminal:
+            """Stand-in for the terminal's data requests: latency plus a request-rate limit"""
+
+            def __init__(self, limit_per_second: int, latency: float):
+                self.limit = limit_per_second
+                self.latency = latency
+                self.requests = []
+                self.lock = threading.Lock()
+                self.local = threading.local()
+
+            def copy_rates_range(self, symbol):
+                time.sleep(self.latency)
+                with self.lock:
+                    now = time.perf_counter()
+                    recent = [t for t in self.requests if now - t < 1.0]
+                    self.requests.append(now)
+                if len(recent) >= self.limit:
+                    self.local.error = (-10005, "Too many requests")
+                    return None
+                return np.zeros(3)
+
+            def last_error(self):
+                return getattr(self.local, 'error', (1, "Success"))
+
+        terminal = ThrottledTerminal(limit_per_second=15, latency=0.02)
+        scheduler = ExtractionScheduler(TokenBucket(rate=40.0, min_rate=2.0, max_rate=60.0),
+                                        max_workers=4, max_retries=8, backoff_base=0.1,
+                                        backoff_cap=1.0, seed=7, on_progress=lambda *args: None)
+        symbols = [f"SYM{i:02d}" for i in range(14)]
+
+        def extract(symbol):
+            # Three requests per symbol, like chunked history requests
+            return sum(len(scheduler.request(lambda: terminal.copy_rates_range(symbol),
+                                             terminal.last_error, symbol)) for _ in range(3))
+
+        start = time.perf_counter()
+        progress = scheduler.run(symbols, extract)
+        elapsed = time.perf_counter() - start
+        summary = scheduler.summary()
+        failed = [symbol for symbol, record in progress.items() if record.status != "done"]
+        if failed:
+            raise AssertionError(f"Symbols failed: {failed}")
+        if list(progress) != symbols or any(record.result != 9 for record in progress.values()):
+            raise AssertionError("Progress records out of order or incomplete")
+        if summary['limiter']['slowdowns'] == 0:
+            raise AssertionError("Limiter did not slow down on throttling errors")
+        print(f"   14 symbols x 3 requests in {elapsed:.2f}s: {summary['requests']} requests, "
+              f"{summary['retries']} retries, rate adapted down to {summary['limiter']['min_rate_seen']:.1f}/s")
+        return summary
+
+    def test_chunked_history(self, data_dir: str = "CSVdata/raw"):
+        """Chunked extraction into month partitions: exact rows, bounded memory, resume after failure"""
+        source = pd.read_csv(os.path.join(data_dir, f"GEN_{self.symbols[0]}_M1_1month.csv"))
+        source['time'] = pd.to_datetime(source['time'])
+        start = source['time'].iloc[0].floor('D').to_pydatetime()
+        end = source['time'].iloc[-1].ceil('D').to_pydatetime()
+        failing = {'at': 5, 'calls': 0}
+
+        def fetch(date_from, date_to):
+            # Stand-in for copy_rates_range (both ends inclusive); fails once mid-history
+            failing['calls'] += 1
+            if failing['calls'] == failing['at']:
+                return None
+            rows = source[(source['time'] >= date_from) & (source['time'] <= date_to)]
+            return rows.reset_index(drop=True)
+
+        with tempfile.TemporaryDirectory() as root:
+            writer = PartitionedBarWriter(root, self.symbols[0], "M1")
+            if extract_history(writer, fetch, start, end, timedelta(days=2)):
+                raise AssertionError("Extraction reported complete despite a failed chunk")
+            stopped = writer.manifest['completed_until']
+
+            # A chunk that died half-way through its append leaves rows behind
+            last_partition = writer.partition_files()[-1]
+            with open(last_partition, 'a') as f:
+                f.write("2099-01-01 00:00:00,1,1,1,1,1,1,1\n")
+
+            writer = PartitionedBarWriter(root, self.symbols[0], "M1")
+            if not extract_history(writer, fetch, start, end, timedelta(days=2)):
+                raise AssertionError("Resumed extraction did not complete")
+
+            files = writer.partition_files()
+            stored = pd.concat([pd.read_csv(path, parse_dates=['time']) for path in files], ignore_index=True)
+            pd.testing.assert_frame_equal(stored, source)
+            months = sorted({f"{t.year:04d}/{t.month:02d}" for t in source['time']})
+            if sorted(writer.manifest['partitions']) != months:
+                raise AssertionError(f"Partitions {sorted(writer.manifest['partitions'])} != months {months}")
+            if sum(entry['rows'] for entry in writer.manifest['partitions'].values()) != len(source):
+                raise AssertionError("Partition row counts do not add up")
+
+            # Memory of a run is bounded by a chunk, not by the history: one and
+            # five years of generated H1 bars in 30-day chunks peak alike
+            def generate(date_from, date_to):
+                times = pd.date_range(date_from, date_to, freq='h')
+                values = np.arange(len(times), dtype=float)
+                return pd.DataFrame({'time': times, 'open': values, 'high': values, 'low': values,
+                                     'close': values, 'tick_volume': 1, 'spread': 0, 'real_volume': 0})
+
+            peaks = {}
+            for years in (1, 5):
+                long_writer = PartitionedBarWriter(root, f"SYNTH{years}", "H1")
+                tracemalloc.start()
+                extract_history(long_writer, generate, datetime(2020, 1, 1), datetime(2020 + years, 1, 1),
+                                timedelta(days=30))
+                peaks[years] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                if len(long_writer.partition_files()) != 12 * years:
+                    raise AssertionError(f"{years}y history stored in {len(long_writer.partition_files())} partitions")
+            if peaks[5] > 1.5 * peaks[1]:
+                raise AssertionError(f"Peak memory grew with the history: {peaks}")
+
+        print(f"   {len(source):,} bars in {len(files)} month partitions, failed after {stopped}, "
+              f"resumed to completion; H1 peak 1y {peaks[1] / 1e6:.2f}MB, 5y {peaks[5] / 1e6:.2f}MB")
+        return {"bars": len(source), "partitions": len(files), "peak_mb": peaks[5] / 1e6}
+
+    # ========================================
+    # OFFLINE MT5 SIMULATOR
+    # ========================================
+
+    def test_mt5_simulator(self):
+        """Replay-clock market data, deterministic fills, stops, latency and the data extractor on the simulator"""
+        symbol = self.symbols[0]
+        start = pd.Timestamp("2025-09-10 12:00")
+        terminal = mt5_sim.SimulatedTerminal(start=start, slippage_points=2)
+        bars = terminal._frame(symbol)
+        spec = terminal.specs[symbol]
+
+        rates = terminal.copy_rates_range(symbol, mt5_sim.TIMEFRAME_M1, start - pd.Timedelta(hours=1),
+                                          start + pd.Timedelta(hours=1))
+        expected = bars.loc[start - pd.Timedelta(hours=1):start - pd.Timedelta(minutes=1)]
+        if not np.array_equal(pd.to_datetime(rates['time'], unit='s'), expected.index) or \
+                not np.allclose(rates['close'], expected['close']):
+            raise AssertionError("copy_rates_range served bars not closed by the clock")
+        hourly = terminal.copy_rates_from_pos(symbol, mt5_sim.TIMEFRAME_H1, 0, 3)
+        if len(hourly) != 3 or hourly['close'][-1] != expected['close'].iloc[-1]:
+            raise AssertionError("Forming H1 bar does not end at the last closed M1 bar")
+
+        tick = terminal.symbol_info_tick(symbol)
+        last = expected.iloc[-1]
+        if tick.bid != last['close'] or abs(tick.ask - (last['close'] + last['spread'])) > 1e-9:
+            raise AssertionError(f"Tick {tick.bid}/{tick.ask} does not quote the last closed bar")
+
+        # Deterministic market fill, mark-to-market and close
+        opened = terminal.order_send({"action": mt5_sim.TRADE_ACTION_DEAL, "symbol": symbol, "volume": 0.01,
+                                      "type": mt5_sim.ORDER_TYPE_BUY})
+        if opened.retcode != mt5_sim.TRADE_RETCODE_DONE or abs(opened.price - (tick.ask + 2 * spec['point'])) > 1e-9:
+            raise AssertionError(f"Buy filled at {opened.price}, expected ask + 2 points")
+        terminal.advance(30)
+        position, = terminal.positions_get(symbol=symbol)
+        value_per_price = spec['tick_value'] / spec['tick_size']
+        bid = terminal.symbol_info_tick(symbol).bid
+        if position.ticket != opened.order or abs(position.profit - (bid - opened.price) * 0.01 * value_per_price) > 1e-9:
+            raise AssertionError("Position not marked to the current bid")
+        closed = terminal.order_send({"action": mt5_sim.TRADE_ACTION_DEAL, "symbol": symbol, "volume": 0.01,
+                                      "type": mt5_sim.ORDER_TYPE_SELL, "position": opened.order})
+        deals = terminal.history_deals_get(start, start + pd.Timedelta(days=1))
+        if closed.retcode != mt5_sim.TRADE_RETCODE_DONE or terminal.positions_total() != 0 or len(deals) != 2 or \
+                abs(sum(deal.profit for deal in deals) - (terminal.balance - terminal.initial_balance)) > 1e-9:
+            raise AssertionError("Closing deal does not book the position's P&L")
+
+        # Stop loss of a short, placed halfway to the next day's highest ask, closes at the stop
+        tick = terminal.symbol_info_tick(symbol)
+        ahead = bars.loc[terminal.clock.now:terminal.clock.now + pd.Timedelta(days=1)]
+        stop = tick.ask + ((ahead['high'] + ahead['spread']).max() - tick.ask) / 2
+        short = terminal.order_send({"action": mt5_sim.TRADE_ACTION_DEAL, "symbol": symbol, "volume": 0.01,
+                                     "type": mt5_sim.ORDER_TYPE_SELL, "sl": stop})
+        terminal.advance(60 * 24)
+        exits = terminal.history_deals_get(position=short.order)
+        if terminal.positions_total() != 0 or len(exits) != 2 or exits[-1].reason != mt5_sim.DEAL_REASON_SL \
+                or exits[-1].price != stop:
+            raise AssertionError("Stop loss did not close at the stop price")
+        invalid = terminal.order_send({"action": mt5_sim.TRADE_ACTION_DEAL, "symbol": symbol, "volume": 0.015,
+                                       "type": mt5_sim.ORDER_TYPE_BUY})
+        if invalid.retcode != mt5_sim.TRADE_RETCODE_INVALID_VOLUME:
+            raise AssertionError("Off-step volume accepted")
+
+        # Injected latency overlaps across concurrent senders
+        slow = mt5_sim.SimulatedTerminal(start=start, latency={'order_send': 0.01})
+        request = {"action": mt5_sim.TRADE_ACTION_DEAL, "symbol": symbol, "volume": 0.01,
+                   "type": mt5_sim.ORDER_TYPE_BUY}
+        begin = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: slow.order_send(request), range(160)))
+        elapsed = time.perf_counter() - begin
+        if any(result.retcode != mt5_sim.TRADE_RETCODE_DONE for result in results) or slow.positions_total() != 160:
+            raise AssertionError("Concurrent orders failed")
+        if elapsed > 0.8:
+            raise AssertionError(f"160 orders with 10ms latency on 8 threads took {elapsed:.2f}s")
+
+        # Drop-in: the data extractor imports MetaTrader5 and runs against the simulator
+        previous = {name: sys.modules.get(name) for name in ('MetaTrader5', 'data_extractor')}
+        replay = mt5_sim.install(start=start)
+        try:
+            sys.modules.pop('data_extractor', None)
+            data_extractor = importlib.import_module('data_extractor')
+            with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+                extractor = data_extractor.EnhancedDataExtractor(data_dir=directory, history_days=2)
+                extractor.extract_symbol_data(symbol, {})
+                replay.advance(60 * 24)
+                incremental = data_extractor.EnhancedDataExtractor(data_dir=directory, incremental=True)
+                incremental.extract_symbol_data(symbol, {})
+                stored = load_bars(os.path.join(directory, "raw", f"GEN_{symbol}_M1_1month.csv"))
+        finally:
+            for name, module in previous.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+        reference = bars.loc[start - pd.Timedelta(days=2):replay.clock.now - pd.Timedelta(minutes=1)]
+        if not stored.index.equals(reference.index) or not np.allclose(stored['close'], reference['close']):
+            raise AssertionError("Extraction through the simulator does not match the stored bars")
+
+        print(f"   Fill {opened.price} (ask + 2 points), round trip P&L {deals[-1].profit:+.2f}, "
+              f"160 orders at 10ms latency in {elapsed:.2f}s, extractor stored {len(stored):,} bars")
+        return {"latency_seconds": elapsed, "extracted_bars": len(stored)}
+
+    def test_partitioned_lake(self):
+        """Overlapping monthly imports, manifest-indexed range reads and change-only quality/gap passes"""
+        symbol = self.symbols[0]
+        source = pd.read_csv(os.path.join("CSVdata", "raw", f"GEN_{symbol}_M1_1month.csv"), parse_dates=['time'])
+        september = pd.Timestamp("2025-09-01")
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            root = os.path.join(data_dir, "lake")
+            # Two overlapping extracts, as successive monthly pulls would produce
+            first = source[source['time'] < pd.Timestamp("2025-09-10")]
+            second = source[source['time'] >= pd.Timestamp("2025-09-05")]
+            paths = []
+            for name, part in (("first", first), ("second", second)):
+                paths.append(os.path.join(data_dir, f"{name}.csv"))
+                part.to_csv(paths[-1], index=False)
+
+            if import_csv(root, symbol, paths[0]) != len(first):
+                raise AssertionError("First import did not store every row")
+            quality = DataQualityController(data_dir=data_dir)
+            filler = DataGapFiller(data_dir=data_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                quality.analyze_lake(root)
+                filled = filler.process_lake(root)
+            if quality.summary_stats['partitions_analyzed'] != 2 or len(filled) != 2:
+                raise AssertionError("First passes did not process both partitions")
+
+            # The second import only extends September: August keeps its checksum
+            august = dict(load_manifest(root, symbol, "M1")['partitions']['2025/08'])
+            added = import_csv(root, symbol, paths[1])
+            if added != len(source) - len(first) or import_csv(root, symbol, paths[1]) != 0:
+                raise AssertionError(f"Overlapping import added {added} rows")
+            manifest = load_manifest(root, symbol, "M1")
+            if manifest['partitions']['2025/08'] != august or manifest['rows'] != len(source):
+                raise AssertionError("Import touched a closed partition or lost rows")
+            for key, entry in manifest['partitions'].items():
+                year, month = key.split('/')
+                rows = source[(source['time'].dt.year == int(year)) & (source['time'].dt.month == int(month))]
+                if entry['rows'] != len(rows) or entry['schema_version'] != 1 or \
+                        pd.Timestamp(entry['min_time']) != rows['time'].iloc[0] or \
+                        pd.Timestamp(entry['max_time']) != rows['time'].iloc[-1] or \
+                        entry['checksum'] != file_checksum(os.path.join(root, symbol, "M1", year, f"{month}.csv")):
+                    raise AssertionError(f"Manifest entry {key} does not describe its partition")
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                quality.analyze_lake(root)
+                filled = filler.process_lake(root)
+            if (quality.summary_stats['partitions_analyzed'], quality.summary_stats['partitions_skipped']) != (1, 1) \
+                    or list(filled) != [f"{symbol} 2025/09"]:
+                raise AssertionError("Unchanged partition was processed again")
+            if len(quality.quality_reports) != 2:
+                raise AssertionError("Skipped partition report was not carried over")
+
+            # Range reads match the flat file and only need the partitions they overlap
+            window = ("2025-09-03", "2025-09-05 12:00")
+            expected = source[(source['time'] >= window[0]) & (source['time'] < window[1])].set_index('time')
+            if select_partitions(manifest, *window) != ["2025/09"]:
+                raise AssertionError("Range selected partitions it does not overlap")
+            os.remove(os.path.join(root, symbol, "M1", "2025", "08.csv"))
+            shutil.rmtree(os.path.join(root, symbol, "M1", "2025", "08.columns"), ignore_errors=True)
+            pd.testing.assert_frame_equal(read_range(root, symbol, "M1", *window), expected, check_freq=False)
+            if verify_partitions(root, symbol, "M1") != ["2025/08"]:
+                raise AssertionError("Missing partition not reported by verification")
+
+        print(f"   {len(source):,} bars in {len(manifest['partitions'])} partitions from overlapping imports; "
+              f"{len(expected):,} bars read from 1 partition")
+
+    def benchmark_backends(self, data_dir: str = "CSVdata/raw"):
+        """Time the per-row indicators on every CSV file for both backends"""
+        backends = {name: quiet(AdvancedTechnicalIndicators, backend=name) for name in ('pandas', 'numpy')}
+        files = sorted(glob.glob(os.path.join(data_dir, "GEN_*_M1_1month.csv")))
+
+        print(f"\n⏱️  BACKEND BENCHMARK ({len(files)} files)")
+        print("-" * 72)
+        print(f"{'Symbol':<10} {'Bars':>7} {'Indicator':<28} {'pandas':>9} {'numpy':>9} {'Speedup':>8}")
+        print("-" * 72)
+
+        totals = {'pandas': 0.0, 'numpy': 0.0}
+        for path in files:
+            symbol = os.path.basename(path).split('_')[1]
+            df = load_symbol_data(symbol, data_dir=data_dir)
+            for method in self.RECURSIVE_INDICATORS:
+                timings = {}
+                for name, indicators in backends.items():
+                    start = time.perf_counter()
+                    getattr(indicators, method)(df)
+                    timings[name] = time.perf_counter() - start
+                    totals[name] += timings[name]
+                print(f"{symbol:<10} {len(df):>7,} {method:<28} {timings['pandas']:>8.3f}s "
+                      f"{timings['numpy']:>8.4f}s {timings['pandas'] / timings['numpy']:>7.1f}x")
+
+        print("-" * 72)
+        print(f"{'TOTAL':<47} {totals['pandas']:>8.2f}s {totals['numpy']:>8.3f}s "
+              f"{totals['pandas'] / totals['numpy']:>7.1f}x")
+        return totals
+
+    def run_all_tests(self):
+        """Run the complete validation suite"""
+        print("🧪 INDICATOR VALIDATION TEST SUITE")
+        print("=" * 60)
+        print(f"📅 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+        self.run_test("Stream matches batch (bar by bar)", self.test_stream_matches_batch)
+        self.run_test("Stream matches batch (full history)", self.test_stream_full_history)
+        self.run_test("NumPy kernels match pandas loops", self.test_kernel_backends_match)
+        self.run_test("Panel kernels match per-symbol results", self.test_panel_kernels_match)
+        self.run_test("Rolling feature cache", self.test_feature_cache)
+        self.run_test("Columnar output modes", self.test_output_modes)
+        self.run_test("Batched engine matches per-symbol pipeline", self.test_batch_engine_matches)
+        self.run_test("Parameter sweep matches per-parameter runs", self.test_parameter_sweep)
+        self.run_test("Tail-window evaluation matches full history", self.test_tail_evaluation)
+        self.run_test("Indicator frame cache", self.test_indicator_frame_cache)
+        self.run_test("Incremental resampler", self.test_incremental_resampler)
+        self.run_test("Signal series match scalar signals", self.test_signal_series)
+        self.run_test("Point-in-time index", self.test_point_in_time_index)
+        self.run_test("Process-pool analysis", self.test_parallel_analysis)
+        self.run_test("Shared-memory market data", self.test_shared_market_data)
+        self.run_test("Bounded signal history", self.test_signal_history)
+        self.run_test("Unified indicator plan", self.test_unified_indicator_plan)
+        self.run_test("Enhanced signal series match scalar analysis", self.test_enhanced_signal_series)
+        self.run_test("Event-driven backtester", self.test_backtester)
+        self.run_test("Vectorized backtester", self.test_vectorized_backtester)
+        self.run_test("Walk-forward optimizer", self.test_walk_forward_optimizer)
+        self.run_test("Columnar market data store", self.test_columnar_store)
+        self.run_test("Extraction scheduler", self.test_extraction_scheduler)
+        self.run_test("Chunked history extraction", self.test_chunked_history)
+        self.run_test("Offline MT5 simulator", self.test_mt5_simulator)
+        self.run_test("Partitioned store manifest", self.test_partitioned_lake)
+
+        passed = len([r for r in self.test_results if r["status"] == "PASSED"])
+        print("\n" + "=" * 60)
+        print(f"📊 RESULTS: {passed}/{len(self.test_results)} tests passed")
+        return passed == len(self.test_results)
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description="Indicator validation test suite")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time calculation backends on every file in CSVdata/raw")
+    args = parser.parse_args()
+
+    tester = IndicatorValidationTester()
+    if args.benchmark:
+        tester.benchmark_backends()
+        return 0
+
+    success = tester.run_all_tests()
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    exit(main())
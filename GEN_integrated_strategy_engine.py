@@ -98,7 +98,7 @@ class IntegratedStrategyEngine:
         results = {}
         
         # Multi-timeframe analysis for all symbols
-        mtf_results = self.multi_timeframe.analyze_multiple_symbols(self.enabled_symbols)
+        mtf_results = self.multi_timeframe.analyze_multiple_symbols(self.enabled_symbols, batched=True)
         
         # Process and enhance results
         for symbol, confluence_signal in mtf_results.items():
@@ -0,0 +1,840 @@
+#!/usr/bin/env python3
+"""
+Offline MT5 Simulator
+=====================
+
+Drop-in stand-in for the MetaTrader5 module, backed by the stored M1 bars
+(CSVdata, through the column stores), so the MT5-facing modules (order
+manager, risk manager, strategy framework, data extractor, screeners,
+trade testers) run on Linux, in tests and in load tests.
+
+Market data follows a replay clock: at clock time T only M1 bars closed by
+T are visible (open time + 1 minute <= T). copy_rates_* serve those bars
+(higher timeframes resampled from them, the last one still forming),
+symbol_info_tick quotes the close of the last closed bar as bid and
+bid + the bar's spread as ask. The clock starts after the last stored bar
+unless a start time is given; advance()/set_time() move it.
+
+Trading uses a hedging account with a deterministic fill model: market
+orders fill at the current ask (buys) or bid (sells) moved by
+slippage_points against the order, a position's ticket is the ticket of
+the order that opened it, and P&L is converted to account currency with
+the symbol's tick value per tick size (symbol_specifications.json), as in
+the backtester. Stop loss / take profit are checked against every bar the
+clock passes, the stop first when both are inside one bar. Pending orders
+are rejected (TRADE_RETCODE_INVALID_ORDER).
+
+Latency injection: every API call sleeps its configured latency (seconds,
+per function name or "default") plus uniform jitter, outside the terminal
+lock, so concurrent callers overlap like they would against a terminal.
+
+Usage:
+    import GEN_mt5_simulator
+    GEN_mt5_simulator.install(start="2025-09-10 12:00", latency={"order_send": 0.005})
+    import MetaTrader5 as mt5          # now the simulator, also inside other modules
+    from GEN_order_manager import EnhancedOrderManager
+
+    python GEN_mt5_simulator.py --orders 2000 --threads 16 --latency 0.002   # order_send load test
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import argparse
+import fnmatch
+import json
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from GEN_columnar_store import DATA_SOURCES, available_symbols, find_data_file, load_bars
+
+# ========================================
+# MT5 CONSTANTS (values of the MetaTrader5 package)
+# ========================================
+
+TIMEFRAME_M1, TIMEFRAME_M2, TIMEFRAME_M3, TIMEFRAME_M4, TIMEFRAME_M5 = 1, 2, 3, 4, 5
+TIMEFRAME_M6, TIMEFRAME_M10, TIMEFRAME_M12, TIMEFRAME_M15, TIMEFRAME_M20, TIMEFRAME_M30 = 6, 10, 12, 15, 20, 30
+TIMEFRAME_H1, TIMEFRAME_H2, TIMEFRAME_H3, TIMEFRAME_H4 = 16385, 16386, 16387, 16388
+TIMEFRAME_H6, TIMEFRAME_H8, TIMEFRAME_H12 = 16390, 16392, 16396
+TIMEFRAME_D1, TIMEFRAME_W1, TIMEFRAME_MN1 = 16408, 32769, 49153
+
+ORDER_TYPE_BUY, ORDER_TYPE_SELL = 0, 1
+ORDER_TYPE_BUY_LIMIT, ORDER_TYPE_SELL_LIMIT, ORDER_TYPE_BUY_STOP, ORDER_TYPE_SELL_STOP = 2, 3, 4, 5
+ORDER_TYPE_BUY_STOP_LIMIT, ORDER_TYPE_SELL_STOP_LIMIT, ORDER_TYPE_CLOSE_BY = 6, 7, 8
+ORDER_FILLING_FOK, ORDER_FILLING_IOC, ORDER_FILLING_RETURN = 0, 1, 2
+ORDER_TIME_GTC, ORDER_TIME_DAY, ORDER_TIME_SPECIFIED, ORDER_TIME_SPECIFIED_DAY = 0, 1, 2, 3
+
+TRADE_ACTION_DEAL, TRADE_ACTION_PENDING, TRADE_ACTION_SLTP = 1, 5, 6
+TRADE_ACTION_MODIFY, TRADE_ACTION_REMOVE, TRADE_ACTION_CLOSE_BY = 7, 8, 10
+
+TRADE_RETCODE_REQUOTE = 10004
+TRADE_RETCODE_REJECT = 10006
+TRADE_RETCODE_DONE = 10009
+TRADE_RETCODE_INVALID = 10013
+TRADE_RETCODE_INVALID_VOLUME = 10014
+TRADE_RETCODE_INVALID_PRICE = 10015
+TRADE_RETCODE_INVALID_STOPS = 10016
+TRADE_RETCODE_TRADE_DISABLED = 10017
+TRADE_RETCODE_MARKET_CLOSED = 10018
+TRADE_RETCODE_NO_MONEY = 10019
+TRADE_RETCODE_INVALID_ORDER = 10035
+TRADE_RETCODE_POSITION_CLOSED = 10036
+
+SYMBOL_TRADE_MODE_DISABLED, SYMBOL_TRADE_MODE_LONGONLY, SYMBOL_TRADE_MODE_SHORTONLY = 0, 1, 2
+SYMBOL_TRADE_MODE_CLOSEONLY, SYMBOL_TRADE_MODE_FULL = 3, 4
+
+POSITION_TYPE_BUY, POSITION_TYPE_SELL = 0, 1
+DEAL_TYPE_BUY, DEAL_TYPE_SELL = 0, 1
+DEAL_ENTRY_IN, DEAL_ENTRY_OUT = 0, 1
+DEAL_REASON_EXPERT, DEAL_REASON_SL, DEAL_REASON_TP = 3, 4, 5
+
+COPY_TICKS_ALL, COPY_TICKS_INFO, COPY_TICKS_TRADE = -1, 1, 2
+TICK_FLAG_BID, TICK_FLAG_ASK = 2, 4
+
+RES_S_OK = 1
+RES_E_FAIL = -1
+RES_E_INVALID_PARAMS = -2
+RES_E_NOT_FOUND = -4
+
+ACCOUNT_TRADE_MODE_DEMO = 0
+
+TIMEFRAME_FREQUENCIES = {
+    TIMEFRAME_M1: '1min', TIMEFRAME_M2: '2min', TIMEFRAME_M3: '3min', TIMEFRAME_M4: '4min',
+    TIMEFRAME_M5: '5min', TIMEFRAME_M6: '6min', TIMEFRAME_M10: '10min', TIMEFRAME_M12: '12min',
+    TIMEFRAME_M15: '15min', TIMEFRAME_M20: '20min', TIMEFRAME_M30: '30min',
+    TIMEFRAME_H1: '1h', TIMEFRAME_H2: '2h', TIMEFRAME_H3: '3h', TIMEFRAME_H4: '4h',
+    TIMEFRAME_H6: '6h', TIMEFRAME_H8: '8h', TIMEFRAME_H12: '12h',
+    TIMEFRAME_D1: '1D', TIMEFRAME_W1: 'W-SUN', TIMEFRAME_MN1: 'MS',
+}
+
+BAR_DURATION = pd.Timedelta(minutes=1)
+
+RATES_DTYPE = np.dtype([('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+                        ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')])
+TICKS_DTYPE = np.dtype([('time', '<i8'), ('bid', '<f8'), ('ask', '<f8'), ('last', '<f8'), ('volume', '<u8'),
+                        ('time_msc', '<i8'), ('flags', '<u4'), ('volume_real', '<f8')])
+
+# ========================================
+# RESULT STRUCTURES (field names of the MetaTrader5 package)
+# ========================================
+
+AccountInfo = namedtuple('AccountInfo', [
+    'login', 'trade_mode', 'leverage', 'limit_orders', 'margin_so_mode', 'trade_allowed', 'trade_expert',
+    'margin_mode', 'currency_digits', 'fifo_close', 'balance', 'credit', 'profit', 'equity', 'margin',
+    'margin_free', 'margin_level', 'margin_so_call', 'margin_so_so', 'margin_initial', 'margin_maintenance',
+    'assets', 'liabilities', 'commission_blocked', 'name', 'server', 'currency', 'company'])
+TerminalInfo = namedtuple('TerminalInfo', [
+    'community_account', 'community_connection', 'connected', 'dlls_allowed', 'trade_allowed',
+    'tradeapi_disabled', 'email_enabled', 'ftp_enabled', 'notifications_enabled', 'mqid', 'build',
+    'maxbars', 'codepage', 'ping_last', 'community_balance', 'retransmission', 'company', 'name',
+    'language', 'path', 'data_path', 'commondata_path'])
+SymbolInfo = namedtuple('SymbolInfo', [
+    'name', 'description', 'path', 'visible', 'select', 'time', 'digits', 'spread', 'spread_float',
+    'trade_mode', 'trade_exemode', 'bid', 'ask', 'point', 'trade_tick_value', 'trade_tick_size',
+    'trade_contract_size', 'volume_min', 'volume_max', 'volume_step', 'margin_initial',
+    'margin_maintenance', 'currency_base', 'currency_profit', 'currency_margin'])
+Tick = namedtuple('Tick', ['time', 'bid', 'ask', 'last', 'volume', 'time_msc', 'flags', 'volume_real'])
+TradePosition = namedtuple('TradePosition', [
+    'ticket', 'time', 'time_msc', 'time_update', 'time_update_msc', 'type', 'magic', 'identifier',
+    'reason', 'volume', 'price_open', 'sl', 'tp', 'price_current', 'swap', 'profit', 'symbol',
+    'comment', 'external_id'])
+TradeDeal = namedtuple('TradeDeal', [
+    'ticket', 'order', 'time', 'time_msc', 'type', 'entry', 'magic', 'position_id', 'reason', 'volume',
+    'price', 'commission', 'swap', 'profit', 'fee', 'symbol', 'comment', 'external_id'])
+TradeRequest = namedtuple('TradeRequest', [
+    'action', 'magic', 'order', 'symbol', 'volume', 'price', 'stoplimit', 'sl', 'tp', 'deviation',
+    'type', 'type_filling', 'type_time', 'expiration', 'comment', 'position', 'position_by'])
+OrderSendResult = namedtuple('OrderSendResult', [
+    'retcode', 'deal', 'order', 'volume', 'price', 'bid', 'ask', 'comment', 'request_id',
+    'retcode_external', 'request'])
+
+
+def _timestamp(value) -> pd.Timestamp:
+    """Timestamp of an MT5 time argument (datetime or epoch seconds)"""
+    if isinstance(value, (int, np.integer, float)):
+        return pd.Timestamp(int(value), unit='s')
+    return pd.Timestamp(value)
+
+
+def _epoch(timestamp: pd.Timestamp) -> int:
+    return int(timestamp.value // 10**9)
+
+
+class ReplayClock:
+    """Simulated current time; only bars closed by it are visible"""
+
+    def __init__(self, start):
+        self.now = pd.Timestamp(start)
+
+    def set(self, value):
+        self.now = _timestamp(value)
+
+    def advance(self, delta: pd.Timedelta):
+        self.now = self.now + pd.Timedelta(delta)
+
+
+class SimulatedTerminal:
+    """
+    Market data, account, positions and deals of the simulated terminal
+
+    The public methods carry the names and signatures of the MetaTrader5
+    module functions.
+    """
+
+    def __init__(self, start=None, balance: float = 10000.0, leverage: int = 100, currency: str = "USD",
+                 slippage_points: float = 0.0,
+                 latency: Union[float, Dict[str, float], None] = None, jitter: float = 0.0, seed: int = 0,
+                 symbol_specs_path: str = "symbol_specifications.json", sources=DATA_SOURCES,
+                 bars: Dict[str, pd.DataFrame] = None):
+        """
+        Initialize the simulated terminal
+
+        Args:
+            start: Initial replay time (default: close of the last stored bar)
+            balance: Starting account balance
+            leverage: Account leverage used for margin
+            currency: Account currency
+            slippage_points: Adverse slippage of market fills in points
+            latency: Seconds slept per API call, as one value or per function name
+                     (key "default" for the rest)
+            jitter: Extra uniform random latency in seconds
+            seed: Seed of the latency jitter
+            symbol_specs_path: Symbol specifications (tick value/size, volumes, trade mode)
+            sources: Data directories of the stored M1 bars
+            bars: Symbol -> M1 bars indexed by time, used instead of the stored files
+        """
+        with open(symbol_specs_path, 'r') as f:
+            specs = json.load(f)
+        self.specs = specs.get('symbol_specifications', specs.get('approved_symbols', {}))
+        self.sources = sources
+        self.bars: Dict[str, pd.DataFrame] = dict(bars or {})
+        self.arrays: Dict[str, tuple] = {}
+        self.symbols = sorted(set(self.specs) & (set(self.bars) | set(available_symbols(sources))))
+
+        self.latency = latency if isinstance(latency, dict) else {'default': latency or 0.0}
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.lock = threading.RLock()
+        self.local = threading.local()
+        self.calls: Dict[str, int] = {}
+
+        if start is None:
+            start = max(self._times(symbol)[-1] for symbol in self.symbols) + BAR_DURATION
+        self.clock = ReplayClock(start)
+
+        self.connected = False
+        self.balance = balance
+        self.initial_balance = balance
+        self.leverage = leverage
+        self.currency = currency
+        self.slippage_points = slippage_points
+        self.positions: Dict[int, Dict] = {}
+        self.deals: List[TradeDeal] = []
+        self._next_ticket = 1000001
+        self._next_deal = 5000001
+
+    # ========================================
+    # INTERNALS
+    # ========================================
+
+    def _call(self, name: str):
+        """Count the call and inject its latency"""
+        with self.lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            delay = self.latency.get(name, self.latency.get('default', 0.0))
+            if self.jitter:
+                delay += self.rng.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        self.local.error = (RES_S_OK, "Success")
+
+    def _fail(self, code: int, message: str):
+        self.local.error = (code, message)
+        return None
+
+    def _frame(self, symbol: str) -> Optional[pd.DataFrame]:
+        """M1 bars of a symbol (loaded on first use)"""
+        if symbol not in self.symbols:
+            return None
+        if symbol not in self.arrays:
+            with self.lock:
+                if symbol not in self.arrays:
+                    if symbol not in self.bars:
+                        self.bars[symbol] = load_bars(find_data_file(symbol, self.sources))
+                    df = self.bars[symbol]
+                    # Per-call lookups (quotes, clock position) go through plain arrays
+                    self.arrays[symbol] = (df.index.asi8, df['close'].to_numpy(dtype=float),
+                                           df['spread'].to_numpy(dtype=float))
+        return self.bars[symbol]
+
+    def _times(self, symbol: str) -> pd.DatetimeIndex:
+        if symbol in self.bars:
+            return self.bars[symbol].index
+        return pd.DatetimeIndex(load_bars(find_data_file(symbol, self.sources), columns=[], index=False)['time'])
+
+    def _closed(self, symbol: str, at: pd.Timestamp = None) -> int:
+        """Number of M1 bars closed by a time (default: the replay clock)"""
+        at = self.clock.now if at is None else at
+        self._frame(symbol)
+        return int(np.searchsorted(self.arrays[symbol][0], (at - BAR_DURATION).value, side='right'))
+
+    def _visible(self, symbol: str, timeframe: int) -> Optional[pd.DataFrame]:
+        """Bars of a timeframe built from the M1 bars closed by the clock"""
+        df = self._frame(symbol)
+        if df is None:
+            return self._fail(RES_E_INVALID_PARAMS, f"Unknown symbol {symbol}")
+        if timeframe not in TIMEFRAME_FREQUENCIES:
+            return self._fail(RES_E_INVALID_PARAMS, f"Invalid timeframe {timeframe}")
+        df = df.iloc[:self._closed(symbol)]
+        if timeframe != TIMEFRAME_M1 and len(df):
+            df = df.resample(TIMEFRAME_FREQUENCIES[timeframe], label='left', closed='left').agg(
+                {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'tick_volume': 'sum',
+                 'spread': 'max', 'real_volume': 'sum'}).dropna(subset=['open'])
+        return df
+
+    def _rates(self, symbol: str, df: pd.DataFrame) -> np.ndarray:
+        rates = np.zeros(len(df), dtype=RATES_DTYPE)
+        rates['time'] = df.index.asi8 // 10**9
+        for name in ('open', 'high', 'low', 'close', 'tick_volume', 'real_volume'):
+            if name in df:
+                rates[name] = df[name].to_numpy()
+        if 'spread' in df:
+            rates['spread'] = np.rint(df['spread'].to_numpy() / self.specs[symbol]['point'])
+        return rates
+
+    def _quote(self, symbol: str):
+        """(bid, ask, time) of the last closed M1 bar, or None before the first bar"""
+        if self._frame(symbol) is None:
+            return None
+        closed = self._closed(symbol)
+        if closed == 0:
+            return None
+        times, close, spread = self.arrays[symbol]
+        bid = float(close[closed - 1])
+        return bid, bid + float(spread[closed - 1]), pd.Timestamp(times[closed - 1]) + BAR_DURATION
+
+    def _value_per_price(self, symbol: str) -> float:
+        spec = self.specs[symbol]
+        return spec['tick_value'] / spec['tick_size']
+
+    def _profit(self, position: Dict, price: float, volume: float = None) -> float:
+        direction = 1 if position['type'] == POSITION_TYPE_BUY else -1
+        volume = position['volume'] if volume is None else volume
+        return direction * (price - position['price_open']) * volume * self._value_per_price(position['symbol'])
+
+    def _exit_price(self, position: Dict) -> Optional[float]:
+        quote = self._quote(position['symbol'])
+        if quote is None:
+            return None
+        return quote[0] if position['type'] == POSITION_TYPE_BUY else quote[1]
+
+    def _margin(self, symbol: str, volume: float, price: float) -> float:
+        return volume * price * self._value_per_price(symbol) / self.leverage
+
+    def _record_deal(self, order: int, position: Dict, deal_type: int, entry: int, volume: float,
+                     price: float, profit: float, reason: int, at: pd.Timestamp, comment: str) -> TradeDeal:
+        deal = TradeDeal(
+            ticket=self._next_deal, order=order, time=_epoch(at), time_msc=int(at.value // 10**6),
+            type=deal_type, entry=entry, magic=position['magic'], position_id=position['ticket'],
+            reason=reason, volume=volume, price=price, commission=0.0, swap=0.0, profit=profit, fee=0.0,
+            symbol=position['symbol'], comment=comment, external_id="")
+        self._next_deal += 1
+        self.deals.append(deal)
+        return deal
+
+    def _close(self, position: Dict, volume: float, price: float, order: int, reason: int,
+               at: pd.Timestamp, comment: str) -> TradeDeal:
+        profit = self._profit(position, price, volume)
+        self.balance += profit
+        deal_type = DEAL_TYPE_SELL if position['type'] == POSITION_TYPE_BUY else DEAL_TYPE_BUY
+        deal = self._record_deal(order, position, deal_type, DEAL_ENTRY_OUT, volume, price, profit, reason,
+                                 at, comment)
+        position['volume'] = round(position['volume'] - volume, 8)
+        position['time_update'] = at
+        if position['volume'] <= 1e-9:
+            del self.positions[position['ticket']]
+        return deal
+
+    def _settle(self, before: pd.Timestamp):
+        """Close positions whose stop loss or take profit was hit by bars closed since `before`"""
+        for position in list(self.positions.values()):
+            if not position['sl'] and not position['tp']:
+                continue
+            symbol = position['symbol']
+            df = self._frame(symbol)
+            first, last = self._closed(symbol, before), self._closed(symbol)
+            if first >= last:
+                continue
+            bars = df.iloc[first:last]
+            spread = bars['spread'].to_numpy()
+            if position['type'] == POSITION_TYPE_BUY:
+                # Long positions exit at the bid
+                stop_hit = bars['low'].to_numpy() <= position['sl'] if position['sl'] else np.zeros(len(bars), bool)
+                target_hit = bars['high'].to_numpy() >= position['tp'] if position['tp'] else np.zeros(len(bars), bool)
+            else:
+                # Short positions exit at the ask
+                stop_hit = (bars['high'].to_numpy() + spread >= position['sl'] if position['sl']
+                            else np.zeros(len(bars), bool))
+                target_hit = (bars['low'].to_numpy() + spread <= position['tp'] if position['tp']
+                              else np.zeros(len(bars), bool))
+            hits = np.flatnonzero(stop_hit | target_hit)
+            if len(hits):
+                row = hits[0]
+                stopped = bool(stop_hit[row])
+                self._close(position, position['volume'], position['sl'] if stopped else position['tp'],
+                            order=0, reason=DEAL_REASON_SL if stopped else DEAL_REASON_TP,
+                            at=bars.index[row] + BAR_DURATION, comment="[sl]" if stopped else "[tp]")
+
+    def _position_tuple(self, position: Dict) -> TradePosition:
+        price = self._exit_price(position)
+        price = position['price_open'] if price is None else price
+        opened, updated = position['time'], position['time_update']
+        return TradePosition(
+            ticket=position['ticket'], time=_epoch(opened), time_msc=int(opened.value // 10**6),
+            time_update=_epoch(updated), time_update_msc=int(updated.value // 10**6), type=position['type'],
+            magic=position['magic'], identifier=position['ticket'], reason=DEAL_REASON_EXPERT,
+            volume=position['volume'], price_open=position['price_open'], sl=position['sl'], tp=position['tp'],
+            price_current=price, swap=0.0, profit=self._profit(position, price), symbol=position['symbol'],
+            comment=position['comment'], external_id="")
+
+    @staticmethod
+    def _matches(name: str, group: Optional[str]) -> bool:
+        """MT5 group filter: comma-separated patterns, "!" excludes"""
+        if not group:
+            return True
+        included = False
+        for pattern in group.split(','):
+            pattern = pattern.strip()
+            if pattern.startswith('!'):
+                if fnmatch.fnmatch(name, pattern[1:]):
+                    return False
+            elif fnmatch.fnmatch(name, pattern):
+                included = True
+        return included
+
+    # ========================================
+    # REPLAY CLOCK
+    # ========================================
+
+    def set_time(self, value):
+        """Move the replay clock to a time, settling stops and targets of the bars passed"""
+        with self.lock:
+            before = self.clock.now
+            self.clock.set(value)
+            if self.clock.now > before:
+                self._settle(before)
+
+    def advance(self, minutes: float = 1.0):
+        """Move the replay clock forward"""
+        self.set_time(self.clock.now + pd.Timedelta(minutes=minutes))
+
+    # ========================================
+    # CONNECTION AND TERMINAL
+    # ========================================
+
+    def initialize(self, *args, **kwargs) -> bool:
+        self._call('initialize')
+        self.connected = True
+        return True
+
+    def login(self, *args, **kwargs) -> bool:
+        self._call('login')
+        return True
+
+    def shutdown(self):
+        self._call('shutdown')
+        self.connected = False
+
+    def last_error(self):
+        return getattr(self.local, 'error', (RES_S_OK, "Success"))
+
+    def version(self):
+        self._call('version')
+        return (500, 5000, "21 Sep 2025")
+
+    def terminal_info(self) -> TerminalInfo:
+        self._call('terminal_info')
+        return TerminalInfo(
+            community_account=False, community_connection=False, connected=True, dlls_allowed=False,
+            trade_allowed=True, tradeapi_disabled=False, email_enabled=False, ftp_enabled=False,
+            notifications_enabled=False, mqid=False, build=5000, maxbars=100000, codepage=0, ping_last=0,
+            community_balance=0.0, retransmission=0.0, company="Multi-Symbol Strategy Framework",
+            name="Offline MT5 Simulator", language="English", path="", data_path="", commondata_path="")
+
+    def account_info(self) -> AccountInfo:
+        self._call('account_info')
+        with self.lock:
+            profit = sum(self._position_tuple(position).profit for position in self.positions.values())
+            margin = sum(self._margin(position['symbol'], position['volume'], position['price_open'])
+                         for position in self.positions.values())
+            equity = self.balance + profit
+            return AccountInfo(
+                login=10000001, trade_mode=ACCOUNT_TRADE_MODE_DEMO, leverage=self.leverage, limit_orders=200,
+                margin_so_mode=0, trade_allowed=True, trade_expert=True, margin_mode=2, currency_digits=2,
+                fifo_close=False, balance=round(self.balance, 2), credit=0.0, profit=round(profit, 2),
+                equity=round(equity, 2), margin=round(margin, 2), margin_free=round(equity - margin, 2),
+                margin_level=round(equity / margin * 100, 2) if margin else 0.0, margin_so_call=50.0,
+                margin_so_so=30.0, margin_initial=0.0, margin_maintenance=0.0, assets=0.0, liabilities=0.0,
+                commission_blocked=0.0, name="Offline simulator", server="Simulator-Replay",
+                currency=self.currency, company="Multi-Symbol Strategy Framework")
+
+    # ========================================
+    # SYMBOLS AND MARKET DATA
+    # ========================================
+
+    def symbols_total(self) -> int:
+        self._call('symbols_total')
+        return len(self.symbols)
+
+    def symbols_get(self, group: str = None):
+        self._call('symbols_get')
+        return tuple(self._symbol_tuple(symbol) for symbol in self.symbols if self._matches(symbol, group))
+
+    def symbol_select(self, symbol: str, enable: bool = True) -> bool:
+        self._call('symbol_select')
+        return symbol in self.symbols or bool(self._fail(RES_E_NOT_FOUND, f"Unknown symbol {symbol}"))
+
+    def symbol_info(self, symbol: str) -> Optional[SymbolInfo]:
+        self._call('symbol_info')
+        if symbol not in self.symbols:
+            return self._fail(RES_E_NOT_FOUND, f"Unknown symbol {symbol}")
+        return self._symbol_tuple(symbol)
+
+    def _symbol_tuple(self, symbol: str) -> SymbolInfo:
+        spec = self.specs[symbol]
+        quote = self._quote(symbol)
+        bid, ask, at = quote if quote else (0.0, 0.0, self.clock.now)
+        return SymbolInfo(
+            name=symbol, description=spec.get('description', symbol), path=spec.get('symbol_type', ''),
+            visible=True, select=True, time=_epoch(at), digits=spec['digits'],
+            spread=int(round((ask - bid) / spec['point'])), spread_float=True,
+            trade_mode=spec.get('trade_mode', SYMBOL_TRADE_MODE_FULL), trade_exemode=spec.get('execution_mode', 0),
+            bid=bid, ask=ask, point=spec['point'], trade_tick_value=spec['tick_value'],
+            trade_tick_size=spec['tick_size'], trade_contract_size=spec['contract_size'],
+            volume_min=spec['min_lot'], volume_max=spec['max_lot'], volume_step=spec['lot_step'],
+            margin_initial=spec.get('margin_initial', 0.0), margin_maintenance=spec.get('margin_maintenance', 0.0),
+            currency_base=spec.get('currency_base', ''), currency_profit=spec.get('currency_profit', ''),
+            currency_margin=spec.get('currency_margin', ''))
+
+    def symbol_info_tick(self, symbol: str) -> Optional[Tick]:
+        self._call('symbol_info_tick')
+        quote = self._quote(symbol)
+        if quote is None:
+            return self._fail(RES_E_NOT_FOUND, f"No quote for {symbol} at {self.clock.now}")
+        bid, ask, at = quote
+        return Tick(time=_epoch(at), bid=bid, ask=ask, last=0.0, volume=0, time_msc=int(at.value // 10**6),
+                    flags=TICK_FLAG_BID | TICK_FLAG_ASK, volume_real=0.0)
+
+    def copy_rates_from_pos(self, symbol: str, timeframe: int, start_pos: int, count: int):
+        """Bars counted back from the newest (start_pos 0 is the bar still forming)"""
+        self._call('copy_rates_from_pos')
+        df = self._visible(symbol, timeframe)
+        if df is None:
+            return None
+        end = len(df) - start_pos
+        return self._rates(symbol, df.iloc[max(0, end - count):max(0, end)])
+
+    def copy_rates_from(self, symbol: str, timeframe: int, date_from, count: int):
+        """`count` bars opened at or before date_from"""
+        self._call('copy_rates_from')
+        df = self._visible(symbol, timeframe)
+        if df is None:
+            return None
+        end = df.index.searchsorted(_timestamp(date_from), side='right')
+        return self._rates(symbol, df.iloc[max(0, end - count):end])
+
+    def copy_rates_range(self, symbol: str, timeframe: int, date_from, date_to):
+        """Bars opened within [date_from, date_to]"""
+        self._call('copy_rates_range')
+        df = self._visible(symbol, timeframe)
+        if df is None:
+            return None
+        return self._rates(symbol, df.loc[_timestamp(date_from):_timestamp(date_to)])
+
+    def _ticks(self, symbol: str, df: pd.DataFrame) -> np.ndarray:
+        """One tick per M1 bar, quoting the bar's close at its close time"""
+        ticks = np.zeros(len(df), dtype=TICKS_DTYPE)
+        times = df.index + BAR_DURATION
+        ticks['time'] = times.asi8 // 10**9
+        ticks['time_msc'] = times.asi8 // 10**6
+        ticks['bid'] = df['close'].to_numpy()
+        ticks['ask'] = (df['close'] + df['spread']).to_numpy()
+        ticks['flags'] = TICK_FLAG_BID | TICK_FLAG_ASK
+        return ticks
+
+    def copy_ticks_from(self, symbol: str, date_from, count: int, flags: int = COPY_TICKS_ALL):
+        self._call('copy_ticks_from')
+        df = self._visible(symbol, TIMEFRAME_M1)
+        if df is None:
+            return None
+        start = df.index.searchsorted(_timestamp(date_from) - BAR_DURATION, side='left')
+        return self._ticks(symbol, df.iloc[start:start + count])
+
+    def copy_ticks_range(self, symbol: str, date_from, date_to, flags: int = COPY_TICKS_ALL):
+        self._call('copy_ticks_range')
+        df = self._visible(symbol, TIMEFRAME_M1)
+        if df is None:
+            return None
+        return self._ticks(symbol, df.loc[_timestamp(date_from) - BAR_DURATION:_timestamp(date_to) - BAR_DURATION])
+
+    # ========================================
+    # TRADING
+    # ========================================
+
+    def order_send(self, request: Dict) -> Optional[OrderSendResult]:
+        """
+        Execute a trade request
+
+        TRADE_ACTION_DEAL opens a position, or closes (part of) the position
+        given as "position"; TRADE_ACTION_SLTP changes a position's stops.
+        """
+        self._call('order_send')
+        if not isinstance(request, dict) or 'action' not in request:
+            return self._fail(RES_E_INVALID_PARAMS, "Invalid request")
+        fields = {name: request.get(name, 0) for name in TradeRequest._fields}
+        fields['symbol'] = request.get('symbol', '')
+        fields['comment'] = request.get('comment', '')
+        trade_request = TradeRequest(**fields)
+
+        with self.lock:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            retcode, comment, deal, volume, price = self._execute(request, ticket)
+            quote = self._quote(trade_request.symbol) if trade_request.symbol in self.symbols else None
+            bid, ask = (quote[0], quote[1]) if quote else (0.0, 0.0)
+            return OrderSendResult(
+                retcode=retcode, deal=deal.ticket if deal else 0, order=ticket if deal else 0,
+                volume=volume if deal else 0.0, price=price if deal else 0.0, bid=bid, ask=ask,
+                comment=comment, request_id=ticket, retcode_external=0, request=trade_request)
+
+    def _execute(self, request: Dict, ticket: int):
+        """(retcode, comment, deal, volume, price) of a request (lock held)"""
+        action = request['action']
+        if action == TRADE_ACTION_SLTP:
+            position = self.positions.get(request.get('position'))
+            if position is None:
+                return TRADE_RETCODE_POSITION_CLOSED, "Position not found", None, 0.0, 0.0
+            position['sl'], position['tp'] = float(request.get('sl', 0.0)), float(request.get('tp', 0.0))
+            return TRADE_RETCODE_DONE, "Request executed", None, 0.0, 0.0
+        if action != TRADE_ACTION_DEAL or request.get('type') not in (ORDER_TYPE_BUY, ORDER_TYPE_SELL):
+            return TRADE_RETCODE_INVALID_ORDER, "Pending orders are not simulated", None, 0.0, 0.0
+
+        symbol = request.get('symbol')
+        if symbol not in self.symbols:
+            return TRADE_RETCODE_INVALID, f"Unknown symbol {symbol}", None, 0.0, 0.0
+        spec = self.specs[symbol]
+        volume = float(request.get('volume', 0.0))
+        steps = volume / spec['lot_step']
+        if volume < spec['min_lot'] - 1e-9 or volume > spec['max_lot'] + 1e-9 or abs(steps - round(steps)) > 1e-6:
+            return TRADE_RETCODE_INVALID_VOLUME, "Invalid volume", None, 0.0, 0.0
+        quote = self._quote(symbol)
+        if quote is None:
+            return TRADE_RETCODE_MARKET_CLOSED, "Market closed", None, 0.0, 0.0
+        bid, ask, _ = quote
+        buy = request['type'] == ORDER_TYPE_BUY
+        slippage = self.slippage_points * spec['point']
+        price = ask + slippage if buy else bid - slippage
+        now = self.clock.now
+        comment = request.get('comment', '')
+
+        if request.get('position'):
+            position = self.positions.get(request['position'])
+            if position is None:
+                return TRADE_RETCODE_POSITION_CLOSED, "Position not found", None, 0.0, 0.0
+            if position['type'] == (POSITION_TYPE_BUY if buy else POSITION_TYPE_SELL) or volume > position['volume'] + 1e-9:
+                return TRADE_RETCODE_INVALID, "Close request does not match the position", None, 0.0, 0.0
+            deal = self._close(position, volume, price, ticket, DEAL_REASON_EXPERT, now, comment)
+            return TRADE_RETCODE_DONE, "Request executed", deal, volume, price
+
+        trade_mode = spec.get('trade_mode', SYMBOL_TRADE_MODE_FULL)
+        if trade_mode in (SYMBOL_TRADE_MODE_DISABLED, SYMBOL_TRADE_MODE_CLOSEONLY) or \
+                (trade_mode == SYMBOL_TRADE_MODE_LONGONLY and not buy) or \
+                (trade_mode == SYMBOL_TRADE_MODE_SHORTONLY and buy):
+            return TRADE_RETCODE_TRADE_DISABLED, "Trade disabled", None, 0.0, 0.0
+        sl, tp = float(request.get('sl', 0.0) or 0.0), float(request.get('tp', 0.0) or 0.0)
+        if (sl and (sl >= price if buy else sl <= price)) or (tp and (tp <= price if buy else tp >= price)):
+            return TRADE_RETCODE_INVALID_STOPS, "Invalid stops", None, 0.0, 0.0
+
+        account = self._free_margin()
+        if self._margin(symbol, volume, price) > account:
+            return TRADE_RETCODE_NO_MONEY, "No money", None, 0.0, 0.0
+
+        position = {'ticket': ticket, 'symbol': symbol, 'type': POSITION_TYPE_BUY if buy else POSITION_TYPE_SELL,
+                    'volume': volume, 'price_open': price, 'sl': sl, 'tp': tp, 'magic': request.get('magic', 0),
+                    'comment': comment, 'time': now, 'time_update': now}
+        self.positions[ticket] = position
+        deal = self._record_deal(ticket, position, DEAL_TYPE_BUY if buy else DEAL_TYPE_SELL, DEAL_ENTRY_IN,
+                                 volume, price, 0.0, DEAL_REASON_EXPERT, now, comment)
+        return TRADE_RETCODE_DONE, "Request executed", deal, volume, price
+
+    def _free_margin(self) -> float:
+        equity = self.balance
+        margin = 0.0
+        for position in self.positions.values():
+            price = self._exit_price(position)
+            equity += self._profit(position, position['price_open'] if price is None else price)
+            margin += self._margin(position['symbol'], position['volume'], position['price_open'])
+        return equity - margin
+
+    def positions_total(self) -> int:
+        self._call('positions_total')
+        return len(self.positions)
+
+    def positions_get(self, symbol: str = None, group: str = None, ticket: int = None):
+        self._call('positions_get')
+        with self.lock:
+            return tuple(self._position_tuple(position) for position in self.positions.values()
+                         if (symbol is None or position['symbol'] == symbol)
+                         and (ticket is None or position['ticket'] == ticket)
+                         and self._matches(position['symbol'], group))
+
+    def orders_total(self) -> int:
+        self._call('orders_total')
+        return 0
+
+    def orders_get(self, symbol: str = None, group: str = None, ticket: int = None):
+        self._call('orders_get')
+        return ()
+
+    def history_deals_total(self, date_from, date_to) -> int:
+        return len(self.history_deals_get(date_from, date_to))
+
+    def history_deals_get(self, date_from=None, date_to=None, group: str = None, ticket: int = None,
+                          position: int = None):
+        """Deals by time range ([date_from, date_to]), order ticket or position"""
+        self._call('history_deals_get')
+        with self.lock:
+            deals = list(self.deals)
+        if ticket is not None:
+            return tuple(deal for deal in deals if deal.order == ticket)
+        if position is not None:
+            return tuple(deal for deal in deals if deal.position_id == position)
+        if date_from is None or date_to is None:
+            return self._fail(RES_E_INVALID_PARAMS, "history_deals_get needs a time range, ticket or position")
+        start, end = _epoch(_timestamp(date_from)), _epoch(_timestamp(date_to))
+        return tuple(deal for deal in deals
+                     if start <= deal.time <= end and self._matches(deal.symbol, group))
+
+
+# ========================================
+# MODULE-LEVEL API (drop-in for `import MetaTrader5 as mt5`)
+# ========================================
+
+API_FUNCTIONS = (
+    'initialize', 'login', 'shutdown', 'last_error', 'version', 'terminal_info', 'account_info',
+    'symbols_total', 'symbols_get', 'symbol_select', 'symbol_info', 'symbol_info_tick',
+    'copy_rates_from_pos', 'copy_rates_from', 'copy_rates_range', 'copy_ticks_from', 'copy_ticks_range',
+    'order_send', 'positions_total', 'positions_get', 'orders_total', 'orders_get',
+    'history_deals_total', 'history_deals_get',
+)
+
+_terminal: Optional[SimulatedTerminal] = None
+
+
+def get_terminal() -> SimulatedTerminal:
+    """Terminal behind the module-level functions (created with defaults on first use)"""
+    global _terminal
+    if _terminal is None:
+        _terminal = SimulatedTerminal()
+    return _terminal
+
+
+def configure(terminal: SimulatedTerminal = None, **kwargs) -> SimulatedTerminal:
+    """
+    Replace the terminal behind the module-level functions
+
+    Args:
+        terminal: Terminal to use (created from kwargs when omitted)
+        **kwargs: SimulatedTerminal arguments
+
+    Returns:
+        The terminal
+    """
+    global _terminal
+    _terminal = terminal or SimulatedTerminal(**kwargs)
+    return _terminal
+
+
+def install(terminal: SimulatedTerminal = None, **kwargs) -> SimulatedTerminal:
+    """
+    Register this module as MetaTrader5, so `import MetaTrader5 as mt5` in
+    modules imported afterwards gets the simulator
+
+    Args:
+        terminal: Terminal to use (created from kwargs when omitted)
+        **kwargs: SimulatedTerminal arguments
+
+    Returns:
+        The terminal
+    """
+    sys.modules['MetaTrader5'] = sys.modules[__name__]
+    return configure(terminal, **kwargs)
+
+
+def _delegate(name: str):
+    def call(*args, **kwargs):
+        return getattr(get_terminal(), name)(*args, **kwargs)
+    call.__name__ = name
+    call.__doc__ = getattr(SimulatedTerminal, name).__doc__
+    return call
+
+
+for _name in API_FUNCTIONS:
+    globals()[_name] = _delegate(_name)
+
+
+def main():
+    """Load-test order_send: concurrent open/close round trips with injected latency"""
+    parser = argparse.ArgumentParser(description="Offline MT5 simulator order pipeline load test")
+    parser.add_argument("--orders", type=int, default=1000, help="Round trips (open + close) to send")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent senders")
+    parser.add_argument("--latency", type=float, default=0.002, help="Seconds per order_send")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra uniform latency in seconds")
+    parser.add_argument("--symbols", nargs="*", default=None, help="Symbols to trade (default: all)")
+    args = parser.parse_args()
+
+    terminal = configure(latency={'order_send': args.latency}, jitter=args.jitter, balance=1e9)
+    symbols = args.symbols or terminal.symbols
+    print("🚀 MT5 SIMULATOR LOAD TEST")
+    print("=" * 60)
+    print(f"📋 {args.orders} round trips on {len(symbols)} symbols, {args.threads} threads, "
+          f"{args.latency * 1000:.1f}ms latency, replay time {terminal.clock.now}")
+
+    def round_trip(i: int) -> List[float]:
+        symbol = symbols[i % len(symbols)]
+        volume = terminal.specs[symbol]['min_lot']
+        timings = []
+        start = time.perf_counter()
+        result = order_send({"action": TRADE_ACTION_DEAL, "symbol": symbol, "volume": volume,
+                             "type": ORDER_TYPE_BUY if i % 2 == 0 else ORDER_TYPE_SELL, "magic": i})
+        timings.append(time.perf_counter() - start)
+        if result.retcode != TRADE_RETCODE_DONE:
+            return timings
+        start = time.perf_counter()
+        order_send({"action": TRADE_ACTION_DEAL, "symbol": symbol, "volume": volume, "position": result.order,
+                    "type": ORDER_TYPE_SELL if i % 2 == 0 else ORDER_TYPE_BUY})
+        timings.append(time.perf_counter() - start)
+        return timings
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        timings = [t for trip in pool.map(round_trip, range(args.orders)) for t in trip]
+    elapsed = time.perf_counter() - start
+    latencies = np.array(timings) * 1000
+    print(f"\n📊 {len(timings):,} orders in {elapsed:.2f}s ({len(timings) / elapsed:,.0f} orders/s)")
+    print(f"   Latency p50 {np.percentile(latencies, 50):.2f}ms, p99 {np.percentile(latencies, 99):.2f}ms")
+    print(f"   Deals: {len(terminal.deals):,}, open positions: {len(terminal.positions)}, "
+          f"balance change: {terminal.balance - terminal.initial_balance:+,.2f}")
+
+
+if __name__ == "__main__":
+    main()
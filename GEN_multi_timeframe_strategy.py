@@ -24,11 +24,23 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Literal
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 import json
 import os
 import warnings
 warnings.filterwarnings('ignore')
 
+from GEN_advanced_technical_indicators import CUMULATIVE_COLUMNS, ema_horizon, true_range
+from GEN_batch_indicator_engine import BatchIndicatorEngine, SymbolPanel
+from GEN_columnar_store import bars_exist, load_bars
+from GEN_feature_cache import RollingFeatureCache
+from GEN_incremental_resampler import IncrementalResampler
+from GEN_indicator_frame_cache import IndicatorFrameCache
+from GEN_parallel_analysis import ParallelSymbolAnalyzer
+from GEN_point_in_time_index import PointInTimeIndex
+from GEN_shared_market_data import DEFAULT_PREFIX, SharedMarketDataReader, SharedMarketDataWriter
+from GEN_signal_history import SignalHistoryStore
+
 class TimeFrame(Enum):
     """Supported timeframes"""
     M1 = "1T"      # 1 minute
@@ -38,6 +50,37 @@ class TimeFrame(Enum):
     H4 = "4H"      # 4 hours
     D1 = "1D"      # 1 day
 
+# Latest-bar evaluation: indicators over the derived tail, the full history,
+# or both with the tail result checked against the full one
+EVALUATION_MODES = ('tail', 'full', 'verify')
+
+# Tolerances for the tail verification. pandas' online rolling variance drifts
+# by ~1e-8 relative over a month of M1 bars, so the full-history Bollinger
+# values are the less precise side of the comparison
+TAIL_RTOL = 1e-6
+TAIL_ATOL = 1e-9
+
+# How a historical current_time selects each timeframe's bar: the last bar
+# closed at or before it ('asof', no look-ahead) or the bar whose open time
+# is nearest to it ('nearest', may select a bar that had not closed yet)
+TIME_ALIGNMENTS = ('asof', 'nearest')
+
+# Confluent signal fields kept in the signal history store
+SIGNAL_HISTORY_FIELDS = {
+    'overall_direction': np.int8,
+    'overall_strength': np.float64,
+    'confluence_score': np.float64,
+    'position_size_multiplier': np.float64,
+    'timeframes': np.int8,
+}
+SIGNAL_HISTORY_CATEGORIES = {
+    'recommended_action': ("STRONG_SELL", "SELL", "HOLD", "BUY", "STRONG_BUY"),
+    'risk_level': ("LOW", "MEDIUM", "HIGH"),
+}
+
+# Per-indicator vote columns of a timeframe signal series (+1 buy, -1 sell, 0 none)
+SIGNAL_VOTE_COLUMNS = ('rsi_signal', 'macd_signal', 'bb_signal', 'ma_signal', 'momentum_signal')
+
 class SignalStrength(Enum):
     """Signal strength levels"""
     VERY_WEAK = 0.2
@@ -89,16 +132,43 @@ class MultiTimeframeStrategy:
     
     def __init__(self, config_path: str = "GEN_unified_config.json"):
         """Initialize multi-timeframe strategy"""
+        self.config_path = config_path
         self.config = self._load_config(config_path)
         self.timeframes = [TimeFrame.M1, TimeFrame.M5, TimeFrame.M15, TimeFrame.H1, TimeFrame.H4, TimeFrame.D1]
         self.timeframe_weights = self._initialize_timeframe_weights()
         self.data_cache = {}
-        self.signal_history = {}
+        self.resamplers = {}
+        self.feature_cache = RollingFeatureCache()
+        self.batch_engine = BatchIndicatorEngine(self.config.get("multi_timeframe", {}).get("indicators", {}))
+        self.signal_history = SignalHistoryStore(
+            SIGNAL_HISTORY_FIELDS, SIGNAL_HISTORY_CATEGORIES,
+            capacity=self.config.get("multi_timeframe", {}).get("signal_history_capacity", 10000),
+            spill_dir=self.config.get("multi_timeframe", {}).get("signal_history_spill_dir"))
         
         # Strategy parameters from config
         self.confluence_threshold = self.config.get("multi_timeframe", {}).get("confluence_threshold", 0.6)
         self.max_timeframes = self.config.get("multi_timeframe", {}).get("max_timeframes", 6)
         self.signal_decay_hours = self.config.get("multi_timeframe", {}).get("signal_decay_hours", 4)
+        self.evaluation_mode = self.config.get("multi_timeframe", {}).get("evaluation_mode", "tail")
+        if self.evaluation_mode not in EVALUATION_MODES:
+            raise ValueError(f"Unknown evaluation mode '{self.evaluation_mode}', expected one of {EVALUATION_MODES}")
+        self.tail_checks = []
+        # (symbol, timeframe) pairs whose tail disagreed with full history in 'verify' mode
+        self.tail_fallbacks = set()
+        self.indicator_cache_enabled = self.config.get("multi_timeframe", {}).get("indicator_cache", True)
+        self.indicator_cache = IndicatorFrameCache()
+        self.time_alignment = self.config.get("multi_timeframe", {}).get("time_alignment", "asof")
+        if self.time_alignment not in TIME_ALIGNMENTS:
+            raise ValueError(f"Unknown time alignment '{self.time_alignment}', expected one of {TIME_ALIGNMENTS}")
+        self.point_in_time = PointInTimeIndex(self.data_cache)
+        self.parallel_workers = self.config.get("multi_timeframe", {}).get("parallel_workers")
+        self.parallel_chunksize = self.config.get("multi_timeframe", {}).get("parallel_chunksize")
+        self.parallel_analyzer = None
+        self.shared_writer = None
+        self.shared_reader = None
+        shared_data = self.config.get("multi_timeframe", {}).get("shared_data")
+        if shared_data:
+            self.attach_shared_data(shared_data)
         
         print("✅ Multi-Timeframe Strategy Engine initialized")
     
@@ -118,6 +188,14 @@ class MultiTimeframeStrategy:
                 "confluence_threshold": 0.6,
                 "max_timeframes": 6,
                 "signal_decay_hours": 4,
+                "evaluation_mode": "tail",
+                "indicator_cache": True,
+                "time_alignment": "asof",
+                "parallel_workers": None,
+                "parallel_chunksize": None,
+                "shared_data": None,
+                "signal_history_capacity": 10000,
+                "signal_history_spill_dir": None,
                 "timeframe_weights": {
                     "M1": 0.1,
                     "M5": 0.15,
@@ -157,41 +235,50 @@ class MultiTimeframeStrategy:
                 default_weights[getattr(TimeFrame, tf)] = weight
         
         return default_weights
-    
+
+    def apply_parameters(self, parameters: Dict):
+        """
+        Override settings of the multi_timeframe config section
+
+        Indicator frames are cached per indicator settings, so changed
+        periods are calculated fresh while earlier frames stay reusable.
+
+        Args:
+            parameters: Dotted path within the section -> value, e.g.
+                        {"confluence_threshold": 0.7, "timeframe_weights.D1": 0.4,
+                         "indicators.rsi_period": 21}
+        """
+        section = self.config.setdefault("multi_timeframe", {})
+        for path, value in parameters.items():
+            *parents, name = path.split(".")
+            node = section
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[name] = value
+
+        self.timeframe_weights = self._initialize_timeframe_weights()
+        self.confluence_threshold = section.get("confluence_threshold", 0.6)
+        self.batch_engine = BatchIndicatorEngine(section.get("indicators", {}))
+
     def load_data(self, symbol: str, data_path: str = None) -> bool:
-        """Load minute data for a symbol"""
+        """Load minute data for a symbol (attached from shared memory when published there)"""
+        if data_path is None and self.shared_reader is not None and self.shared_reader.has(symbol):
+            self.data_cache[symbol] = self.shared_reader.frames(symbol, self.timeframes)
+            print(f"✅ Attached {symbol} shared data across {len(self.timeframes)} timeframes")
+            return True
+        
         try:
             if data_path is None:
                 data_path = f"CSVdata/raw/GEN_{symbol}_M1_1month.csv"
             
-            if not os.path.exists(data_path):
+            if not bars_exist(data_path):
                 print(f"❌ Data file not found: {data_path}")
                 return False
             
-            # Load M1 data
-            df = pd.read_csv(data_path)
-            df['time'] = pd.to_datetime(df['time'])
-            df.set_index('time', inplace=True)
+            # Load M1 data (memory-mapped column store, converted from the CSV on first use)
+            df = load_bars(data_path)
             
-            # Generate higher timeframes
-            timeframe_data = {}
-            timeframe_data[TimeFrame.M1] = df
-            
-            # Create higher timeframes using OHLC resampling
-            for tf in [TimeFrame.M5, TimeFrame.M15, TimeFrame.H1, TimeFrame.H4, TimeFrame.D1]:
-                resampled = df.resample(tf.value).agg({
-                    'open': 'first',
-                    'high': 'max',
-                    'low': 'min',
-                    'close': 'last',
-                    'tick_volume': 'sum',
-                    'spread': 'mean',
-                    'real_volume': 'sum'
-                }).dropna()
-                
-                timeframe_data[tf] = resampled
-            
-            self.data_cache[symbol] = timeframe_data
+            timeframe_data = self.load_frame(symbol, df)
             
             print(f"✅ Loaded {symbol} data across {len(timeframe_data)} timeframes")
             for tf, data in timeframe_data.items():
@@ -203,19 +290,148 @@ class MultiTimeframeStrategy:
             print(f"❌ Error loading data for {symbol}: {e}")
             return False
     
+    def load_frame(self, symbol: str, df: pd.DataFrame) -> Dict[TimeFrame, pd.DataFrame]:
+        """
+        Load a symbol from an M1 OHLCV DataFrame (e.g. the first bars of a replay)
+        
+        Args:
+            symbol: Trading symbol
+            df: M1 OHLCV DataFrame indexed by time
+            
+        Returns:
+            Timeframe -> DataFrame, as stored in the data cache
+        """
+        # Generate higher timeframes
+        timeframe_data = {}
+        timeframe_data[TimeFrame.M1] = df
+        
+        # Create higher timeframes hierarchically (M5 from M1, ..., D1 from H4);
+        # the resampler is kept so appended bars only update the open buckets
+        resampler = IncrementalResampler()
+        resampler.append(df)
+        for tf in [TimeFrame.M5, TimeFrame.M15, TimeFrame.H1, TimeFrame.H4, TimeFrame.D1]:
+            timeframe_data[tf] = resampler.frame(tf.name)
+        
+        self.data_cache[symbol] = timeframe_data
+        self.resamplers[symbol] = resampler
+        return timeframe_data
+    
+    def append_bars(self, symbol: str, bars: pd.DataFrame) -> Dict[TimeFrame, pd.DataFrame]:
+        """
+        Append new M1 bars for a loaded symbol and update every timeframe
+        
+        Only the open bucket of each higher timeframe is re-aggregated. A bar
+        with the time of the current last M1 bar replaces it. The data cache
+        then holds new read-only views of the resampler's arrays, so an append
+        costs O(new bars) whatever the length of the history.
+        
+        Args:
+            symbol: Symbol loaded with load_data
+            bars: M1 OHLCV DataFrame indexed by time
+            
+        Returns:
+            Higher timeframe -> DataFrame of bars closed by this append
+        """
+        if symbol not in self.resamplers:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        
+        resampler = self.resamplers[symbol]
+        closed = resampler.append(bars)
+        self.data_cache[symbol] = {tf: resampler.frame(tf.name) for tf in self.timeframes}
+        if self.shared_writer is not None and symbol in self.shared_writer.symbols():
+            self.shared_writer.publish_frames(symbol, self.data_cache[symbol])
+        
+        return {getattr(TimeFrame, name): frame for name, frame in closed.items()}
+    
+    def publish_shared_data(self, symbols: List[str] = None, prefix: str = DEFAULT_PREFIX) -> str:
+        """
+        Publish loaded symbols to shared memory (this strategy becomes the single writer)
+        
+        Bars appended later with append_bars are published as well.
+        
+        Args:
+            symbols: Loaded symbols to publish (defaults to all of data_cache)
+            prefix: Shared segment name prefix readers attach with
+            
+        Returns:
+            Prefix of the published data
+        """
+        if self.shared_writer is None:
+            self.shared_writer = SharedMarketDataWriter(prefix)
+        for symbol in symbols or list(self.data_cache):
+            if symbol not in self.resamplers:
+                raise ValueError(f"Data not loaded from file for symbol: {symbol}")
+            self.shared_writer.publish_frames(symbol, self.data_cache[symbol])
+        return self.shared_writer.prefix
+    
+    def attach_shared_data(self, prefix: str = DEFAULT_PREFIX):
+        """
+        Read symbols published by another process's publish_shared_data
+        
+        load_data then attaches to published symbols instead of reading
+        their files; the attached frames are read-only.
+        
+        Args:
+            prefix: Shared segment name prefix used by the writer
+        """
+        self.shared_reader = SharedMarketDataReader(prefix)
+    
+    def refresh_shared_data(self, symbols: List[str] = None):
+        """Pick up bars published since the shared symbols were attached"""
+        if self.shared_reader is None:
+            return
+        for symbol in symbols or list(self.data_cache):
+            if symbol in self.data_cache and symbol not in self.resamplers:
+                self.data_cache[symbol] = self.shared_reader.frames(symbol, self.timeframes)
+    
+    def close_shared_data(self):
+        """Detach from shared data and remove the segments this strategy published"""
+        if self.shared_reader is not None:
+            self.shared_reader.close()
+            self.shared_reader = None
+        if self.shared_writer is not None:
+            self.shared_writer.close()
+            self.shared_writer = None
+    
     def calculate_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate technical indicators for a dataset"""
+        with self.feature_cache.frame(data):
+            return self._calculate_technical_indicators(data)
+    
+    def _calculate_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Indicator calculation drawing rolling statistics from the feature cache"""
         df = data.copy()
-        
-        # Get parameters from config
+        self._add_basic_indicators(df, self.basic_indicator_parameters())
+        return df
+    
+    def basic_indicator_parameters(self) -> Dict[str, float]:
+        """Basic indicator parameters from the config, with defaults filled in"""
         indicators_config = self.config.get("multi_timeframe", {}).get("indicators", {})
-        rsi_period = indicators_config.get("rsi_period", 14)
-        macd_fast = indicators_config.get("macd_fast", 12)
-        macd_slow = indicators_config.get("macd_slow", 26)
-        macd_signal = indicators_config.get("macd_signal", 9)
-        bb_period = indicators_config.get("bb_period", 20)
-        bb_std = indicators_config.get("bb_std", 2)
-        atr_period = indicators_config.get("atr_period", 14)
+        return {
+            "rsi_period": indicators_config.get("rsi_period", 14),
+            "macd_fast": indicators_config.get("macd_fast", 12),
+            "macd_slow": indicators_config.get("macd_slow", 26),
+            "macd_signal": indicators_config.get("macd_signal", 9),
+            "bb_period": indicators_config.get("bb_period", 20),
+            "bb_std": indicators_config.get("bb_std", 2),
+            "atr_period": indicators_config.get("atr_period", 14)
+        }
+    
+    def _add_basic_indicators(self, df, parameters: Dict[str, float]):
+        """
+        Write the basic indicator columns into a frame in place
+        
+        Args:
+            df: DataFrame or IndicatorBuffer with OHLCV data
+            parameters: Resolved parameters (see basic_indicator_parameters)
+        """
+        rsi_period = parameters["rsi_period"]
+        macd_fast = parameters["macd_fast"]
+        macd_slow = parameters["macd_slow"]
+        macd_signal = parameters["macd_signal"]
+        bb_period = parameters["bb_period"]
+        bb_std = parameters["bb_std"]
+        atr_period = parameters["atr_period"]
         
         # RSI
         delta = df['close'].diff()
@@ -225,41 +441,206 @@ class MultiTimeframeStrategy:
         df['rsi'] = 100 - (100 / (1 + rs))
         
         # MACD
-        ema_fast = df['close'].ewm(span=macd_fast).mean()
-        ema_slow = df['close'].ewm(span=macd_slow).mean()
+        ema_fast = self.feature_cache.ewm(df, 'close', macd_fast)
+        ema_slow = self.feature_cache.ewm(df, 'close', macd_slow)
         df['macd'] = ema_fast - ema_slow
         df['macd_signal'] = df['macd'].ewm(span=macd_signal).mean()
         df['macd_histogram'] = df['macd'] - df['macd_signal']
         
         # Bollinger Bands
-        df['bb_middle'] = df['close'].rolling(window=bb_period).mean()
-        std = df['close'].rolling(window=bb_period).std()
+        df['bb_middle'] = self.feature_cache.rolling(df, 'close', 'mean', bb_period)
+        std = self.feature_cache.rolling(df, 'close', 'std', bb_period)
         df['bb_upper'] = df['bb_middle'] + (std * bb_std)
         df['bb_lower'] = df['bb_middle'] - (std * bb_std)
         df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
         df['bb_position'] = (df['close'] - df['bb_lower']) / (df['bb_upper'] - df['bb_lower'])
         
         # ATR (Average True Range)
-        df['tr'] = np.maximum(
-            df['high'] - df['low'],
-            np.maximum(
-                abs(df['high'] - df['close'].shift(1)),
-                abs(df['low'] - df['close'].shift(1))
-            )
-        )
-        df['atr'] = df['tr'].rolling(window=atr_period).mean()
+        df['tr'] = self.feature_cache.feature(df, 'tr', true_range)
+        df['atr'] = self.feature_cache.rolling(df, 'tr', 'mean', atr_period)
         df['atr_percent'] = df['atr'] / df['close']
         
         # Simple Moving Averages
-        df['sma_20'] = df['close'].rolling(window=20).mean()
-        df['sma_50'] = df['close'].rolling(window=50).mean()
+        df['sma_20'] = self.feature_cache.rolling(df, 'close', 'mean', 20)
+        df['sma_50'] = self.feature_cache.rolling(df, 'close', 'mean', 50)
         
         # Price momentum
         df['momentum_1'] = df['close'] / df['close'].shift(1) - 1
         df['momentum_5'] = df['close'] / df['close'].shift(5) - 1
         df['momentum_20'] = df['close'] / df['close'].shift(20) - 1
+    
+    def indicator_lookback(self) -> int:
+        """
+        Bars of history needed for stable last-bar values of the basic indicators
         
-        return df
+        EMAs (MACD) count their convergence horizon, windows their length plus
+        any shift they are compared against.
+        
+        Returns:
+            Number of trailing bars
+        """
+        indicators_config = self.config.get("multi_timeframe", {}).get("indicators", {})
+        macd_slow = indicators_config.get("macd_slow", 26)
+        macd_signal = indicators_config.get("macd_signal", 9)
+        
+        return max(
+            indicators_config.get("rsi_period", 14) + 1,
+            ema_horizon(2.0 / (macd_slow + 1)) + ema_horizon(2.0 / (macd_signal + 1)),
+            indicators_config.get("bb_period", 20),
+            indicators_config.get("atr_period", 14) + 1,
+            50,  # sma_50
+            21   # momentum_20
+        )
+    
+    def indicator_lookahead(self) -> int:
+        """Trailing bars whose indicator values depend on later bars (none for the basic set)"""
+        return 0
+    
+    def indicator_settings(self) -> Dict:
+        """Indicator parameters the calculated frames depend on (cache key)"""
+        return {"basic": self.config.get("multi_timeframe", {}).get("indicators", {})}
+    
+    def _calculate_indicator_frame(self, symbol: str, timeframe: TimeFrame, data: pd.DataFrame,
+                                   calculate, latest_only: bool = False) -> pd.DataFrame:
+        """
+        Indicator frame of one symbol and timeframe, served from the indicator cache
+        
+        Frames are cached per (symbol, timeframe, indicator settings) and only
+        extended by the bars added since they were calculated. In 'tail' mode
+        latest-bar lookups calculate just the trailing indicator_lookback()
+        bars; 'verify' bypasses the cache, calculates tail and full history,
+        records the comparison in tail_checks and returns the full result. A
+        symbol/timeframe whose tail disagrees is added to tail_fallbacks and
+        evaluated over its full history from then on. Path-dependent columns
+        of a tail are continued from the full-history state
+        (_resume_path_columns).
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of data
+            data: OHLCV frame of the symbol and timeframe
+            calculate: Indicator function (calculate_technical_indicators or an override)
+            latest_only: Only the last row will be read
+            
+        Returns:
+            DataFrame with indicators; only its last row is meaningful for
+            latest-only lookups in 'tail' mode
+        """
+        lookback = self.indicator_lookback()
+        tail_only = latest_only and self.evaluation_mode != 'full' and lookback < len(data) \
+            and (symbol, timeframe) not in self.tail_fallbacks
+        
+        resume = partial(self._resume_path_columns, symbol, timeframe, data)
+        
+        if tail_only and self.evaluation_mode == 'verify':
+            df = resume(calculate(data.iloc[-lookback:]), len(data) - lookback)
+            full = calculate(data)
+            check = self._compare_latest(df.iloc[-1], full.iloc[-1], lookback, len(data))
+            if check['mismatched']:
+                self.tail_fallbacks.add((symbol, timeframe))
+            self.tail_checks.append(check)
+            return full
+        
+        if not self.indicator_cache_enabled:
+            return resume(calculate(data.iloc[-lookback:]), len(data) - lookback) if tail_only else calculate(data)
+        
+        config_key = IndicatorFrameCache.config_hash(calculate.__name__, self.indicator_settings())
+        return self.indicator_cache.get(symbol, timeframe, config_key, data, calculate, lookback,
+                                        lookahead=self.indicator_lookahead(), tail_only=tail_only,
+                                        resume=resume)
+    
+    def _resume_path_columns(self, symbol: str, timeframe: TimeFrame, data: pd.DataFrame,
+                             frame: pd.DataFrame, start: int) -> pd.DataFrame:
+        """
+        Continue path-dependent indicator columns of a window from the full history
+        
+        The basic indicators settle within indicator_lookback(), so the frame
+        is returned unchanged.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of data
+            data: Full OHLCV frame of the symbol and timeframe
+            frame: Indicator frame aligned to the end of data
+            start: First row of data whose values came from a truncated window
+            
+        Returns:
+            The frame
+        """
+        return frame
+    
+    def bar_positions(self, symbol: str, timeframe: TimeFrame, times) -> np.ndarray:
+        """
+        Rows of a cached timeframe frame evaluated at historical times
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of the cached frame
+            times: Query time or array of query times
+            
+        Returns:
+            Row positions per time_alignment ('asof': last bar closed at or
+            before the time, -1 where none had closed; 'nearest': nearest open time)
+        """
+        if self.time_alignment == 'asof':
+            return self.point_in_time.positions(symbol, timeframe, times)
+        index = self.data_cache[symbol][timeframe].index
+        return index.get_indexer(pd.DatetimeIndex(np.atleast_1d(times)), method='nearest')
+    
+    def indicator_asof(self, symbol: str, timeframe: TimeFrame, columns: List[str], times) -> pd.DataFrame:
+        """
+        Basic indicator values of the bar each time evaluates to (see bar_positions)
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of the indicators
+            columns: Indicator columns (e.g. ['atr', 'atr_percent'])
+            times: Evaluation times
+            
+        Returns:
+            DataFrame indexed by evaluation time, NaN where no bar had closed
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        
+        data = self.data_cache[symbol][timeframe]
+        df = self._calculate_indicator_frame(symbol, timeframe, data, self.calculate_technical_indicators)
+        positions = self.bar_positions(symbol, timeframe, times)
+        valid = positions >= 0
+        values = {column: np.where(valid, df[column].to_numpy(dtype=float)[np.maximum(positions, 0)], np.nan)
+                  for column in columns}
+        return pd.DataFrame(values, index=pd.DatetimeIndex(np.atleast_1d(times), name='time'))
+    
+    def _bar_at(self, symbol: str, timeframe: TimeFrame, df: pd.DataFrame, current_time) -> Tuple[pd.Series, pd.Timestamp]:
+        """Indicator row and bar time evaluated at current_time (see bar_positions)"""
+        idx = self.bar_positions(symbol, timeframe, current_time)[0]
+        if idx < 0:
+            raise ValueError(f"No closed {timeframe.name} bar at or before {current_time}")
+        return df.iloc[idx], df.index[idx]
+    
+    @staticmethod
+    def _compare_latest(tail_row: pd.Series, full_row: pd.Series, tail: int, bars: int) -> Dict:
+        """Compare tail and full-history values of the last bar"""
+        columns = [c for c in full_row.index if c not in CUMULATIVE_COLUMNS
+                   and pd.api.types.is_number(full_row[c]) and c in tail_row.index]
+        tail_values = tail_row[columns].to_numpy(dtype=float)
+        full_values = full_row[columns].to_numpy(dtype=float)
+        matches = np.isclose(tail_values, full_values, rtol=TAIL_RTOL, atol=TAIL_ATOL, equal_nan=True)
+        mismatched = [c for c, ok in zip(columns, matches) if not ok]
+        
+        if mismatched:
+            print(f"⚠️  Tail of {tail} bars differs from full history ({bars} bars): {mismatched}")
+        
+        with np.errstate(invalid='ignore'):
+            max_diff = np.nanmax(np.abs(tail_values - full_values), initial=0.0)
+        return {
+            'time': full_row.name,
+            'tail_bars': tail,
+            'full_bars': bars,
+            'columns': len(columns),
+            'mismatched': mismatched,
+            'max_abs_diff': float(max_diff)
+        }
     
     def generate_timeframe_signal(self, symbol: str, timeframe: TimeFrame, 
                                  current_time: datetime = None) -> TimeframeSignal:
@@ -274,19 +655,42 @@ class MultiTimeframeStrategy:
         # Get data for this timeframe
         data = self.data_cache[symbol][timeframe]
         
-        # Calculate indicators
-        df = self.calculate_technical_indicators(data)
+        # Calculate indicators (cached; latest bar only needs the warm-up tail)
+        df = self._calculate_indicator_frame(symbol, timeframe, data, self.calculate_technical_indicators,
+                                             latest_only=current_time is None)
         
         # Get latest values (or at specific time if provided)
         if current_time:
-            # Find closest time
-            idx = df.index.get_indexer([current_time], method='nearest')[0]
-            latest = df.iloc[idx]
-            signal_time = df.index[idx]
+            latest, signal_time = self._bar_at(symbol, timeframe, df, current_time)
         else:
             latest = df.iloc[-1]
             signal_time = df.index[-1]
         
+        return self._timeframe_signal_from_row(timeframe, latest, signal_time)
+    
+    def generate_timeframe_signals_batch(self, symbols: List[str], 
+                                         timeframe: TimeFrame) -> Dict[str, TimeframeSignal]:
+        """
+        Generate latest-bar signals for many symbols in one batched indicator pass
+        
+        Args:
+            symbols: Symbols with data in the cache
+            timeframe: Timeframe to evaluate
+            
+        Returns:
+            Symbol -> TimeframeSignal (symbols without data for the timeframe are omitted)
+        """
+        frames = {symbol: self.data_cache[symbol][timeframe] for symbol in symbols
+                  if timeframe in self.data_cache.get(symbol, {})}
+        max_bars = self.indicator_lookback() if self.evaluation_mode == 'tail' else None
+        panel = SymbolPanel.from_frames(frames, max_bars=max_bars)
+        summaries = self.batch_engine.analyze_panel(panel, include_advanced=False)
+        
+        return {symbol: self._timeframe_signal_from_row(timeframe, summary, summary['time'])
+                for symbol, summary in summaries.items()}
+    
+    def _timeframe_signal_from_row(self, timeframe: TimeFrame, latest, signal_time) -> TimeframeSignal:
+        """Build a timeframe signal from one bar of indicator values (row or summary dict)"""
         # Signal generation logic
         signals = []
         indicators = {}
@@ -408,6 +812,10 @@ class MultiTimeframeStrategy:
                 except Exception as e:
                     print(f"⚠️  Error generating signal for {tf.name}: {e}")
         
+        return self._confluence_from_signals(symbol, timeframe_signals)
+    
+    def _confluence_from_signals(self, symbol: str, timeframe_signals: List[TimeframeSignal]) -> ConfluentSignal:
+        """Aggregate timeframe signals into a confluent signal"""
         if not timeframe_signals:
             raise ValueError(f"No valid signals generated for {symbol}")
         
@@ -483,6 +891,188 @@ class MultiTimeframeStrategy:
             timestamp=latest_timestamp
         )
     
+    def generate_timeframe_signal_series(self, symbol: str, timeframe: TimeFrame) -> pd.DataFrame:
+        """
+        Timeframe signal of every bar, vectorized
+        
+        Row i holds what generate_timeframe_signal(symbol, timeframe, t)
+        returns for the bar at t = index[i].
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe to evaluate
+            
+        Returns:
+            DataFrame indexed by bar time with the indicator votes, signal_sum,
+            signal_count, direction (MarketDirection value), strength
+            (SignalStrength value), confidence and price
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        
+        if timeframe not in self.data_cache[symbol]:
+            raise ValueError(f"Timeframe {timeframe.name} not available for {symbol}")
+        
+        data = self.data_cache[symbol][timeframe]
+        df = self._calculate_indicator_frame(symbol, timeframe, data, self.calculate_technical_indicators)
+        return self._signal_series_from_frame(df)
+    
+    @staticmethod
+    def _signal_series_from_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized _timeframe_signal_from_row over every row of an indicator frame"""
+        def vote(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+            # NaN comparisons are False, so warm-up bars cast no vote (as in the scalar path)
+            return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
+        
+        column = lambda name: df[name].to_numpy(dtype=float)
+        close, rsi, bb_position, momentum = column('close'), column('rsi'), column('bb_position'), column('momentum_20')
+        macd, macd_signal, macd_histogram = column('macd'), column('macd_signal'), column('macd_histogram')
+        sma_20, sma_50 = column('sma_20'), column('sma_50')
+        
+        with np.errstate(invalid='ignore'):
+            votes = {
+                'rsi_signal': vote(rsi < 30, rsi > 70),
+                'macd_signal': vote((macd > macd_signal) & (macd_histogram > 0),
+                                    (macd < macd_signal) & (macd_histogram < 0)),
+                'bb_signal': vote(bb_position < 0.2, bb_position > 0.8),
+                'ma_signal': vote((close > sma_20) & (sma_20 > sma_50), (close < sma_20) & (sma_20 < sma_50)),
+                'momentum_signal': vote(momentum > 0.02, momentum < -0.02)
+            }
+        
+        stacked = np.vstack([votes[name] for name in SIGNAL_VOTE_COLUMNS]).astype(np.int64)
+        signal_sum = stacked.sum(axis=0)
+        signal_count = np.count_nonzero(stacked, axis=0)
+        
+        levels = [signal_sum >= 3, signal_sum >= 2, signal_sum >= 1,
+                  signal_sum <= -3, signal_sum <= -2, signal_sum <= -1]
+        direction = np.select(levels, [MarketDirection.STRONG_BUY.value, MarketDirection.BUY.value,
+                                       MarketDirection.BUY.value, MarketDirection.STRONG_SELL.value,
+                                       MarketDirection.SELL.value, MarketDirection.SELL.value],
+                              default=MarketDirection.NEUTRAL.value)
+        strength = np.select(levels, [SignalStrength.VERY_STRONG.value, SignalStrength.STRONG.value,
+                                      SignalStrength.WEAK.value, SignalStrength.VERY_STRONG.value,
+                                      SignalStrength.STRONG.value, SignalStrength.WEAK.value],
+                             default=SignalStrength.NEUTRAL.value)
+        
+        series = pd.DataFrame(votes, index=df.index)
+        series['signal_sum'] = signal_sum
+        series['signal_count'] = signal_count
+        series['direction'] = direction
+        series['strength'] = strength
+        series['confidence'] = np.abs(signal_sum) / np.maximum(signal_count, 1)
+        series['price'] = df['close']
+        return series
+    
+    def calculate_confluence_series(self, symbol: str, times=None,
+                                    base_timeframe: TimeFrame = TimeFrame.M1) -> pd.DataFrame:
+        """
+        Confluent signal at many times, vectorized
+        
+        Row i holds what calculate_confluence_signal(symbol, times[i])
+        returns: each timeframe contributes its bar at the time (see
+        bar_positions). Timeframes without a closed bar are left out, as the
+        scalar path skips them; times with no closed bar at all are HOLD
+        with no timestamp and timeframes = 0.
+        
+        Args:
+            symbol: Trading symbol
+            times: Evaluation times (defaults to every bar of base_timeframe)
+            base_timeframe: Timeframe whose bars are evaluated when times is None
+            
+        Returns:
+            DataFrame indexed by evaluation time with overall_direction
+            (MarketDirection value), normalized_direction, overall_strength,
+            confluence_score, recommended_action, risk_level,
+            position_size_multiplier, timestamp, timeframes (number of
+            timeframes with a bar) and the direction of each timeframe
+            ('<name>_direction', 0 where it has no bar)
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        
+        if times is None:
+            times = self.data_cache[symbol][base_timeframe].index
+        times = pd.DatetimeIndex(times)
+        
+        timeframes = [tf for tf in self.timeframes if tf in self.data_cache[symbol]]
+        if not timeframes:
+            raise ValueError(f"No valid signals generated for {symbol}")
+        
+        # Accumulate in timeframe order, as the scalar path does, for identical sums
+        weighted_direction = np.zeros(len(times))
+        total_weight = np.zeros(len(times))
+        agreeing_timeframes = np.zeros(len(times), dtype=np.int64)
+        available_timeframes = np.zeros(len(times), dtype=np.int64)
+        timestamp = np.full(len(times), np.iinfo(np.int64).min)
+        columns = {}
+        
+        for tf in timeframes:
+            series = self.generate_timeframe_signal_series(symbol, tf)
+            positions = self.bar_positions(symbol, tf, times)
+            valid = positions >= 0
+            positions = np.maximum(positions, 0)
+            direction = np.where(valid, series['direction'].to_numpy()[positions], 0)
+            confidence = np.where(valid, series['confidence'].to_numpy()[positions], 0.0)
+            
+            adjusted_weight = self.timeframe_weights.get(tf, 0.1) * confidence
+            weighted_direction += direction * adjusted_weight
+            total_weight += adjusted_weight
+            agreeing_timeframes += direction != 0
+            available_timeframes += valid
+            
+            signal_time = np.where(valid, series.index.asi8[positions], np.iinfo(np.int64).min)
+            timestamp = np.maximum(timestamp, signal_time)
+            columns[f"{tf.name.lower()}_direction"] = direction
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            normalized_direction = np.where(total_weight > 0, weighted_direction / total_weight, 0.0)
+        
+        overall_direction = np.select(
+            [normalized_direction >= 1.5, normalized_direction >= 0.5,
+             normalized_direction <= -1.5, normalized_direction <= -0.5],
+            [MarketDirection.STRONG_BUY.value, MarketDirection.BUY.value,
+             MarketDirection.STRONG_SELL.value, MarketDirection.SELL.value],
+            default=MarketDirection.NEUTRAL.value)
+        confluence_score = agreeing_timeframes / np.maximum(available_timeframes, 1)
+        overall_strength = np.minimum(np.abs(normalized_direction), 1.0)
+        
+        actionable = (confluence_score >= self.confluence_threshold) & (overall_strength >= 0.6)
+        strong = overall_strength >= 0.8
+        buy = overall_direction > 0
+        recommended_action = np.select(
+            [~actionable, buy & strong, buy, strong],
+            ["HOLD", "STRONG_BUY", "BUY", "STRONG_SELL"], default="SELL")
+        risk_level = np.select([~actionable, confluence_score >= 0.8], ["HIGH", "LOW"], default="MEDIUM")
+        position_size_multiplier = np.where(actionable, confluence_score * overall_strength, 0.5)
+        
+        result = pd.DataFrame({
+            'overall_direction': overall_direction,
+            'normalized_direction': normalized_direction,
+            'overall_strength': overall_strength,
+            'confluence_score': confluence_score,
+            'recommended_action': recommended_action,
+            'risk_level': risk_level,
+            'position_size_multiplier': position_size_multiplier,
+            'timestamp': pd.DatetimeIndex(timestamp.view('datetime64[ns]')),
+            'timeframes': available_timeframes,
+            **columns
+        }, index=times)
+        result.index.name = 'time'
+        return result
+    
+    def record_signal(self, signal: ConfluentSignal):
+        """Add a confluent signal to the bounded signal history"""
+        self.signal_history.append(
+            signal.symbol, signal.timestamp,
+            overall_direction=signal.overall_direction.value,
+            overall_strength=signal.overall_strength,
+            confluence_score=signal.confluence_score,
+            position_size_multiplier=signal.position_size_multiplier,
+            timeframes=len(signal.timeframe_signals),
+            recommended_action=signal.recommended_action,
+            risk_level=signal.risk_level
+        )
+    
     def analyze_symbol(self, symbol: str, current_time: datetime = None) -> ConfluentSignal:
         """Complete analysis for a symbol"""
         try:
@@ -495,10 +1085,7 @@ class MultiTimeframeStrategy:
             confluence_signal = self.calculate_confluence_signal(symbol, current_time)
             
             # Store in history
-            if symbol not in self.signal_history:
-                self.signal_history[symbol] = []
-            
-            self.signal_history[symbol].append(confluence_signal)
+            self.record_signal(confluence_signal)
             
             return confluence_signal
             
@@ -507,19 +1094,51 @@ class MultiTimeframeStrategy:
             raise
     
     def analyze_multiple_symbols(self, symbols: List[str], 
-                                current_time: datetime = None) -> Dict[str, ConfluentSignal]:
-        """Analyze multiple symbols simultaneously"""
+                                current_time: datetime = None,
+                                batched: bool = False,
+                                parallel: bool = False) -> Dict[str, ConfluentSignal]:
+        """
+        Analyze multiple symbols simultaneously
+        
+        Args:
+            symbols: Symbols to analyze
+            current_time: Evaluate at this time (see bar_positions) instead of the latest bar
+            batched: Compute the latest-bar indicators of all symbols in one batched
+                     pass per timeframe (latest-bar analysis only)
+            parallel: Analyze the symbols in persistent worker processes
+                      (see analyze_symbols_parallel); takes precedence over batched
+            
+        Returns:
+            Symbol -> ConfluentSignal (None when the analysis failed)
+        """
         results = {}
         
         print(f"🔍 MULTI-TIMEFRAME ANALYSIS")
         print(f"=" * 60)
         print(f"Analyzing {len(symbols)} symbols across {len(self.timeframes)} timeframes")
         
+        batched = batched and current_time is None and not parallel
+        if batched:
+            batch_signals = self._generate_batch_timeframe_signals(symbols)
+        if parallel:
+            parallel_signals = self.analyze_symbols_parallel(symbols, current_time)
+        
         for i, symbol in enumerate(symbols, 1):
             print(f"\n📊 Analyzing {symbol} ({i}/{len(symbols)})...")
             
             try:
-                signal = self.analyze_symbol(symbol, current_time)
+                if parallel:
+                    signal = parallel_signals[symbol]
+                    if isinstance(signal, Exception):
+                        raise signal
+                    self.record_signal(signal)
+                elif batched:
+                    if symbol not in batch_signals:
+                        raise ValueError(f"Failed to load data for {symbol}")
+                    signal = self._confluence_from_signals(symbol, batch_signals[symbol])
+                    self.record_signal(signal)
+                else:
+                    signal = self.analyze_symbol(symbol, current_time)
                 results[symbol] = signal
                 
                 # Display results
@@ -539,6 +1158,55 @@ class MultiTimeframeStrategy:
         
         return results
     
+    def analyze_symbols_parallel(self, symbols: List[str], current_time: datetime = None,
+                                 method: str = "analyze_symbol") -> Dict:
+        """
+        Analyze symbols in persistent worker processes
+        
+        Workers are started on first use with this strategy's class and
+        config file (multi_timeframe.parallel_workers / parallel_chunksize)
+        and keep their caches between calls; each symbol is always analyzed
+        by the same worker. Workers attach to this strategy's shared data
+        (publish_shared_data / attach_shared_data) instead of loading files,
+        and see newly published bars on every call.
+        
+        Args:
+            symbols: Symbols to analyze
+            current_time: Evaluation time (None for the latest bar)
+            method: Per-symbol analysis method run in the workers
+            
+        Returns:
+            Symbol -> ConfluentSignal, or the Exception raised for it
+        """
+        if self.parallel_analyzer is None:
+            shared = self.shared_writer or self.shared_reader
+            self.parallel_analyzer = ParallelSymbolAnalyzer(type(self), self.config_path,
+                                                            workers=self.parallel_workers,
+                                                            chunksize=self.parallel_chunksize,
+                                                            shared_prefix=shared.prefix if shared else None)
+        
+        return self.parallel_analyzer.analyze(symbols, method, current_time)
+    
+    def close_workers(self):
+        """Shut down the worker processes of analyze_symbols_parallel"""
+        if self.parallel_analyzer is not None:
+            self.parallel_analyzer.close()
+            self.parallel_analyzer = None
+    
+    def _generate_batch_timeframe_signals(self, symbols: List[str]) -> Dict[str, List[TimeframeSignal]]:
+        """Latest-bar signals on every timeframe for all loadable symbols, batched per timeframe"""
+        loaded = [symbol for symbol in symbols if symbol in self.data_cache or self.load_data(symbol)]
+        signals = {symbol: [] for symbol in loaded}
+        
+        for tf in self.timeframes:
+            try:
+                for symbol, signal in self.generate_timeframe_signals_batch(loaded, tf).items():
+                    signals[symbol].append(signal)
+            except Exception as e:
+                print(f"⚠️  Error generating batched signals for {tf.name}: {e}")
+        
+        return signals
+    
     def _get_direction_icon(self, direction: MarketDirection) -> str:
         """Get icon for market direction"""
         icons = {
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Parallel Symbol Analysis
+========================
+
+Process-pool execution of per-symbol strategy analysis.
+
+Indicator work is pandas/NumPy heavy and largely GIL-bound, so symbols are
+analyzed in separate processes. Each worker is a persistent process holding
+its own strategy instance, and every symbol is pinned to one worker, so a
+worker's data cache and indicator caches stay warm across calls. Only the
+compact ConfluentSignal results travel back to the caller.
+
+Workers load symbol data from the default data files (load_data), or
+attach to data published in shared memory (GEN_shared_market_data) when a
+shared prefix is given; shared bars published later are picked up on the
+next call.
+
+Usage:
+    with ParallelSymbolAnalyzer(MultiTimeframeStrategy, workers=4) as analyzer:
+        results = analyzer.analyze(symbols)          # {symbol: ConfluentSignal or Exception}
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+# Strategy instance of the current worker process
+_worker_strategy = None
+
+
+def _initialize_worker(strategy_class, config_path: str, shared_prefix: str = None):
+    """Create the worker's strategy instance (runs once per worker process)"""
+    global _worker_strategy
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_strategy = strategy_class(config_path)
+        if shared_prefix:
+            _worker_strategy.attach_shared_data(shared_prefix)
+
+
+def _analyze_chunk(method: str, symbols: List[str], current_time: datetime = None) -> List[Tuple]:
+    """Analyze symbols with the worker's strategy; errors are returned, not raised"""
+    _worker_strategy.refresh_shared_data(symbols)
+    results = []
+    for symbol in symbols:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                signal = getattr(_worker_strategy, method)(symbol, current_time)
+            results.append((symbol, signal))
+        except Exception as e:
+            results.append((symbol, RuntimeError(f"{type(e).__name__}: {e}")))
+    return results
+
+
+def _worker_stats() -> Dict:
+    """Cache statistics of the worker's strategy"""
+    return {
+        'pid': os.getpid(),
+        'symbols': sorted(_worker_strategy.data_cache),
+        'shared_symbols': sorted(symbol for symbol in _worker_strategy.data_cache
+                                 if symbol not in _worker_strategy.resamplers),
+        'indicator_cache': _worker_strategy.indicator_cache.get_stats()
+    }
+
+
+class ParallelSymbolAnalyzer:
+    """
+    Persistent worker processes analyzing symbols in parallel
+
+    Symbols are assigned to workers on first use (least loaded worker) and
+    stay there; each call sends every worker its symbols in chunks.
+    """
+
+    def __init__(self, strategy_class, config_path: str = "GEN_unified_config.json",
+                 workers: int = None, chunksize: int = None, shared_prefix: str = None):
+        """
+        Initialize parallel analyzer
+
+        Args:
+            strategy_class: Strategy class instantiated in every worker
+                            (MultiTimeframeStrategy or a subclass)
+            config_path: Configuration file passed to the strategy
+            workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Symbols per task sent to a worker (defaults to all of
+                       the worker's symbols in one task)
+            shared_prefix: Attach workers to market data published under this
+                           shared-memory prefix
+        """
+        self.strategy_class = strategy_class
+        self.config_path = config_path
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunksize = chunksize
+        self.shared_prefix = shared_prefix
+        self.assignment: Dict[str, int] = {}
+        self._executors: List[ProcessPoolExecutor] = []
+
+    def _start(self):
+        if not self._executors:
+            self._executors = [
+                ProcessPoolExecutor(max_workers=1, initializer=_initialize_worker,
+                                    initargs=(self.strategy_class, self.config_path, self.shared_prefix))
+                for _ in range(self.workers)
+            ]
+
+    def _assign(self, symbols: List[str]) -> Dict[int, List[str]]:
+        """Worker -> symbols, pinning symbols not seen before to the least loaded worker"""
+        loads = [0] * self.workers
+        for worker in self.assignment.values():
+            loads[worker] += 1
+        for symbol in symbols:
+            if symbol not in self.assignment:
+                worker = loads.index(min(loads))
+                self.assignment[symbol] = worker
+                loads[worker] += 1
+
+        tasks = {}
+        for symbol in symbols:
+            tasks.setdefault(self.assignment[symbol], []).append(symbol)
+        return tasks
+
+    def analyze(self, symbols: List[str], method: str = "analyze_symbol",
+                current_time: datetime = None) -> Dict:
+        """
+        Analyze symbols across the worker processes
+
+        Args:
+            symbols: Symbols to analyze
+            method: Strategy method called per symbol as method(symbol, current_time)
+                    (e.g. analyze_symbol, analyze_symbol_enhanced)
+            current_time: Evaluation time passed to the method
+
+        Returns:
+            Symbol -> ConfluentSignal, or the Exception raised for it
+        """
+        self._start()
+        futures = []
+        for worker, worker_symbols in self._assign(list(dict.fromkeys(symbols))).items():
+            chunksize = self.chunksize or len(worker_symbols)
+            for start in range(0, len(worker_symbols), chunksize):
+                chunk = worker_symbols[start:start + chunksize]
+                futures.append(self._executors[worker].submit(_analyze_chunk, method, chunk, current_time))
+
+        results = {}
+        for future in futures:
+            results.update(future.result())
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def worker_stats(self) -> List[Dict]:
+        """Cache statistics of every worker (starts the workers if needed)"""
+        self._start()
+        return [executor.submit(_worker_stats).result() for executor in self._executors]
+
+    def close(self):
+        """Shut the worker processes down; the next call starts fresh workers"""
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        self._executors = []
+        self.assignment = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
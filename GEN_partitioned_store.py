@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Partitioned Market Data Store
+=============================
+
+Long histories (multi-year M1 bars or ticks) stored as one CSV per month:
+
+    CSVdata/lake/BTCUSD/M1/2024/03.csv
+    CSVdata/lake/BTCUSD/M1/_manifest.json
+
+History is extracted in fixed windows (chunks) and every chunk is appended
+straight to the month partitions it covers, so memory stays bounded by one
+chunk however long the history is. After each chunk the writer updates the
+manifest next to the partitions: how far the extraction got and, per
+partition, its row count, first/last timestamp, byte size, SHA-256 checksum
+and schema version. A run that fails part-way resumes from the last
+completed chunk: partition files are first truncated back to their recorded
+sizes, dropping rows of a chunk that was only partly written.
+
+The manifest is the index of the store:
+- read_range() loads only the partitions whose time span overlaps the
+  requested range (through their column stores, see GEN_columnar_store)
+- changed_partitions() compares checksums against the ones a tool recorded
+  on its last pass, so quality checks and gap filling skip closed months
+- import_csv() appends the new rows of a flat 1-month CSV, so repeated
+  monthly extractions accumulate into a multi-year history
+
+Chunk windows are half-open ([start, end)): the fetch for a window asks for
+everything up to just before its end, so a bar or tick on the boundary is
+written by exactly one chunk.
+
+Usage:
+    writer = PartitionedBarWriter("CSVdata/lake", "BTCUSD", "M1")
+    ok = extract_history(writer, fetch, start, end, timedelta(days=7))
+    bars = read_range("CSVdata/lake", "BTCUSD", "M1", "2024-03-10", "2024-05-01")
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from GEN_columnar_store import load_bars
+
+LAKE_DIR = os.path.join("CSVdata", "lake")
+MANIFEST_FILE = "_manifest.json"
+
+# Version of the partition layout and columns; bump when either changes so
+# readers and tools can tell old partitions apart
+SCHEMA_VERSION = 1
+
+# Smallest time step of a timeframe: a window [start, end) is fetched as
+# [start, end - step] because the MT5 range requests include both ends
+FETCH_RESOLUTION = {'TICK': timedelta(milliseconds=1)}
+DEFAULT_RESOLUTION = timedelta(seconds=1)
+
+
+def partition_path(root: str, symbol: str, timeframe: str, year: int, month: int) -> str:
+    """Partition file of a month"""
+    return os.path.join(root, symbol, timeframe, f"{year:04d}", f"{month:02d}.csv")
+
+
+def manifest_path(root: str, symbol: str, timeframe: str) -> str:
+    """Manifest file of a symbol/timeframe"""
+    return os.path.join(root, symbol, timeframe, MANIFEST_FILE)
+
+
+def load_manifest(root: str, symbol: str, timeframe: str = "M1") -> Optional[Dict]:
+    """Manifest of a symbol/timeframe (None when nothing was stored yet)"""
+    try:
+        with open(manifest_path(root, symbol, timeframe), 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_windows(start: datetime, end: datetime, chunk: timedelta) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    Split [start, end) into consecutive windows of at most `chunk`
+
+    Args:
+        start: First instant
+        end: End (exclusive)
+        chunk: Window length
+
+    Yields:
+        (window start, window end) pairs
+    """
+    while start < end:
+        window_end = min(start + chunk, end)
+        yield start, window_end
+        start = window_end
+
+
+def _to_frame(data) -> pd.DataFrame:
+    """DataFrame with a parsed time column from MT5 rates/ticks (epoch seconds) or a frame"""
+    df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    if len(df) and not pd.api.types.is_datetime64_any_dtype(df['time']):
+        df['time'] = pd.to_datetime(df['time'], unit='s')
+    return df
+
+
+class PartitionedBarWriter:
+    """
+    Appends chunks of bars (or ticks) of one symbol/timeframe to month partitions
+
+    Chunks must arrive in time order; the manifest is updated after every chunk.
+    """
+
+    def __init__(self, root: str, symbol: str, timeframe: str = "M1"):
+        """
+        Initialize the writer
+
+        Args:
+            root: Store root directory
+            symbol: Trading symbol
+            timeframe: Timeframe name ("M1", "H1", ... or "TICK")
+        """
+        self.root = root
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.directory = os.path.join(root, symbol, timeframe)
+        self.manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest = load_manifest(root, symbol, timeframe) or {
+            'symbol': symbol, 'timeframe': timeframe, 'schema_version': SCHEMA_VERSION,
+            'columns': None, 'completed_until': None, 'chunks': 0, 'rows': 0, 'partitions': {}}
+
+    def _save_manifest(self):
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    def _partition_file(self, key: str) -> str:
+        year, month = key.split('/')
+        return partition_path(self.root, self.symbol, self.timeframe, int(year), int(month))
+
+    def resume_point(self) -> Optional[pd.Timestamp]:
+        """
+        End of the last completed chunk, after rolling back partly written chunks
+
+        Partition files longer than their recorded size are truncated and
+        partition files the manifest does not know are removed.
+
+        Returns:
+            Timestamp to resume from, or None if nothing was completed
+        """
+        recorded = self.manifest['partitions']
+        for key, entry in recorded.items():
+            path = self._partition_file(key)
+            if os.path.getsize(path) > entry['bytes']:
+                with open(path, 'r+b') as f:
+                    f.truncate(entry['bytes'])
+        for path in self.partition_files():
+            key = os.path.relpath(path, self.directory)[:-len('.csv')].replace(os.sep, '/')
+            if key not in recorded:
+                os.remove(path)
+
+        completed = self.manifest['completed_until']
+        return pd.Timestamp(completed) if completed else None
+
+    def write_chunk(self, data, chunk_end: datetime) -> int:
+        """
+        Append a chunk to its month partitions and update the manifest
+
+        Args:
+            data: Rows of the chunk (MT5 structured array or DataFrame with a time column),
+                  in time order; may be empty
+            chunk_end: End of the chunk window (the resume point once written)
+
+        Returns:
+            Rows written
+        """
+        df = _to_frame(data)
+        if len(df):
+            columns = [str(name) for name in df.columns]
+            if self.manifest['columns'] is None:
+                self.manifest['columns'] = columns
+            elif columns != self.manifest['columns']:
+                raise ValueError(f"Columns {columns} do not match the store's {self.manifest['columns']}")
+
+            months = df['time'].dt.year.to_numpy() * 100 + df['time'].dt.month.to_numpy()
+            bounds = np.flatnonzero(np.diff(months)) + 1
+            for rows in np.split(np.arange(len(df)), bounds):
+                self._append(df.iloc[rows[0]:rows[-1] + 1])
+
+        self.manifest['completed_until'] = str(pd.Timestamp(chunk_end))
+        self.manifest['chunks'] += 1
+        self.manifest['rows'] += len(df)
+        self._save_manifest()
+        return len(df)
+
+    def _append(self, rows: pd.DataFrame):
+        first = rows['time'].iloc[0]
+        key = f"{first.year:04d}/{first.month:02d}"
+        path = self._partition_file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        new_file = key not in self.manifest['partitions']
+        with open(path, 'w' if new_file else 'a', newline='') as f:
+            rows.to_csv(f, index=False, header=new_file)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+
+        entry = self.manifest['partitions'].setdefault(
+            key, {'rows': 0, 'bytes': 0, 'min_time': str(first), 'max_time': None,
+                  'checksum': None, 'schema_version': SCHEMA_VERSION})
+        entry['rows'] += len(rows)
+        entry['bytes'] = size
+        entry['max_time'] = str(rows['time'].iloc[-1])
+        # Rehashing the whole month costs one sequential read per chunk; the
+        # partition being appended to is the only one whose checksum changes
+        entry['checksum'] = file_checksum(path)
+
+    def partition_files(self) -> List[str]:
+        """Partition files in time order"""
+        files = []
+        for year in sorted(os.listdir(self.directory)):
+            year_dir = os.path.join(self.directory, year)
+            if os.path.isdir(year_dir) and year.isdigit():
+                files.extend(os.path.join(year_dir, name) for name in sorted(os.listdir(year_dir))
+                             if name.endswith('.csv'))
+        return files
+
+
+def extract_history(writer: PartitionedBarWriter, fetch: Callable[[datetime, datetime], object],
+                    start: datetime, end: datetime, chunk: timedelta,
+                    on_chunk: Callable[[datetime, datetime, int], None] = None) -> bool:
+    """
+    Extract [start, end) chunk by chunk into a partitioned store, resuming
+    after the last completed chunk of an earlier run
+
+    Args:
+        writer: Partition writer of the symbol/timeframe
+        fetch: fetch(date_from, date_to) with both ends inclusive, returning rows
+               (MT5 structured array or DataFrame) or None on failure
+        start: First instant of the history
+        end: End of the history (exclusive)
+        chunk: Window length per request
+        on_chunk: Called with (window start, window end, rows) after each chunk
+
+    Returns:
+        True when the range is complete, False if a fetch failed (rerun to resume)
+    """
+    resume = writer.resume_point()
+    if resume is not None and resume > pd.Timestamp(start):
+        start = resume.to_pydatetime()
+    resolution = FETCH_RESOLUTION.get(writer.timeframe, DEFAULT_RESOLUTION)
+
+    for window_start, window_end in chunk_windows(start, end, chunk):
+        data = fetch(window_start, window_end - resolution)
+        if data is None:
+            return False
+        rows = writer.write_chunk(data, window_end)
+        if on_chunk:
+            on_chunk(window_start, window_end, rows)
+    return True
+
+
+def datasets(root: str = LAKE_DIR) -> List[Tuple[str, str]]:
+    """(symbol, timeframe) pairs with a manifest in the store"""
+    found = []
+    if os.path.isdir(root):
+        for symbol in sorted(os.listdir(root)):
+            symbol_dir = os.path.join(root, symbol)
+            if os.path.isdir(symbol_dir):
+                found.extend((symbol, timeframe) for timeframe in sorted(os.listdir(symbol_dir))
+                             if os.path.exists(manifest_path(root, symbol, timeframe)))
+    return found
+
+
+def select_partitions(manifest: Dict, start=None, end=None) -> List[str]:
+    """
+    Partitions whose time span overlaps [start, end)
+
+    Args:
+        manifest: Manifest of a symbol/timeframe
+        start: First instant (None for the beginning of the history)
+        end: End, exclusive (None for the end of the history)
+
+    Returns:
+        Partition keys ("YYYY/MM") in time order
+    """
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    return [key for key, entry in sorted(manifest['partitions'].items())
+            if entry['rows']
+            and (start is None or pd.Timestamp(entry['max_time']) >= start)
+            and (end is None or pd.Timestamp(entry['min_time']) < end)]
+
+
+def read_range(root: str, symbol: str, timeframe: str = "M1", start=None, end=None,
+               columns: List[str] = None, index: bool = True) -> pd.DataFrame:
+    """
+    Load the rows of [start, end), reading only the partitions that overlap it
+
+    Args:
+        root: Store root directory
+        symbol: Trading symbol
+        timeframe: Timeframe name
+        start: First instant (None for the beginning of the history)
+        end: End, exclusive (None for the end of the history)
+        columns: Columns to load besides time (None for all)
+        index: Index the frame by time; otherwise keep it as a column
+
+    Returns:
+        DataFrame with parsed timestamps (empty if nothing is stored in the range)
+    """
+    manifest = load_manifest(root, symbol, timeframe)
+    if manifest is None:
+        raise FileNotFoundError(f"No partitioned data for {symbol} {timeframe} in {root}")
+
+    frames = []
+    for key in select_partitions(manifest, start, end):
+        entry = manifest['partitions'][key]
+        if entry['schema_version'] > SCHEMA_VERSION:
+            raise ValueError(f"Partition {symbol} {timeframe} {key} has schema version "
+                             f"{entry['schema_version']}, this reader supports {SCHEMA_VERSION}")
+        year, month = key.split('/')
+        frames.append(load_bars(partition_path(root, symbol, timeframe, int(year), int(month)), columns))
+
+    if not frames:
+        names = [name for name in manifest['columns'] or ['time']
+                 if name == 'time' or columns is None or name in columns]
+        df = pd.DataFrame({name: pd.Series(dtype='datetime64[ns]' if name == 'time' else float)
+                           for name in names})
+        return df.set_index('time') if index else df
+
+    df = pd.concat(frames) if len(frames) > 1 else frames[0]
+    # Partition boundaries are months, so only the first and last can hold rows outside the range
+    if start is not None:
+        df = df[df.index >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df.index < pd.Timestamp(end)]
+    return df if index else df.reset_index()
+
+
+def verify_partitions(root: str, symbol: str, timeframe: str = "M1") -> List[str]:
+    """
+    Partitions whose file is missing or no longer matches its manifest checksum
+
+    Returns:
+        Partition keys in time order
+    """
+    manifest = load_manifest(root, symbol, timeframe) or {'partitions': {}}
+    damaged = []
+    for key, entry in sorted(manifest['partitions'].items()):
+        year, month = key.split('/')
+        path = partition_path(root, symbol, timeframe, int(year), int(month))
+        if not os.path.exists(path) or file_checksum(path) != entry['checksum']:
+            damaged.append(key)
+    return damaged
+
+
+def changed_partitions(manifest: Dict, processed: Dict[str, str]) -> List[str]:
+    """
+    Partitions that changed since a tool last processed them
+
+    Args:
+        manifest: Manifest of a symbol/timeframe
+        processed: Partition key -> checksum the tool recorded when it processed it
+
+    Returns:
+        Partition keys (new or with a different checksum) in time order
+    """
+    return [key for key, entry in sorted(manifest['partitions'].items())
+            if processed.get(key) != entry['checksum']]
+
+
+def import_csv(root: str, symbol: str, csv_path: str, timeframe: str = "M1") -> int:
+    """
+    Append the rows of a flat bar CSV that are newer than the stored history
+
+    Rows before the manifest's completed_until are skipped, so overlapping
+    monthly extracts can be imported one after another.
+
+    Args:
+        root: Store root directory
+        symbol: Trading symbol
+        csv_path: Bar CSV file (time column plus OHLCV columns)
+        timeframe: Timeframe of the bars
+
+    Returns:
+        Rows added
+    """
+    writer = PartitionedBarWriter(root, symbol, timeframe)
+    resume = writer.resume_point()
+    df = load_bars(csv_path, index=False)
+    if resume is not None:
+        df = df[df['time'] >= resume]
+    if df.empty:
+        return 0
+    resolution = FETCH_RESOLUTION.get(timeframe, DEFAULT_RESOLUTION)
+    return writer.write_chunk(df.reset_index(drop=True), df['time'].iloc[-1] + resolution)
+
+
+def main():
+    """Import flat bar CSVs into the partitioned store and summarize its manifests"""
+    parser = argparse.ArgumentParser(description="Partitioned market data store")
+    parser.add_argument("--root", default=LAKE_DIR, help="Store root directory")
+    parser.add_argument("--import-dir", metavar="DIR",
+                        help="Import the GEN_{symbol}_M1_1month.csv files of a directory")
+    parser.add_argument("--verify", action="store_true", help="Check partition checksums")
+    args = parser.parse_args()
+
+    print("🗄️  PARTITIONED MARKET DATA STORE")
+    print("=" * 60)
+    if args.import_dir:
+        start = time.perf_counter()
+        suffix = "_M1_1month.csv"
+        for name in sorted(os.listdir(args.import_dir)):
+            if name.startswith("GEN_") and name.endswith(suffix):
+                symbol = name[len("GEN_"):-len(suffix)]
+                added = import_csv(args.root, symbol, os.path.join(args.import_dir, name))
+                print(f"   {'✅' if added else '⏭️ '} {symbol:<10} {added:,} rows added")
+        print(f"⏱️  Imported in {time.perf_counter() - start:.1f}s\n")
+
+    for symbol, timeframe in datasets(args.root):
+        manifest = load_manifest(args.root, symbol, timeframe)
+        keys = sorted(manifest['partitions'])
+        span = (f"{manifest['partitions'][keys[0]]['min_time']} → "
+                f"{manifest['partitions'][keys[-1]]['max_time']}" if keys else "empty")
+        print(f"📊 {symbol:<10} {timeframe:<4} {manifest['rows']:>10,} rows in {len(keys):>3} partitions | {span}")
+        if args.verify:
+            for key in verify_partitions(args.root, symbol, timeframe):
+                print(f"   ❌ {key}: checksum mismatch")
+
+
+if __name__ == "__main__":
+    main()
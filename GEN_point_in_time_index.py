@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Point-in-Time Bar Index
+=======================
+
+As-of lookups over the strategy data cache ({symbol: {timeframe: DataFrame}})
+without look-ahead.
+
+Bars are indexed by their open time, so the bar at 10:00 on H1 is still
+forming until 11:00. For a query time t the index returns the last bar that
+had fully closed by t (open time + bar length <= t), found by binary search
+on a monotonic int64 array of close times. Close-time arrays are built once
+per cached frame and rebuilt only when the frame is replaced (e.g. by
+MultiTimeframeStrategy.append_bars).
+
+Usage:
+    index = PointInTimeIndex(strategy.data_cache)
+    positions = index.positions('BTCUSD', TimeFrame.H1, times)   # -1 where no bar had closed
+    bars = index.asof('BTCUSD', times)                           # bar open time per timeframe
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+from typing import Dict, Hashable, List
+
+import numpy as np
+import pandas as pd
+
+from GEN_incremental_resampler import DEFAULT_LEVELS
+
+# Bar length per timeframe name
+TIMEFRAME_DURATIONS = {name: pd.Timedelta(freq) for name, freq, _ in DEFAULT_LEVELS}
+
+
+def _timeframe_name(timeframe: Hashable) -> str:
+    """Timeframe name of a TimeFrame member or a plain name"""
+    return getattr(timeframe, 'name', timeframe)
+
+
+def to_nanoseconds(times) -> np.ndarray:
+    """Query time(s) as an int64 nanosecond array"""
+    return pd.DatetimeIndex(np.atleast_1d(times)).asi8
+
+
+class PointInTimeIndex:
+    """
+    Last fully closed bar at or before a time, per symbol and timeframe
+
+    Lookups read the data cache it was created with, so frames loaded or
+    appended later are picked up automatically.
+    """
+
+    def __init__(self, data_cache: Dict[str, Dict], durations: Dict[str, pd.Timedelta] = None):
+        """
+        Initialize point-in-time index
+
+        Args:
+            data_cache: {symbol: {timeframe: OHLCV DataFrame indexed by bar open time}}
+            durations: Bar length per timeframe name (defaults to M1..D1)
+        """
+        self.data_cache = data_cache
+        self.durations = durations or TIMEFRAME_DURATIONS
+        self._close_times = {}
+
+    def close_times(self, symbol: str, timeframe: Hashable) -> np.ndarray:
+        """
+        Close time of every bar as int64 nanoseconds
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (TimeFrame member or name)
+
+        Returns:
+            Monotonic array aligned with the rows of the cached frame
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        if timeframe not in self.data_cache[symbol]:
+            raise ValueError(f"Timeframe {_timeframe_name(timeframe)} not available for {symbol}")
+
+        data = self.data_cache[symbol][timeframe]
+        key = (symbol, timeframe)
+        cached = self._close_times.get(key)
+        if cached is None or cached[0] is not data:
+            duration = self.durations[_timeframe_name(timeframe)].value
+            close_times = data.index.asi8 + duration
+            if len(close_times) > 1 and np.any(close_times[1:] <= close_times[:-1]):
+                raise ValueError(f"{symbol} {_timeframe_name(timeframe)}: bar times are not strictly increasing")
+            cached = (data, close_times)
+            self._close_times[key] = cached
+        return cached[1]
+
+    def positions(self, symbol: str, timeframe: Hashable, times) -> np.ndarray:
+        """
+        Row of the last bar closed at or before each time
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (TimeFrame member or name)
+            times: Query time or array of query times (any order)
+
+        Returns:
+            int64 row positions into the cached frame, -1 where no bar had closed yet
+        """
+        close_times = self.close_times(symbol, timeframe)
+        return np.searchsorted(close_times, to_nanoseconds(times), side='right') - 1
+
+    def bar_times(self, symbol: str, timeframe: Hashable, times) -> pd.DatetimeIndex:
+        """
+        Open time of the last bar closed at or before each time
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (TimeFrame member or name)
+            times: Query time or array of query times
+
+        Returns:
+            Bar open times (NaT where no bar had closed yet)
+        """
+        positions = self.positions(symbol, timeframe, times)
+        index = self.data_cache[symbol][timeframe].index.asi8
+        values = np.where(positions >= 0, index[np.maximum(positions, 0)], np.iinfo(np.int64).min)
+        return pd.DatetimeIndex(values.view('datetime64[ns]'))
+
+    def bars(self, symbol: str, timeframe: Hashable, times) -> pd.DataFrame:
+        """
+        Last closed bar at or before each time
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (TimeFrame member or name)
+            times: Query time or array of query times
+
+        Returns:
+            DataFrame indexed by query time with the bar's columns and its
+            open time in 'bar_time' (all NaN where no bar had closed yet)
+        """
+        positions = self.positions(symbol, timeframe, times)
+        data = self.data_cache[symbol][timeframe]
+        valid = positions >= 0
+        result = data.iloc[np.maximum(positions, 0)].astype(float)
+        result.loc[~valid] = np.nan
+        result.index = pd.DatetimeIndex(np.atleast_1d(times), name='time')
+        result.insert(0, 'bar_time', self.bar_times(symbol, timeframe, times))
+        return result
+
+    def asof(self, symbol: str, times, timeframes: List[Hashable] = None) -> pd.DataFrame:
+        """
+        Open time of the last closed bar of every timeframe at each time
+
+        Args:
+            symbol: Trading symbol
+            times: Query time or array of query times
+            timeframes: Timeframes to look up (defaults to every cached timeframe)
+
+        Returns:
+            DataFrame indexed by query time with one column per timeframe name
+        """
+        if symbol not in self.data_cache:
+            raise ValueError(f"Data not loaded for symbol: {symbol}")
+        timeframes = timeframes or list(self.data_cache[symbol])
+        return pd.DataFrame({_timeframe_name(tf): self.bar_times(symbol, tf, times) for tf in timeframes},
+                            index=pd.DatetimeIndex(np.atleast_1d(times), name='time'))
+
+    def invalidate(self, symbol: str = None):
+        """Drop the close-time arrays of one symbol, or all of them"""
+        if symbol is None:
+            self._close_times.clear()
+            return
+        for key in [key for key in self._close_times if key[0] == symbol]:
+            del self._close_times[key]
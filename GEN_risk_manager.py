@@ -24,7 +24,12 @@ Version: 1.0
 Date: 2025-09-19
 """
 
-import MetaTrader5 as mt5
+try:
+    import MetaTrader5 as mt5
+except ImportError:
+    # Offline use (backtesting): subclasses replace the MT5 calls, anything left
+    # behaves like a disconnected terminal
+    mt5 = None
 import pandas as pd
 import numpy as np
 import json
@@ -477,12 +482,12 @@ class CoefficientBasedRiskManager:
         # For other symbols, check if position value would be too high
         try:
             # Get current market data
-            tick = mt5.symbol_info_tick(symbol)
-            symbol_info = mt5.symbol_info(symbol)
+            market = self.get_sizing_inputs(symbol)
             
-            if not tick or not symbol_info:
+            if not market:
                 self.logger.warning(f"⚠️ Cannot get market data for {symbol}, using base coefficient")
                 return base_coefficient
+            contract_size, ask = market
                 
             # Get account balance for percentage calculation
             if not self.account_metrics:
@@ -493,14 +498,14 @@ class CoefficientBasedRiskManager:
                     
             # Calculate position value with base coefficient
             min_lot = self.risk_config['position_coefficients'][symbol]['min_lot']
-            position_value = min_lot * base_coefficient * symbol_info.trade_contract_size * tick.ask
+            position_value = min_lot * base_coefficient * contract_size * ask
             
             # Check if position value exceeds 15% of account (safe limit)
             max_position_value = self.account_metrics.balance * 0.15
             
             if position_value > max_position_value:
                 # Calculate safe coefficient to bring position within 15% limit
-                safe_coefficient = max_position_value / (min_lot * symbol_info.trade_contract_size * tick.ask)
+                safe_coefficient = max_position_value / (min_lot * contract_size * ask)
                 # Never reduce below coefficient 1.0
                 safe_coefficient = max(safe_coefficient, 1.0)
                 
@@ -517,6 +522,19 @@ class CoefficientBasedRiskManager:
             # On error, use base coefficient but log the issue
             return base_coefficient
         
+    def get_sizing_inputs(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """Contract size and current ask of a symbol from MT5 (None when unavailable)"""
+        tick = mt5.symbol_info_tick(symbol)
+        symbol_info = mt5.symbol_info(symbol)
+        if not tick or not symbol_info:
+            return None
+        return symbol_info.trade_contract_size, tick.ask
+    
+    def count_open_positions(self, symbol: str) -> int:
+        """Open MT5 positions in a symbol"""
+        positions = mt5.positions_get(symbol=symbol)
+        return len(positions) if positions else 0
+        
     def update_account_metrics(self) -> bool:
         """Update real-time account metrics from MT5"""
         try:
@@ -663,8 +681,7 @@ class CoefficientBasedRiskManager:
             )
             
         # Check if we already have a position in this symbol
-        existing_positions = mt5.positions_get(symbol=trade_request.symbol)
-        if existing_positions and len(existing_positions) >= self.HARD_LIMITS["max_positions_per_symbol"]:
+        if self.count_open_positions(trade_request.symbol) >= self.HARD_LIMITS["max_positions_per_symbol"]:
             return RiskDecision(
                 decision=TradeDecision.REJECTED,
                 approved_lot_size=0.0,
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Shared-Memory Market Data
+=========================
+
+Publishes the strategy data cache (time and OHLCV per symbol and timeframe)
+in multiprocessing.shared_memory so that analysis workers, the dashboard and
+other processes read one copy of the bars instead of loading their own.
+
+One process is the writer: it publishes the frames it loaded and every new
+bar (MultiTimeframeStrategy.append_bars does this once publish_shared_data
+has been called). Any number of readers attach by name and get read-only
+DataFrames whose columns are views of the shared segments, so adding readers
+does not add copies of the data (frame(copy=True) returns a private copy).
+
+Layout per (symbol, timeframe):
+- header segment "<prefix>_<symbol>_<timeframe>": int64 version, size,
+  generation, capacity. The version is odd while the writer updates rows
+  (seqlock), so readers never see a half-written size.
+- data segment "<prefix>_<symbol>_<timeframe>_g<generation>": one column
+  array of `capacity` 8-byte values per SHARED_COLUMNS entry. When a frame
+  outgrows its capacity, or is republished with a different history, the
+  writer copies it into a new generation and readers re-attach on their
+  next read.
+
+Rows before the last published bar are closed: the writer never rewrites
+them within a generation. The last (still forming) bar is updated in place.
+A frame returned by frame() is a view of `size` rows, so its closed rows
+never change but its last row follows the writer's updates of that bar;
+callers that keep a frame and need it fixed take frame(copy=True), which is
+copied inside the seqlock check and so is a consistent snapshot. Call
+frame() again after new bars to see them.
+
+Usage:
+    writer = SharedMarketDataWriter("gen_market")
+    writer.publish_frames("BTCUSD", strategy.data_cache["BTCUSD"])
+    reader = SharedMarketDataReader("gen_market")
+    h1 = reader.frame("BTCUSD", "H1")
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PREFIX = "gen_market"
+
+# Shared column layout (time as int64 nanoseconds); every column is 8 bytes wide
+SHARED_COLUMNS = (
+    ('time', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('tick_volume', np.int64),
+    ('spread', np.float64),
+    ('real_volume', np.int64),
+)
+
+# Header fields (int64 each)
+VERSION, SIZE, GENERATION, CAPACITY = range(4)
+HEADER_FIELDS = 4
+
+MIN_CAPACITY = 1024
+GROWTH_FACTOR = 2
+
+
+def _timeframe_name(timeframe: Hashable) -> str:
+    """Timeframe name of a TimeFrame member or a plain name"""
+    return getattr(timeframe, 'name', timeframe)
+
+
+def _segment_name(prefix: str, symbol: str, timeframe: Hashable, generation: int = None) -> str:
+    name = f"{prefix}_{symbol}_{_timeframe_name(timeframe)}"
+    return name if generation is None else f"{name}_g{generation}"
+
+
+_attach_lock = threading.Lock()
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing segment without handing it to this process's resource tracker"""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the segment, and the tracker unlinks it when
+    # the reader exits; only the writer owns (and unlinks) segments. Registration
+    # is skipped for this segment only: other threads' registrations pass through,
+    # and the lock keeps concurrent attaches from restoring each other's hook
+    tracked_name = name if name.startswith('/') else f"/{name}"
+    with _attach_lock:
+        register = resource_tracker.register
+
+        def register_others(resource_name, resource_type):
+            if resource_name != tracked_name or resource_type != "shared_memory":
+                register(resource_name, resource_type)
+
+        resource_tracker.register = register_others
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _column_views(segment: SharedMemory, capacity: int) -> Dict[str, np.ndarray]:
+    """Column arrays laid out back to back in a data segment"""
+    return {name: np.ndarray(capacity, dtype=dtype, buffer=segment.buf, offset=i * capacity * 8)
+            for i, (name, dtype) in enumerate(SHARED_COLUMNS)}
+
+
+class SharedMarketDataWriter:
+    """
+    Single writer publishing per-symbol, per-timeframe bars to shared memory
+
+    Segments live until close() is called on the writer.
+    """
+
+    def __init__(self, prefix: str = DEFAULT_PREFIX):
+        """
+        Initialize shared market data writer
+
+        Args:
+            prefix: Segment name prefix readers attach with
+        """
+        self.prefix = prefix
+        self._segments: Dict[Tuple[str, str], Dict] = {}
+
+    def publish(self, symbol: str, timeframe: Hashable, frame: pd.DataFrame):
+        """
+        Publish a symbol's bars of one timeframe
+
+        Only the rows from the previously last bar on are written; a frame
+        whose earlier history differs from what was published is written in
+        full to a new generation, so closed rows readers hold never change.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (TimeFrame member or name)
+            frame: OHLCV DataFrame indexed by bar time
+        """
+        key = (symbol, _timeframe_name(timeframe))
+        entry = self._segments.get(key)
+        if entry is None:
+            entry = self._create(symbol, timeframe, len(frame))
+
+        header = entry['header']
+        size = int(header[SIZE])
+        times = frame.index.asi8
+        start = max(size - 1, 0)
+        rewrite = start > len(frame) or (start and times[start - 1] != entry['columns']['time'][start - 1])
+
+        header[VERSION] += 1
+        if rewrite or len(frame) > header[CAPACITY]:
+            self._grow(symbol, timeframe, entry, len(frame))
+            start = 0
+        columns = entry['columns']
+        columns['time'][start:len(frame)] = times[start:]
+        for name, dtype in SHARED_COLUMNS[1:]:
+            columns[name][start:len(frame)] = frame[name].to_numpy(dtype=dtype)[start:]
+        header[SIZE] = len(frame)
+        header[VERSION] += 1
+
+    def publish_frames(self, symbol: str, frames: Dict[Hashable, pd.DataFrame]):
+        """Publish every timeframe of a symbol ({timeframe: DataFrame}, e.g. data_cache[symbol])"""
+        for timeframe, frame in frames.items():
+            self.publish(symbol, timeframe, frame)
+
+    def _create(self, symbol: str, timeframe: Hashable, rows: int) -> Dict:
+        name = _segment_name(self.prefix, symbol, timeframe)
+        header_segment = self._create_segment(name, HEADER_FIELDS * 8)
+        header = np.ndarray(HEADER_FIELDS, dtype=np.int64, buffer=header_segment.buf)
+        header[:] = 0
+        entry = {'header_segment': header_segment, 'header': header, 'segment': None, 'columns': None}
+        self._segments[(symbol, _timeframe_name(timeframe))] = entry
+        self._allocate(symbol, timeframe, entry, rows, generation=0)
+        return entry
+
+    def _grow(self, symbol: str, timeframe: Hashable, entry: Dict, rows: int):
+        """Move a frame to a new segment generation (readers re-attach on their next read)"""
+        retired = entry['segment']
+        self._allocate(symbol, timeframe, entry, rows, generation=int(entry['header'][GENERATION]) + 1)
+        retired.close()
+        retired.unlink()
+
+    def _allocate(self, symbol: str, timeframe: Hashable, entry: Dict, rows: int, generation: int):
+        capacity = max(MIN_CAPACITY, GROWTH_FACTOR * rows)
+        segment = self._create_segment(_segment_name(self.prefix, symbol, timeframe, generation),
+                                       capacity * 8 * len(SHARED_COLUMNS))
+        entry['segment'] = segment
+        entry['columns'] = _column_views(segment, capacity)
+        entry['header'][GENERATION] = generation
+        entry['header'][CAPACITY] = capacity
+
+    @staticmethod
+    def _create_segment(name: str, size: int) -> SharedMemory:
+        try:
+            return SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over from a writer that did not shut down cleanly
+            stale = _attach(name)
+            stale.close()
+            stale.unlink()
+            return SharedMemory(name=name, create=True, size=size)
+
+    def symbols(self) -> List[str]:
+        """Published symbols"""
+        return sorted({symbol for symbol, _ in self._segments})
+
+    def close(self, unlink: bool = True):
+        """
+        Release the writer's segments
+
+        Args:
+            unlink: Also remove the segments (readers keep their mappings
+                    but can no longer attach)
+        """
+        for entry in self._segments.values():
+            entry['columns'] = entry['header'] = None
+            for segment in (entry['segment'], entry['header_segment']):
+                segment.close()
+                if unlink:
+                    segment.unlink()
+        self._segments = {}
+
+
+class SharedMarketDataReader:
+    """
+    Read-only, zero-copy access to bars published by a SharedMarketDataWriter
+
+    frame() returns the same DataFrame object until the writer publishes a
+    change, so identity-based caches (IndicatorFrameCache) keep hitting. The
+    frame is a view: its last row follows the writer's updates of the forming
+    bar (use frame(copy=True) for a frame that never changes).
+    """
+
+    def __init__(self, prefix: str = DEFAULT_PREFIX):
+        """
+        Initialize shared market data reader
+
+        Args:
+            prefix: Segment name prefix used by the writer
+        """
+        self.prefix = prefix
+        self._attached: Dict[Tuple[str, str], Dict] = {}
+        self._retired: List[SharedMemory] = []
+
+    def has(self, symbol: str, timeframe: Hashable = 'M1') -> bool:
+        """Whether the writer has published a symbol's timeframe"""
+        try:
+            self._entry(symbol, timeframe)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _entry(self, symbol: str, timeframe: Hashable) -> Dict:
+        key = (symbol, _timeframe_name(timeframe))
+        if key not in self._attached:
+            header_segment = _attach(_segment_name(self.prefix, symbol, timeframe))
+            header = np.ndarray(HEADER_FIELDS, dtype=np.int64, buffer=header_segment.buf)
+            self._attached[key] = {'header_segment': header_segment, 'header': header,
+                                   'segment': None, 'generation': None, 'version': None, 'frame': None}
+        return self._attached[key]
+
+    def frame(self, symbol: str, timeframe: Hashable, timeout: float = 1.0,
+              copy: bool = False) -> pd.DataFrame:
+        """
+        Current bars of a symbol's timeframe
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe (TimeFrame member or name)
+            timeout: Seconds to wait for a writer update in progress
+            copy: Return a private copy taken under the version check instead of
+                  the shared view (whose last row the writer keeps updating)
+
+        Returns:
+            Read-only OHLCV DataFrame indexed by bar time, backed by shared memory
+            (a writable copy with copy=True)
+        """
+        try:
+            entry = self._entry(symbol, timeframe)
+        except FileNotFoundError:
+            raise ValueError(f"{symbol} {_timeframe_name(timeframe)} has not been published "
+                             f"under '{self.prefix}'") from None
+        header = entry['header']
+
+        deadline = time.monotonic() + timeout
+        while True:
+            version = int(header[VERSION])
+            if version == entry['version'] and not copy:
+                return entry['frame']
+            if version % 2 == 0:
+                if version == entry['version']:
+                    frame = entry['frame']
+                else:
+                    generation, size, capacity = int(header[GENERATION]), int(header[SIZE]), int(header[CAPACITY])
+                    if generation != entry['generation']:
+                        self._reattach(symbol, timeframe, entry, generation)
+                    frame = self._view(entry['segment'], capacity, size)
+                result = self._copy(frame) if copy else frame
+                if int(header[VERSION]) == version:
+                    entry.update(version=version, frame=frame)
+                    return result
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Writer update of {symbol} {_timeframe_name(timeframe)} did not finish")
+            time.sleep(0.0001)
+
+    def _reattach(self, symbol: str, timeframe: Hashable, entry: Dict, generation: int):
+        if entry['segment'] is not None:
+            # Frames handed out earlier still reference the old mapping
+            self._retired.append(entry['segment'])
+        entry['segment'] = _attach(_segment_name(self.prefix, symbol, timeframe, generation))
+        entry['generation'] = generation
+
+    @staticmethod
+    def _view(segment: SharedMemory, capacity: int, size: int) -> pd.DataFrame:
+        columns = {}
+        for name, array in _column_views(segment, capacity).items():
+            view = array[:size]
+            view.flags.writeable = False
+            columns[name] = view
+        index = pd.DatetimeIndex(columns.pop('time').view('datetime64[ns]'), name='time', copy=False)
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    @staticmethod
+    def _copy(frame: pd.DataFrame) -> pd.DataFrame:
+        # DataFrame.copy() keeps the index as a view of the segment
+        copied = frame.copy()
+        copied.index = frame.index.copy(deep=True)
+        return copied
+
+    def frames(self, symbol: str, timeframes: List[Hashable], copy: bool = False) -> Dict[Hashable, pd.DataFrame]:
+        """Current bars of several timeframes ({timeframe: DataFrame}, keyed as given)"""
+        return {timeframe: self.frame(symbol, timeframe, copy=copy) for timeframe in timeframes}
+
+    def close(self):
+        """Detach from all segments (frames handed out must no longer be used)"""
+        segments = self._retired + [segment for entry in self._attached.values()
+                                    for segment in (entry['segment'], entry['header_segment']) if segment]
+        self._attached = {}
+        self._retired = []
+        for segment in segments:
+            try:
+                segment.close()
+            except BufferError:
+                # Still referenced by a live frame; released with it
+                pass
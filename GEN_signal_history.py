@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Signal History Store
+====================
+
+Bounded, columnar per-symbol signal history.
+
+Strategies used to keep every generated signal as a dataclass in an
+unbounded list, and status queries scanned the whole list. The store keeps
+the scalar fields of the most recent `capacity` signals of each symbol in
+typed NumPy arrays ordered by timestamp, so memory stays bounded over long
+uptimes and time-range counts are two binary searches.
+
+Each symbol's records live in arrays of twice the capacity; the retained
+window slides to the right and is copied back to the front when the end is
+reached (amortized O(1) per append). Records leaving the window can be
+spilled to a per-symbol CSV file instead of being dropped; they are written
+in batches when the window is moved back (or on flush()).
+
+Usage:
+    store = SignalHistoryStore({'confidence': np.float64}, {'action': ('BUY', 'SELL', 'HOLD')},
+                               capacity=10000, spill_dir="signal_history")
+    store.append('BTCUSD', timestamp, confidence=0.8, action='BUY')
+    store.count(start=now - timedelta(hours=1))
+    store.range('BTCUSD', start, end)        # DataFrame indexed by timestamp
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CAPACITY = 10000
+
+
+class _SymbolBuffer:
+    """Time-ordered record arrays of one symbol (valid rows: start..end, evicted rows: spilled..start)"""
+
+    def __init__(self, dtypes: Dict[str, np.dtype], capacity: int):
+        self.capacity = capacity
+        self.columns = {name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self.spilled = 0
+        self.start = 0
+        self.end = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def times(self) -> np.ndarray:
+        return self.columns['timestamp'][self.start:self.end]
+
+    def rows(self, first: int, last: int) -> Dict[str, np.ndarray]:
+        """Columns of records first..last (offsets into the valid window)"""
+        return {name: array[self.start + first:self.start + last] for name, array in self.columns.items()}
+
+
+class SignalHistoryStore:
+    """
+    Per-symbol ring buffers of signal fields with time-range queries
+
+    Numeric fields are stored as given; categorical fields (actions, risk
+    levels, directions as text) are stored as int8 codes into their category
+    tuple. Timestamps are int64 nanoseconds.
+    """
+
+    def __init__(self, fields: Dict[str, np.dtype], categories: Dict[str, Tuple[str, ...]] = None,
+                 capacity: int = DEFAULT_CAPACITY, spill_dir: str = None):
+        """
+        Initialize signal history store
+
+        Args:
+            fields: Numeric field name -> dtype
+            categories: Categorical field name -> allowed values
+            capacity: Signals kept in memory per symbol
+            spill_dir: Directory for evicted signals (<symbol>_signals.csv);
+                       None drops them
+        """
+        self.categories = categories or {}
+        self.dtypes = {'timestamp': np.dtype(np.int64)}
+        self.dtypes.update({name: np.dtype(dtype) for name, dtype in fields.items()})
+        self.dtypes.update({name: np.dtype(np.int8) for name in self.categories})
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.total_appended = 0
+        self.total_spilled = 0
+        self._buffers: Dict[str, _SymbolBuffer] = {}
+        self._codes = {name: {value: code for code, value in enumerate(values)}
+                       for name, values in self.categories.items()}
+
+    def append(self, symbol: str, timestamp, **values):
+        """
+        Record one signal
+
+        Signals normally arrive in time order; an older signal is inserted at
+        its place (or spilled directly when it predates the retained window).
+
+        Args:
+            symbol: Trading symbol
+            timestamp: Signal time
+            **values: Field values (categorical fields by value)
+        """
+        record = {'timestamp': pd.Timestamp(timestamp).value}
+        for name in self.dtypes:
+            if name == 'timestamp':
+                continue
+            value = values.get(name)
+            if name in self._codes:
+                if value not in self._codes[name]:
+                    raise ValueError(f"Unknown {name} '{value}', expected one of {self.categories[name]}")
+                value = self._codes[name][value]
+            record[name] = np.nan if value is None else value
+
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            buffer = self._buffers[symbol] = _SymbolBuffer(self.dtypes, self.capacity)
+        self.total_appended += 1
+
+        times = buffer.times()
+        position = len(times)
+        if position and record['timestamp'] < times[-1]:
+            position = int(np.searchsorted(times, record['timestamp'], side='right'))
+            if position == 0 and len(buffer) == self.capacity:
+                self._spill(symbol, {name: np.array([value], dtype=self.dtypes[name])
+                                     for name, value in record.items()})
+                return
+
+        if len(buffer) == self.capacity:
+            buffer.start += 1
+            position -= 1
+        if buffer.end == len(buffer.columns['timestamp']):
+            self._compact(symbol, buffer)
+
+        at = buffer.start + position
+        for name, array in buffer.columns.items():
+            array[at + 1:buffer.end + 1] = array[at:buffer.end].copy()
+            array[at] = record[name]
+        buffer.end += 1
+
+    def _compact(self, symbol: str, buffer: _SymbolBuffer):
+        """Spill the evicted records and move the retained window back to the front of the arrays"""
+        self._spill_evicted(symbol, buffer)
+        for array in buffer.columns.values():
+            array[:len(buffer)] = array[buffer.start:buffer.end]
+        buffer.end = len(buffer)
+        buffer.start = buffer.spilled = 0
+
+    def _spill_evicted(self, symbol: str, buffer: _SymbolBuffer):
+        if buffer.start > buffer.spilled:
+            self._spill(symbol, {name: array[buffer.spilled:buffer.start] for name, array in buffer.columns.items()})
+        buffer.spilled = buffer.start
+
+    def flush(self):
+        """Write evicted signals not yet spilled (no-op without spill_dir)"""
+        for symbol, buffer in self._buffers.items():
+            self._spill_evicted(symbol, buffer)
+
+    def _spill(self, symbol: str, rows: Dict[str, np.ndarray]):
+        if self.spill_dir is None:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, f"{symbol}_signals.csv")
+        frame = self._to_frame(rows)
+        frame.to_csv(path, mode='a', header=not os.path.exists(path))
+        self.total_spilled += len(frame)
+
+    def _to_frame(self, rows: Dict[str, np.ndarray]) -> pd.DataFrame:
+        columns = {}
+        for name, array in rows.items():
+            if name == 'timestamp':
+                continue
+            if name in self.categories:
+                columns[name] = pd.Categorical.from_codes(array, categories=list(self.categories[name]))
+            else:
+                columns[name] = array.copy()
+        index = pd.DatetimeIndex(rows['timestamp'].view('datetime64[ns]'), name='timestamp')
+        return pd.DataFrame(columns, index=index)
+
+    def _bounds(self, buffer: _SymbolBuffer, start, end) -> Tuple[int, int]:
+        """Offsets of the records with start <= timestamp < end"""
+        times = buffer.times()
+        first = 0 if start is None else int(np.searchsorted(times, pd.Timestamp(start).value, side='left'))
+        last = len(times) if end is None else int(np.searchsorted(times, pd.Timestamp(end).value, side='left'))
+        return first, max(first, last)
+
+    def count(self, symbol: str = None, start=None, end=None) -> int:
+        """
+        Number of retained signals in a time range
+
+        Args:
+            symbol: Trading symbol (None for all symbols)
+            start: Inclusive lower time bound (None for unbounded)
+            end: Exclusive upper time bound (None for unbounded)
+
+        Returns:
+            Signal count
+        """
+        symbols = self.symbols() if symbol is None else [symbol]
+        total = 0
+        for name in symbols:
+            if name in self._buffers:
+                first, last = self._bounds(self._buffers[name], start, end)
+                total += last - first
+        return total
+
+    def range(self, symbol: str, start=None, end=None) -> pd.DataFrame:
+        """
+        Retained signals of a symbol in a time range
+
+        Args:
+            symbol: Trading symbol
+            start: Inclusive lower time bound (None for unbounded)
+            end: Exclusive upper time bound (None for unbounded)
+
+        Returns:
+            DataFrame indexed by timestamp with one column per field
+        """
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            return self._to_frame({name: np.empty(0, dtype=dtype) for name, dtype in self.dtypes.items()})
+        return self._to_frame(buffer.rows(*self._bounds(buffer, start, end)))
+
+    def latest(self, symbol: str = None, n: int = 1) -> pd.DataFrame:
+        """
+        Most recent signals
+
+        Args:
+            symbol: Trading symbol (None for the most recent across all symbols)
+            n: Number of signals
+
+        Returns:
+            DataFrame indexed by timestamp (with a 'symbol' column), oldest first
+        """
+        frames = []
+        for name in (self.symbols() if symbol is None else [symbol]):
+            buffer = self._buffers.get(name)
+            if buffer is not None and len(buffer):
+                frame = self._to_frame(buffer.rows(max(len(buffer) - n, 0), len(buffer)))
+                frame.insert(0, 'symbol', name)
+                frames.append(frame)
+        if not frames:
+            frame = self.range(symbol)
+            frame.insert(0, 'symbol', pd.Series(dtype=object))
+            return frame
+        return pd.concat(frames).sort_index(kind='stable').iloc[-n:]
+
+    def load_spilled(self, symbol: str) -> pd.DataFrame:
+        """Signals of a symbol spilled to disk (empty when none were spilled)"""
+        path = os.path.join(self.spill_dir or "", f"{symbol}_signals.csv")
+        if self.spill_dir is None or not os.path.exists(path):
+            return self.range(None)
+        return pd.read_csv(path, index_col='timestamp', parse_dates=['timestamp'])
+
+    def symbols(self) -> List[str]:
+        """Symbols with recorded signals"""
+        return list(self._buffers)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._buffers
+
+    def __len__(self) -> int:
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def memory_bytes(self) -> int:
+        """Bytes allocated by the record arrays"""
+        return sum(array.nbytes for buffer in self._buffers.values() for array in buffer.columns.values())
@@ -50,6 +50,9 @@ from GEN_risk_manager import CoefficientBasedRiskManager, TradeRequest, MarketCo
 from GEN_config_loader import (ConfigurationLoader, TechnicalConfig, SignalConfig, 
                              RiskConfig, ExecutionConfig, ConfigurationError)
 
+# Import bounded signal history
+from GEN_signal_history import DEFAULT_CAPACITY, SignalHistoryStore
+
 class SignalType(Enum):
     """Trading signal types"""
     BUY = "BUY"
@@ -183,7 +186,11 @@ class BaseStrategy(ABC):
         
         # Performance tracking
         self.metrics = StrategyMetrics()
-        self.signal_history: List[MarketSignal] = []
+        self.signal_history = SignalHistoryStore(
+            {'strength': np.int8, 'confidence': np.float64, 'price': np.float64},
+            {'signal_type': tuple(signal_type.value for signal_type in SignalType)},
+            capacity=self.config.custom_parameters.get("signal_history_capacity", DEFAULT_CAPACITY),
+            spill_dir=self.config.custom_parameters.get("signal_history_spill_dir"))
         self.trade_history: List[Dict] = []
         self.active_positions: Dict[str, Dict] = {}
         
@@ -430,7 +437,9 @@ class BaseStrategy(ABC):
                 return False
                 
             # Add to signal history
-            self.signal_history.append(signal)
+            self.signal_history.append(signal.symbol, signal.timestamp, strength=signal.strength.value,
+                                       confidence=signal.confidence, price=signal.price,
+                                       signal_type=signal.signal_type.value)
             self.metrics.total_signals += 1
             
             # Create trade request for risk manager
@@ -664,6 +673,18 @@ class BaseStrategy(ABC):
             "strategy_id": signal.strategy_id
         }
         
+    def _history_to_dicts(self, history: pd.DataFrame) -> List[Dict]:
+        """Convert signal history rows to the _signal_to_dict format"""
+        return [{
+            "symbol": row.symbol,
+            "signal_type": row.signal_type,
+            "strength": SignalStrength(row.strength).name,
+            "confidence": row.confidence,
+            "timestamp": timestamp.isoformat(),
+            "price": row.price,
+            "strategy_id": self.config.strategy_name
+        } for timestamp, row in zip(history.index, history.itertuples())]
+        
     def get_strategy_status(self) -> Dict[str, any]:
         """Get comprehensive strategy status"""
         self.metrics.update_metrics()
@@ -685,7 +706,7 @@ class BaseStrategy(ABC):
                 "signals_per_hour": f"{self.metrics.signals_per_hour:.1f}",
                 "profit_factor": f"{self.metrics.profit_factor:.2f}"
             },
-            "recent_signals": len([s for s in self.signal_history if s.timestamp > datetime.now() - timedelta(hours=1)])
+            "recent_signals": self.signal_history.count(start=datetime.now() - timedelta(hours=1))
         }
         
     def save_strategy_state(self, filepath: str = None) -> bool:
@@ -703,7 +724,7 @@ class BaseStrategy(ABC):
                     "enabled": self.config.enabled
                 },
                 "status": self.get_strategy_status(),
-                "signal_history": [self._signal_to_dict(s) for s in self.signal_history[-100:]],  # Last 100 signals
+                "signal_history": self._history_to_dicts(self.signal_history.latest(n=100)),  # Last 100 signals
                 "trade_history": self.trade_history[-50:]  # Last 50 trades
             }
             
@@ -107,89 +107,119 @@ class TradingStatusDashboard:
         
         try:
             # Use the enhanced strategy's analyze_symbol_enhanced method
-            confluent_signal = self.strategy.analyze_symbol_enhanced(symbol)
-            
-            # Extract key metrics from ConfluentSignal object
-            signal_data = {
-                'action': confluent_signal.recommended_action,
-                'confluence_score': confluent_signal.confluence_score,
-                'overall_strength': confluent_signal.overall_strength,
-                'risk_level': confluent_signal.risk_level,
-                'bullish_timeframes': 0,
-                'bearish_timeframes': 0,
-                'neutral_timeframes': 0,
-                'timeframes': {},
-                'current_price': confluent_signal.timeframe_signals[-1].price if confluent_signal.timeframe_signals else 0
-            }
-            
-            # Count timeframe directions
-            for tf_signal in confluent_signal.timeframe_signals:
-                tf_name = tf_signal.timeframe.name
-                direction_value = tf_signal.direction.value
-                
-                # Store timeframe data
-                signal_data['timeframes'][tf_name] = {
-                    'signal': 'BUY' if direction_value > 0 else 'SELL' if direction_value < 0 else 'NEUTRAL',
-                    'strength': tf_signal.strength.value if hasattr(tf_signal.strength, 'value') else abs(direction_value),
-                    'confidence': tf_signal.confidence
-                }
-                
-                # Count directions
-                if direction_value > 0:
-                    signal_data['bullish_timeframes'] += 1
-                elif direction_value < 0:
-                    signal_data['bearish_timeframes'] += 1
-                else:
-                    signal_data['neutral_timeframes'] += 1
-            
-            signal, reason = self.get_signal_category(signal_data)
+            return self.status_from_signal(symbol, self.strategy.analyze_symbol_enhanced(symbol))
+        except Exception as e:
+            return self.error_status(symbol, f'Analysis failed: {str(e)}')
+    
+    def analyze_symbols(self, symbols):
+        """
+        Analyze several symbols with one batched indicator pass per timeframe
+        
+        Args:
+            symbols: Symbols to analyze
             
-            # Get timeframe breakdown
-            tf_details = {}
-            for tf in self.timeframes:
-                tf_data = signal_data.get('timeframes', {}).get(tf, {})
-                if tf_data:
-                    tf_signal = tf_data.get('signal', 'NEUTRAL')
-                    tf_strength = tf_data.get('strength', 0)
-                    if tf_signal == 'BUY':
-                        tf_details[tf] = f"🟢 {tf_strength:.2f}"
-                    elif tf_signal == 'SELL':
-                        tf_details[tf] = f"🔴 {tf_strength:.2f}"
-                    else:
-                        tf_details[tf] = f"⚪ {tf_strength:.2f}"
-                else:
-                    tf_details[tf] = "⚪ 0.00"
+        Returns:
+            List of status dicts in symbol order
+        """
+        print(f"\n🔍 Analyzing {len(symbols)} symbols (batched)...")
+        signals = self.strategy.analyze_multiple_symbols_enhanced(symbols, batched=True)
+        
+        results = []
+        for symbol in symbols:
+            confluent_signal = signals.get(symbol)
+            if confluent_signal is None:
+                results.append(self.error_status(symbol, 'Analysis failed: no enhanced signals'))
+                continue
+            try:
+                results.append(self.status_from_signal(symbol, confluent_signal))
+            except Exception as e:
+                results.append(self.error_status(symbol, f'Analysis failed: {str(e)}'))
+        return results
+    
+    def status_from_signal(self, symbol, confluent_signal):
+        """Build the status row of a symbol from its enhanced ConfluentSignal"""
+        # Extract key metrics from ConfluentSignal object
+        signal_data = {
+            'action': confluent_signal.recommended_action,
+            'confluence_score': confluent_signal.confluence_score,
+            'overall_strength': confluent_signal.overall_strength,
+            'risk_level': confluent_signal.risk_level,
+            'bullish_timeframes': 0,
+            'bearish_timeframes': 0,
+            'neutral_timeframes': 0,
+            'timeframes': {},
+            'current_price': confluent_signal.timeframe_signals[-1].price if confluent_signal.timeframe_signals else 0
+        }
+        
+        # Count timeframe directions
+        for tf_signal in confluent_signal.timeframe_signals:
+            tf_name = tf_signal.timeframe.name
+            direction_value = tf_signal.direction.value
             
-            return {
-                'symbol': symbol,
-                'signal': signal,
-                'reason': reason,
-                'confluence': signal_data.get('confluence_score', 0),
-                'strength': signal_data.get('overall_strength', 0),
-                'risk': signal_data.get('risk_level', 'HIGH'),
-                'bull_tf': signal_data.get('bullish_timeframes', 0),
-                'bear_tf': signal_data.get('bearish_timeframes', 0),
-                'neutral_tf': signal_data.get('neutral_timeframes', 0),
-                'timeframe_details': tf_details,
-                'last_price': signal_data.get('current_price', 'N/A'),
-                'volume_trend': signal_data.get('volume_trend', 'Unknown')
+            # Store timeframe data
+            signal_data['timeframes'][tf_name] = {
+                'signal': 'BUY' if direction_value > 0 else 'SELL' if direction_value < 0 else 'NEUTRAL',
+                'strength': tf_signal.strength.value if hasattr(tf_signal.strength, 'value') else abs(direction_value),
+                'confidence': tf_signal.confidence
             }
             
-        except Exception as e:
-            return {
-                'symbol': symbol,
-                'signal': '❌ ERROR',
-                'reason': f'Analysis failed: {str(e)}',
-                'confluence': 0,
-                'strength': 0,
-                'risk': 'UNKNOWN',
-                'bull_tf': 0,
-                'bear_tf': 0,
-                'neutral_tf': 0,
-                'timeframe_details': {},
-                'last_price': 'N/A',
-                'volume_trend': 'Unknown'
-            }
+            # Count directions
+            if direction_value > 0:
+                signal_data['bullish_timeframes'] += 1
+            elif direction_value < 0:
+                signal_data['bearish_timeframes'] += 1
+            else:
+                signal_data['neutral_timeframes'] += 1
+        
+        signal, reason = self.get_signal_category(signal_data)
+        
+        # Get timeframe breakdown
+        tf_details = {}
+        for tf in self.timeframes:
+            tf_data = signal_data.get('timeframes', {}).get(tf, {})
+            if tf_data:
+                tf_signal = tf_data.get('signal', 'NEUTRAL')
+                tf_strength = tf_data.get('strength', 0)
+                if tf_signal == 'BUY':
+                    tf_details[tf] = f"🟢 {tf_strength:.2f}"
+                elif tf_signal == 'SELL':
+                    tf_details[tf] = f"🔴 {tf_strength:.2f}"
+                else:
+                    tf_details[tf] = f"⚪ {tf_strength:.2f}"
+            else:
+                tf_details[tf] = "⚪ 0.00"
+        
+        return {
+            'symbol': symbol,
+            'signal': signal,
+            'reason': reason,
+            'confluence': signal_data.get('confluence_score', 0),
+            'strength': signal_data.get('overall_strength', 0),
+            'risk': signal_data.get('risk_level', 'HIGH'),
+            'bull_tf': signal_data.get('bullish_timeframes', 0),
+            'bear_tf': signal_data.get('bearish_timeframes', 0),
+            'neutral_tf': signal_data.get('neutral_timeframes', 0),
+            'timeframe_details': tf_details,
+            'last_price': signal_data.get('current_price', 'N/A'),
+            'volume_trend': signal_data.get('volume_trend', 'Unknown')
+        }
+    
+    def error_status(self, symbol, reason):
+        """Status row of a symbol whose analysis failed"""
+        return {
+            'symbol': symbol,
+            'signal': '❌ ERROR',
+            'reason': reason,
+            'confluence': 0,
+            'strength': 0,
+            'risk': 'UNKNOWN',
+            'bull_tf': 0,
+            'bear_tf': 0,
+            'neutral_tf': 0,
+            'timeframe_details': {},
+            'last_price': 'N/A',
+            'volume_trend': 'Unknown'
+        }
     
     def generate_status_table(self):
         """Generate comprehensive trading status table"""
@@ -205,10 +235,7 @@ class TradingStatusDashboard:
         print("=" * 80)
         
         # Analyze all symbols
-        results = []
-        for symbol in self.symbols:
-            result = self.analyze_symbol(symbol)
-            results.append(result)
+        results = self.analyze_symbols(self.symbols)
         
         # Create main status table
         print("\n📋 MAIN TRADING STATUS TABLE")
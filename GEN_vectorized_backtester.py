@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Vectorized Backtester
+=====================
+
+Fast screening backtest of per-bar confluence actions with array operations.
+
+Signals and stop ATR are prepared once per symbol (bar_signals over the full
+history). A run then only depends on the execution settings of a
+BacktestConfig (ATR multiples for stop loss / take profit, slippage, HOLD
+handling, warm-up, balance), so thousands of settings can be screened
+against one signal preparation.
+
+Execution rules are those of the event-driven backtester (GEN_backtester),
+without the risk manager: every signal change to BUY or SELL at a bar close
+fills at the next bar's open (ask + slippage for buys, bid - slippage for
+sells), reverses an opposite position and is ignored while a position in
+the same direction is open. Stops and targets are checked inside the bars
+from the entry bar on, the stop first when both are reached. Costs come from
+the bars' spread column. Positions are a fixed volume per symbol (its
+minimum lot unless given).
+
+Work is proportional to the number of signal changes, not bars: exits are
+found with array searches over the bars a position can live (until the next
+opposite signal), and positions, P&L and equity are built with array
+operations.
+
+Usage:
+    backtester = VectorizedBacktester()
+    backtester.prepare_strategy(MultiTimeframeStrategy(), symbols)
+    result = backtester.run(BacktestConfig(stop_loss_atr=1.5, take_profit_atr=3.0))
+    screen = backtester.screen([BacktestConfig(stop_loss_atr=sl) for sl in (1, 2, 3)])
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import contextlib
+import io
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from GEN_backtester import (BAR_DURATION, BacktestConfig, BacktestResult, BacktestTrade, available_symbols,
+                            bar_signals, load_symbol_bars)
+from GEN_multi_timeframe_strategy import MultiTimeframeStrategy
+
+EXIT_REASONS = ("signal", "stop_loss", "take_profit", "end_of_data")
+SIGNAL_EXIT, STOP_LOSS, TAKE_PROFIT, END_OF_DATA = range(len(EXIT_REASONS))
+
+
+@dataclass
+class SymbolSeries:
+    """Bars, signal directions and stop ATR of one symbol as arrays"""
+    times: np.ndarray                  # bar open times (int64 ns)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    spread: np.ndarray
+    direction: np.ndarray              # signal at each bar close (+1/0/-1)
+    atr: np.ndarray
+
+
+class VectorizedBacktester:
+    """
+    Array-based backtests of prepared confluence signals
+
+    Symbols are prepared with prepare_strategy (or add_symbol for signals
+    computed elsewhere); run() and screen() evaluate execution settings.
+    """
+
+    def __init__(self, symbol_specs_path: str = "symbol_specifications.json",
+                 volumes: Dict[str, float] = None):
+        """
+        Initialize vectorized backtester
+
+        Args:
+            symbol_specs_path: Symbol specifications (tick value/size, point, min lot)
+            volumes: Symbol -> position volume in lots (default: the symbol's min lot)
+        """
+        with open(symbol_specs_path, 'r') as f:
+            self.symbol_specs = json.load(f).get('symbol_specifications', {})
+        self.volumes = volumes or {}
+        self.series: Dict[str, SymbolSeries] = {}
+        self._timelines: Dict[Tuple, Tuple[np.ndarray, Dict[str, np.ndarray]]] = {}
+
+    def add_symbol(self, symbol: str, bars: pd.DataFrame, direction: np.ndarray, atr: np.ndarray):
+        """
+        Register a symbol's bars with its per-bar signal
+
+        Args:
+            symbol: Trading symbol (must be in the symbol specifications)
+            bars: M1 OHLC bars with spread, indexed by open time
+            direction: Signal direction at each bar close (+1 buy, -1 sell, 0 hold)
+            atr: Stop ATR at each bar close
+        """
+        if symbol not in self.symbol_specs:
+            raise ValueError(f"No symbol specification for {symbol}")
+        self.series[symbol] = SymbolSeries(
+            times=bars.index.asi8,
+            open=bars['open'].to_numpy(dtype=float),
+            high=bars['high'].to_numpy(dtype=float),
+            low=bars['low'].to_numpy(dtype=float),
+            close=bars['close'].to_numpy(dtype=float),
+            spread=bars['spread'].to_numpy(dtype=float),
+            direction=np.asarray(direction, dtype=np.int8),
+            atr=np.asarray(atr, dtype=float)
+        )
+        self._timelines.clear()
+
+    def prepare_strategy(self, strategy: MultiTimeframeStrategy, symbols: List[str] = None,
+                         data: Dict[str, pd.DataFrame] = None, stop_timeframe: str = "H1"):
+        """
+        Compute the signals of a strategy over the full history of symbols
+
+        Args:
+            strategy: Strategy instance (enhanced signals when available)
+            symbols: Symbols to prepare (defaults to every symbol with data)
+            data: Symbol -> M1 OHLCV DataFrame (loaded from the data files when omitted)
+            stop_timeframe: Timeframe name of the ATR used for stops
+        """
+        symbols = symbols or (list(data) if data else available_symbols())
+        for symbol in symbols:
+            bars = data[symbol] if data else load_symbol_bars(symbol)
+            with contextlib.redirect_stdout(io.StringIO()):
+                strategy.load_frame(symbol, bars)
+                direction, _, atr = bar_signals(strategy, symbol, bars.index, stop_timeframe)
+            self.add_symbol(symbol, bars, direction, atr)
+
+    def _trading_start(self, symbols: List[str], config: BacktestConfig) -> int:
+        """First tradable time (ns): the earliest bar of the symbols plus the warm-up"""
+        first = min(self.series[symbol].times[0] for symbol in symbols)
+        return first + pd.Timedelta(config.warmup).value
+
+    def _bars_before(self, symbol: str, end: int = None) -> SymbolSeries:
+        """Series of a symbol truncated to the bars opening before end (views)"""
+        s = self.series[symbol]
+        if end is None:
+            return s
+        last = int(np.searchsorted(s.times, end))
+        return SymbolSeries(*(getattr(s, name)[:last] for name in SymbolSeries.__dataclass_fields__))
+
+    def _simulate(self, symbol: str, config: BacktestConfig, start: int, end: int = None) -> Dict[str, np.ndarray]:
+        """Trades and per-bar P&L of one symbol"""
+        s = self._bars_before(symbol, end)
+        spec = self.symbol_specs[symbol]
+        n = len(s.times)
+        slippage = config.slippage_points * spec['point']
+        volume = self.volumes.get(symbol, spec.get('min_lot', 0.01))
+        value = volume * spec['tick_value'] / spec['tick_size']
+
+        # Signal changes at bar closes from the first tradable bar, filled at the next open
+        first = int(np.searchsorted(s.times, start))
+        direction = s.direction[first:]
+        previous = np.concatenate(([0], direction[:-1]))
+        decisions = first + np.flatnonzero(direction != previous)
+        decisions = decisions[decisions + 1 < n]
+        directions = s.direction[decisions].astype(np.int64)
+        if not config.close_on_hold:
+            decisions, directions = decisions[directions != 0], directions[directions != 0]
+        fills = decisions + 1
+        stops = config.stop_loss_atr * s.atr[decisions]
+        targets = config.take_profit_atr * s.atr[decisions]
+
+        # A position lives at most until the next signal in another direction
+        changes = np.flatnonzero(np.diff(directions)) + 1
+        following = np.searchsorted(changes, np.arange(len(directions)), side='right')
+        limits = np.append(fills[changes], n)[following]
+
+        trades = {name: [] for name in ('direction', 'entry_bar', 'exit_bar', 'entry_price', 'stop_loss',
+                                        'take_profit', 'exit_price', 'reason')}
+        held = np.full(n, -1, dtype=np.int64)
+        active = None
+        for i in range(len(fills)):
+            fill, side = fills[i], directions[i]
+            if active is not None and active[2] < fill:
+                # Stopped out (or still open at the end) before this order
+                self._book(trades, held, active)
+                active = None
+            if active is not None:
+                if active[0] == side:
+                    continue
+                exit_price = s.open[fill] - slippage if active[0] > 0 else s.open[fill] + s.spread[fill] + slippage
+                self._book(trades, held, active[:2] + (fill, exit_price, SIGNAL_EXIT) + active[5:])
+                active = None
+            if side == 0:
+                continue
+
+            entry = s.open[fill] + s.spread[fill] + slippage if side > 0 else s.open[fill] - slippage
+            stop_loss, take_profit = entry - side * stops[i], entry + side * targets[i]
+            limit = limits[i]
+            low, high, spread = s.low[fill:limit], s.high[fill:limit], s.spread[fill:limit]
+            if side > 0:
+                stop_hit, target_hit = low <= stop_loss, high >= take_profit
+            else:
+                stop_hit, target_hit = high + spread >= stop_loss, low + spread <= take_profit
+            hits = stop_hit | target_hit
+            k = int(hits.argmax()) if len(hits) else 0
+            if len(hits) and hits[k]:
+                bar = fill + k
+                bar_open = s.open[bar] if side > 0 else s.open[bar] + s.spread[bar]
+                if stop_hit[k]:
+                    exit_bar, reason = bar, STOP_LOSS
+                    exit_price = (min(bar_open, stop_loss) - slippage if side > 0
+                                  else max(bar_open, stop_loss) + slippage)
+                else:
+                    exit_bar, reason = bar, TAKE_PROFIT
+                    exit_price = max(bar_open, take_profit) if side > 0 else min(bar_open, take_profit)
+            elif limit == n:
+                exit_bar, reason = n, END_OF_DATA
+                exit_price = s.close[-1] - slippage if side > 0 else s.close[-1] + s.spread[-1] + slippage
+            else:
+                # Closed by the next signal; exit set when that order is processed
+                exit_bar, reason, exit_price = n + 1, SIGNAL_EXIT, np.nan
+            active = (side, fill, exit_bar, exit_price, reason, entry, stop_loss, take_profit)
+        if active is not None:
+            self._book(trades, held, active)
+
+        trades = {name: np.asarray(values) for name, values in trades.items()}
+        trades['direction'] = trades['direction'].astype(np.int64)
+        trades['entry_bar'] = trades['entry_bar'].astype(np.int64)
+        trades['exit_bar'] = trades['exit_bar'].astype(np.int64)
+        trades['reason'] = trades['reason'].astype(np.int64)
+        trades['pnl'] = trades['direction'] * (trades['exit_price'] - trades['entry_price']) * value
+        trades['spread_cost'] = s.spread[trades['entry_bar']] * value
+        trades['volume'] = np.full(len(trades['pnl']), volume)
+
+        # Per-bar P&L at the close: booked trades plus the open position marked to market
+        booked_bar = np.minimum(trades['exit_bar'], n - 1)
+        realized = np.bincount(booked_bar, weights=trades['pnl'], minlength=n).cumsum()
+        holding = held >= 0
+        unrealized = np.zeros(n)
+        if len(trades['pnl']):
+            side = trades['direction'][held[holding]]
+            mark = np.where(side > 0, s.close[holding], s.close[holding] + s.spread[holding])
+            unrealized[holding] = side * (mark - trades['entry_price'][held[holding]]) * value
+        return {'trades': trades, 'realized': realized, 'equity': realized + unrealized,
+                'holding': holding.astype(np.int64), 'bars': n - first, 'times': s.times}
+
+    @staticmethod
+    def _book(trades: Dict[str, List], held: np.ndarray, active: Tuple):
+        """Record a closed trade and mark the bars it was held at the close"""
+        side, fill, exit_bar, exit_price, reason, entry, stop_loss, take_profit = active
+        held[fill:min(exit_bar, len(held) - 1 if reason == END_OF_DATA else exit_bar)] = len(trades['direction'])
+        for name, value in zip(('direction', 'entry_bar', 'exit_bar', 'entry_price', 'stop_loss', 'take_profit',
+                                'exit_price', 'reason'),
+                               (side, fill, exit_bar, entry, stop_loss, take_profit, exit_price, reason)):
+            trades[name].append(value)
+
+    def _timeline(self, symbols: Tuple[str, ...], start: int,
+                  end: int = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Union of the symbols' tradable bar times and each symbol's last bar at every time"""
+        key = (symbols, start, end)
+        if key not in self._timelines:
+            times = np.unique(np.concatenate([self.series[symbol].times for symbol in symbols]))
+            times = times[(times >= start) & (times < end if end is not None else True)]
+            positions = {symbol: np.searchsorted(self.series[symbol].times, times, side='right') - 1
+                         for symbol in symbols}
+            self._timelines[key] = (times, positions)
+        return self._timelines[key]
+
+    def run(self, config: BacktestConfig = None, symbols: List[str] = None,
+            start=None, end=None) -> BacktestResult:
+        """
+        Backtest the prepared signals with one set of execution settings
+
+        Args:
+            config: Execution settings (stop_timeframe and block are fixed at preparation)
+            symbols: Prepared symbols to include (default: all)
+            start: First time orders may be decided (not before the warm-up ends)
+            end: Bars opening at or after this time are ignored; positions
+                 still open are closed at the last bar before it
+
+        Returns:
+            BacktestResult with the portfolio equity curve and the trade log
+        """
+        started = time.perf_counter()
+        config = config or BacktestConfig()
+        symbols = tuple(symbols or self.series)
+        first = self._trading_start(symbols, config)
+        start = first if start is None else max(first, pd.Timestamp(start).value)
+        end = None if end is None else pd.Timestamp(end).value
+        times, positions = self._timeline(symbols, start, end)
+
+        balance = np.full(len(times), config.initial_balance)
+        equity = balance.copy()
+        open_positions = np.zeros(len(times), dtype=np.int64)
+        trade_frames = []
+        bars = 0
+        for symbol in symbols:
+            simulated = self._simulate(symbol, config, start, end)
+            if not simulated['bars']:
+                continue
+            position = positions[symbol]
+            valid = position >= 0
+            at = np.where(valid, position, 0)
+            balance += np.where(valid, simulated['realized'][at], 0.0)
+            equity += np.where(valid, simulated['equity'][at], 0.0)
+            open_positions += np.where(valid, simulated['holding'][at], 0)
+            bars += simulated['bars']
+            trade_frames.append(self._trade_frame(symbol, simulated['times'], simulated['trades']))
+
+        trades = pd.concat(trade_frames, ignore_index=True) if trade_frames else pd.DataFrame(
+            columns=list(BacktestTrade.__dataclass_fields__))
+        trades = trades.sort_values('entry_time', kind='stable', ignore_index=True)
+        trades['trade_id'] = np.arange(1, len(trades) + 1)
+        trades = trades.sort_values('exit_time', kind='stable', ignore_index=True)
+        equity_curve = pd.DataFrame({'balance': balance, 'equity': equity, 'open_positions': open_positions},
+                                    index=pd.DatetimeIndex(times + BAR_DURATION.value, name='time'))
+        if len(equity_curve):
+            equity_curve.iloc[-1] = [balance[-1], balance[-1], 0]
+        return BacktestResult(equity_curve, trades, {}, config.initial_balance, bars,
+                              time.perf_counter() - started)
+
+    @staticmethod
+    def _trade_frame(symbol: str, times: np.ndarray, trades: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Trades of one symbol in the BacktestTrade layout"""
+        exit_times = np.where(trades['exit_bar'] < len(times), times[np.minimum(trades['exit_bar'], len(times) - 1)],
+                              times[-1] + BAR_DURATION.value)
+        return pd.DataFrame({
+            'trade_id': 0,
+            'symbol': symbol,
+            'direction': np.where(trades['direction'] > 0, "BUY", "SELL"),
+            'volume': trades['volume'],
+            'entry_time': pd.DatetimeIndex(times[trades['entry_bar']]),
+            'entry_price': trades['entry_price'],
+            'stop_loss': trades['stop_loss'],
+            'take_profit': trades['take_profit'],
+            'spread_cost': trades['spread_cost'],
+            'exit_time': pd.DatetimeIndex(exit_times),
+            'exit_price': trades['exit_price'],
+            'exit_reason': np.asarray(EXIT_REASONS)[trades['reason']],
+            'pnl': trades['pnl']
+        }, columns=list(BacktestTrade.__dataclass_fields__))
+
+    def screen(self, configs: List[BacktestConfig], symbols: List[str] = None) -> pd.DataFrame:
+        """
+        Run many execution settings against the prepared signals
+
+        Args:
+            configs: Settings to evaluate
+            symbols: Prepared symbols to include (default: all)
+
+        Returns:
+            One row per config: its settings followed by the summary figures
+        """
+        rows = []
+        for config in configs:
+            summary = self.run(config, symbols).summary()
+            rows.append({**asdict(config), **summary})
+        return pd.DataFrame(rows)
+
+
+def main():
+    """Screen stop loss / take profit multiples on the stored M1 data"""
+    print("🚀 VECTORIZED BACKTEST SCREEN")
+    print("=" * 60)
+    with contextlib.redirect_stdout(io.StringIO()):
+        strategy = MultiTimeframeStrategy()
+    backtester = VectorizedBacktester()
+
+    start = time.perf_counter()
+    backtester.prepare_strategy(strategy)
+    print(f"🔄 Signals prepared for {len(backtester.series)} symbols in {time.perf_counter() - start:.1f}s")
+
+    configs = [BacktestConfig(stop_loss_atr=sl, take_profit_atr=tp)
+               for sl in (1.0, 1.5, 2.0, 3.0) for tp in (1.0, 1.5, 2.0, 3.0)]
+    start = time.perf_counter()
+    screen = backtester.screen(configs)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(configs)} configs screened in {elapsed:.2f}s ({elapsed / len(configs) * 1000:.0f}ms each)\n")
+    columns = ['stop_loss_atr', 'take_profit_atr', 'total_return_percent', 'max_drawdown_percent',
+               'total_trades', 'win_rate', 'profit_factor']
+    print(screen[columns].sort_values('profit_factor', ascending=False).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Walk-Forward Optimizer
+======================
+
+Rolling train/test evaluation of a strategy parameter grid over the stored
+M1 history, run in parallel worker processes.
+
+Parameters are dotted paths within the strategy's multi_timeframe config
+section (MultiTimeframeStrategy.apply_parameters), e.g.
+"confluence_threshold", "timeframe_weights.D1" or "indicators.rsi_period".
+
+- Windows: the history is split into rolling windows of `train` followed by
+  `test` (pandas offsets such as "10D" / "5D"), advanced by `step`
+  (default: the test length).
+- Evaluation: a worker computes a parameter set's signals once over the full
+  history (signals are as of each bar close, so later bars never leak into
+  earlier ones) and runs the vectorized backtester on every train and test
+  segment.
+- Parallelism: one task per parameter set on a process pool using every
+  core. The M1 bars are published once in shared memory
+  (GEN_shared_market_data) and every worker attaches read-only to the same
+  copy.
+- Caching and resume: every (parameters, window) result is appended to a
+  JSONL cache as soon as its task finishes. A rerun (for example after an
+  interruption) evaluates only the parameter sets with missing windows.
+  Cached lines are tied to the data, symbols, strategy and execution
+  settings they were computed with.
+- Report: the parameter sets ranked by their mean out-of-sample (test)
+  objective, plus the walk-forward chain that trades each test window with
+  the parameters that scored best on the preceding train window.
+
+Usage:
+    optimizer = WalkForwardOptimizer(grid={"confluence_threshold": [0.5, 0.6, 0.7],
+                                           "indicators.rsi_period": [9, 14, 21]})
+    report = optimizer.run()
+    report.save("walk_forward_results")
+
+Author: Multi-Symbol Strategy Framework
+Date: 2025-09-21
+Version: 1.0
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from GEN_backtester import BacktestConfig, available_symbols, bar_signals, load_symbol_bars
+from GEN_indicator_frame_cache import IndicatorFrameCache
+from GEN_multi_timeframe_strategy import MultiTimeframeStrategy
+from GEN_shared_market_data import SharedMarketDataReader, SharedMarketDataWriter
+from GEN_vectorized_backtester import VectorizedBacktester
+
+DEFAULT_GRID = {
+    "confluence_threshold": [0.5, 0.6, 0.7],
+    "timeframe_weights.D1": [0.25, 0.35],
+    "indicators.rsi_period": [9, 14, 21],
+}
+
+SEGMENTS = ("train", "test")
+
+# Worker state: strategy with the shared bars loaded, and its pristine config
+_worker = None
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """One train period followed by its out-of-sample test period"""
+    index: int
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp
+    test_end: pd.Timestamp
+
+    @property
+    def test_start(self) -> pd.Timestamp:
+        return self.train_end
+
+    @property
+    def key(self) -> str:
+        return f"{self.train_start:%Y%m%d%H%M}-{self.train_end:%Y%m%d%H%M}-{self.test_end:%Y%m%d%H%M}"
+
+    def segment(self, name: str):
+        """(start, end) of the train or test segment"""
+        return (self.train_start, self.train_end) if name == "train" else (self.test_start, self.test_end)
+
+
+def walk_forward_windows(start: pd.Timestamp, end: pd.Timestamp, train: str = "10D", test: str = "5D",
+                         step: str = None) -> List[WalkForwardWindow]:
+    """
+    Rolling train/test windows over a time range
+
+    Args:
+        start: First bar time
+        end: Time after the last bar
+        train: Train period length (pandas offset)
+        test: Test period length (pandas offset)
+        step: Distance between window starts (defaults to the test length)
+
+    Returns:
+        Windows whose test period ends by `end`
+    """
+    train, test = pd.Timedelta(train), pd.Timedelta(test)
+    step = pd.Timedelta(step) if step else test
+    windows = []
+    train_start = start
+    while train_start + train + test <= end:
+        windows.append(WalkForwardWindow(len(windows), train_start, train_start + train, train_start + train + test))
+        train_start += step
+    return windows
+
+
+def parameter_grid(grid: Dict[str, List]) -> List[Dict]:
+    """Every combination of the grid's values ({path: [values]} -> [{path: value}])"""
+    paths = list(grid)
+    return [dict(zip(paths, values)) for values in itertools.product(*(grid[path] for path in paths))]
+
+
+def _initialize_worker(strategy_class, config_path: str, prefix: str, symbols: List[str]):
+    """Attach to the shared bars and prepare the worker's strategy (once per worker process)"""
+    global _worker
+    reader = SharedMarketDataReader(prefix)
+    with contextlib.redirect_stdout(io.StringIO()):
+        strategy = strategy_class(config_path)
+        bars = {}
+        for symbol in symbols:
+            bars[symbol] = reader.frame(symbol, 'M1')
+            strategy.load_frame(symbol, bars[symbol])
+    _worker = {'reader': reader, 'strategy': strategy, 'bars': bars, 'config': copy.deepcopy(strategy.config)}
+
+
+def _evaluate_parameters(parameters: Dict, windows: List[WalkForwardWindow], execution: Dict,
+                         stop_timeframe: str) -> List[Dict]:
+    """Backtest one parameter set on every train and test segment of the windows"""
+    strategy = _worker['strategy']
+    strategy.config = copy.deepcopy(_worker['config'])
+    backtester = VectorizedBacktester()
+    with contextlib.redirect_stdout(io.StringIO()):
+        strategy.apply_parameters(parameters)
+        for symbol, bars in _worker['bars'].items():
+            direction, _, atr = bar_signals(strategy, symbol, bars.index, stop_timeframe)
+            backtester.add_symbol(symbol, bars, direction, atr)
+
+    config = BacktestConfig(**execution)
+    rows = []
+    for window in windows:
+        for segment in SEGMENTS:
+            start, end = window.segment(segment)
+            summary = backtester.run(config, start=start, end=end).summary()
+            rows.append({'window': window.key, 'segment': segment, **summary})
+    return rows
+
+
+@dataclass
+class WalkForwardReport:
+    """Results of every (parameters, window, segment) with the out-of-sample ranking"""
+    results: pd.DataFrame
+    ranking: pd.DataFrame
+    walk_forward: pd.DataFrame
+    parameter_names: List[str]
+    objective: str
+    evaluated: int = 0
+    elapsed: float = 0.0
+
+    def best_parameters(self) -> Dict:
+        """Parameters with the best mean out-of-sample objective"""
+        if not len(self.ranking):
+            return {}
+        best = self.ranking.iloc[0]
+        return {name: best[name].item() if hasattr(best[name], 'item') else best[name]
+                for name in self.parameter_names}
+
+    def summary(self) -> Dict:
+        """Headline out-of-sample figures"""
+        chain = self.walk_forward
+        return {
+            "objective": self.objective,
+            "parameter_sets": int(len(self.ranking)),
+            "windows": int(chain['window'].nunique()) if len(chain) else 0,
+            "evaluated_parameter_sets": self.evaluated,
+            "best_parameters": self.best_parameters(),
+            "walk_forward_return_percent": float(((1 + chain['total_return_percent'] / 100).prod() - 1) * 100)
+            if len(chain) else 0.0,
+            "walk_forward_trades": int(chain['total_trades'].sum()) if len(chain) else 0,
+            "elapsed_seconds": round(self.elapsed, 2)
+        }
+
+    def save(self, output_dir: str = "walk_forward_results") -> str:
+        """Write results.csv, ranking.csv, walk_forward.csv and report.json; returns the directory"""
+        os.makedirs(output_dir, exist_ok=True)
+        self.results.to_csv(os.path.join(output_dir, "results.csv"), index=False)
+        self.ranking.to_csv(os.path.join(output_dir, "ranking.csv"), index=False)
+        self.walk_forward.to_csv(os.path.join(output_dir, "walk_forward.csv"), index=False)
+        with open(os.path.join(output_dir, "report.json"), 'w') as f:
+            json.dump({**self.summary(), "config_section": "multi_timeframe"}, f, indent=2, default=str)
+        return output_dir
+
+
+class WalkForwardOptimizer:
+    """
+    Parallel walk-forward evaluation of a parameter grid with a resumable result cache
+    """
+
+    def __init__(self, grid: Dict[str, List] = None, symbols: List[str] = None,
+                 strategy_class=MultiTimeframeStrategy, config_path: str = "GEN_unified_config.json",
+                 train: str = "10D", test: str = "5D", step: str = None,
+                 execution: BacktestConfig = None, stop_timeframe: str = "H1",
+                 objective: str = "total_return_percent", workers: int = None,
+                 cache_path: str = "walk_forward_results/cache.jsonl"):
+        """
+        Initialize walk-forward optimizer
+
+        Args:
+            grid: Parameter path -> candidate values (see apply_parameters)
+            symbols: Symbols to backtest (default: every symbol with data)
+            strategy_class: MultiTimeframeStrategy or a subclass
+            config_path: Base configuration of the strategy
+            train: Train period length (pandas offset)
+            test: Test period length (pandas offset)
+            step: Distance between window starts (defaults to the test length)
+            execution: Backtest execution settings (stops, costs, warm-up)
+            stop_timeframe: Timeframe name of the ATR used for stops
+            objective: Summary figure to maximize (BacktestResult.summary key)
+            workers: Worker processes (defaults to the CPU count)
+            cache_path: JSONL file of evaluated (parameters, window) results
+        """
+        self.grid = grid or DEFAULT_GRID
+        self.symbols = symbols
+        self.strategy_class = strategy_class
+        self.config_path = config_path
+        self.train = train
+        self.test = test
+        self.step = step
+        self.execution = execution or BacktestConfig()
+        self.stop_timeframe = stop_timeframe
+        self.objective = objective
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.cache_path = cache_path
+
+    def _context_key(self, data: Dict[str, pd.DataFrame]) -> str:
+        """Hash of everything besides the parameters that a cached result depends on"""
+        base_config = {}
+        if os.path.exists(self.config_path):
+            with open(self.config_path, 'r') as f:
+                base_config = json.load(f)
+        fingerprint = {symbol: [str(df.index[0]), str(df.index[-1]), len(df), float(df['close'].sum())]
+                       for symbol, df in sorted(data.items())}
+        return IndicatorFrameCache.config_hash(
+            fingerprint, self.strategy_class.__name__, base_config, asdict(self.execution), self.stop_timeframe)
+
+    def _load_cache(self, context: str) -> Dict:
+        """(parameters key, window key, segment) -> cached row of this context"""
+        cached = {}
+        if not os.path.exists(self.cache_path):
+            return cached
+        with open(self.cache_path, 'r') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # Line cut short by an interruption
+                    continue
+                if row.get('context') == context:
+                    cached[(row['parameters_key'], row['window'], row['segment'])] = row
+        return cached
+
+    def _append_cache(self, rows: List[Dict]):
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.cache_path, 'a') as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def run(self, data: Dict[str, pd.DataFrame] = None) -> WalkForwardReport:
+        """
+        Evaluate the grid on every window (cached results are reused)
+
+        Args:
+            data: Symbol -> M1 OHLCV DataFrame (loaded from the data files when omitted)
+
+        Returns:
+            WalkForwardReport
+        """
+        started = time.perf_counter()
+        symbols = self.symbols or (list(data) if data else available_symbols())
+        data = {symbol: data[symbol] if data else load_symbol_bars(symbol) for symbol in symbols}
+        first = min(df.index[0] for df in data.values())
+        last = max(df.index[-1] for df in data.values()) + pd.Timedelta(minutes=1)
+        windows = walk_forward_windows(first, last, self.train, self.test, self.step)
+        if not windows:
+            raise ValueError(f"History from {first} to {last} is shorter than one {self.train} + {self.test} window")
+
+        context = self._context_key(data)
+        cached = self._load_cache(context)
+        parameter_sets = parameter_grid(self.grid)
+        keys = [IndicatorFrameCache.config_hash(parameters) for parameters in parameter_sets]
+        pending = [(key, parameters) for key, parameters in zip(keys, parameter_sets)
+                   if any((key, window.key, segment) not in cached for window in windows for segment in SEGMENTS)]
+
+        print(f"🔄 Walk-forward: {len(parameter_sets)} parameter sets x {len(windows)} windows "
+              f"on {len(symbols)} symbols ({len(parameter_sets) - len(pending)} cached)")
+        if pending:
+            self._evaluate(pending, windows, symbols, data, context, cached)
+
+        report = self._report(parameter_sets, keys, windows, cached)
+        report.evaluated = len(pending)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _evaluate(self, pending: List, windows: List[WalkForwardWindow], symbols: List[str],
+                  data: Dict[str, pd.DataFrame], context: str, cached: Dict):
+        """Run the pending parameter sets on the worker pool, caching each as it finishes"""
+        prefix = f"gen_wfo_{os.getpid()}"
+        writer = SharedMarketDataWriter(prefix)
+        executor = None
+        try:
+            for symbol in symbols:
+                writer.publish(symbol, 'M1', data[symbol])
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, len(pending)), initializer=_initialize_worker,
+                initargs=(self.strategy_class, self.config_path, prefix, symbols))
+            futures = {executor.submit(_evaluate_parameters, parameters, windows, asdict(self.execution),
+                                       self.stop_timeframe): (key, parameters)
+                       for key, parameters in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                key, parameters = futures[future]
+                rows = [{'context': context, 'parameters_key': key, 'parameters': parameters, **row}
+                        for row in future.result()]
+                self._append_cache(rows)
+                cached.update({(key, row['window'], row['segment']): row for row in rows})
+                print(f"   ✅ [{done}/{len(pending)}] {parameters}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            writer.close()
+
+    def _report(self, parameter_sets: List[Dict], keys: List[str], windows: List[WalkForwardWindow],
+                cached: Dict) -> WalkForwardReport:
+        """Results table, out-of-sample ranking and walk-forward chain"""
+        names = list(self.grid)
+        records = []
+        for key, parameters in zip(keys, parameter_sets):
+            for window in windows:
+                for segment in SEGMENTS:
+                    row = cached[(key, window.key, segment)]
+                    records.append({'parameters_key': key, **parameters, 'window_index': window.index,
+                                    **{name: value for name, value in row.items()
+                                       if name not in ('context', 'parameters_key', 'parameters')}})
+        results = pd.DataFrame(records)
+
+        train = results[results['segment'] == 'train']
+        test = results[results['segment'] == 'test']
+        grouped = test.groupby('parameters_key', sort=False)
+        ranking = pd.DataFrame({
+            'mean_test_objective': grouped[self.objective].mean(),
+            'mean_train_objective': train.groupby('parameters_key', sort=False)[self.objective].mean(),
+            'mean_test_return_percent': grouped['total_return_percent'].mean(),
+            'worst_test_drawdown_percent': grouped['max_drawdown_percent'].max(),
+            'profitable_test_windows': grouped['total_return_percent'].apply(lambda r: int((r > 0).sum())),
+            'test_trades': grouped['total_trades'].sum()
+        })
+        parameters = results.drop_duplicates('parameters_key').set_index('parameters_key')[names]
+        ranking = parameters.join(ranking).sort_values('mean_test_objective', ascending=False, kind='stable')
+        ranking = ranking.reset_index()
+        ranking.insert(0, 'rank', np.arange(1, len(ranking) + 1))
+
+        # Each test window traded with the parameters that were best on its train window
+        chain = []
+        for window in windows:
+            window_train = train[train['window'] == window.key]
+            best_key = window_train.sort_values(self.objective, ascending=False, kind='stable')['parameters_key'].iloc[0]
+            selected = test[(test['window'] == window.key) & (test['parameters_key'] == best_key)].iloc[0]
+            chain.append({'window_index': window.index, 'window': window.key,
+                          'test_start': window.test_start, 'test_end': window.test_end,
+                          'parameters_key': best_key, **{name: selected[name] for name in names},
+                          'train_objective': window_train[window_train['parameters_key'] == best_key][
+                              self.objective].iloc[0],
+                          **{metric: selected[metric] for metric in ('total_return_percent', 'max_drawdown_percent',
+                                                                     'total_trades', 'win_rate', 'profit_factor')}})
+        return WalkForwardReport(results, ranking, pd.DataFrame(chain), names, self.objective)
+
+
+def main():
+    """Walk-forward optimization of the multi-timeframe strategy parameters"""
+    parser = argparse.ArgumentParser(description="Walk-forward parameter optimizer")
+    parser.add_argument("--grid", help="JSON file of {parameter path: [values]} (default: built-in grid)")
+    parser.add_argument("--symbols", nargs="*", help="Symbols to backtest (default: all with data)")
+    parser.add_argument("--enhanced", action="store_true", help="Use EnhancedMultiTimeframeStrategy")
+    parser.add_argument("--train", default="10D", help="Train period length")
+    parser.add_argument("--test", default="5D", help="Test period length")
+    parser.add_argument("--step", help="Distance between windows (default: test length)")
+    parser.add_argument("--objective", default="total_return_percent", help="Summary figure to maximize")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default="walk_forward_results", help="Directory for the report and cache")
+    args = parser.parse_args()
+
+    print("🚀 WALK-FORWARD OPTIMIZER")
+    print("=" * 60)
+    grid = None
+    if args.grid:
+        with open(args.grid, 'r') as f:
+            grid = json.load(f)
+    strategy_class = MultiTimeframeStrategy
+    if args.enhanced:
+        from GEN_enhanced_multi_timeframe_strategy import EnhancedMultiTimeframeStrategy
+        strategy_class = EnhancedMultiTimeframeStrategy
+
+    optimizer = WalkForwardOptimizer(grid=grid, symbols=args.symbols, strategy_class=strategy_class,
+                                     train=args.train, test=args.test, step=args.step, objective=args.objective,
+                                     workers=args.workers, cache_path=os.path.join(args.output, "cache.jsonl"))
+    report = optimizer.run()
+
+    print("\n🏆 OUT-OF-SAMPLE RANKING")
+    columns = ['rank'] + report.parameter_names + ['mean_test_objective', 'mean_train_objective',
+                                                   'profitable_test_windows', 'test_trades']
+    print(report.ranking[columns].head(10).to_string(index=False))
+    print("\n📊 SUMMARY")
+    for key, value in report.summary().items():
+        print(f"   {key}: {value}")
+    print(f"\n💾 Report saved to {report.save(args.output)}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 import os
 
+from GEN_columnar_store import load_bars
+
 def analyze_gaps():
     print('🔍 ANALYZING GAP PATTERNS IN CSV DATA')
     print('=' * 60)
@@ -17,8 +19,7 @@ def analyze_gaps():
         print('❌ USOUSD CSV file not found!')
         return
     
-    df = pd.read_csv(csv_path)
-    df['time'] = pd.to_datetime(df['time'])
+    df = load_bars(csv_path, index=False)
     df = df.sort_values('time')
     
     print(f'📊 ANALYZING: {csv_path}')
@@ -7,48 +7,86 @@ This script extracts 1-month of 1-minute OHLC data for all tradeable symbols
 from the screened symbol list and saves them as CSV files.
 
 ENHANCED FEATURES (Fixed from lessons learned):
-- Configurable sleep delays between requests (prevents rate limiting)
-- Retry logic for failed requests (handles connection issues)  
+- Symbols extracted concurrently by a bounded worker pool, all requests
+  sharing a token-bucket rate limit that slows down when requests fail
+  (prevents rate limiting without fixed sleeps)
+- Retry logic with jittered exponential backoff (handles connection issues)
 - Better error handling and logging
 - Support for both old and new symbol specification formats
 - Comprehensive progress tracking and statistics
 - Saves data as CSV files with standardized naming (GEN_SYMBOL_M1_1month.csv)
+- Incremental mode: fetches only bars newer than the last stored timestamp
+  (tracked per symbol in CSVdata/extraction_manifest.json), re-fetches the
+  boundary bar, appends atomically and optionally trims to a rolling window
+- History mode: walks a long date range (years of M1 bars or ticks) in
+  fixed windows, streaming each window into month partitions of
+  CSVdata/lake (GEN_partitioned_store) with bounded memory; a failed run
+  resumes from the last completed window
 - ZERO tolerance for bugs - all issues fixed at source
 
 Usage:
-    python data_extractor.py
+    python data_extractor.py                                   # full 30-day pull
+    python data_extractor.py --incremental --retention-days 30 # daily refresh
+    python data_extractor.py --history-start 2020-01-01 --chunk-days 7
 """
 
 import MetaTrader5 as mt5
 import pandas as pd
 import numpy as np
+import argparse
 import json
 import os
+import threading
 from datetime import datetime, timedelta
-import time
 from typing import Dict, List, Optional, Tuple
 
+from GEN_columnar_store import bars_exist, load_bars, write_store
+from GEN_extraction_scheduler import ExtractionScheduler, TokenBucket
+from GEN_partitioned_store import PartitionedBarWriter, extract_history
+
+MANIFEST_FILE = "extraction_manifest.json"
+
 class EnhancedDataExtractor:
     """Production-grade data extractor with all lessons learned applied"""
     
     def __init__(self, 
-                 sleep_between_requests: float = 1.0,
-                 sleep_between_symbols: float = 2.0,
+                 requests_per_second: float = 5.0,
+                 max_workers: int = 4,
                  max_retries: int = 3,
-                 data_dir: str = "CSVdata"):
+                 data_dir: str = "CSVdata",
+                 incremental: bool = False,
+                 retention_days: Optional[int] = None,
+                 history_days: int = 30):
         """
         Initialize the enhanced data extractor
         
         Args:
-            sleep_between_requests: Seconds to sleep between individual requests
-            sleep_between_symbols: Seconds to sleep between different symbols
-            max_retries: Maximum retry attempts for failed requests
+            requests_per_second: Initial request rate shared by all workers (adapts
+                                 between a tenth of it and four times it)
+            max_workers: Symbols extracted concurrently
+            max_retries: Maximum attempts per request
             data_dir: Directory to save CSV files
+            incremental: Fetch only bars after the last stored timestamp and append them
+            retention_days: Keep only this many days before the newest bar (None keeps all)
+            history_days: Days fetched for a full pull (and for symbols with no stored bars)
         """
-        self.sleep_between_requests = sleep_between_requests
-        self.sleep_between_symbols = sleep_between_symbols
+        self.requests_per_second = requests_per_second
+        self.max_workers = max_workers
         self.max_retries = max_retries
+        self.scheduler = ExtractionScheduler(
+            TokenBucket(rate=requests_per_second, min_rate=requests_per_second / 10,
+                        max_rate=requests_per_second * 4),
+            max_workers=max_workers, max_retries=max_retries,
+            on_progress=self.report_progress)
         self.data_dir = data_dir
+        self.incremental = incremental
+        self.retention_days = retention_days
+        self.history_days = history_days
+        self.manifest_path = os.path.join(data_dir, MANIFEST_FILE)
+        self.manifest = self.load_manifest()
+        self.lock = threading.Lock()
+        # last_error() is terminal-global: requests and their error reads are serialized
+        self.terminal_lock = threading.Lock()
         
         # Ensure directories exist
         os.makedirs(os.path.join(data_dir, "raw"), exist_ok=True)
@@ -61,6 +99,7 @@ class EnhancedDataExtractor:
             "symbols_successful": 0,
             "symbols_failed": 0,
             "total_bars": 0,
+            "bars_trimmed": 0,
             "total_retries": 0,
             "failed_symbols": [],
             "successful_symbols": [],
@@ -73,6 +112,13 @@ class EnhancedDataExtractor:
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"[{timestamp}] {level}: {message}")
         
+    def report_progress(self, progress, finished: int, total: int):
+        """Per-symbol progress line from the extraction scheduler"""
+        if progress.status == "done":
+            self.log(f"📈 Progress: {finished}/{total} - ✅ {progress.symbol} ({progress.seconds:.1f}s)")
+        elif progress.status == "failed":
+            self.log(f"📈 Progress: {finished}/{total} - ❌ {progress.symbol}: {progress.error}", "ERROR")
+        
     def connect_mt5(self) -> bool:
         """Initialize MT5 connection with enhanced error handling"""
         self.log("🔌 Initializing MT5 connection...")
@@ -91,6 +137,109 @@ class EnhancedDataExtractor:
         self.log(f"✅ Connected to MT5 - Account: {account_info.login}, Server: {account_info.server}")
         return True
         
+    def load_manifest(self) -> Dict:
+        """Load the per-symbol extraction manifest (empty if none was written yet)"""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"symbols": {}}
+        except json.JSONDecodeError as e:
+            self.log(f"⚠️  Unreadable manifest {self.manifest_path} ({e}), rebuilding from stored files", "WARN")
+            return {"symbols": {}}
+            
+    def save_manifest(self):
+        """Write the manifest atomically (temp file + rename)"""
+        with self.lock:
+            self.manifest["updated"] = datetime.now().isoformat()
+            temp_path = f"{self.manifest_path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(temp_path, self.manifest_path)
+        
+    def last_stored_time(self, symbol: str, filepath: str) -> Optional[pd.Timestamp]:
+        """
+        Last stored bar time of a symbol, from the manifest or the stored file
+        
+        Args:
+            symbol: Trading symbol
+            filepath: Stored CSV file of the symbol
+            
+        Returns:
+            Timestamp of the last stored bar, or None if nothing is stored
+        """
+        if not bars_exist(filepath):
+            return None
+        entry = self.manifest["symbols"].get(symbol)
+        if entry and entry.get("file") == os.path.basename(filepath):
+            return pd.Timestamp(entry["last_time"])
+        # Files written before the manifest existed
+        times = load_bars(filepath, columns=[], index=False)['time']
+        return times.iloc[-1] if len(times) else None
+        
+    def append_bars(self, filepath: str, new_bars: pd.DataFrame) -> Tuple[pd.DataFrame, int, int]:
+        """
+        Append bars to a stored file, replacing stored bars they overlap
+        
+        The first fetched bar is the last stored one (fetches start at the last
+        stored timestamp), and its fresh copy wins since the stored one may have
+        been written while the bar was still forming. The merged file replaces
+        the old one atomically.
+        
+        Args:
+            filepath: Stored CSV file
+            new_bars: Fetched bars with a parsed time column
+            
+        Returns:
+            (merged bars, bars added, bars trimmed by the retention window)
+        """
+        stored = load_bars(filepath, index=False)
+        kept = stored[stored['time'] < new_bars['time'].iloc[0]]
+        merged = pd.concat([kept, new_bars[stored.columns]], ignore_index=True)
+        added = len(merged) - len(stored)
+        
+        trimmed = 0
+        if self.retention_days is not None:
+            cutoff = merged['time'].iloc[-1] - timedelta(days=self.retention_days)
+            trimmed = int((merged['time'] < cutoff).sum())
+            merged = merged.iloc[trimmed:].reset_index(drop=True)
+        
+        self.write_bars(merged, filepath)
+        return merged, added, trimmed
+        
+    def write_bars(self, df: pd.DataFrame, filepath: str):
+        """Write bars atomically (temp file + rename) and refresh the column store"""
+        temp_path = f"{filepath}.tmp"
+        df.to_csv(temp_path, index=False)
+        os.replace(temp_path, filepath)
+        write_store(df, filepath)
+        
+    def update_manifest(self, symbol: str, filepath: str, df: pd.DataFrame, bars_fetched: int):
+        """Record the stored range of a symbol"""
+        entry = {
+            "file": os.path.basename(filepath),
+            "first_time": str(df['time'].iloc[0]),
+            "last_time": str(df['time'].iloc[-1]),
+            "rows": len(df),
+            "bars_fetched": bars_fetched,
+            "extracted_at": datetime.now().isoformat()
+        }
+        with self.lock:
+            self.manifest["symbols"][symbol] = entry
+        self.save_manifest()
+            
+    def server_time(self, symbol: str) -> datetime:
+        """
+        Current time on the trade server's clock, from the symbol's last tick
+        
+        Bar times are server times, so date ranges are computed on that clock
+        (local time when no tick is available).
+        """
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is None or not tick.time:
+            return datetime.now()
+        return pd.Timestamp(tick.time, unit='s').to_pydatetime()
+        
     def load_symbol_specs(self) -> Dict:
         """Load symbol specifications from previous screening"""
         try:
@@ -113,57 +262,64 @@ class EnhancedDataExtractor:
             return {k: v for k, v in symbol_specs['symbol_specifications'].items() 
                    if v.get('tradeable', False)}
                    
-    def get_data_with_retry(self, symbol: str, timeframe, date_from, date_to, attempt: int = 1) -> Optional[np.ndarray]:
+    def terminal_request(self, call, symbol: str, kind: str):
         """
-        Get data with retry logic and proper error handling
+        Pair a terminal request with the failure reason of that same request
+        
+        Worker threads share the terminal, so a later last_error() could report
+        another symbol's failure; the request and its last_error() read run
+        under one lock and the reason is kept with the request.
+        
+        Args:
+            call: Terminal request function (returns None on failure)
+            symbol: Trading symbol (for the log)
+            kind: Request kind (for the log)
+            
+        Returns:
+            (request, last_error) functions for ExtractionScheduler.request
+        """
+        failure = {'error': None}
+        
+        def request():
+            with self.terminal_lock:
+                result = call()
+                failure['error'] = mt5.last_error() if result is None else None
+            return result
+            
+        def last_error():
+            self.log(f"  ⚠️  {symbol} {kind} request failed: {failure['error']}", "WARN")
+            return failure['error']
+            
+        return request, last_error
+        
+    def get_data_with_retry(self, symbol: str, timeframe, date_from, date_to) -> Optional[np.ndarray]:
+        """
+        Get data through the rate-limited scheduler, retrying failed requests
+        with jittered exponential backoff
         
         Args:
             symbol: Trading symbol
             timeframe: MT5 timeframe constant
             date_from: Start date
             date_to: End date
-            attempt: Current attempt number
             
         Returns:
             Numpy array of rates or None if failed
         """
-        try:
-            if attempt > 1:
-                retry_sleep = self.sleep_between_requests * attempt
-                self.log(f"  ⏱️  Waiting {retry_sleep:.1f}s before retry {attempt}/{self.max_retries}...")
-                time.sleep(retry_sleep)
-            elif self.sleep_between_requests > 0:
-                time.sleep(self.sleep_between_requests)
-                
-            # Request data
-            rates = mt5.copy_rates_range(symbol, timeframe, date_from, date_to)
-            
-            if rates is None:
-                error = mt5.last_error()
-                self.log(f"  ⚠️  Data request failed: {error}", "WARN")
-                
-                if attempt < self.max_retries:
-                    self.stats["total_retries"] += 1
-                    return self.get_data_with_retry(symbol, timeframe, date_from, date_to, attempt + 1)
-                else:
-                    self.log(f"  ❌ Max retries reached for {symbol}", "ERROR")
-                    return None
-                    
-            if len(rates) == 0:
-                self.log(f"  ⚠️  No data returned for {symbol}", "WARN")
-                return None
-                
-            self.log(f"  ✅ Retrieved {len(rates):,} bars for {symbol}")
-            return rates
+        request, last_error = self.terminal_request(
+            lambda: mt5.copy_rates_range(symbol, timeframe, date_from, date_to), symbol, "data")
+        rates = self.scheduler.request(request, last_error, label=symbol)
+        
+        if rates is None:
+            self.log(f"  ❌ Max retries reached for {symbol}", "ERROR")
+            return None
             
-        except Exception as e:
-            self.log(f"  ❌ Exception during data request: {e}", "ERROR")
+        if len(rates) == 0:
+            self.log(f"  ⚠️  No data returned for {symbol}", "WARN")
+            return None
             
-            if attempt < self.max_retries:
-                self.stats["total_retries"] += 1
-                return self.get_data_with_retry(symbol, timeframe, date_from, date_to, attempt + 1)
-            else:
-                return None
+        self.log(f"  ✅ Retrieved {len(rates):,} bars for {symbol}")
+        return rates
                 
     def extract_symbol_data(self, symbol: str, symbol_info: Dict) -> bool:
         """
@@ -183,9 +339,19 @@ class EnhancedDataExtractor:
             
             self.log(f"📊 {symbol}: {description} | Spread: {spread}")
             
-            # Calculate date range (1 month of data)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
+            # Generate filename following user's naming preference (GEN_ prefix)
+            filename = f"GEN_{symbol}_M1_1month.csv"
+            filepath = os.path.join(self.data_dir, "raw", filename)
+            
+            # Calculate date range: from the last stored bar (inclusive) in
+            # incremental mode, otherwise the full history window
+            end_date = self.server_time(symbol)
+            last_time = self.last_stored_time(symbol, filepath) if self.incremental else None
+            if last_time is not None:
+                start_date = last_time.to_pydatetime()
+                self.log(f"🔁 {symbol}: incremental from last stored bar {last_time}")
+            else:
+                start_date = end_date - timedelta(days=self.history_days)
             
             # Get data with retry logic
             rates = self.get_data_with_retry(
@@ -207,20 +373,25 @@ class EnhancedDataExtractor:
             current_spread = symbol_info.get('spread', symbol_info.get('spread_float', symbol_info.get('spread_points', 0)))
             df['spread'] = current_spread
             
-            # Generate filename following user's naming preference (GEN_ prefix)
-            filename = f"GEN_{symbol}_M1_1month.csv"
-            filepath = os.path.join(self.data_dir, "raw", filename)
+            fetched = len(df)
+            if last_time is not None:
+                df, added, trimmed = self.append_bars(filepath, df)
+                self.log(f"💾 Appended {added:,} new bars to {filename} ({fetched:,} fetched, "
+                         f"{trimmed:,} trimmed, {len(df):,} stored)")
+            else:
+                self.write_bars(df, filepath)
+                added, trimmed = len(df), 0
+                self.log(f"💾 Saved {len(df):,} bars to {filename}")
             
-            # Save to CSV
-            df.to_csv(filepath, index=False)
             file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
+            self.log(f"📅 {symbol}: {df['time'].min()} to {df['time'].max()} ({file_size_mb:.2f} MB)")
             
-            self.log(f"💾 Saved {len(df):,} bars to {filename} ({file_size_mb:.2f} MB)")
-            self.log(f"📅 Date range: {df['time'].min()} to {df['time'].max()}")
-            
-            # Update statistics
-            self.stats["total_bars"] += len(df)
-            self.stats["successful_symbols"].append(symbol)
+            # Update manifest and statistics (symbols run on worker threads)
+            self.update_manifest(symbol, filepath, df, fetched)
+            with self.lock:
+                self.stats["total_bars"] += added
+                self.stats["bars_trimmed"] += trimmed
+                self.stats["successful_symbols"].append(symbol)
             
             return True
             
@@ -228,10 +399,76 @@ class EnhancedDataExtractor:
             self.log(f"❌ Exception extracting {symbol}: {e}", "ERROR")
             return False
             
-    def run_extraction(self) -> Dict:
+    def extract_symbol_history(self, symbol: str, start: datetime, end: datetime,
+                               timeframe: str = "M1", chunk_days: float = 7.0) -> bool:
+        """
+        Extract a long history of a symbol window by window into the partitioned store
+        
+        Only one window is held in memory at a time. A rerun after a failure
+        continues after the last window that was written completely.
+        
+        Args:
+            symbol: Trading symbol to extract
+            start: First instant of the history
+            end: End of the history (exclusive)
+            timeframe: Timeframe name ("M1", "H1", ...) or "TICK" for ticks
+            chunk_days: Days per request window
+            
+        Returns:
+            True if the whole range is stored, False otherwise
+        """
+        try:
+            writer = PartitionedBarWriter(os.path.join(self.data_dir, "lake"), symbol, timeframe)
+            resume = writer.resume_point()
+            if resume is not None and resume > pd.Timestamp(start):
+                self.log(f"🔁 {symbol}: resuming {timeframe} history from {resume}")
+            
+            if timeframe == "TICK":
+                def request(date_from, date_to):
+                    return mt5.copy_ticks_range(symbol, date_from, date_to, mt5.COPY_TICKS_ALL)
+            else:
+                mt5_timeframe = getattr(mt5, f"TIMEFRAME_{timeframe}")
+                def request(date_from, date_to):
+                    return mt5.copy_rates_range(symbol, mt5_timeframe, date_from, date_to)
+                    
+            def fetch(date_from, date_to):
+                call, last_error = self.terminal_request(lambda: request(date_from, date_to), symbol, "history")
+                return self.scheduler.request(call, last_error, label=symbol)
+                
+            rows_before = writer.manifest['rows']
+            complete = extract_history(writer, fetch, start, end, timedelta(days=chunk_days))
+            added = writer.manifest['rows'] - rows_before
+            
+            with self.lock:
+                self.stats["total_bars"] += added
+            if not complete:
+                self.log(f"❌ {symbol}: history stopped at {writer.manifest['completed_until']} "
+                         f"(rerun to resume)", "ERROR")
+                return False
+                
+            self.log(f"💾 {symbol}: {added:,} {timeframe} rows stored, {writer.manifest['rows']:,} in "
+                     f"{len(writer.manifest['partitions'])} partitions")
+            with self.lock:
+                self.stats["successful_symbols"].append(symbol)
+            return True
+            
+        except Exception as e:
+            self.log(f"❌ Exception extracting {symbol} history: {e}", "ERROR")
+            return False
+            
+    def run_extraction(self, history_start: Optional[datetime] = None,
+                       history_end: Optional[datetime] = None,
+                       timeframe: str = "M1", chunk_days: float = 7.0) -> Dict:
         """
         Run complete extraction process for all tradeable symbols
         
+        Args:
+            history_start: Extract the history from this date into the
+                           partitioned store instead of the 30-day CSV files
+            history_end: End of the history (defaults to now)
+            timeframe: History timeframe name or "TICK"
+            chunk_days: Days per history request window
+        
         Returns:
             Dictionary with extraction results and statistics
         """
@@ -257,27 +494,32 @@ class EnhancedDataExtractor:
             return {"success": False, "error": "No tradeable symbols found"}
             
         self.log(f"📋 Found {len(tradeable_symbols)} tradeable symbols")
-        self.log(f"⚙️  Settings: sleep={self.sleep_between_requests}s, retries={self.max_retries}")
+        if history_start is not None:
+            history_end = history_end or datetime.now()
+            mode = f"history {timeframe} {history_start:%Y-%m-%d} to {history_end:%Y-%m-%d} in {chunk_days}-day chunks"
+        else:
+            mode = f"{'incremental' if self.incremental else 'full'}, retention={self.retention_days or 'all'} days"
+        self.log(f"⚙️  Settings: rate={self.requests_per_second}/s, workers={self.max_workers}, "
+                 f"retries={self.max_retries}, mode={mode}")
         self.log(f"🎯 Symbols: {list(tradeable_symbols.keys())}")
         
-        # Process each symbol
-        for i, (symbol, symbol_info) in enumerate(tradeable_symbols.items(), 1):
-            self.log(f"\n📈 Progress: {i}/{len(tradeable_symbols)} symbols")
-            self.log("-" * 40)
-            
+        # Extract symbols concurrently (requests share the scheduler's rate limit)
+        if history_start is not None:
+            job = lambda symbol: self.extract_symbol_history(symbol, history_start, history_end,
+                                                             timeframe, chunk_days)
+        else:
+            job = lambda symbol: self.extract_symbol_data(symbol, tradeable_symbols[symbol])
+        progress = self.scheduler.run(list(tradeable_symbols), job)
+        
+        for symbol, record in progress.items():
             self.stats["symbols_processed"] += 1
-            success = self.extract_symbol_data(symbol, symbol_info)
-            
-            if success:
+            if record.status == "done":
                 self.stats["symbols_successful"] += 1
             else:
                 self.stats["symbols_failed"] += 1
                 self.stats["failed_symbols"].append(symbol)
-                
-            # Sleep between symbols (except last one)
-            if i < len(tradeable_symbols) and self.sleep_between_symbols > 0:
-                self.log(f"⏱️  Sleeping {self.sleep_between_symbols}s before next symbol...")
-                time.sleep(self.sleep_between_symbols)
+        scheduler_stats = self.scheduler.summary()
+        self.stats["total_retries"] = scheduler_stats["retries"]
                 
         # Final statistics
         self.stats["end_time"] = datetime.now()
@@ -291,7 +533,10 @@ class EnhancedDataExtractor:
         self.log(f"✅ Successful: {self.stats['symbols_successful']}")
         self.log(f"❌ Failed: {self.stats['symbols_failed']}")
         self.log(f"📈 Total bars: {self.stats['total_bars']:,}")
-        self.log(f"🔄 Total retries: {self.stats['total_retries']}")
+        if self.stats['bars_trimmed']:
+            self.log(f"✂️  Bars trimmed by retention: {self.stats['bars_trimmed']:,}")
+        self.log(f"🔄 Total retries: {self.stats['total_retries']} "
+                 f"(backoff {scheduler_stats['backoff_seconds']:.1f}s, final rate {scheduler_stats['rate']}/s)")
         
         if self.stats['symbols_successful'] > 0:
             avg_bars = self.stats['total_bars'] / self.stats['symbols_successful']
@@ -309,14 +554,19 @@ class EnhancedDataExtractor:
                 "extractor_version": "Enhanced-Fixed",
                 "data_directory": self.data_dir,
                 "extraction_settings": {
-                    "sleep_between_requests": self.sleep_between_requests,
-                    "sleep_between_symbols": self.sleep_between_symbols,
-                    "max_retries": self.max_retries
+                    "requests_per_second": self.requests_per_second,
+                    "max_workers": self.max_workers,
+                    "max_retries": self.max_retries,
+                    "incremental": self.incremental,
+                    "retention_days": self.retention_days,
+                    "history_days": self.history_days
                 }
             },
             "statistics": self.stats,
+            "scheduler": scheduler_stats,
             "successful_extractions": {
-                symbol: f"GEN_{symbol}_M1_1month.csv" 
+                symbol: (os.path.join("lake", symbol, timeframe) if history_start is not None
+                         else f"GEN_{symbol}_M1_1month.csv")
                 for symbol in self.stats["successful_symbols"]
             }
         }
@@ -340,15 +590,35 @@ class EnhancedDataExtractor:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Extract M1 bars for all tradeable symbols")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Fetch only bars after the last stored timestamp of each symbol")
+    parser.add_argument("--retention-days", type=int, default=None,
+                        help="Trim stored bars older than this many days before the newest bar")
+    parser.add_argument("--history-days", type=int, default=30,
+                        help="Days fetched for a full pull or a symbol with no stored bars")
+    parser.add_argument("--workers", type=int, default=4, help="Symbols extracted concurrently")
+    parser.add_argument("--rate", type=float, default=5.0, help="Initial requests per second")
+    parser.add_argument("--history-start", type=datetime.fromisoformat, default=None,
+                        help="Extract history from this date into the partitioned store (YYYY-MM-DD)")
+    parser.add_argument("--history-end", type=datetime.fromisoformat, default=None,
+                        help="End of the history (default: now)")
+    parser.add_argument("--timeframe", default="M1", help="History timeframe (M1, M5, H1, ...) or TICK")
+    parser.add_argument("--chunk-days", type=float, default=7.0, help="Days per history request window")
+    args = parser.parse_args()
+    
     # Create extractor with proven settings from testing
     extractor = EnhancedDataExtractor(
-        sleep_between_requests=1.0,    # Proven to work well
-        sleep_between_symbols=2.0,     # Good balance of speed vs reliability  
-        max_retries=3                  # Sufficient for most issues
+        requests_per_second=args.rate,
+        max_workers=args.workers,
+        max_retries=3,                 # Sufficient for most issues
+        incremental=args.incremental,
+        retention_days=args.retention_days,
+        history_days=args.history_days
     )
     
     # Run extraction
-    result = extractor.run_extraction()
+    result = extractor.run_extraction(args.history_start, args.history_end, args.timeframe, args.chunk_days)
     
     if result["success"]:
         stats = result["statistics"]
@@ -9,6 +9,7 @@ Author: Multi-Symbol Strategy Framework
 Date: 2025-09-19
 """
 
+import argparse
 import pandas as pd
 import numpy as np
 import os
@@ -20,6 +21,9 @@ from dataclasses import dataclass, asdict
 import warnings
 warnings.filterwarnings('ignore')
 
+from GEN_columnar_store import load_bars
+from GEN_partitioned_store import LAKE_DIR, changed_partitions, datasets, load_manifest, partition_path
+
 @dataclass
 class QualityIssue:
     """Represents a data quality issue"""
@@ -141,18 +145,106 @@ class DataQualityController:
         
         return reports
     
+    def analyze_lake(self, lake_dir: str = LAKE_DIR, timeframe: str = "M1",
+                     state_file: str = "_quality_state.json") -> Dict[str, SymbolQualityReport]:
+        """
+        Analyze the month partitions of the partitioned store, skipping unchanged ones
+        
+        Reports are kept per partition in a state file next to the store
+        together with the partition checksum they were computed from; a
+        partition is analyzed again only when its manifest checksum differs.
+        
+        Args:
+            lake_dir: Partitioned store root
+            timeframe: Timeframe to analyze
+            state_file: State file name inside lake_dir
+        
+        Returns:
+            "SYMBOL YYYY/MM" -> quality report
+        """
+        print("🔍 DATA QUALITY CONTROLLER (partitioned store)")
+        print("=" * 60)
+        
+        state_path = os.path.join(lake_dir, state_file)
+        try:
+            with open(state_path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {}
+        
+        start_time = time.time()
+        reports = {}
+        analyzed = skipped = 0
+        for symbol, dataset_timeframe in datasets(lake_dir):
+            if dataset_timeframe != timeframe:
+                continue
+            manifest = load_manifest(lake_dir, symbol, timeframe)
+            dataset = f"{symbol}/{timeframe}"
+            # Drop partitions that are no longer in the manifest
+            recorded = {key: entry for key, entry in state.get(dataset, {}).items()
+                        if key in manifest['partitions']}
+            changed = set(changed_partitions(manifest, {key: entry['checksum']
+                                                        for key, entry in recorded.items()}))
+            
+            for key in sorted(manifest['partitions']):
+                name = f"{symbol} {key}"
+                if key not in changed:
+                    report_dict = dict(recorded[key]['report'])
+                    report_dict['date_range'] = tuple(pd.Timestamp(t) for t in report_dict['date_range'])
+                    reports[name] = SymbolQualityReport(**report_dict)
+                    skipped += 1
+                    continue
+                
+                year, month = key.split('/')
+                report = self.analyze_single_file(
+                    partition_path(lake_dir, symbol, timeframe, int(year), int(month)), name)
+                analyzed += 1
+                if report:
+                    reports[name] = report
+                    recorded[key] = {'checksum': manifest['partitions'][key]['checksum'],
+                                     'report': self.report_to_dict(report)}
+                    grade_color = self.get_grade_color(report.quality_grade)
+                    print(f"Analyzed {name:<18} {grade_color} Grade: {report.quality_grade} | "
+                          f"Issues: {report.total_issues} | Score: {report.overall_quality_score:.1f}%")
+                else:
+                    recorded.pop(key, None)
+            state[dataset] = recorded
+        
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f, indent=2, default=str)
+        os.replace(temp_path, state_path)
+        
+        self.quality_reports = reports
+        analysis_time = time.time() - start_time
+        self.summary_stats.update({
+            "files_analyzed": len(reports),
+            "total_records": sum(r.total_records for r in reports.values()),
+            "total_issues": sum(r.total_issues for r in reports.values()),
+            "avg_quality_score": sum(r.overall_quality_score for r in reports.values()) / len(reports) if reports else 0,
+            "analysis_duration": analysis_time,
+            "partitions_analyzed": analyzed,
+            "partitions_skipped": skipped
+        })
+        
+        print("-" * 60)
+        print(f"📊 ANALYSIS COMPLETE ({analysis_time:.1f}s)")
+        print(f"📈 Partitions: {len(reports)} | Analyzed: {analyzed} | Unchanged (skipped): {skipped}")
+        print("=" * 60)
+        return reports
+    
     def analyze_single_file(self, file_path: str, symbol: str) -> Optional[SymbolQualityReport]:
         """Analyze a single CSV file for quality issues"""
         try:
-            # Load data
-            df = pd.read_csv(file_path)
+            # Load data (timestamps parsed by the shared column-store loader)
+            df = load_bars(file_path, index=False)
+            if 'datetime' not in df.columns:
+                df = df.rename(columns={'time': 'datetime'})
             
             # Basic file info
             file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
             total_records = len(df)
             
-            # Convert datetime
-            df['datetime'] = pd.to_datetime(df['datetime'])
             date_range = (df['datetime'].min(), df['datetime'].max())
             
             # Initialize quality checks
@@ -497,14 +589,7 @@ class DataQualityController:
             
             # Convert reports to serializable format
             for symbol, report in self.quality_reports.items():
-                report_dict = asdict(report)
-                # Convert datetime objects to strings
-                if report_dict['date_range']:
-                    report_dict['date_range'] = [
-                        report_dict['date_range'][0].isoformat(),
-                        report_dict['date_range'][1].isoformat()
-                    ]
-                report_data["symbol_reports"][symbol] = report_dict
+                report_data["symbol_reports"][symbol] = self.report_to_dict(report)
             
             # Save to file
             output_path = os.path.join(self.data_dir, filename)
@@ -518,6 +603,17 @@ class DataQualityController:
             print(f"❌ Error saving quality report: {e}")
             return False
     
+    def report_to_dict(self, report: SymbolQualityReport) -> dict:
+        """Report as a dict with the date range as ISO strings"""
+        report_dict = asdict(report)
+        # Convert datetime objects to strings
+        if report_dict['date_range']:
+            report_dict['date_range'] = [
+                report_dict['date_range'][0].isoformat(),
+                report_dict['date_range'][1].isoformat()
+            ]
+        return report_dict
+    
     def get_issues_by_severity(self) -> Dict[str, List[str]]:
         """Get symbols grouped by issue severity"""
         critical = []
@@ -547,12 +643,17 @@ def main():
     print("🔍 DATA QUALITY CONTROLLER")
     print("=" * 60)
     
+    parser = argparse.ArgumentParser(description="Data quality analysis of the bar CSV files")
+    parser.add_argument("--lake", action="store_true",
+                        help="Analyze the month partitions of the partitioned store (changed ones only)")
+    args = parser.parse_args()
+    
     # Initialize controller
     controller = DataQualityController()
     
     try:
-        # Analyze all files
-        reports = controller.analyze_all_files()
+        # Analyze all files (or the store partitions)
+        reports = controller.analyze_lake() if args.lake else controller.analyze_all_files()
         
         if not reports:
             print("❌ No data analyzed")
@@ -2,10 +2,11 @@
 """
 Validation script for gap-filled data
 """
-import pandas as pd
 import os
 from datetime import timedelta
 
+from GEN_columnar_store import load_bars
+
 def validate_fixed_data():
     print('✅ VALIDATING FIXED DATA QUALITY')
     print('=' * 50)
@@ -31,8 +32,7 @@ def validate_fixed_data():
         
         # Load fixed data
         fixed_path = os.path.join(fixed_dir, filename)
-        df = pd.read_csv(fixed_path)
-        df['time'] = pd.to_datetime(df['time'])
+        df = load_bars(fixed_path, index=False)
         df = df.sort_values('time')
         
         # Check for gaps